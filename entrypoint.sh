@@ -30,6 +30,7 @@ SALT="False"
 PLUGINS=""
 WEBHOOK="False"
 SOCKET_HOST="127.0.0.1"
+POLLING_ENGINE="threaded"
 HEALTH_CHECK="False"
 DEBUG="False"
 COLORIZE_LOGS="True"
@@ -189,6 +190,14 @@ validate_mode() {
     esac
 }
 
+# Function to validate polling engine
+validate_polling_engine() {
+    case "$1" in
+        threaded|async) return 0 ;;
+        *) log "ERROR" "entrypoint" "Invalid polling engine" "{\"polling_engine\": \"$1\"}"; return 1 ;;
+    esac
+}
+
 # Function to validate boolean values
 validate_bool() {
     case "$1" in
@@ -344,6 +353,15 @@ while [ $# -gt 0 ]; do
             SOCKET_HOST="$2"
             shift 2
             ;;
+        --polling_engine)
+            require_option_value "--polling_engine" "$2"
+            if validate_polling_engine "$2"; then
+                POLLING_ENGINE="$2"
+            else
+                exit 1
+            fi
+            shift 2
+            ;;
         --colorize_logs)
             require_option_value "--colorize_logs" "$2"
             if validate_bool "$2"; then
@@ -367,7 +385,7 @@ while [ $# -gt 0 ]; do
             exit 0
             ;;
         *)
-            log "ERROR" "entrypoint" "Invalid option" "{\"option\": \"$1\", \"available\": \"--log-level, --mode, --log-format, --colorize_logs, --debug, --salt, --plugins, --webhook, --socket_host, --health_check, --check-docker\"}"
+            log "ERROR" "entrypoint" "Invalid option" "{\"option\": \"$1\", \"available\": \"--log-level, --mode, --log-format, --colorize_logs, --debug, --salt, --plugins, --webhook, --socket_host, --polling_engine, --health_check, --check-docker\"}"
             exit 1
             ;;
     esac
@@ -383,7 +401,7 @@ fi
 
 log "INFO" "entrypoint" "Starting pyTMBot from entrypoint... ›››››››› 🚀🚀🚀" "{}"
 log "INFO" "entrypoint" "User information" "{\"user\": \"$(id -un)\", \"uid\": $(id -u), \"gid\": $(id -g), \"groups\": \"$(groups)\"}"
-log "INFO" "entrypoint" "Configuration" "{\"python\": \"$PYTHON_PATH\", \"mode\": \"$MODE\", \"log_level\": \"$LOG_LEVEL\", \"log_format\": \"$EFFECTIVE_LOG_FORMAT\", \"colorize_logs\": \"$COLORIZE_LOGS\", \"debug\": \"$DEBUG\", \"plugins\": \"$PLUGINS\", \"webhook\": \"$WEBHOOK\", \"socket_host\": \"$SOCKET_HOST\", \"strict_docker_access\": \"$STRICT_DOCKER_ACCESS\"}"
+log "INFO" "entrypoint" "Configuration" "{\"python\": \"$PYTHON_PATH\", \"mode\": \"$MODE\", \"log_level\": \"$LOG_LEVEL\", \"log_format\": \"$EFFECTIVE_LOG_FORMAT\", \"colorize_logs\": \"$COLORIZE_LOGS\", \"debug\": \"$DEBUG\", \"plugins\": \"$PLUGINS\", \"webhook\": \"$WEBHOOK\", \"socket_host\": \"$SOCKET_HOST\", \"polling_engine\": \"$POLLING_ENGINE\", \"strict_docker_access\": \"$STRICT_DOCKER_ACCESS\"}"
 
 # Check dependencies
 check_dependencies
@@ -429,7 +447,8 @@ else
         --mode "$MODE" \
         --colorize_logs "$COLORIZE_LOGS" \
         --webhook "$WEBHOOK" \
-        --socket_host "$SOCKET_HOST"
+        --socket_host "$SOCKET_HOST" \
+        --polling_engine "$POLLING_ENGINE"
 
     if [ -n "$LOG_FORMAT" ]; then
         set -- "$@" --log-format "$LOG_FORMAT"
@@ -13,7 +13,7 @@ from datetime import datetime
 from functools import cached_property
 from inspect import signature
 from pathlib import Path
-from threading import Lock, RLock
+from threading import Lock, RLock, local
 from types import SimpleNamespace, TracebackType
 from typing import Final
 from uuid import uuid4
@@ -22,6 +22,7 @@ from docker.client import DockerClient
 from docker.errors import DockerException
 from docker.tls import TLSConfig
 
+from pytmbot.adapters.docker.endpoints import PRIMARY_ENDPOINT_NAME, DockerEndpoint
 from pytmbot.exceptions import DockerConnectionError
 from pytmbot.globals import settings
 from pytmbot.logs import Logger
@@ -99,15 +100,21 @@ class DockerAdapter:
     _STRICT_DOCKER_ACCESS_ENV: Final[str] = "STRICT_DOCKER_ACCESS"
     _DOCKER_INFO_TTL_SECONDS: Final[float] = 30.0
 
-    def __init__(self) -> None:
+    def __init__(self, endpoint: DockerEndpoint | None = None) -> None:
         self._log = Logger()
+        self._endpoint = endpoint
         self._lock = RLock()  # Thread safety for client operations
         self._create_lock = Lock()
         self._client: DockerClientLike | None = None
         self._start_time: datetime = datetime.now()
         self._connection_failures = 0
         self._last_health_check: datetime | None = None
-        self._span_id: str | None = None
+        # Adapters are shared per endpoint across threads: span ids and entered
+        # clients are tracked per thread, and a replaced client is closed only
+        # once its last user has exited.
+        self._local = local()
+        self._client_users: dict[int, int] = {}
+        self._retired_clients: dict[int, DockerClientLike] = {}
         self._strict_docker_access = self._is_strict_docker_access_enabled()
         self._configured_timeout = self._DEFAULT_TIMEOUT
         self._disabled_reason: str | None = None
@@ -119,6 +126,7 @@ class DockerAdapter:
         # Initialize base context for all operations
         self._base_context = {
             "docker_url": self._docker_url,
+            "docker_endpoint": endpoint.name if endpoint else PRIMARY_ENDPOINT_NAME,
             "adapter_id": id(self),
             "strict_docker_access": self._strict_docker_access,
         }
@@ -157,7 +165,11 @@ class DockerAdapter:
         docker_settings = getattr(settings, "docker", None)
         validation_error: str | None = None
         docker_url = ""
-        if docker_settings is None:
+        if self._endpoint is not None:
+            docker_url = self._endpoint.url
+            if not docker_url:
+                validation_error = "Docker host URL cannot be empty"
+        elif docker_settings is None:
             validation_error = "Docker configuration is missing"
         else:
             host_value = getattr(docker_settings, "host", None)
@@ -215,8 +227,10 @@ class DockerAdapter:
             )
 
         # Check for TCP socket without TLS
-        if self._docker_url.startswith("tcp://") and not self._docker_url.startswith(
-            "tcp+tls://"
+        if (
+            self._docker_url.startswith("tcp://")
+            and not self._docker_url.startswith("tcp+tls://")
+            and not self._uses_tls()
         ):
             self._log.warning(
                 "docker.adapter.tcp.connection.warn",
@@ -225,14 +239,34 @@ class DockerAdapter:
             )
 
         # Validate certificate paths if HTTPS is used
-        if self._docker_url.startswith("https://"):
+        if self._uses_tls():
             self._validate_tls_configuration()
 
+    def _uses_tls(self) -> bool:
+        if self._endpoint is not None:
+            return self._endpoint.uses_tls
+        return self._docker_url.startswith("https://")
+
+    def _tls_settings(self) -> tuple[str | None, str | None, str | bool | None, bool]:
+        """Return ``(cert_path, key_path, ca_cert, verify_hostname)`` for TLS."""
+        endpoint = self._endpoint
+        if endpoint is not None:
+            return (
+                endpoint.tls_client_cert,
+                endpoint.tls_client_key,
+                endpoint.tls_ca_cert or True,
+                endpoint.tls_verify_hostname,
+            )
+        return (
+            getattr(settings.docker, "cert_path", None),
+            getattr(settings.docker, "key_path", None),
+            getattr(settings.docker, "ca_cert", True),
+            bool(getattr(settings.docker, "verify_hostname", True)),
+        )
+
     def _validate_tls_configuration(self) -> None:
         """Validate TLS certificate configuration."""
-        cert_path = getattr(settings.docker, "cert_path", None)
-        key_path = getattr(settings.docker, "key_path", None)
-        ca_cert = getattr(settings.docker, "ca_cert", None)
+        cert_path, key_path, ca_cert, _ = self._tls_settings()
 
         if cert_path and not Path(cert_path).exists():
             self._log.warning(
@@ -264,6 +298,50 @@ class DockerAdapter:
         )
         return {"timeout": int(timeout)}
 
+    def _entered(self) -> list[tuple[str, DockerClientLike | None]]:
+        """Per-thread stack of ``(span_id, client)`` for nested ``with`` blocks."""
+        entered: list[tuple[str, DockerClientLike | None]] | None = getattr(
+            self._local, "entered", None
+        )
+        if entered is None:
+            entered = self._local.entered = []
+        return entered
+
+    @property
+    def _span_id(self) -> str | None:
+        entered = self._entered()
+        return entered[-1][0] if entered else None
+
+    def _acquire_locked(self, client: DockerClientLike) -> DockerClientLike:
+        """Count the calling thread as a user of ``client``; caller holds ``_lock``."""
+        key = id(client)
+        self._client_users[key] = self._client_users.get(key, 0) + 1
+        entered = self._entered()
+        if entered:
+            entered[-1] = (entered[-1][0], client)
+        return client
+
+    def _retire_locked(self, client: DockerClientLike) -> bool:
+        """Retire a replaced client; return whether it is unused and can be closed now."""
+        if self._client_users.get(id(client), 0) > 0:
+            self._retired_clients[id(client)] = client
+            return False
+        return True
+
+    def _release(self, client: DockerClientLike) -> None:
+        """Drop one user of ``client`` and close it if it was retired meanwhile."""
+        key = id(client)
+        with self._lock:
+            remaining = self._client_users.get(key, 0) - 1
+            if remaining > 0:
+                self._client_users[key] = remaining
+                return
+            self._client_users.pop(key, None)
+            retired = self._retired_clients.pop(key, None)
+        if retired is not None:
+            with suppress(Exception):
+                retired.close()
+
     def _get_context(
         self, action: str, extra: dict[str, object] | None = None
     ) -> dict[str, object]:
@@ -297,14 +375,11 @@ class DockerAdapter:
 
     def _create_tls_config(self) -> TLSConfig | None:
         """Create TLS configuration with enhanced security."""
-        if not self._docker_url.startswith("https://"):
+        if not self._uses_tls():
             return None
 
         try:
-            cert_path = getattr(settings.docker, "cert_path", None)
-            key_path = getattr(settings.docker, "key_path", None)
-            ca_cert = getattr(settings.docker, "ca_cert", True)
-            verify_hostname = bool(getattr(settings.docker, "verify_hostname", True))
+            cert_path, key_path, ca_cert, verify_hostname = self._tls_settings()
             if not ca_cert:
                 verify_hostname = False
 
@@ -487,7 +562,15 @@ class DockerAdapter:
 
     def __enter__(self) -> DockerClientLike:
         """Enter Docker context manager - create and return client with thread safety."""
-        self._span_id = uuid4().hex[:8]
+        entered = self._entered()
+        entered.append((uuid4().hex[:8], None))
+        try:
+            return self._enter_client()
+        except BaseException:
+            entered.pop()
+            raise
+
+    def _enter_client(self) -> DockerClientLike:
         context = self._get_context("context_enter")
 
         try:
@@ -497,13 +580,13 @@ class DockerAdapter:
                         self._client = self._build_unavailable_client(
                             self._disabled_reason
                         )
-                    return self._client
+                    return self._acquire_locked(self._client)
 
                 if not self._should_recreate_client():
                     if self._client is None:
                         raise DockerConnectionError("Docker client is not initialized")
                     self._log.trace("docker.adapter.context.entered.debug", **context)
-                    return self._client
+                    return self._acquire_locked(self._client)
 
             # Slow path: create client outside the primary lock.
             with self._create_lock:
@@ -516,12 +599,17 @@ class DockerAdapter:
                         self._log.trace(
                             "docker.adapter.context.entered.debug", **context
                         )
-                        return self._client
+                        return self._acquire_locked(self._client)
 
                     old_client = self._client
                     self._client = None
+                    # Threads still inside ``with`` keep using the old client; it
+                    # is closed by the last of them in ``__exit__``.
+                    close_now = old_client is not None and self._retire_locked(
+                        old_client
+                    )
 
-                if old_client:
+                if old_client is not None and close_now:
                     with suppress(Exception):
                         old_client.close()
 
@@ -530,13 +618,13 @@ class DockerAdapter:
                 with self._lock:
                     self._client = created_client
                     self._log.trace("docker.adapter.context.entered.debug", **context)
-                    return self._client
+                    return self._acquire_locked(created_client)
 
         except Exception as e:
             if not self._strict_docker_access:
                 with self._lock:
                     self._client = self._build_unavailable_client(sanitize_exception(e))
-                    return self._client
+                    return self._acquire_locked(self._client)
             self._log.error(
                 "docker.adapter.enter.context.fail",
                 error=sanitize_exception(e),
@@ -552,6 +640,8 @@ class DockerAdapter:
     ) -> None:
         """Exit Docker context manager - manage connection lifecycle."""
         context = self._get_context("context_exit")
+        entered = self._entered()
+        _, client = entered.pop() if entered else ("", None)
 
         # Note: We don't always close the client here as we want connection reuse
         # The client will be closed when the adapter is garbage collected or
@@ -566,8 +656,11 @@ class DockerAdapter:
                     exception_message=str(exc_val),
                     **context,
                 )
-                # Mark client for recreation on Docker errors
-                self._last_health_check = None
+                # Re-check the client on next use, unless the failure happened on
+                # a client that another thread has already replaced.
+                with self._lock:
+                    if client is None or client is self._client:
+                        self._last_health_check = None
             else:
                 # Other exceptions - log at debug to reduce noise
                 self._log.trace(
@@ -580,7 +673,8 @@ class DockerAdapter:
             # Normal exit - only debug level
             self._log.trace("docker.adapter.context.exited.debug", **context)
 
-        self._span_id = None
+        if client is not None:
+            self._release(client)
 
     def health_check(self) -> bool:
         """
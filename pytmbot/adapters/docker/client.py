@@ -7,45 +7,202 @@ also providing basic information about the status of local servers.
 
 from __future__ import annotations
 
-from collections.abc import Iterator
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from contextlib import contextmanager
-from threading import RLock, local
+from dataclasses import dataclass, field
+from threading import RLock
+from typing import Any, Final
 
 from docker.client import DockerClient
 
 from pytmbot.adapters.docker._adapter import DockerAdapter
+from pytmbot.adapters.docker.endpoints import (
+    PRIMARY_ENDPOINT_NAME,
+    DockerEndpoint,
+    resolve_docker_endpoints,
+)
+from pytmbot.globals import settings
+from pytmbot.logs import Logger
+from pytmbot.utils import sanitize_exception
 
-_adapter_state = local()
+logger = Logger()
+
+FAN_OUT_MAX_WORKERS: Final[int] = 8
+
+# One adapter (and so one pooled DockerClient) per endpoint, shared by all threads.
+_adapters: dict[str, DockerAdapter] = {}
 _adapter_lock = RLock()
+_endpoints: tuple[DockerEndpoint, ...] | None = None
+_fan_out_executor: ThreadPoolExecutor | None = None
+# Calls that outlived their endpoint timeout; the endpoint is skipped until they end.
+_stuck_calls: dict[str, Future[Any]] = {}
+
+
+@dataclass(slots=True)
+class DockerFanOut[T]:
+    """Per-endpoint results of :func:`docker_fan_out`; ``failures`` maps to reasons."""
 
+    results: dict[str, T] = field(default_factory=dict)
+    failures: dict[str, str] = field(default_factory=dict)
 
-def _get_thread_adapter() -> DockerAdapter:
-    """Get or create thread-local DockerAdapter instance."""
+    @property
+    def partial(self) -> bool:
+        return bool(self.failures)
+
+
+def docker_endpoints() -> tuple[DockerEndpoint, ...]:
+    """Configured named endpoints; empty when only ``docker.host`` is set."""
+    global _endpoints
     with _adapter_lock:
-        adapter = getattr(_adapter_state, "adapter", None)
+        if _endpoints is None:
+            _endpoints = resolve_docker_endpoints(getattr(settings, "docker", None))
+        return _endpoints
+
+
+def docker_endpoint_names() -> tuple[str, ...]:
+    """Endpoint names in configuration order; the first one is primary."""
+    endpoints = docker_endpoints()
+    if not endpoints:
+        return (PRIMARY_ENDPOINT_NAME,)
+    return tuple(endpoint.name for endpoint in endpoints)
+
+
+def _find_endpoint(name: str | None) -> DockerEndpoint | None:
+    endpoints = docker_endpoints()
+    if not endpoints:
+        if name not in (None, PRIMARY_ENDPOINT_NAME):
+            raise KeyError(f"Unknown Docker endpoint: {name}")
+        return None
+    if name is None:
+        return endpoints[0]
+    for endpoint in endpoints:
+        if endpoint.name == name:
+            return endpoint
+    raise KeyError(f"Unknown Docker endpoint: {name}")
+
+
+def _get_adapter(name: str | None = None) -> DockerAdapter:
+    """Get or create the shared DockerAdapter of endpoint ``name`` (primary by default)."""
+    endpoint = _find_endpoint(name)
+    key = endpoint.name if endpoint is not None else PRIMARY_ENDPOINT_NAME
+    with _adapter_lock:
+        adapter = _adapters.get(key)
         if adapter is None:
-            adapter = DockerAdapter()
-            _adapter_state.adapter = adapter
+            adapter = DockerAdapter(endpoint) if endpoint else DockerAdapter()
+            _adapters[key] = adapter
         return adapter
 
 
+def _get_fan_out_executor() -> ThreadPoolExecutor:
+    global _fan_out_executor
+    with _adapter_lock:
+        if _fan_out_executor is None:
+            _fan_out_executor = ThreadPoolExecutor(
+                max_workers=FAN_OUT_MAX_WORKERS, thread_name_prefix="docker-fanout"
+            )
+        return _fan_out_executor
+
+
 def reset_docker_client_context() -> None:
-    """Reset and close current thread DockerAdapter (mainly for tests/shutdown)."""
+    """Close every endpoint adapter and the fan-out pool (mainly for tests/shutdown)."""
+    global _endpoints, _fan_out_executor
     with _adapter_lock:
-        adapter = getattr(_adapter_state, "adapter", None)
-        if adapter is not None:
-            adapter.close()
-            delattr(_adapter_state, "adapter")
+        adapters = list(_adapters.values())
+        _adapters.clear()
+        _stuck_calls.clear()
+        _endpoints = None
+        executor, _fan_out_executor = _fan_out_executor, None
+    for adapter in adapters:
+        adapter.close()
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
 
 
 @contextmanager
-def docker_client_context() -> Iterator[DockerClient]:
+def docker_client_context(endpoint: str | None = None) -> Iterator[DockerClient]:
     """
     Provide a managed Docker client via a single public gateway.
 
-    The gateway reuses a thread-local adapter to avoid repeated adapter creation
-    overhead while still delegating connection lifecycle checks to DockerAdapter.
+    ``endpoint`` selects a named daemon; by default the primary one is used. The
+    adapter is shared across threads so its DockerClient connection pool is reused,
+    while connection lifecycle checks stay delegated to DockerAdapter.
     """
-    adapter = _get_thread_adapter()
+    adapter = _get_adapter(endpoint)
     with adapter as client:
         yield client
+
+
+def _run_on_endpoint[T](name: str, operation: Callable[[DockerClient], T]) -> T:
+    with docker_client_context(name) as client:
+        return operation(client)
+
+
+def docker_fan_out[T](operation: Callable[[DockerClient], T]) -> DockerFanOut[T]:
+    """
+    Run ``operation`` against every endpoint concurrently.
+
+    Each endpoint gets its own ``query_timeout_seconds`` budget, measured from
+    submission. Slow or failing daemons are reported in ``failures`` instead of
+    delaying or failing the others. A call that timed out keeps its worker until the
+    daemon answers, so that endpoint is skipped rather than queued again meanwhile.
+    """
+    endpoints = docker_endpoints()
+    outcome: DockerFanOut[T] = DockerFanOut()
+    if not endpoints:
+        try:
+            outcome.results[PRIMARY_ENDPOINT_NAME] = _run_on_endpoint(
+                PRIMARY_ENDPOINT_NAME, operation
+            )
+        except Exception as error:
+            outcome.failures[PRIMARY_ENDPOINT_NAME] = sanitize_exception(error)
+        return outcome
+
+    executor = _get_fan_out_executor()
+    started = time.monotonic()
+    pending: list[tuple[DockerEndpoint, Future[T]]] = []
+    with _adapter_lock:
+        for endpoint in endpoints:
+            stuck = _stuck_calls.get(endpoint.name)
+            if stuck is not None and not stuck.done():
+                outcome.failures[endpoint.name] = "previous query still running"
+                continue
+            _stuck_calls.pop(endpoint.name, None)
+            pending.append(
+                (endpoint, executor.submit(_run_on_endpoint, endpoint.name, operation))
+            )
+
+    for endpoint, future in pending:
+        remaining = endpoint.query_timeout_seconds - (time.monotonic() - started)
+        try:
+            outcome.results[endpoint.name] = future.result(timeout=max(remaining, 0))
+        except FutureTimeoutError:
+            if not future.cancel():
+                with _adapter_lock:
+                    _stuck_calls[endpoint.name] = future
+            outcome.failures[endpoint.name] = (
+                f"timed out after {endpoint.query_timeout_seconds:g}s"
+            )
+        except Exception as error:
+            outcome.failures[endpoint.name] = sanitize_exception(error)
+
+    if outcome.failures:
+        logger.warning(
+            "docker.client.fanout.partial.warn",
+            failed_endpoints=outcome.failures,
+            succeeded_endpoints=sorted(outcome.results),
+            execution_time=f"{time.monotonic() - started:.3f}s",
+        )
+    return outcome
+
+
+__all__ = [
+    "DockerFanOut",
+    "docker_client_context",
+    "docker_endpoint_names",
+    "docker_endpoints",
+    "docker_fan_out",
+    "reset_docker_client_context",
+]
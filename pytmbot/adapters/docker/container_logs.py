@@ -0,0 +1,642 @@
+#!/usr/local/bin/python3
+"""
+(c) Copyright 2025, Denis Rozhnovskiy <pytelemonbot@mail.ru>
+pyTMBot - A simple Telegram bot to handle Docker containers and images,
+also providing basic information about the status of local servers.
+"""
+
+from __future__ import annotations
+
+import gzip
+import re
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from enum import StrEnum
+from importlib import import_module
+from tempfile import SpooledTemporaryFile
+from types import TracebackType
+from typing import IO, Final, Protocol, Self
+
+from docker.errors import APIError
+
+from pytmbot.adapters.docker.client import docker_client_context
+from pytmbot.adapters.docker.containers_info import (
+    _is_logs_driver_not_readable_error,
+)
+from pytmbot.adapters.docker.utils import (
+    build_container_context,
+    get_container_safely,
+    with_operation_logging,
+)
+from pytmbot.exceptions import (
+    ContainerLogsUnavailableError,
+    ContainerNotFoundError,
+    ErrorContext,
+)
+from pytmbot.logs import Logger
+from pytmbot.utils import sanitize_exception
+
+logger = Logger()
+
+LOG_SEARCH_MAX_MATCHES: Final[int] = 50
+LOG_SEARCH_CONTEXT_LINES: Final[int] = 2
+LOG_SEARCH_TIME_BUDGET_SECONDS: Final[float] = 5.0
+LOG_SEARCH_MAX_LINE_CHARS: Final[int] = 1000
+LOG_SEARCH_TAIL_LINES: Final[int] = 200_000
+LOG_SEARCH_MATCH_MARKER: Final[str] = "> "
+LOG_SEARCH_CONTEXT_MARKER: Final[str] = "  "
+LOG_SEARCH_BLOCK_SEPARATOR: Final[str] = "--"
+TELEGRAM_MAX_UPLOAD_BYTES: Final[int] = 50 * 1024 * 1024
+LOG_EXPORT_DEFAULT_MAX_BYTES: Final[int] = 20 * 1024 * 1024
+LOG_EXPORT_SPOOL_BYTES: Final[int] = 1024 * 1024
+LOG_EXPORT_BATCH_BYTES: Final[int] = 64 * 1024
+LOG_EXPORT_SIZE_MARGIN_BYTES: Final[int] = 256 * 1024
+LOG_EXPORT_TIME_BUDGET_SECONDS: Final[float] = 60.0
+LOG_EXPORT_TRUNCATION_NOTICE: Final[bytes] = (
+    b"\n[LOG EXPORT TRUNCATED - size or time limit reached]\n"
+)
+
+type LogLineMatcher = Callable[[str], bool]
+type LogTextFilter = Callable[[str], str]
+
+
+class _CompressedWriter(Protocol):
+    def write(self, data: bytes, /) -> int: ...
+
+    def close(self) -> None: ...
+
+
+class LogSeverity(StrEnum):
+    """Minimum severity accepted by the level filter."""
+
+    WARNING = "warning"
+    ERROR = "error"
+
+
+_SEVERITY_TOKENS: Final[dict[LogSeverity, tuple[str, ...]]] = {
+    LogSeverity.ERROR: (
+        "ERROR",
+        "ERR",
+        "FATAL",
+        "CRITICAL",
+        "CRIT",
+        "PANIC",
+        "EMERG",
+        "ALERT",
+        "EXCEPTION",
+        "TRACEBACK",
+    ),
+    LogSeverity.WARNING: ("WARN", "WARNING"),
+}
+
+
+def _compile_severity_pattern(severity: LogSeverity) -> re.Pattern[str]:
+    tokens = list(_SEVERITY_TOKENS[LogSeverity.ERROR])
+    if severity == LogSeverity.WARNING:
+        tokens.extend(_SEVERITY_TOKENS[LogSeverity.WARNING])
+    return re.compile(rf"\b(?:{'|'.join(tokens)})\b", re.IGNORECASE)
+
+
+_SEVERITY_PATTERNS: Final[dict[LogSeverity, re.Pattern[str]]] = {
+    severity: _compile_severity_pattern(severity) for severity in LogSeverity
+}
+
+
+@dataclass(frozen=True, slots=True)
+class LogSearchLine:
+    """One line of search output, either a match or surrounding context."""
+
+    line_number: int
+    text: str
+    is_match: bool
+
+
+@dataclass(slots=True)
+class LogSearchResult:
+    """Bounded result of a streaming log search."""
+
+    blocks: list[list[LogSearchLine]] = field(default_factory=list)
+    # Every match scanned; ``blocks`` hold only the newest ``max_matches``.
+    match_count: int = 0
+    scanned_lines: int = 0
+    limit_reached: bool = False
+    timed_out: bool = False
+    elapsed_seconds: float = 0.0
+
+    def render(self) -> str:
+        """Render blocks grep-style: matches marked, blocks separated by ``--``."""
+        rendered_blocks = [
+            "\n".join(
+                f"{LOG_SEARCH_MATCH_MARKER if line.is_match else LOG_SEARCH_CONTEXT_MARKER}"
+                f"{line.text}"
+                for line in block
+            )
+            for block in self.blocks
+        ]
+        return f"\n{LOG_SEARCH_BLOCK_SEPARATOR}\n".join(rendered_blocks)
+
+
+def build_log_line_matcher(
+    pattern: str | re.Pattern[str] | None = None,
+    severity: LogSeverity | str | None = None,
+) -> LogLineMatcher:
+    """
+    Build a line predicate from an optional regex and an optional severity floor.
+
+    When both are given, a line must satisfy both.
+
+    Raises:
+        ValueError: If neither filter is given or the pattern does not compile.
+    """
+    compiled: re.Pattern[str] | None = None
+    if isinstance(pattern, re.Pattern):
+        compiled = pattern
+    elif pattern:
+        try:
+            compiled = re.compile(pattern)
+        except re.error as error:
+            raise ValueError(f"Invalid log search pattern: {error}") from error
+
+    severity_pattern = (
+        _SEVERITY_PATTERNS[LogSeverity(severity)] if severity is not None else None
+    )
+
+    if compiled is None and severity_pattern is None:
+        raise ValueError("Log search requires a pattern or a severity filter")
+
+    if compiled is not None and severity_pattern is not None:
+        regex_search = compiled.search
+        severity_search = severity_pattern.search
+        return lambda line: (
+            severity_search(line) is not None and regex_search(line) is not None
+        )
+
+    single_search = (compiled or severity_pattern or re.compile("")).search
+    return lambda line: single_search(line) is not None
+
+
+def iter_log_lines(
+    chunks: Iterable[bytes | str],
+    max_line_chars: int = LOG_SEARCH_MAX_LINE_CHARS,
+) -> Iterator[str]:
+    """
+    Re-assemble lines from a Docker log stream.
+
+    Docker frames do not have to align with newlines, so partial lines are
+    buffered. The buffer is bounded: overlong lines are cut to
+    ``max_line_chars`` and the remainder up to the next newline is dropped.
+    """
+    pending = bytearray()
+    discarding = False
+    byte_limit = max_line_chars * 4
+
+    for chunk in chunks:
+        data = chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+        start = 0
+        while True:
+            newline = data.find(b"\n", start)
+            if newline == -1:
+                if not discarding:
+                    pending += data[start:]
+                    if len(pending) > byte_limit:
+                        yield _decode_line(pending, max_line_chars)
+                        pending.clear()
+                        discarding = True
+                break
+
+            if discarding:
+                discarding = False
+            else:
+                pending += data[start:newline]
+                yield _decode_line(pending, max_line_chars)
+            pending.clear()
+            start = newline + 1
+
+    if pending and not discarding:
+        yield _decode_line(pending, max_line_chars)
+
+
+def _decode_line(raw: bytes | bytearray, max_line_chars: int) -> str:
+    line = bytes(raw).decode("utf-8", errors="replace").rstrip("\r")
+    if len(line) > max_line_chars:
+        return f"{line[: max_line_chars - 3]}..."
+    return line
+
+
+def _drop_oldest_match(blocks: deque[list[LogSearchLine]], context_lines: int) -> None:
+    """Drop the oldest match and the context that only belonged to it."""
+    block = blocks[0]
+    matches = [index for index, line in enumerate(block) if line.is_match]
+    if len(matches) == 1:
+        blocks.popleft()
+        return
+    # Keep only the leading context of the next match.
+    del block[: max(matches[0] + 1, matches[1] - context_lines)]
+
+
+def search_log_lines(
+    lines: Iterable[str],
+    matcher: LogLineMatcher,
+    *,
+    max_matches: int = LOG_SEARCH_MAX_MATCHES,
+    context_lines: int = LOG_SEARCH_CONTEXT_LINES,
+    time_budget_seconds: float = LOG_SEARCH_TIME_BUDGET_SECONDS,
+    clock: Callable[[], float] = time.monotonic,
+) -> LogSearchResult:
+    """
+    Scan lines incrementally and keep the newest matches with surrounding context.
+
+    Memory is bounded by ``max_matches * (2 * context_lines + 1)`` lines: once
+    ``max_matches`` are held, each new match evicts the oldest one. The scan runs
+    to the end of ``lines`` or until the time budget is exhausted. Overlapping
+    context is merged like ``grep -C``.
+    """
+    if max_matches <= 0:
+        raise ValueError("max_matches must be a positive integer")
+    if context_lines < 0:
+        raise ValueError("context_lines must not be negative")
+
+    started_at = clock()
+    deadline = started_at + time_budget_seconds
+    result = LogSearchResult()
+    blocks: deque[list[LogSearchLine]] = deque()
+    before: deque[LogSearchLine] = deque(maxlen=context_lines)
+    current_block: list[LogSearchLine] | None = None
+    after_remaining = 0
+    kept_matches = 0
+
+    for line_number, text in enumerate(lines, start=1):
+        if clock() > deadline:
+            result.timed_out = True
+            break
+
+        result.scanned_lines = line_number
+        if matcher(text):
+            first_number = before[0].line_number if before else line_number
+            if (
+                current_block is None
+                or first_number > current_block[-1].line_number + 1
+            ):
+                current_block = []
+                blocks.append(current_block)
+            current_block.extend(before)
+            before.clear()
+            current_block.append(LogSearchLine(line_number, text, True))
+            result.match_count += 1
+            after_remaining = context_lines
+            if kept_matches == max_matches:
+                _drop_oldest_match(blocks, context_lines)
+                result.limit_reached = True
+            else:
+                kept_matches += 1
+        elif after_remaining > 0 and current_block is not None:
+            current_block.append(LogSearchLine(line_number, text, False))
+            after_remaining -= 1
+        else:
+            before.append(LogSearchLine(line_number, text, False))
+
+    result.blocks = list(blocks)
+    result.elapsed_seconds = clock() - started_at
+    return result
+
+
+def _logs_unavailable_error(container_id: str) -> ContainerLogsUnavailableError:
+    return ContainerLogsUnavailableError(
+        ErrorContext(
+            message=f"Container logs unavailable for: {container_id}",
+            error_code="DOCKER_010",
+            metadata={
+                "container_id": container_id,
+                "reason": "logging_driver_not_readable",
+            },
+        )
+    )
+
+
+def _close_log_stream(stream: object) -> None:
+    """Close a Docker log stream so the daemon stops sending the remainder."""
+    close = getattr(stream, "close", None)
+    if callable(close):
+        try:
+            close()
+        except Exception as error:
+            logger.debug(
+                "docker.logs.stream.close.fail",
+                error=sanitize_exception(error),
+            )
+
+
+@with_operation_logging("search_container_logs")
+def search_container_logs(
+    container_id: str,
+    *,
+    pattern: str | re.Pattern[str] | None = None,
+    severity: LogSeverity | str | None = None,
+    max_matches: int = LOG_SEARCH_MAX_MATCHES,
+    context_lines: int = LOG_SEARCH_CONTEXT_LINES,
+    time_budget_seconds: float = LOG_SEARCH_TIME_BUDGET_SECONDS,
+    tail_lines: int | None = LOG_SEARCH_TAIL_LINES,
+    include_timestamps: bool = True,
+) -> LogSearchResult:
+    """
+    Search the newest ``tail_lines`` of a container's log stream (``None`` for
+    the full log) without loading it into memory.
+
+    Logs are streamed from the daemon (``stream=True``) and filtered line by
+    line, keeping the newest ``max_matches``; the stream is closed at its end or
+    when the time budget runs out.
+
+    Raises:
+        ValueError: If the filters are invalid.
+        ContainerNotFoundError: If the container cannot be found.
+        ContainerLogsUnavailableError: If the logging driver is not readable.
+    """
+    matcher = build_log_line_matcher(pattern=pattern, severity=severity)
+    context = build_container_context(
+        container_id=container_id,
+        action="container_logs_search",
+        severity=str(severity) if severity is not None else None,
+        has_pattern=pattern is not None,
+        max_matches=max_matches,
+    )
+
+    try:
+        with docker_client_context() as adapter:
+            container = get_container_safely(container_id, docker_client=adapter)
+            stream = container.logs(
+                stream=True,
+                follow=False,
+                stdout=True,
+                stderr=True,
+                timestamps=include_timestamps,
+                tail="all" if tail_lines is None else tail_lines,
+            )
+            try:
+                result = search_log_lines(
+                    iter_log_lines(stream),
+                    matcher,
+                    max_matches=max_matches,
+                    context_lines=context_lines,
+                    time_budget_seconds=time_budget_seconds,
+                )
+            finally:
+                _close_log_stream(stream)
+
+        logger.debug(
+            "docker.logs.search.ok",
+            matches=result.match_count,
+            scanned_lines=result.scanned_lines,
+            limit_reached=result.limit_reached,
+            timed_out=result.timed_out,
+            execution_time=f"{result.elapsed_seconds:.3f}s",
+            **context,
+        )
+        return result
+
+    except ContainerNotFoundError:
+        logger.warning("docker.logs.search.not.found.warn", **context)
+        raise
+
+    except APIError as error:
+        if _is_logs_driver_not_readable_error(error):
+            raise _logs_unavailable_error(container_id) from error
+        raise
+
+
+class LogExportCompression(StrEnum):
+    """Compression formats supported by the streaming log export."""
+
+    GZIP = "gzip"
+    ZSTD = "zstd"
+
+
+_EXPORT_EXTENSIONS: Final[dict[LogExportCompression, str]] = {
+    LogExportCompression.GZIP: "gz",
+    LogExportCompression.ZSTD: "zst",
+}
+
+
+@dataclass(slots=True)
+class LogExport:
+    """Compressed log export backed by a spooled temporary file."""
+
+    file: IO[bytes]
+    compression: LogExportCompression
+    raw_bytes: int = 0
+    compressed_bytes: int = 0
+    truncated: bool = False
+    elapsed_seconds: float = 0.0
+
+    @property
+    def extension(self) -> str:
+        return _EXPORT_EXTENSIONS[self.compression]
+
+    def close(self) -> None:
+        self.file.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def _open_zstd_writer(fileobj: IO[bytes]) -> _CompressedWriter:
+    """Open a zstd writer from the stdlib (3.14+) or the ``zstandard`` package."""
+    try:
+        stdlib_zstd = import_module("compression.zstd")
+        writer: _CompressedWriter = stdlib_zstd.ZstdFile(fileobj, mode="w")
+        return writer
+    except ImportError:
+        pass
+
+    try:
+        zstandard = import_module("zstandard")
+    except ImportError as error:
+        raise ValueError(
+            "zstd log export requires Python 3.14+ or the 'zstandard' package"
+        ) from error
+
+    compressor = zstandard.ZstdCompressor(level=3)
+    stream_writer: _CompressedWriter = compressor.stream_writer(fileobj, closefd=False)
+    return stream_writer
+
+
+def resolve_log_export_compression(
+    requested: LogExportCompression | str,
+) -> LogExportCompression:
+    """Return the requested compression, falling back to gzip if zstd is missing."""
+    compression = LogExportCompression(requested)
+    if compression == LogExportCompression.ZSTD:
+        try:
+            import_module("compression.zstd")
+        except ImportError:
+            try:
+                import_module("zstandard")
+            except ImportError:
+                return LogExportCompression.GZIP
+    return compression
+
+
+def _open_compressed_writer(
+    compression: LogExportCompression, fileobj: IO[bytes]
+) -> _CompressedWriter:
+    if compression == LogExportCompression.ZSTD:
+        return _open_zstd_writer(fileobj)
+    return gzip.GzipFile(fileobj=fileobj, mode="wb", compresslevel=6, mtime=0)
+
+
+def _iter_line_batches(
+    chunks: Iterable[bytes | str], batch_bytes: int = LOG_EXPORT_BATCH_BYTES
+) -> Iterator[bytes]:
+    """
+    Group a Docker log stream into batches that end on a line boundary.
+
+    Batching keeps per-write overhead low while making sure text filters
+    never see a line split across two calls.
+    """
+    pending = bytearray()
+    for chunk in chunks:
+        pending += chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+        if len(pending) < batch_bytes:
+            continue
+
+        cut = pending.rfind(b"\n")
+        if cut == -1:
+            if len(pending) < batch_bytes * 4:
+                continue
+            cut = len(pending) - 1
+        yield bytes(pending[: cut + 1])
+        del pending[: cut + 1]
+
+    if pending:
+        yield bytes(pending)
+
+
+def write_compressed_log_export(
+    chunks: Iterable[bytes | str],
+    *,
+    compression: LogExportCompression = LogExportCompression.GZIP,
+    max_bytes: int = LOG_EXPORT_DEFAULT_MAX_BYTES,
+    text_filter: LogTextFilter | None = None,
+    time_budget_seconds: float = LOG_EXPORT_TIME_BUDGET_SECONDS,
+    spool_bytes: int = LOG_EXPORT_SPOOL_BYTES,
+    clock: Callable[[], float] = time.monotonic,
+) -> LogExport:
+    """
+    Compress a log stream into a spooled file without holding it in memory.
+
+    Output stays in memory up to ``spool_bytes`` and then spills to a
+    temporary file. Writing stops with a truncation notice once the compressed
+    size approaches ``max_bytes`` or the time budget runs out. The returned
+    file is rewound and ready to upload; the caller owns closing it.
+    """
+    if not 0 < max_bytes <= TELEGRAM_MAX_UPLOAD_BYTES:
+        raise ValueError(
+            f"max_bytes must be between 1 and {TELEGRAM_MAX_UPLOAD_BYTES} bytes"
+        )
+
+    started_at = clock()
+    deadline = started_at + time_budget_seconds
+    size_limit = max(max_bytes - LOG_EXPORT_SIZE_MARGIN_BYTES, max_bytes // 2)
+    spool: IO[bytes] = SpooledTemporaryFile(max_size=spool_bytes, mode="w+b")
+    export = LogExport(file=spool, compression=compression)
+
+    try:
+        writer = _open_compressed_writer(compression, spool)
+        try:
+            for batch in _iter_line_batches(chunks):
+                if clock() > deadline or spool.tell() >= size_limit:
+                    export.truncated = True
+                    break
+                if text_filter is not None:
+                    batch = text_filter(batch.decode("utf-8", errors="replace")).encode(
+                        "utf-8"
+                    )
+                writer.write(batch)
+                export.raw_bytes += len(batch)
+
+            if export.truncated:
+                writer.write(LOG_EXPORT_TRUNCATION_NOTICE)
+        finally:
+            writer.close()
+    except BaseException:
+        spool.close()
+        raise
+
+    export.compressed_bytes = spool.tell()
+    export.elapsed_seconds = clock() - started_at
+    spool.seek(0)
+    return export
+
+
+@with_operation_logging("export_container_logs")
+def export_container_logs(
+    container_id: str,
+    *,
+    compression: LogExportCompression | str = LogExportCompression.GZIP,
+    max_bytes: int = LOG_EXPORT_DEFAULT_MAX_BYTES,
+    text_filter: LogTextFilter | None = None,
+    include_timestamps: bool = True,
+) -> LogExport:
+    """
+    Stream the full container log into a compressed, size-capped export.
+
+    Raises:
+        ValueError: If the size cap is outside Telegram's upload limit.
+        ContainerNotFoundError: If the container cannot be found.
+        ContainerLogsUnavailableError: If the logging driver is not readable.
+    """
+    resolved_compression = resolve_log_export_compression(compression)
+    context = build_container_context(
+        container_id=container_id,
+        action="container_logs_export",
+        compression=resolved_compression.value,
+        max_bytes=max_bytes,
+    )
+
+    try:
+        with docker_client_context() as adapter:
+            container = get_container_safely(container_id, docker_client=adapter)
+            stream = container.logs(
+                stream=True,
+                follow=False,
+                stdout=True,
+                stderr=True,
+                timestamps=include_timestamps,
+            )
+            try:
+                export = write_compressed_log_export(
+                    stream,
+                    compression=resolved_compression,
+                    max_bytes=max_bytes,
+                    text_filter=text_filter,
+                )
+            finally:
+                _close_log_stream(stream)
+
+        logger.debug(
+            "docker.logs.export.ok",
+            raw_bytes=export.raw_bytes,
+            compressed_bytes=export.compressed_bytes,
+            truncated=export.truncated,
+            execution_time=f"{export.elapsed_seconds:.3f}s",
+            **context,
+        )
+        return export
+
+    except ContainerNotFoundError:
+        logger.warning("docker.logs.export.not.found.warn", **context)
+        raise
+
+    except APIError as error:
+        if _is_logs_driver_not_readable_error(error):
+            raise _logs_unavailable_error(container_id) from error
+        raise
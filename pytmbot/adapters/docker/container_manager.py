@@ -7,13 +7,15 @@ also providing basic information about the status of local servers.
 
 import time
 from collections.abc import Callable
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
 from datetime import datetime
 from functools import wraps
 from threading import RLock
 from typing import Final, NoReturn
 
+from docker.client import DockerClient
 from docker.errors import DockerException
 from docker.models.containers import Container
 
@@ -35,6 +37,146 @@ from pytmbot.utils import is_new_name_valid, sanitize_exception
 logger = Logger()
 session_manager = get_session_manager()
 
+COMPOSE_PROJECT_LABEL: Final[str] = "com.docker.compose.project"
+LIFECYCLE_EXECUTOR_WORKERS: Final[int] = 6
+BULK_EXECUTOR_WORKERS: Final[int] = 3
+BULK_OPERATION_MAX_CONTAINERS: Final[int] = 50
+_BULK_ACTIONS: Final[frozenset[ContainerAction]] = frozenset(
+    {ContainerAction.START, ContainerAction.STOP, ContainerAction.RESTART}
+)
+
+# Bulk workers block on lifecycle futures, so the two pools must stay separate
+# (and the lifecycle pool larger) to rule out executor self-deadlock.
+_executors: dict[str, ThreadPoolExecutor] = {}
+_executors_lock = RLock()
+
+
+def _get_executor(name: str, max_workers: int) -> ThreadPoolExecutor:
+    """Return a lazily created, process-wide executor for container operations."""
+    with _executors_lock:
+        executor = _executors.get(name)
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix=f"docker-{name}"
+            )
+            _executors[name] = executor
+        return executor
+
+
+def shutdown_container_executors(wait: bool = False) -> None:
+    """
+    Shut down the shared container operation executors on bot shutdown.
+
+    Queued operations are cancelled; the next operation recreates the executors.
+    """
+    with _executors_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=wait, cancel_futures=True)
+
+
+@dataclass(frozen=True, slots=True)
+class BulkContainerSelector:
+    """
+    Criteria selecting the containers of a bulk operation.
+
+    At least one criterion is required so a bulk call can never silently
+    target every container on the host.
+    """
+
+    compose_project: str | None = None
+    health: str | None = None
+    status: str | None = None
+
+    def __post_init__(self) -> None:
+        if not (self.compose_project or self.health or self.status):
+            raise ValueError("Bulk selector requires at least one criterion")
+
+    def docker_filters(self) -> dict[str, object]:
+        filters: dict[str, object] = {}
+        if self.compose_project:
+            filters["label"] = f"{COMPOSE_PROJECT_LABEL}={self.compose_project}"
+        if self.health:
+            filters["health"] = self.health
+        if self.status:
+            filters["status"] = self.status
+        return filters
+
+    def describe(self) -> str:
+        parts = [
+            f"{key}={value}"
+            for key, value in (
+                ("project", self.compose_project),
+                ("health", self.health),
+                ("status", self.status),
+            )
+            if value
+        ]
+        return ",".join(parts)
+
+
+@dataclass(frozen=True, slots=True)
+class BulkContainerOutcome:
+    """Result of one container within a bulk operation."""
+
+    container_name: str
+    ok: bool
+    error: str | None = None
+    elapsed_seconds: float = 0.0
+
+
+@dataclass(slots=True)
+class BulkOperationResult:
+    """Aggregated result of a bulk container operation."""
+
+    action: ContainerAction
+    selector: BulkContainerSelector
+    outcomes: list[BulkContainerOutcome] = field(default_factory=list)
+    skipped: int = 0
+
+    @property
+    def succeeded(self) -> list[BulkContainerOutcome]:
+        return [outcome for outcome in self.outcomes if outcome.ok]
+
+    @property
+    def failed(self) -> list[BulkContainerOutcome]:
+        return [outcome for outcome in self.outcomes if not outcome.ok]
+
+    def summary(self) -> str:
+        """Human-readable one-message summary of the bulk operation."""
+        verb = self.action.value.lower()
+        if not self.outcomes:
+            return f"No containers matched {self.selector.describe()}."
+
+        lines = [
+            f"Bulk {verb} ({self.selector.describe()}): "
+            f"{len(self.succeeded)} ok, {len(self.failed)} failed"
+        ]
+        lines.extend(f"✓ {outcome.container_name}" for outcome in self.succeeded)
+        lines.extend(
+            f"✗ {outcome.container_name}: {outcome.error}" for outcome in self.failed
+        )
+        if self.skipped:
+            lines.append(
+                f"{self.skipped} more container(s) skipped "
+                f"(limit {BULK_OPERATION_MAX_CONTAINERS})"
+            )
+        return "\n".join(lines)
+
+
+def get_compose_project(
+    container_id: str, docker_client: DockerClient | None = None
+) -> str | None:
+    """Return the compose project label of a container, if any."""
+    try:
+        container = get_container_safely(container_id, docker_client=docker_client)
+    except Exception:
+        return None
+    labels = getattr(container, "labels", None) or {}
+    project = labels.get(COMPOSE_PROJECT_LABEL) if isinstance(labels, dict) else None
+    return project if isinstance(project, str) and project else None
+
 
 def validate_access(
     func: Callable[..., DockerResponse],
@@ -243,15 +385,15 @@ class ContainerManager:
     ) -> None:
         """Execute an operation with a strict timeout guard."""
         timeout = timeout_seconds or self._max_operation_timeout
-        with ThreadPoolExecutor(max_workers=1) as executor:
-            future = executor.submit(operation)
-            try:
-                future.result(timeout=timeout)
-            except FutureTimeoutError as error:
-                future.cancel()
-                raise TimeoutError(
-                    f"Container operation '{operation_name}' exceeded {timeout:.1f}s"
-                ) from error
+        executor = _get_executor("lifecycle", LIFECYCLE_EXECUTOR_WORKERS)
+        future = executor.submit(operation)
+        try:
+            future.result(timeout=timeout)
+        except FutureTimeoutError as error:
+            future.cancel()
+            raise TimeoutError(
+                f"Container operation '{operation_name}' exceeded {timeout:.1f}s"
+            ) from error
 
     @staticmethod
     def _validate_container_state_for_operation(
@@ -363,29 +505,80 @@ class ContainerManager:
             )
             raise
 
+    def _perform_lifecycle_action(
+        self, action: ContainerAction, user_id: int, container_id: ContainerId
+    ) -> DockerResponse:
+        """Run start/stop/restart without access checks (callers authorize)."""
+        if action == ContainerAction.START:
+            start_timeout = float(
+                getattr(settings.docker, "start_timeout", self._max_operation_timeout)
+            )
+            return self._execute_lifecycle_operation(
+                user_id=user_id,
+                container_id=container_id,
+                operation="start",
+                context_action="container_start",
+                start_event="docker.containers.container.start",
+                success_event="docker.containers.container.start.ok",
+                fail_event="docker.containers.container.start.fail",
+                expected_statuses={"running", "restarting"},
+                expected_status_description="running/restarting",
+                execute_operation=lambda container: self._run_with_timeout(
+                    "start",
+                    container.start,
+                    start_timeout,
+                ),
+            )
+
+        if action == ContainerAction.STOP:
+            timeout = getattr(settings.docker, "stop_timeout", 10)
+            operation_timeout = max(float(timeout) + 5.0, self._max_operation_timeout)
+            return self._execute_lifecycle_operation(
+                user_id=user_id,
+                container_id=container_id,
+                operation="stop",
+                context_action="container_stop",
+                start_event="docker.containers.container.stop",
+                success_event="docker.containers.container.stop.ok",
+                fail_event="docker.containers.container.stop.fail",
+                expected_statuses={"exited", "stopped"},
+                expected_status_description="exited/stopped",
+                execute_operation=lambda container: self._run_with_timeout(
+                    "stop",
+                    lambda: container.stop(timeout=timeout),
+                    operation_timeout,
+                ),
+            )
+
+        if action == ContainerAction.RESTART:
+            timeout = getattr(settings.docker, "restart_timeout", 10)
+            operation_timeout = max(float(timeout) + 5.0, self._max_operation_timeout)
+            return self._execute_lifecycle_operation(
+                user_id=user_id,
+                container_id=container_id,
+                operation="restart",
+                context_action="container_restart",
+                start_event="docker.containers.restarting.container.start",
+                success_event="docker.containers.container.restarted.start",
+                fail_event="docker.containers.container.restart.fail",
+                expected_statuses={"running", "restarting"},
+                expected_status_description="running/restarting",
+                execute_operation=lambda container: self._run_with_timeout(
+                    "restart",
+                    lambda: container.restart(timeout=timeout),
+                    operation_timeout,
+                ),
+            )
+
+        raise ValueError(f"Unsupported lifecycle action: {action}")
+
     @validate_access
     def _start_container(
         self, user_id: int, container_id: ContainerId
     ) -> DockerResponse:
         """Starts a Docker container with enhanced validation and monitoring."""
-        start_timeout = float(
-            getattr(settings.docker, "start_timeout", self._max_operation_timeout)
-        )
-        return self._execute_lifecycle_operation(
-            user_id=user_id,
-            container_id=container_id,
-            operation="start",
-            context_action="container_start",
-            start_event="docker.containers.container.start",
-            success_event="docker.containers.container.start.ok",
-            fail_event="docker.containers.container.start.fail",
-            expected_statuses={"running", "restarting"},
-            expected_status_description="running/restarting",
-            execute_operation=lambda container: self._run_with_timeout(
-                "start",
-                container.start,
-                start_timeout,
-            ),
+        return self._perform_lifecycle_action(
+            ContainerAction.START, user_id, container_id
         )
 
     @validate_access
@@ -393,23 +586,8 @@ class ContainerManager:
         self, user_id: int, container_id: ContainerId
     ) -> DockerResponse:
         """Stops a Docker container with graceful shutdown and timeout handling."""
-        timeout = getattr(settings.docker, "stop_timeout", 10)
-        operation_timeout = max(float(timeout) + 5.0, self._max_operation_timeout)
-        return self._execute_lifecycle_operation(
-            user_id=user_id,
-            container_id=container_id,
-            operation="stop",
-            context_action="container_stop",
-            start_event="docker.containers.container.stop",
-            success_event="docker.containers.container.stop.ok",
-            fail_event="docker.containers.container.stop.fail",
-            expected_statuses={"exited", "stopped"},
-            expected_status_description="exited/stopped",
-            execute_operation=lambda container: self._run_with_timeout(
-                "stop",
-                lambda: container.stop(timeout=timeout),
-                operation_timeout,
-            ),
+        return self._perform_lifecycle_action(
+            ContainerAction.STOP, user_id, container_id
         )
 
     @validate_access
@@ -417,25 +595,17 @@ class ContainerManager:
         self, user_id: int, container_id: ContainerId
     ) -> DockerResponse:
         """Restarts a Docker container with enhanced monitoring."""
-        timeout = getattr(settings.docker, "restart_timeout", 10)
-        operation_timeout = max(float(timeout) + 5.0, self._max_operation_timeout)
-        return self._execute_lifecycle_operation(
-            user_id=user_id,
-            container_id=container_id,
-            operation="restart",
-            context_action="container_restart",
-            start_event="docker.containers.restarting.container.start",
-            success_event="docker.containers.container.restarted.start",
-            fail_event="docker.containers.container.restart.fail",
-            expected_statuses={"running", "restarting"},
-            expected_status_description="running/restarting",
-            execute_operation=lambda container: self._run_with_timeout(
-                "restart",
-                lambda: container.restart(timeout=timeout),
-                operation_timeout,
-            ),
+        return self._perform_lifecycle_action(
+            ContainerAction.RESTART, user_id, container_id
         )
 
+    @validate_access
+    def _authorize_bulk_operation(
+        self, user_id: int, container_id: ContainerId
+    ) -> DockerResponse:
+        """Apply admin, session and rate-limit checks once per bulk request."""
+        return None
+
     @validate_access
     def _rename_container(
         self, user_id: int, container_id: ContainerId, new_container_name: str
@@ -628,3 +798,138 @@ class ContainerManager:
                 **context,
             )
             raise
+
+    def _select_bulk_containers(self, selector: BulkContainerSelector) -> list[str]:
+        """Return names of containers matching a bulk selector."""
+        with docker_client_context() as adapter:
+            containers = adapter.containers.list(
+                all=True, filters=selector.docker_filters()
+            )
+        return sorted(
+            name for container in containers if (name := getattr(container, "name", ""))
+        )
+
+    def _run_bulk_item(
+        self,
+        action: ContainerAction,
+        user_id: int,
+        container_name: str,
+        started: dict[str, float],
+    ) -> BulkContainerOutcome:
+        started[container_name] = time.monotonic()
+        started_at = time.time()
+        try:
+            self._perform_lifecycle_action(action, user_id, container_name)
+        except Exception as error:
+            return BulkContainerOutcome(
+                container_name=container_name,
+                ok=False,
+                error=sanitize_exception(error),
+                elapsed_seconds=time.time() - started_at,
+            )
+        return BulkContainerOutcome(
+            container_name=container_name,
+            ok=True,
+            elapsed_seconds=time.time() - started_at,
+        )
+
+    def bulk_operation(
+        self,
+        user_id: int,
+        action: str | ContainerAction,
+        selector: BulkContainerSelector,
+        *,
+        per_container_timeout: float | None = None,
+    ) -> BulkOperationResult:
+        """
+        Run start/stop/restart on every container matching ``selector`` in parallel.
+
+        Access is validated once for the whole request (admin, session, rate
+        limit); containers then run on the shared bulk executor. Each one is
+        bounded by ``per_container_timeout`` from the moment it starts; one that
+        never gets a worker gives up after its share of the whole batch
+        (``per_container_timeout`` per wave). Failures are collected, not raised.
+
+        Raises:
+            PermissionError: If the user may not manage containers.
+            ValueError: If the action is not a bulk lifecycle action.
+        """
+        container_action = (
+            action
+            if isinstance(action, ContainerAction)
+            else ContainerAction.from_str(action)
+        )
+        if container_action not in _BULK_ACTIONS:
+            raise ValueError(f"Unsupported bulk action: {container_action}")
+
+        self._authorize_bulk_operation(user_id, f"bulk:{selector.describe()}")
+
+        context = {
+            "action": "container_bulk_operation",
+            "operation": container_action.value,
+            "selector": selector.describe(),
+            "user_id": user_id,
+        }
+        started_at = time.time()
+        names = self._select_bulk_containers(selector)
+        result = BulkOperationResult(action=container_action, selector=selector)
+        result.skipped = max(0, len(names) - BULK_OPERATION_MAX_CONTAINERS)
+        names = names[:BULK_OPERATION_MAX_CONTAINERS]
+
+        item_timeout = per_container_timeout or (self._max_operation_timeout + 15.0)
+        executor = _get_executor("bulk", BULK_EXECUTOR_WORKERS)
+        started: dict[str, float] = {}
+        pending: dict[Future[BulkContainerOutcome], str] = {
+            executor.submit(
+                self._run_bulk_item, container_action, user_id, name, started
+            ): name
+            for name in names
+        }
+        waves = max(1, -(-len(pending) // BULK_EXECUTOR_WORKERS))
+        queue_deadline = time.monotonic() + item_timeout * waves
+        outcomes: dict[str, BulkContainerOutcome] = {}
+
+        while pending:
+            now = time.monotonic()
+            next_deadline = queue_deadline
+            for future, name in list(pending.items()):
+                if future.done():
+                    outcomes[name] = future.result()
+                elif (began := started.get(name)) is not None:
+                    if now < began + item_timeout:
+                        next_deadline = min(next_deadline, began + item_timeout)
+                        continue
+                    outcomes[name] = BulkContainerOutcome(
+                        container_name=name,
+                        ok=False,
+                        error=f"timed out after {item_timeout:.0f}s",
+                        elapsed_seconds=now - began,
+                    )
+                elif now < queue_deadline or not future.cancel():
+                    # Still queued, or a worker picked it up just now.
+                    continue
+                else:
+                    outcomes[name] = BulkContainerOutcome(
+                        container_name=name,
+                        ok=False,
+                        error="not started: no worker became free in time",
+                    )
+                del pending[future]
+            if pending:
+                wait(
+                    pending,
+                    timeout=max(0.0, next_deadline - now),
+                    return_when=FIRST_COMPLETED,
+                )
+        result.outcomes = [outcomes[name] for name in names]
+
+        logger.info(
+            "docker.containers.bulk.operation.ok",
+            matched=len(names),
+            succeeded=len(result.succeeded),
+            failed=len(result.failed),
+            skipped=result.skipped,
+            execution_time=f"{time.time() - started_at:.2f}s",
+            **context,
+        )
+        return result
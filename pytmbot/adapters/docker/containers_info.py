@@ -14,7 +14,11 @@ from docker.client import DockerClient
 from docker.errors import APIError
 from docker.models.containers import Container
 
-from pytmbot.adapters.docker.client import docker_client_context
+from pytmbot.adapters.docker.client import (
+    docker_client_context,
+    docker_endpoint_names,
+    docker_fan_out,
+)
 from pytmbot.adapters.docker.utils import (
     build_container_context,
     get_container_safely,
@@ -23,6 +27,7 @@ from pytmbot.adapters.docker.utils import (
 from pytmbot.exceptions import (
     ContainerLogsUnavailableError,
     ContainerNotFoundError,
+    DockerConnectionError,
     ErrorContext,
 )
 from pytmbot.logs import Logger
@@ -34,6 +39,12 @@ logger = Logger()
 CACHE_TTL: Final[int] = 60  # Cache TTL in seconds
 MAX_LOG_TAIL: Final[int] = 100  # Maximum log lines to fetch
 DOCKER_COUNTERS_CACHE_TTL: Final[float] = 30.0
+_DOCKER_COUNTER_KEYS: Final[tuple[str, ...]] = (
+    "images_count",
+    "containers_count",
+    "running_containers",
+    "stopped_containers",
+)
 _LOGS_DRIVER_NOT_READABLE_MARKER: Final[str] = (
     "configured logging driver does not support reading"
 )
@@ -315,11 +326,89 @@ def __aggregate_container_details(
         raise
 
 
+def _collect_container_details(
+    adapter: DockerClient, context: dict[str, str]
+) -> tuple[list[dict[str, str]], list[str], int]:
+    """Return ``(details, failed container ids, total containers)`` for one daemon."""
+    container_objects = adapter.containers.list(all=True)
+    if not container_objects:
+        return [], [], 0
+
+    logger.info(
+        "docker.containers.single.list.start",
+        containers_count=len(container_objects),
+        **context,
+    )
+
+    container_details: list[dict[str, str]] = []
+    failed_containers: list[str] = []
+    for container in container_objects:
+        container_id = (
+            getattr(container, "short_id", "")
+            or str(getattr(container, "id", ""))[:12]
+            or "unknown"
+        )
+        try:
+            details = __aggregate_container_details(container, adapter)
+            container_details.append(details)
+        except ContainerNotFoundError:
+            failed_containers.append(container_id)
+            logger.debug(
+                "docker.containers.container.not.debug",
+                container_id=container_id,
+                **context,
+            )
+        except Exception as e:
+            failed_containers.append(container_id)
+            logger.error(
+                "docker.containers.container.details.fail",
+                container_id=container_id,
+                error=sanitize_exception(e),
+                error_type=type(e).__name__,
+                **context,
+            )
+    return container_details, failed_containers, len(container_objects)
+
+
+def _collect_endpoint_container_details(
+    context: dict[str, str],
+) -> tuple[list[dict[str, str]], list[str], int]:
+    """
+    Fan the container listing out to every endpoint and merge the answers.
+
+    Each entry gets an ``endpoint`` key. Endpoints that fail or time out are
+    left out; only a failure of every endpoint raises.
+    """
+    fan_out = docker_fan_out(
+        lambda adapter: _collect_container_details(adapter, context)
+    )
+    if not fan_out.results:
+        raise DockerConnectionError(f"No Docker endpoint answered: {fan_out.failures}")
+
+    container_details: list[dict[str, str]] = []
+    failed_containers: list[str] = []
+    total_containers = 0
+    for endpoint_name in docker_endpoint_names():
+        if endpoint_name not in fan_out.results:
+            continue
+        details, failed, total = fan_out.results[endpoint_name]
+        # Copies: the per-container details are shared through _container_cache.
+        container_details.extend(
+            {**item, "endpoint": endpoint_name} for item in details
+        )
+        failed_containers.extend(failed)
+        total_containers += total
+    return container_details, failed_containers, total_containers
+
+
 @with_operation_logging("retrieve_containers_stats")
 def retrieve_containers_stats() -> list[dict[str, str]]:
     """
     Retrieve and return details of Docker containers with a single list roundtrip.
 
+    With several Docker endpoints configured the lists are fetched concurrently and
+    merged; each entry then names its ``endpoint``, and unreachable daemons are skipped.
+
     Returns:
         List of container details dictionaries.
 
@@ -330,45 +419,18 @@ def retrieve_containers_stats() -> list[dict[str, str]]:
     start_time = time.time()
 
     try:
-        with docker_client_context() as adapter:
-            container_objects = adapter.containers.list(all=True)
-            if not container_objects:
-                logger.info("docker.containers.no.found.info", **context)
-                return []
-
-            logger.info(
-                "docker.containers.single.list.start",
-                containers_count=len(container_objects),
-                **context,
+        if len(docker_endpoint_names()) > 1:
+            container_details, failed_containers, total_containers = (
+                _collect_endpoint_container_details(context)
             )
-
-            container_details: list[dict[str, str]] = []
-            failed_containers: list[str] = []
-            for container in container_objects:
-                container_id = (
-                    getattr(container, "short_id", "")
-                    or str(getattr(container, "id", ""))[:12]
-                    or "unknown"
+        else:
+            with docker_client_context() as adapter:
+                container_details, failed_containers, total_containers = (
+                    _collect_container_details(adapter, context)
                 )
-                try:
-                    details = __aggregate_container_details(container, adapter)
-                    container_details.append(details)
-                except ContainerNotFoundError:
-                    failed_containers.append(container_id)
-                    logger.debug(
-                        "docker.containers.container.not.debug",
-                        container_id=container_id,
-                        **context,
-                    )
-                except Exception as e:
-                    failed_containers.append(container_id)
-                    logger.error(
-                        "docker.containers.container.details.fail",
-                        container_id=container_id,
-                        error=sanitize_exception(e),
-                        error_type=type(e).__name__,
-                        **context,
-                    )
+        if not total_containers:
+            logger.info("docker.containers.no.found.info", **context)
+            return []
 
         execution_time = time.time() - start_time
 
@@ -382,7 +444,7 @@ def retrieve_containers_stats() -> list[dict[str, str]]:
             successful_count=len(container_details),
             failed_count=len(failed_containers),
             timeout_count=0,
-            total_containers=len(container_objects),
+            total_containers=total_containers,
             execution_time=f"{execution_time:.2f}s",
             **context,
         )
@@ -517,11 +579,29 @@ def fetch_container_logs(
         raise
 
 
+def _count_docker_objects(adapter: DockerClient) -> dict[str, int]:
+    images_count = len(adapter.images.list(all=False))  # Only non-dangling images
+    containers = adapter.containers.list(all=True)
+    containers_count = len(containers)
+    running_containers = sum(
+        1 for container in containers if getattr(container, "status", "") == "running"
+    )
+    return {
+        "images_count": images_count,
+        "containers_count": containers_count,
+        "running_containers": running_containers,
+        "stopped_containers": containers_count - running_containers,
+    }
+
+
 @with_operation_logging("fetch_docker_counters")
 def fetch_docker_counters(*, force_refresh: bool = False) -> dict[str, int]:
     """
     Fetches Docker image and container counts with caching.
 
+    With several Docker endpoints configured the counts are summed over the
+    endpoints that answered in time, and ``unreachable_endpoints`` is added.
+
     Returns:
         Dict with image and container counts.
 
@@ -538,37 +618,36 @@ def fetch_docker_counters(*, force_refresh: bool = False) -> dict[str, int]:
                 logger.debug("docker.containers.counters.cache.hit.debug", **context)
                 return cached_counters
 
-        with docker_client_context() as adapter:
-            # Use list comprehensions for better performance
-            images_count = len(
-                adapter.images.list(all=False)
-            )  # Only non-dangling images
-            containers = adapter.containers.list(all=True)
-            containers_count = len(containers)
-            running_containers = sum(
-                1
-                for container in containers
-                if getattr(container, "status", "") == "running"
-            )
-
+        unreachable: dict[str, str] = {}
+        if len(docker_endpoint_names()) > 1:
+            fan_out = docker_fan_out(_count_docker_objects)
+            if not fan_out.results:
+                raise DockerConnectionError(
+                    f"No Docker endpoint answered: {fan_out.failures}"
+                )
+            unreachable = fan_out.failures
             counters = {
-                "images_count": images_count,
-                "containers_count": containers_count,
-                "running_containers": running_containers,
-                "stopped_containers": containers_count - running_containers,
+                key: sum(result[key] for result in fan_out.results.values())
+                for key in _DOCKER_COUNTER_KEYS
             }
+            counters["unreachable_endpoints"] = len(unreachable)
+        else:
+            with docker_client_context() as adapter:
+                counters = _count_docker_objects(adapter)
 
-            execution_time = time.time() - start_time
+        execution_time = time.time() - start_time
 
-            logger.info(
-                "docker.containers.counters.fetch.info",
-                execution_time=f"{execution_time:.3f}s",
-                **counters,
-                **context,
-            )
+        logger.info(
+            "docker.containers.counters.fetch.info",
+            execution_time=f"{execution_time:.3f}s",
+            **counters,
+            **context,
+        )
 
+        # Partial totals are returned but not cached, so the next view retries.
+        if not unreachable:
             _store_docker_counters(counters)
-            return counters
+        return counters
 
     except Exception as e:
         execution_time = time.time() - start_time
@@ -0,0 +1,67 @@
+#!/usr/local/bin/python3
+"""
+(c) Copyright 2025, Denis Rozhnovskiy <pytelemonbot@mail.ru>
+pyTMBot - A simple Telegram bot to handle Docker containers and images,
+also providing basic information about the status of local servers.
+
+Named Docker daemon endpoints.
+
+Without ``docker.endpoints`` the bot talks to ``docker.host[0]`` exactly as before,
+under the name :data:`PRIMARY_ENDPOINT_NAME`. With it, the first endpoint is the
+primary one used for single-container actions, and aggregate views fan out to all.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Final
+
+PRIMARY_ENDPOINT_NAME: Final[str] = "local"
+DEFAULT_QUERY_TIMEOUT_SECONDS: Final[float] = 5.0
+
+
+@dataclass(frozen=True, slots=True)
+class DockerEndpoint:
+    name: str
+    url: str
+    tls_ca_cert: str | None = None
+    tls_client_cert: str | None = None
+    tls_client_key: str | None = None
+    tls_verify_hostname: bool = True
+    query_timeout_seconds: float = DEFAULT_QUERY_TIMEOUT_SECONDS
+
+    @property
+    def uses_tls(self) -> bool:
+        return self.url.startswith("https://") or bool(
+            self.tls_ca_cert or self.tls_client_cert
+        )
+
+
+def resolve_docker_endpoints(docker_settings: object) -> tuple[DockerEndpoint, ...]:
+    """
+    Build endpoints from the ``docker`` settings section.
+
+    Returns an empty tuple when ``endpoints`` is not configured, which keeps the
+    legacy single-host adapter (``docker.host[0]``) in charge.
+    """
+    configured = getattr(docker_settings, "endpoints", None) or ()
+    return tuple(
+        DockerEndpoint(
+            name=endpoint.name,
+            url=endpoint.host.strip(),
+            tls_ca_cert=endpoint.tls_ca_cert,
+            tls_client_cert=endpoint.tls_client_cert,
+            tls_client_key=endpoint.tls_client_key,
+            tls_verify_hostname=endpoint.tls_verify_hostname,
+            query_timeout_seconds=endpoint.query_timeout_seconds,
+        )
+        for endpoint in configured
+    )
+
+
+__all__ = [
+    "DEFAULT_QUERY_TIMEOUT_SECONDS",
+    "PRIMARY_ENDPOINT_NAME",
+    "DockerEndpoint",
+    "resolve_docker_endpoints",
+]
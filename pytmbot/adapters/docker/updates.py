@@ -20,10 +20,16 @@ from typing import Any, Final
 import aiohttp
 from aiohttp import ClientError, ClientResponseError, ClientSession, ClientTimeout
 from dateutil.parser import ParserError, isoparse
+from docker.models.images import Image
 from packaging import version
 from packaging.version import InvalidVersion
 
-from pytmbot.adapters.docker.client import docker_client_context
+from pytmbot.adapters.docker.client import (
+    docker_client_context,
+    docker_endpoint_names,
+    docker_fan_out,
+)
+from pytmbot.exceptions import DockerConnectionError
 from pytmbot.logs import BaseComponent
 from pytmbot.models.docker_models import TagInfo, UpdateInfo
 from pytmbot.utils import sanitize_exception
@@ -473,19 +479,34 @@ def _process_local_image_tags(
             if not repo or len(repo) > 255:
                 continue
 
-            local_images.setdefault(repo, []).append(
-                {
-                    "tag": tag_version,
-                    "created_at": created_at,
-                    "digest": digest,
-                }
-            )
+            entry: dict[str, str | None] = {
+                "tag": tag_version,
+                "created_at": created_at,
+                "digest": digest,
+            }
+            repo_tags = local_images.setdefault(repo, [])
+            if entry not in repo_tags:
+                repo_tags.append(entry)
         except ValueError:
             log.warning("docker.updates.invalid.tag.warn")
         except Exception:
             log.warning("docker.updates.processing.tag.fail")
 
 
+def _list_local_images() -> list[Image]:
+    """List top-level images, from every Docker endpoint when several are configured."""
+    endpoint_names = docker_endpoint_names()
+    if len(endpoint_names) == 1:
+        with docker_client_context() as adapter:
+            return list(adapter.images.list(all=False))
+
+    fan_out = docker_fan_out(lambda adapter: adapter.images.list(all=False))
+    if not fan_out.results:
+        raise DockerConnectionError(f"No Docker endpoint answered: {fan_out.failures}")
+    # The same image pulled on several daemons yields one catalog entry per tag.
+    return [image for name in endpoint_names for image in fan_out.results.get(name, [])]
+
+
 def _build_repository_urls(repo: str) -> list[str]:
     """Build Docker Hub repository endpoints for a repository name."""
     normalized_repo = repo.strip().strip("/")
@@ -667,7 +688,13 @@ class _UpdaterTagCache:
 
 
 class _UpdaterSyncBridge:
-    """Own the background event loop used by sync callers."""
+    """
+    Own the background event loop used by sync callers.
+
+    This stays separate from the plugin runtime: update checks are core Docker
+    features that work without any plugin loaded, while the plugin runtime belongs
+    to ``PluginManager`` and is shut down and replaced with the plugins.
+    """
 
     def __init__(self) -> None:
         self.lock = RLock()
@@ -1161,35 +1188,34 @@ class DockerImageUpdater(BaseComponent):
         skipped_count = 0
 
         try:
-            with docker_client_context() as adapter:
-                images = adapter.images.list(all=False)
-                self._log.debug("docker.updates.found.local.debug")
+            images = _list_local_images()
+            self._log.debug("docker.updates.found.local.debug")
 
-                for image in images:
-                    try:
-                        if not image.tags:
-                            skipped_count += 1
-                            self._log.debug("docker.updates.skipping.image.debug")
-                            continue
-
-                        digest = _extract_image_digest(image, log=self._log)
-                        _process_local_image_tags(
-                            image,
-                            digest,
-                            local_images,
-                            log=self._log,
-                            parse_tag=_parse_image_tag,
-                        )
-                        processed_count += 1
-
-                    except Exception as e:
+            for image in images:
+                try:
+                    if not image.tags:
                         skipped_count += 1
-                        self._log.warning(
-                            "docker.updates.image.fail",
-                            error=sanitize_exception(e),
-                        )
+                        self._log.debug("docker.updates.skipping.image.debug")
                         continue
 
+                    digest = _extract_image_digest(image, log=self._log)
+                    _process_local_image_tags(
+                        image,
+                        digest,
+                        local_images,
+                        log=self._log,
+                        parse_tag=_parse_image_tag,
+                    )
+                    processed_count += 1
+
+                except Exception as e:
+                    skipped_count += 1
+                    self._log.warning(
+                        "docker.updates.image.fail",
+                        error=sanitize_exception(e),
+                    )
+                    continue
+
         except Exception:
             self._log.error("docker.updates.fetch.local.fail")
             raise
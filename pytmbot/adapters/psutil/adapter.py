@@ -8,7 +8,6 @@ also providing basic information about the status of local servers.
 import concurrent.futures
 import heapq
 import socket
-import threading
 import time
 from collections import OrderedDict
 from collections.abc import Callable, Mapping
@@ -41,6 +40,7 @@ from pytmbot.adapters.psutil.adapter_types import (
 )
 from pytmbot.logs import Logger
 from pytmbot.utils import set_naturalsize
+from pytmbot.utils.housekeeping import HousekeepingJob, get_housekeeping_scheduler
 
 logger = Logger()
 P = ParamSpec("P")
@@ -110,7 +110,6 @@ class PsutilAdapter:
     _MAX_TOP_PROCESSES = 20
     _CPU_WARMUP_INTERVAL_SECONDS = 1.0
     _CPU_USAGE_SAMPLE_PERIOD_SECONDS = 5.0
-    _CPU_WARMUP_THREAD_JOIN_TIMEOUT_SECONDS = 1.5
     _MEMORY_ATTRS = frozenset(
         [
             "total",
@@ -130,8 +129,8 @@ class PsutilAdapter:
         self._lock = RLock()  # Thread safety for instance-level operations
         self._cpu_usage_lock = RLock()
         self._cpu_usage_snapshot: CPUUsageStats | None = None
-        self._cpu_warmup_stop_event = threading.Event()
-        self._cpu_warmup_thread: threading.Thread | None = None
+        self._cpu_times_baseline: list[tuple[float, float]] | None = None
+        self._cpu_warmup_job: HousekeepingJob | None = None
         self._timeout_executor = concurrent.futures.ThreadPoolExecutor(
             max_workers=2,
             thread_name_prefix="psutil_timeout",
@@ -139,65 +138,85 @@ class PsutilAdapter:
         self._start_cpu_warmup()
 
     def _start_cpu_warmup(self) -> None:
-        """Start background CPU sampling to avoid blocking request handlers."""
-        if self._cpu_warmup_thread and self._cpu_warmup_thread.is_alive():
+        """Schedule background CPU sampling to avoid blocking request handlers."""
+        if self._cpu_warmup_job is not None and not self._cpu_warmup_job.cancelled:
             return
 
-        self._cpu_warmup_stop_event.clear()
-        self._cpu_warmup_thread = threading.Thread(
-            target=self._cpu_warmup_worker,
-            name="PsutilCpuWarmup",
-            daemon=True,
+        # Prime this adapter's baseline; every later sample measures the delta.
+        with suppress(Exception), self._cpu_usage_lock:
+            self._cpu_times_baseline = self._read_cpu_times()
+
+        self._cpu_warmup_job = get_housekeeping_scheduler().register(
+            f"psutil_cpu_sample:{id(self):x}",
+            self._sample_cpu_usage,
+            interval=self._CPU_USAGE_SAMPLE_PERIOD_SECONDS,
+            initial_delay=self._CPU_WARMUP_INTERVAL_SECONDS,
         )
-        self._cpu_warmup_thread.start()
 
-    def _cpu_warmup_worker(self) -> None:
-        """Collect CPU usage snapshots at a fixed cadence."""
-        with suppress(Exception):
-            self._psutil.cpu_percent(interval=0.0)
-            self._psutil.cpu_percent(interval=0.0, percpu=True)
+    def _read_cpu_times(self) -> list[tuple[float, float]]:
+        """
+        Read ``(busy, total)`` CPU seconds per core.
 
-        while not self._cpu_warmup_stop_event.is_set():
-            sample_start = time.monotonic()
-            try:
-                per_core_raw = self._psutil.cpu_percent(
-                    interval=self._CPU_WARMUP_INTERVAL_SECONDS,
-                    percpu=True,
-                )
-                per_core_values = [
-                    round(float(value), 1)
-                    for value in per_core_raw
-                    if isinstance(value, (int, float))
-                ]
-                if per_core_values:
-                    overall = round(sum(per_core_values) / len(per_core_values), 1)
-                else:
-                    overall_raw = self._psutil.cpu_percent(interval=0.0)
-                    overall = (
-                        round(float(overall_raw), 1)
-                        if isinstance(overall_raw, (int, float))
-                        else 0.0
-                    )
+        Deltas are computed from these explicitly because ``cpu_percent(interval=0)``
+        keeps its previous reading per calling thread and shares it between all
+        adapters in the process.
+        """
+        busy_total: list[tuple[float, float]] = []
+        for entry in self._psutil.cpu_times(percpu=True):
+            values = entry._asdict()
+            # Guest time is already accounted in user/nice on Linux.
+            total = (
+                sum(values.values())
+                - values.get("guest", 0.0)
+                - values.get("guest_nice", 0.0)
+            )
+            idle = values.get("idle", 0.0) + values.get("iowait", 0.0)
+            busy_total.append((total - idle, total))
+        return busy_total
 
-                snapshot: CPUUsageStats = {
-                    "cpu_percent": overall,
-                    "cpu_percent_per_core": per_core_values,
-                }
+    @staticmethod
+    def _busy_percent(busy_delta: float, total_delta: float) -> float:
+        if total_delta <= 0.0:
+            return 0.0
+        return round(min(100.0, max(0.0, busy_delta / total_delta * 100.0)), 1)
+
+    def _measure_cpu_usage(self) -> CPUUsageStats | None:
+        """Return usage since this adapter's previous measurement and advance the baseline."""
+        current = self._read_cpu_times()
+        with self._cpu_usage_lock:
+            previous, self._cpu_times_baseline = self._cpu_times_baseline, current
+        if previous is None or len(previous) != len(current):
+            return None
+
+        deltas = [
+            (busy - prev_busy, total - prev_total)
+            for (busy, total), (prev_busy, prev_total) in zip(
+                current, previous, strict=True
+            )
+        ]
+        overall = self._busy_percent(
+            sum(busy for busy, _ in deltas), sum(total for _, total in deltas)
+        )
+        return {
+            "cpu_percent": overall,
+            "cpu_percent_per_core": [
+                self._busy_percent(busy, total) for busy, total in deltas
+            ],
+        }
+
+    def _sample_cpu_usage(self) -> None:
+        """Store CPU usage accumulated since the previous sample."""
+        try:
+            snapshot = self._measure_cpu_usage()
+            if snapshot is not None:
                 with self._cpu_usage_lock:
                     self._cpu_usage_snapshot = snapshot
-            except Exception as error:
-                logger.debug(
-                    "bot.system.cpu.warmup.fail",
-                    error=str(error),
-                    error_type=type(error).__name__,
-                )
-
-            elapsed_seconds = time.monotonic() - sample_start
-            sleep_seconds = max(
-                0.0, self._CPU_USAGE_SAMPLE_PERIOD_SECONDS - elapsed_seconds
+        except Exception as error:
+            logger.debug(
+                "bot.system.cpu.warmup.fail",
+                error=str(error),
+                error_type=type(error).__name__,
             )
-            if self._cpu_warmup_stop_event.wait(timeout=sleep_seconds):
-                break
 
     def _safe_execute(
         self,
@@ -219,9 +238,14 @@ class PsutilAdapter:
             log_context: Additional context for logging
         """
         start_time = time.perf_counter()
-        span_context: dict[str, object] = dict(log_context or {})
-        span_context["operation"] = operation
-        span_context["span_id"] = uuid4().hex[:8]
+
+        def span_context() -> dict[str, object]:
+            # Only failures are logged, so the span ID is minted lazily.
+            return {
+                **(log_context or {}),
+                "operation": operation,
+                "span_id": uuid4().hex[:8],
+            }
 
         try:
             if timeout:
@@ -241,7 +265,7 @@ class PsutilAdapter:
                 "bot.system.timed.warn",
                 timeout_seconds=timeout,
                 ms=round(execution_time_ms, 2),
-                **span_context,
+                **span_context(),
             )
             return fallback, execution_time_ms
 
@@ -252,7 +276,7 @@ class PsutilAdapter:
                 error=str(e),
                 error_type=type(e).__name__,
                 ms=round(execution_time_ms, 2),
-                **span_context,
+                **span_context(),
             )
             return fallback, execution_time_ms
 
@@ -263,21 +287,15 @@ class PsutilAdapter:
                 error=str(e),
                 error_type=type(e).__name__,
                 ms=round(execution_time_ms, 2),
-                **span_context,
+                **span_context(),
             )
             return fallback, execution_time_ms
 
     def close(self) -> None:
         """Release shared executor resources."""
-        self._cpu_warmup_stop_event.set()
-        warmup_thread = self._cpu_warmup_thread
-        if (
-            warmup_thread is not None
-            and warmup_thread.is_alive()
-            and warmup_thread is not threading.current_thread()
-        ):
-            warmup_thread.join(timeout=self._CPU_WARMUP_THREAD_JOIN_TIMEOUT_SECONDS)
-        self._cpu_warmup_thread = None
+        warmup_job, self._cpu_warmup_job = self._cpu_warmup_job, None
+        if warmup_job is not None:
+            warmup_job.cancel()
         self._timeout_executor.shutdown(wait=False, cancel_futures=True)
 
     def __del__(self) -> None:
@@ -294,9 +312,10 @@ class PsutilAdapter:
         **context: object,
     ) -> None:
         """Log a single operation result line with semantic level by latency."""
-        payload = {**context, "ms": round(execution_time_ms, 2)}
-
         level = "debug" if execution_time_ms < 100 else "info"
+        if not logger.is_enabled_for(level):
+            return
+        payload = {**context, "ms": round(execution_time_ms, 2)}
         getattr(logger, level)(event, **payload)
 
     @staticmethod
@@ -306,6 +325,8 @@ class PsutilAdapter:
         **context: object,
     ) -> None:
         """Log low-priority periodic operation results on TRACE."""
+        if not logger.is_enabled_for("TRACE"):
+            return
         payload = {**context, "ms": round(execution_time_ms, 2)}
         logger.trace(event, **payload)
 
@@ -1051,26 +1072,10 @@ class PsutilAdapter:
                     ),
                 }
 
-            cpu_per_core_raw = self._psutil.cpu_percent(interval=0.0, percpu=True)
-            cpu_per_core = [
-                round(float(core), 1)
-                for core in cpu_per_core_raw
-                if isinstance(core, (int, float))
-            ]
-            if cpu_per_core and any(core > 0.0 for core in cpu_per_core):
-                cpu_percent = round(sum(cpu_per_core) / len(cpu_per_core), 1)
-            else:
-                cpu_percent_raw = self._psutil.cpu_percent(interval=0.0)
-                cpu_percent = (
-                    round(float(cpu_percent_raw), 1)
-                    if isinstance(cpu_percent_raw, (int, float))
-                    else 0.0
-                )
-
-            snapshot: CPUUsageStats = {
-                "cpu_percent": cpu_percent,
-                "cpu_percent_per_core": cpu_per_core,
-            }
+            snapshot = self._measure_cpu_usage()
+            if snapshot is None:
+                # No baseline yet: nothing has been measured over an interval.
+                return {"cpu_percent": 0.0, "cpu_percent_per_core": []}
             with self._cpu_usage_lock:
                 self._cpu_usage_snapshot = snapshot
             return snapshot
@@ -0,0 +1,13 @@
+#!/usr/local/bin/python3
+"""
+(c) Copyright 2025, Denis Rozhnovskiy <pytelemonbot@mail.ru>
+pyTMBot - A simple Telegram bot to handle Docker containers and images,
+also providing basic information about the status of local servers.
+
+Multi-host agent mode.
+
+``python -m pytmbot.agent`` runs only the system and Docker collectors and streams
+their snapshots to a central pyTMBot instance, which ingests them through
+:mod:`pytmbot.agent.server`. Submodules are imported directly so that the agent
+process never loads the bot, handler or template stack.
+"""
@@ -0,0 +1,58 @@
+#!/usr/local/bin/python3
+"""
+(c) Copyright 2025, Denis Rozhnovskiy <pytelemonbot@mail.ru>
+pyTMBot - A simple Telegram bot to handle Docker containers and images,
+also providing basic information about the status of local servers.
+
+Entry point for ``python -m pytmbot.agent``.
+
+The agent is configured through ``PYTMBOT_AGENT_*`` environment variables and
+accepts the bot's ``--log-level`` / ``--log-format`` flags. It loads no bot settings,
+handlers, templates or Telegram client.
+"""
+
+from __future__ import annotations
+
+import signal
+import sys
+from types import FrameType
+
+from pytmbot.agent.client import AgentClient, AgentConfig
+from pytmbot.agent.collector import SnapshotCollector
+from pytmbot.logs import Logger
+
+
+def main() -> int:
+    logger = Logger()
+    try:
+        config = AgentConfig.from_env()
+    except ValueError as error:
+        logger.error("bot.agent.config.fail", error=str(error))
+        return 2
+
+    collector = SnapshotCollector(docker_host=config.docker_host)
+    client = AgentClient(config, collector.collect)
+
+    def _stop(signum: int, frame: FrameType | None) -> None:
+        _ = frame
+        logger.info("bot.agent.stop", signal=signal.Signals(signum).name)
+        client.stop()
+
+    signal.signal(signal.SIGINT, _stop)
+    signal.signal(signal.SIGTERM, _stop)
+    logger.info(
+        "bot.agent.start",
+        server=str(config.server),
+        host_id=config.host_id,
+        interval_seconds=config.interval_seconds,
+        docker=config.docker_host is not None,
+    )
+    try:
+        client.run()
+    finally:
+        collector.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,367 @@
+#!/usr/local/bin/python3
+"""
+(c) Copyright 2025, Denis Rozhnovskiy <pytelemonbot@mail.ru>
+pyTMBot - A simple Telegram bot to handle Docker containers and images,
+also providing basic information about the status of local servers.
+
+Agent client.
+
+One asyncio task keeps a connection to the central bot: it authenticates, sends a
+full snapshot, then a delta every interval (an empty delta doubles as heartbeat),
+and a fresh full snapshot every ``keyframe_every`` frames or when the server asks.
+Collection runs in a worker thread so a slow psutil or Docker call never stalls the
+channel. Lost connections are retried with jittered exponential backoff, which
+keeps hundreds of agents from reconnecting in lockstep after a central restart.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hmac
+import os
+import random
+import socket
+import threading
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import Final, TypedDict
+
+from pytmbot.agent.protocol import (
+    AGENT_PROTOCOL_VERSION,
+    AgentEndpoint,
+    AgentProtocolError,
+    FrameSigner,
+    FrameType,
+    Snapshot,
+    derive_session_key,
+    diff_snapshot,
+    encode_frame,
+    parse_endpoint,
+    read_frame,
+    session_proof,
+    sign_challenge,
+    validate_host_id,
+)
+from pytmbot.logs import BaseComponent
+
+AGENT_DEFAULT_INTERVAL_SECONDS: Final[float] = 15.0
+AGENT_DEFAULT_DOCKER_HOST: Final[str] = "unix:///var/run/docker.sock"
+AGENT_KEYFRAME_EVERY: Final[int] = 40
+AGENT_HANDSHAKE_TIMEOUT_SECONDS: Final[float] = 10.0
+AGENT_RECONNECT_BASE_SECONDS: Final[float] = 1.0
+AGENT_RECONNECT_MAX_SECONDS: Final[float] = 60.0
+
+ENV_SERVER: Final[str] = "PYTMBOT_AGENT_SERVER"
+ENV_SECRET: Final[str] = "PYTMBOT_AGENT_SECRET"
+ENV_HOST_ID: Final[str] = "PYTMBOT_AGENT_HOST_ID"
+ENV_INTERVAL: Final[str] = "PYTMBOT_AGENT_INTERVAL"
+ENV_DOCKER_HOST: Final[str] = "PYTMBOT_AGENT_DOCKER_HOST"
+
+
+class AgentClientStats(TypedDict):
+    connected: bool
+    connects: int
+    reconnects: int
+    full_frames: int
+    delta_frames: int
+    resyncs: int
+    bytes_sent: int
+
+
+@dataclass(frozen=True, slots=True)
+class AgentConfig:
+    server: AgentEndpoint
+    secret: str
+    host_id: str
+    interval_seconds: float = AGENT_DEFAULT_INTERVAL_SECONDS
+    docker_host: str | None = AGENT_DEFAULT_DOCKER_HOST
+    keyframe_every: int = AGENT_KEYFRAME_EVERY
+
+    @classmethod
+    def from_env(cls, environ: Mapping[str, str] = os.environ) -> AgentConfig:
+        """
+        Read agent settings from ``PYTMBOT_AGENT_*`` variables.
+
+        Raises ``ValueError`` for a missing server or secret and for invalid values.
+        An empty ``PYTMBOT_AGENT_DOCKER_HOST`` disables Docker collection.
+        """
+        server = environ.get(ENV_SERVER, "").strip()
+        secret = environ.get(ENV_SECRET, "")
+        if not server or not secret:
+            raise ValueError(f"{ENV_SERVER} and {ENV_SECRET} are required")
+        host_id = environ.get(ENV_HOST_ID) or socket.gethostname().split(".")[0]
+        try:
+            validate_host_id(host_id)
+        except AgentProtocolError as error:
+            raise ValueError(
+                f"{ENV_HOST_ID} must match [A-Za-z0-9._-]{{1,32}}: '{host_id}'"
+            ) from error
+        interval = float(environ.get(ENV_INTERVAL, AGENT_DEFAULT_INTERVAL_SECONDS))
+        if interval <= 0:
+            raise ValueError(f"{ENV_INTERVAL} must be positive")
+        docker_host = environ.get(ENV_DOCKER_HOST, AGENT_DEFAULT_DOCKER_HOST).strip()
+        return cls(
+            server=parse_endpoint(server),
+            secret=secret,
+            host_id=host_id,
+            interval_seconds=interval,
+            docker_host=docker_host or None,
+        )
+
+
+def reconnect_delay(attempt: int, rng: Callable[[], float] = random.random) -> float:
+    """Jittered exponential delay before reconnect ``attempt`` (1-based)."""
+    ceiling = min(
+        AGENT_RECONNECT_MAX_SECONDS,
+        AGENT_RECONNECT_BASE_SECONDS * 2.0 ** max(attempt - 1, 0),
+    )
+    return ceiling * (0.5 + 0.5 * rng())
+
+
+class AgentClient(BaseComponent):
+    """Stream snapshots from ``collect`` to the central bot until :meth:`stop`."""
+
+    __slots__ = (
+        "_config",
+        "_collect",
+        "_loop",
+        "_stopping",
+        "_stop_requested",
+        "_connected",
+        "_connects",
+        "_full_frames",
+        "_delta_frames",
+        "_resyncs",
+        "_bytes_sent",
+    )
+
+    def __init__(self, config: AgentConfig, collect: Callable[[], Snapshot]) -> None:
+        super().__init__("agent_client")
+        self._config = config
+        self._collect = collect
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._stopping: asyncio.Event | None = None
+        self._stop_requested = threading.Event()
+        self._connected = False
+        self._connects = 0
+        self._full_frames = 0
+        self._delta_frames = 0
+        self._resyncs = 0
+        self._bytes_sent = 0
+
+    def run(self) -> None:
+        """Blocking entry point; returns once :meth:`stop` has been called."""
+        if not self._stop_requested.is_set():
+            asyncio.run(self._serve())
+
+    def stop(self) -> None:
+        """Thread-safe; the client cannot be restarted afterwards."""
+        self._stop_requested.set()
+        loop, stopping = self._loop, self._stopping
+        if loop is not None and stopping is not None:
+            try:
+                loop.call_soon_threadsafe(stopping.set)
+            except RuntimeError:
+                pass
+
+    def get_stats(self) -> AgentClientStats:
+        return {
+            "connected": self._connected,
+            "connects": self._connects,
+            "reconnects": max(self._connects - 1, 0),
+            "full_frames": self._full_frames,
+            "delta_frames": self._delta_frames,
+            "resyncs": self._resyncs,
+            "bytes_sent": self._bytes_sent,
+        }
+
+    async def _serve(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._stopping = stopping = asyncio.Event()
+        if self._stop_requested.is_set():
+            return
+        attempt = 0
+        while not stopping.is_set():
+            connects = self._connects
+            try:
+                await self._session()
+                attempt = 0
+            except (OSError, EOFError, AgentProtocolError, TimeoutError) as error:
+                # A session that got through the handshake restarts the backoff.
+                attempt = 1 if self._connects > connects else attempt + 1
+                with self.log_context(
+                    server=str(self._config.server),
+                    attempt=attempt,
+                    error=str(error),
+                    error_type=type(error).__name__,
+                ) as log:
+                    log.warning("bot.agent.client.connection.fail")
+            finally:
+                self._connected = False
+            if attempt and not stopping.is_set():
+                await self._wait(stopping, reconnect_delay(attempt))
+
+    @staticmethod
+    async def _wait(event: asyncio.Event, timeout: float) -> None:
+        try:
+            await asyncio.wait_for(event.wait(), timeout=timeout)
+        except TimeoutError:
+            pass
+
+    async def _open(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        server = self._config.server
+        if server.scheme == "unix":
+            return await asyncio.open_unix_connection(server.path)
+        return await asyncio.open_connection(server.host, server.port)
+
+    async def _handshake(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> FrameSigner:
+        """Authenticate, check the server's proof and return the session's signer."""
+        challenge = await read_frame(reader)
+        nonce = challenge.get("nonce")
+        if challenge["type"] != FrameType.CHALLENGE or not isinstance(nonce, str):
+            raise AgentProtocolError("Expected a challenge frame")
+        host_id = self._config.host_id
+        await self._send(
+            writer,
+            {
+                "type": FrameType.HELLO,
+                "version": AGENT_PROTOCOL_VERSION,
+                "host": host_id,
+                "mac": sign_challenge(self._config.secret, nonce, host_id),
+            },
+        )
+        reply = await read_frame(reader)
+        if reply["type"] != FrameType.WELCOME:
+            raise AgentProtocolError(f"Rejected by server: {reply.get('reason')}")
+        session_key = derive_session_key(self._config.secret, nonce, host_id)
+        proof = reply.get("proof")
+        if not isinstance(proof, str) or not hmac.compare_digest(
+            proof, session_proof(session_key)
+        ):
+            raise AgentProtocolError("Server did not prove the session key")
+        return FrameSigner(session_key, server=False)
+
+    async def _send(
+        self,
+        writer: asyncio.StreamWriter,
+        payload: Mapping[str, object],
+        signer: FrameSigner | None = None,
+    ) -> None:
+        frame = encode_frame(payload, signer)
+        writer.write(frame)
+        await writer.drain()
+        self._bytes_sent += len(frame)
+
+    async def _session(self) -> None:
+        stopping = self._stopping
+        assert stopping is not None
+        reader, writer = await asyncio.wait_for(
+            self._open(), timeout=AGENT_HANDSHAKE_TIMEOUT_SECONDS
+        )
+        resync = asyncio.Event()
+        listener: asyncio.Task[None] | None = None
+        try:
+            signer = await asyncio.wait_for(
+                self._handshake(reader, writer),
+                timeout=AGENT_HANDSHAKE_TIMEOUT_SECONDS,
+            )
+            self._connected = True
+            self._connects += 1
+            with self.log_context(
+                server=str(self._config.server), host_id=self._config.host_id
+            ) as log:
+                log.info("bot.agent.client.connected")
+            listener = asyncio.create_task(self._listen(reader, resync, signer))
+            await self._stream(writer, signer, resync, listener, stopping)
+        finally:
+            if listener is not None:
+                listener.cancel()
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+    async def _listen(
+        self,
+        reader: asyncio.StreamReader,
+        resync: asyncio.Event,
+        signer: FrameSigner,
+    ) -> None:
+        """Watch server frames; returns when the server closes the channel."""
+        try:
+            while True:
+                frame = await read_frame(reader, signer)
+                if frame["type"] == FrameType.RESYNC:
+                    resync.set()
+        except (asyncio.IncompleteReadError, OSError, AgentProtocolError):
+            return
+
+    async def _stream(
+        self,
+        writer: asyncio.StreamWriter,
+        signer: FrameSigner,
+        resync: asyncio.Event,
+        listener: asyncio.Task[None],
+        stopping: asyncio.Event,
+    ) -> None:
+        previous: Snapshot | None = None
+        seq = 0
+        since_keyframe = 0
+        while not stopping.is_set():
+            try:
+                snapshot = await asyncio.to_thread(self._collect)
+            except Exception as error:
+                with self.log_context(error=str(error)) as log:
+                    log.error("bot.agent.client.collect.fail")
+                snapshot = previous or {}
+            seq += 1
+            if (
+                previous is None
+                or resync.is_set()
+                or since_keyframe >= self._config.keyframe_every
+            ):
+                if resync.is_set():
+                    self._resyncs += 1
+                    resync.clear()
+                await self._send(
+                    writer,
+                    {"type": FrameType.SNAPSHOT, "seq": seq, "full": snapshot},
+                    signer,
+                )
+                self._full_frames += 1
+                since_keyframe = 0
+            else:
+                changed, removed = diff_snapshot(previous, snapshot)
+                frame: dict[str, object] = {"type": FrameType.DELTA, "seq": seq}
+                if changed:
+                    frame["set"] = changed
+                if removed:
+                    frame["unset"] = removed
+                await self._send(writer, frame, signer)
+                self._delta_frames += 1
+                since_keyframe += 1
+            previous = snapshot
+
+            waiter = asyncio.create_task(stopping.wait())
+            resync_waiter = asyncio.create_task(resync.wait())
+            done, pending = await asyncio.wait(
+                {waiter, resync_waiter, listener},
+                timeout=self._config.interval_seconds,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            for task in (waiter, resync_waiter):
+                if task in pending:
+                    task.cancel()
+            if listener in done:
+                raise EOFError("Server closed the agent channel")
+
+
+__all__ = [
+    "AgentClient",
+    "AgentClientStats",
+    "AgentConfig",
+    "reconnect_delay",
+]
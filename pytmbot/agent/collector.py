@@ -0,0 +1,155 @@
+#!/usr/local/bin/python3
+"""
+(c) Copyright 2025, Denis Rozhnovskiy <pytelemonbot@mail.ru>
+pyTMBot - A simple Telegram bot to handle Docker containers and images,
+also providing basic information about the status of local servers.
+
+Agent snapshot collector.
+
+Builds the snapshot an agent streams to the central bot from ``PsutilAdapter`` and,
+when a Docker endpoint is configured, from the Docker SDK. Collections are keyed by
+name (mount point, container name) rather than listed, so a delta only carries the
+entries that actually changed.
+"""
+
+from __future__ import annotations
+
+import socket
+from contextlib import suppress
+from typing import TYPE_CHECKING, Final
+
+from pytmbot.adapters.psutil.adapter import PsutilAdapter
+from pytmbot.agent.protocol import Snapshot
+from pytmbot.logs import BaseComponent
+
+if TYPE_CHECKING:
+    from docker.client import DockerClient
+
+DOCKER_TIMEOUT_SECONDS: Final[int] = 10
+
+
+class SnapshotCollector(BaseComponent):
+    """Collect one host snapshot per call; not thread-safe, call from one thread."""
+
+    __slots__ = ("_psutil", "_docker_host", "_docker_client", "_hostname")
+
+    def __init__(
+        self,
+        psutil_adapter: PsutilAdapter | None = None,
+        *,
+        docker_host: str | None = None,
+    ) -> None:
+        super().__init__("agent_collector")
+        self._psutil = psutil_adapter or PsutilAdapter()
+        self._docker_host = docker_host
+        self._docker_client: DockerClient | None = None
+        self._hostname = socket.gethostname()
+
+    def collect(self) -> Snapshot:
+        snapshot: Snapshot = {
+            "hostname": self._hostname,
+            "system": self._collect_system(),
+        }
+        if self._docker_host:
+            snapshot["docker"] = self._collect_docker()
+        return snapshot
+
+    def _collect_system(self) -> Snapshot:
+        adapter = self._psutil
+        memory = adapter.get_memory()
+        swap = adapter.get_swap_memory()
+        processes = adapter.get_process_counts()
+        return {
+            "uptime": adapter.get_uptime(),
+            "load_average": [round(value, 2) for value in adapter.get_load_average()],
+            "cpu": {
+                "percent": adapter.get_cpu_usage()["cpu_percent"],
+                "count": adapter.get_cpu_count(),
+            },
+            "memory": {
+                "percent": memory["percent"],
+                "used": memory["used"],
+                "available": memory["available"],
+                "total": memory["total"],
+            },
+            "swap": {
+                "percent": swap["percent"],
+                "used": swap["used"],
+                "total": swap["total"],
+            },
+            "processes": {
+                "running": processes["running"],
+                "sleeping": processes["sleeping"],
+                "total": processes["total"],
+            },
+            "disks": {
+                disk["mnt_point"]: {
+                    "percent": disk["percent"],
+                    "used": disk["used"],
+                    "size": disk["size"],
+                }
+                for disk in adapter.get_disk_usage()
+            },
+        }
+
+    def _client(self) -> DockerClient:
+        if self._docker_client is None:
+            # Imported lazily: agents without Docker never load the SDK.
+            from docker.client import DockerClient
+
+            self._docker_client = DockerClient(
+                base_url=self._docker_host, timeout=DOCKER_TIMEOUT_SECONDS
+            )
+        return self._docker_client
+
+    def _collect_docker(self) -> Snapshot:
+        try:
+            client = self._client()
+            images_count = len(client.images.list())
+            containers = client.containers.list(all=True)
+        except Exception as error:
+            self._close_docker()
+            with self.log_context(
+                docker_host=self._docker_host, error=str(error)
+            ) as log:
+                log.warning("bot.agent.collector.docker.fail")
+            return {"available": False}
+
+        running = sum(1 for container in containers if container.status == "running")
+        return {
+            "available": True,
+            "images_count": images_count,
+            "containers_count": len(containers),
+            "running_containers": running,
+            "stopped_containers": len(containers) - running,
+            "containers": {
+                container.name: {
+                    "status": container.status,
+                    "image": _image_label(container.attrs),
+                }
+                for container in containers
+            },
+        }
+
+    def _close_docker(self) -> None:
+        client, self._docker_client = self._docker_client, None
+        if client is not None:
+            with suppress(Exception):
+                client.close()
+
+    def close(self) -> None:
+        self._close_docker()
+        self._psutil.close()
+
+
+def _image_label(attrs: object) -> str:
+    # ``Config.Image`` is the reference the container was created from; it needs
+    # no extra API call, unlike ``container.image``.
+    if isinstance(attrs, dict):
+        config = attrs.get("Config")
+        if isinstance(config, dict) and isinstance(config.get("Image"), str):
+            return str(config["Image"])
+    return "unknown"
+
+
+__all__ = ["SnapshotCollector"]
@@ -0,0 +1,274 @@
+#!/usr/local/bin/python3
+"""
+(c) Copyright 2025, Denis Rozhnovskiy <pytelemonbot@mail.ru>
+pyTMBot - A simple Telegram bot to handle Docker containers and images,
+also providing basic information about the status of local servers.
+
+Agent wire protocol.
+
+Frames are a 4-byte big-endian length followed by compact JSON. The server opens
+with a random challenge; the agent answers with an HMAC-SHA256 of the challenge and
+its host id keyed by its secret, so the secret never crosses the wire. Both sides
+then derive a session key from the secret and the challenge, the server proves it
+in the welcome frame, and every later frame carries an HMAC-SHA256 of a
+per-direction counter and the JSON body under that key, so frames cannot be forged,
+replayed or reordered. After the handshake the agent sends a full snapshot, then
+deltas that carry only changed leaves (``set``) and removed paths (``unset``).
+Every frame has a sequence number; the server asks for a new full snapshot when a
+delta does not follow the last frame. This module uses only the stdlib and the
+stdlib-only :mod:`pytmbot.utils.agent_address`, so the agent process stays small.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import hmac
+import json
+import secrets
+import struct
+from collections.abc import Mapping, Sequence
+from enum import StrEnum
+from typing import Final
+
+from pytmbot.utils.agent_address import HOST_ID_PATTERN, AgentEndpoint, parse_endpoint
+
+AGENT_PROTOCOL_VERSION: Final[int] = 2
+MAX_FRAME_BYTES: Final[int] = 256 * 1024
+_FRAME_HEADER: Final[struct.Struct] = struct.Struct("!I")
+_NONCE_BYTES: Final[int] = 16
+_MAC_BYTES: Final[int] = hashlib.sha256().digest_size
+_COUNTER: Final[struct.Struct] = struct.Struct("!Q")
+
+type Snapshot = dict[str, object]
+type SnapshotPath = list[str]
+
+
+class AgentProtocolError(Exception):
+    """Malformed, oversized or unauthenticated agent traffic."""
+
+
+class FrameType(StrEnum):
+    CHALLENGE = "challenge"
+    HELLO = "hello"
+    WELCOME = "welcome"
+    ERROR = "error"
+    SNAPSHOT = "snapshot"
+    DELTA = "delta"
+    RESYNC = "resync"
+
+
+def validate_host_id(host_id: object) -> str:
+    if not isinstance(host_id, str) or not HOST_ID_PATTERN.match(host_id):
+        raise AgentProtocolError("Invalid agent host id")
+    return host_id
+
+
+class FrameSigner:
+    """
+    MAC state of one authenticated session, kept by each side of the channel.
+
+    Each direction has its own label and frame counter, so a frame can neither be
+    reflected back to its sender nor replayed, dropped or reordered unnoticed.
+    """
+
+    __slots__ = ("_key", "_send_label", "_receive_label", "_sent", "_received")
+
+    def __init__(self, key: bytes, *, server: bool) -> None:
+        self._key = key
+        self._send_label, self._receive_label = (
+            (b"s2a", b"a2s") if server else (b"a2s", b"s2a")
+        )
+        self._sent = 0
+        self._received = 0
+
+    def _mac(self, label: bytes, counter: int, body: bytes) -> bytes:
+        message = label + _COUNTER.pack(counter) + body
+        return hmac.new(self._key, message, hashlib.sha256).digest()
+
+    def seal(self, body: bytes) -> bytes:
+        mac = self._mac(self._send_label, self._sent, body)
+        self._sent += 1
+        return mac + body
+
+    def open(self, data: bytes) -> bytes:
+        mac, body = data[:_MAC_BYTES], data[_MAC_BYTES:]
+        expected = self._mac(self._receive_label, self._received, body)
+        if len(mac) != _MAC_BYTES or not hmac.compare_digest(mac, expected):
+            raise AgentProtocolError("Frame authentication failed")
+        self._received += 1
+        return body
+
+
+def encode_frame(
+    payload: Mapping[str, object], signer: FrameSigner | None = None
+) -> bytes:
+    body = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode()
+    if len(body) > MAX_FRAME_BYTES:
+        raise AgentProtocolError(f"Frame of {len(body)} bytes exceeds the limit")
+    if signer is not None:
+        body = signer.seal(body)
+    return _FRAME_HEADER.pack(len(body)) + body
+
+
+async def read_sized_frame(
+    reader: asyncio.StreamReader, signer: FrameSigner | None = None
+) -> tuple[dict[str, object], int]:
+    """
+    Read one frame and its size on the wire; with ``signer`` its MAC is verified.
+
+    Raises ``asyncio.IncompleteReadError`` when the channel is closed.
+    """
+    (length,) = _FRAME_HEADER.unpack(await reader.readexactly(_FRAME_HEADER.size))
+    limit = MAX_FRAME_BYTES + (_MAC_BYTES if signer is not None else 0)
+    if length > limit:
+        raise AgentProtocolError(f"Frame of {length} bytes exceeds the limit")
+    body = await reader.readexactly(length)
+    if signer is not None:
+        body = signer.open(body)
+    try:
+        payload = json.loads(body)
+    except (UnicodeDecodeError, json.JSONDecodeError) as error:
+        raise AgentProtocolError("Frame is not valid JSON") from error
+    if not isinstance(payload, dict) or not isinstance(payload.get("type"), str):
+        raise AgentProtocolError("Frame has no type")
+    return payload, _FRAME_HEADER.size + length
+
+
+async def read_frame(
+    reader: asyncio.StreamReader, signer: FrameSigner | None = None
+) -> dict[str, object]:
+    payload, _ = await read_sized_frame(reader, signer)
+    return payload
+
+
+def new_challenge() -> str:
+    return secrets.token_hex(_NONCE_BYTES)
+
+
+def sign_challenge(secret: str, nonce: str, host_id: str) -> str:
+    message = f"{AGENT_PROTOCOL_VERSION}:{nonce}:{host_id}".encode()
+    return hmac.new(secret.encode(), message, hashlib.sha256).hexdigest()
+
+
+def match_challenge(
+    accepted_secrets: Sequence[str], nonce: str, host_id: str, mac: object
+) -> int | None:
+    """Index of the secret that produced ``mac``; every secret is checked in constant time."""
+    if not isinstance(mac, str):
+        return None
+    matched: int | None = None
+    for index, secret in enumerate(accepted_secrets):
+        if hmac.compare_digest(sign_challenge(secret, nonce, host_id), mac):
+            matched = index
+    return matched
+
+
+def verify_challenge(
+    accepted_secrets: Sequence[str], nonce: str, host_id: str, mac: object
+) -> bool:
+    """Constant-time check of ``mac`` against every accepted secret."""
+    return match_challenge(accepted_secrets, nonce, host_id, mac) is not None
+
+
+def derive_session_key(secret: str, nonce: str, host_id: str) -> bytes:
+    """Per-connection key for frame MACs, bound to the challenge and the host id."""
+    message = f"{AGENT_PROTOCOL_VERSION}:session:{nonce}:{host_id}".encode()
+    return hmac.new(secret.encode(), message, hashlib.sha256).digest()
+
+
+def session_proof(session_key: bytes) -> str:
+    """Sent by the server in the welcome frame to prove it knows the secret too."""
+    return hmac.new(session_key, b"welcome", hashlib.sha256).hexdigest()
+
+
+def diff_snapshot(
+    previous: Mapping[str, object], current: Mapping[str, object]
+) -> tuple[Snapshot, list[SnapshotPath]]:
+    """
+    Return ``(set, unset)`` turning ``previous`` into ``current``.
+
+    Nested mappings are diffed key by key; any other value that changed (lists
+    included) is sent whole.
+    """
+    changed: Snapshot = {}
+    removed: list[SnapshotPath] = [[key] for key in previous if key not in current]
+    for key, value in current.items():
+        if key not in previous:
+            changed[key] = value
+            continue
+        old = previous[key]
+        if isinstance(old, Mapping) and isinstance(value, Mapping):
+            nested_set, nested_unset = diff_snapshot(old, value)
+            if nested_set:
+                changed[key] = nested_set
+            removed.extend([key, *path] for path in nested_unset)
+        elif old != value or type(old) is not type(value):
+            changed[key] = value
+    return changed, removed
+
+
+def _merge(base: Mapping[str, object], changed: Mapping[str, object]) -> Snapshot:
+    merged = dict(base)
+    for key, value in changed.items():
+        old = merged.get(key)
+        if isinstance(old, Mapping) and isinstance(value, Mapping):
+            merged[key] = _merge(old, value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def _without(base: Mapping[str, object], path: Sequence[str]) -> Snapshot:
+    result = dict(base)
+    head, *tail = path
+    if not tail:
+        result.pop(head, None)
+        return result
+    nested = result.get(head)
+    if isinstance(nested, Mapping):
+        result[head] = _without(nested, tail)
+    return result
+
+
+def apply_delta(
+    snapshot: Mapping[str, object],
+    changed: Mapping[str, object],
+    removed: Sequence[Sequence[str]] = (),
+) -> Snapshot:
+    """
+    Apply a :func:`diff_snapshot` result without mutating ``snapshot``.
+
+    Untouched branches are shared with the previous snapshot, so readers holding
+    the old one keep a consistent view.
+    """
+    result = _merge(snapshot, changed) if changed else dict(snapshot)
+    for path in removed:
+        if path:
+            result = _without(result, path)
+    return result
+
+
+__all__ = [
+    "AGENT_PROTOCOL_VERSION",
+    "AgentEndpoint",
+    "AgentProtocolError",
+    "FrameSigner",
+    "FrameType",
+    "MAX_FRAME_BYTES",
+    "Snapshot",
+    "SnapshotPath",
+    "apply_delta",
+    "derive_session_key",
+    "diff_snapshot",
+    "encode_frame",
+    "match_challenge",
+    "new_challenge",
+    "parse_endpoint",
+    "read_frame",
+    "read_sized_frame",
+    "session_proof",
+    "sign_challenge",
+    "validate_host_id",
+    "verify_challenge",
+]
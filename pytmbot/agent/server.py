@@ -0,0 +1,522 @@
+#!/usr/local/bin/python3
+"""
+(c) Copyright 2025, Denis Rozhnovskiy <pytelemonbot@mail.ru>
+pyTMBot - A simple Telegram bot to handle Docker containers and images,
+also providing basic information about the status of local servers.
+
+Agent ingestion server.
+
+Runs an asyncio server on a daemon thread of the central bot. Every agent is one
+coroutine that mostly sleeps in ``read``, so hundreds of agents cost a few sockets
+and small buffers rather than a thread each. Snapshots land in :class:`HostRegistry`,
+which handlers read from the bot's worker threads; applying a delta builds a new
+snapshot that shares unchanged branches with the old one, so a reader holding a
+snapshot never sees a half-applied update.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import functools
+import os
+import threading
+import time
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Final, TypedDict
+
+from pytmbot.agent.protocol import (
+    AGENT_PROTOCOL_VERSION,
+    AgentEndpoint,
+    AgentProtocolError,
+    FrameSigner,
+    FrameType,
+    Snapshot,
+    apply_delta,
+    derive_session_key,
+    encode_frame,
+    match_challenge,
+    new_challenge,
+    read_frame,
+    read_sized_frame,
+    session_proof,
+    validate_host_id,
+)
+from pytmbot.logs import BaseComponent
+
+AGENT_DEFAULT_STALE_AFTER_SECONDS: Final[float] = 90.0
+AGENT_DEFAULT_MAX_AGENTS: Final[int] = 512
+AGENT_SERVER_HANDSHAKE_TIMEOUT_SECONDS: Final[float] = 10.0
+AGENT_SERVER_START_TIMEOUT_SECONDS: Final[float] = 5.0
+AGENT_SERVER_STOP_TIMEOUT_SECONDS: Final[float] = 5.0
+
+
+class AgentHostStats(TypedDict):
+    connected: bool
+    seq: int
+    full_frames: int
+    delta_frames: int
+    resyncs: int
+    bytes_received: int
+
+
+class AgentIngestionStats(TypedDict):
+    running: bool
+    listen: str
+    connections: int
+    rejected: int
+    hosts: dict[str, AgentHostStats]
+
+
+@dataclass(frozen=True, slots=True)
+class AgentHostView:
+    """Read-only view of one host handed to handlers."""
+
+    host_id: str
+    snapshot: Snapshot
+    age_seconds: float
+    online: bool
+
+
+class _HostState:
+    __slots__ = (
+        "snapshot",
+        "seq",
+        "last_seen",
+        "connected",
+        "full_frames",
+        "delta_frames",
+        "resyncs",
+        "bytes_received",
+    )
+
+    def __init__(self) -> None:
+        self.snapshot: Snapshot = {}
+        self.seq = 0
+        self.last_seen = 0.0
+        self.connected = False
+        self.full_frames = 0
+        self.delta_frames = 0
+        self.resyncs = 0
+        self.bytes_received = 0
+
+    def get_stats(self) -> AgentHostStats:
+        return {
+            "connected": self.connected,
+            "seq": self.seq,
+            "full_frames": self.full_frames,
+            "delta_frames": self.delta_frames,
+            "resyncs": self.resyncs,
+            "bytes_received": self.bytes_received,
+        }
+
+
+class HostRegistry:
+    """Latest snapshot per agent host; safe to use from any thread."""
+
+    __slots__ = ("_lock", "_hosts", "_stale_after", "_clock")
+
+    def __init__(
+        self,
+        stale_after_seconds: float = AGENT_DEFAULT_STALE_AFTER_SECONDS,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._lock = threading.Lock()
+        self._hosts: dict[str, _HostState] = {}
+        self._stale_after = stale_after_seconds
+        self._clock = clock
+
+    def set_stale_after(self, seconds: float) -> None:
+        with self._lock:
+            self._stale_after = seconds
+
+    def set_connected(self, host_id: str, connected: bool) -> None:
+        with self._lock:
+            state = self._hosts.setdefault(host_id, _HostState())
+            state.connected = connected
+            if connected:
+                # A new session starts with a full snapshot.
+                state.seq = 0
+
+    def apply_full(
+        self, host_id: str, seq: int, snapshot: Snapshot, size: int = 0
+    ) -> None:
+        with self._lock:
+            state = self._hosts.setdefault(host_id, _HostState())
+            state.snapshot = snapshot
+            state.seq = seq
+            state.last_seen = self._clock()
+            state.full_frames += 1
+            state.bytes_received += size
+
+    def apply_delta(
+        self,
+        host_id: str,
+        seq: int,
+        changed: Mapping[str, object],
+        removed: Sequence[Sequence[str]],
+        size: int = 0,
+    ) -> bool:
+        """Apply a delta; ``False`` means it does not follow the last frame."""
+        with self._lock:
+            state = self._hosts.get(host_id)
+            if state is None or state.seq == 0 or seq != state.seq + 1:
+                if state is not None:
+                    state.resyncs += 1
+                return False
+            if changed or removed:
+                state.snapshot = apply_delta(state.snapshot, changed, removed)
+            state.seq = seq
+            state.last_seen = self._clock()
+            state.delta_frames += 1
+            state.bytes_received += size
+        return True
+
+    def _view_locked(
+        self, host_id: str, state: _HostState, now: float
+    ) -> AgentHostView:
+        age = now - state.last_seen
+        return AgentHostView(
+            host_id=host_id,
+            snapshot=state.snapshot,
+            age_seconds=age,
+            online=state.connected and age <= self._stale_after,
+        )
+
+    def get(self, host_id: str) -> AgentHostView | None:
+        with self._lock:
+            state = self._hosts.get(host_id)
+            if state is None or not state.last_seen:
+                return None
+            return self._view_locked(host_id, state, self._clock())
+
+    def views(self) -> list[AgentHostView]:
+        """Every host that has reported, sorted by host id, under one lock."""
+        with self._lock:
+            now = self._clock()
+            return [
+                self._view_locked(host_id, state, now)
+                for host_id, state in sorted(self._hosts.items())
+                if state.last_seen
+            ]
+
+    def get_stats(self) -> dict[str, AgentHostStats]:
+        with self._lock:
+            return {
+                host_id: state.get_stats() for host_id, state in self._hosts.items()
+            }
+
+
+class AgentIngestionServer(BaseComponent):
+    """
+    Accept authenticated agent connections and feed a :class:`HostRegistry`.
+
+    A host listed in ``host_secrets`` can only authenticate with its own secret;
+    the shared ``secrets`` cover every other host. A connected host is never taken
+    over by a connection that authenticated with a different credential.
+    """
+
+    __slots__ = (
+        "_endpoint",
+        "_secrets",
+        "_host_secrets",
+        "_registry",
+        "_max_agents",
+        "_thread",
+        "_loop",
+        "_stopping",
+        "_ready",
+        "_start_error",
+        "_sessions",
+        "_connections",
+        "_rejected",
+        "bound_port",
+    )
+
+    def __init__(
+        self,
+        endpoint: AgentEndpoint,
+        secrets: Sequence[str],
+        registry: HostRegistry,
+        *,
+        host_secrets: Mapping[str, str] | None = None,
+        max_agents: int = AGENT_DEFAULT_MAX_AGENTS,
+    ) -> None:
+        super().__init__("agent_ingestion")
+        if not secrets and not host_secrets:
+            raise ValueError("At least one agent secret is required")
+        self._endpoint = endpoint
+        self._secrets = tuple(secrets)
+        self._host_secrets = dict(host_secrets or {})
+        self._registry = registry
+        self._max_agents = max_agents
+        self._thread: threading.Thread | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._stopping: asyncio.Event | None = None
+        self._ready = threading.Event()
+        self._start_error: BaseException | None = None
+        # host id -> (channel, credential it authenticated with)
+        self._sessions: dict[str, tuple[asyncio.StreamWriter, str]] = {}
+        self._connections = 0
+        self._rejected = 0
+        self.bound_port = 0
+
+    @property
+    def registry(self) -> HostRegistry:
+        return self._registry
+
+    def start(self, timeout: float = AGENT_SERVER_START_TIMEOUT_SECONDS) -> None:
+        """Start listening; raises if the listener could not be bound."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="agent_ingestion", daemon=True
+        )
+        self._thread.start()
+        if not self._ready.wait(timeout):
+            raise TimeoutError("Agent ingestion server did not start in time")
+        if self._start_error is not None:
+            raise self._start_error
+
+    def stop(self, timeout: float = AGENT_SERVER_STOP_TIMEOUT_SECONDS) -> None:
+        loop, stopping, thread = self._loop, self._stopping, self._thread
+        if loop is not None and stopping is not None:
+            with contextlib.suppress(RuntimeError):
+                loop.call_soon_threadsafe(stopping.set)
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=timeout)
+        self._thread = None
+
+    def get_stats(self) -> AgentIngestionStats:
+        return {
+            "running": self._thread is not None and self._thread.is_alive(),
+            "listen": str(self._endpoint),
+            "connections": self._connections,
+            "rejected": self._rejected,
+            "hosts": self._registry.get_stats(),
+        }
+
+    def _run(self) -> None:
+        try:
+            asyncio.run(self._serve())
+        except BaseException as error:
+            self._start_error = error
+            with self.log_context(error=str(error)) as log:
+                log.error("bot.agent.server.fail")
+        finally:
+            self._ready.set()
+
+    async def _listen(self) -> asyncio.Server:
+        endpoint = self._endpoint
+        if endpoint.scheme == "unix":
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(endpoint.path)
+            server = await asyncio.start_unix_server(self._handle, path=endpoint.path)
+            os.chmod(endpoint.path, 0o600)
+            return server
+        server = await asyncio.start_server(
+            self._handle, host=endpoint.host, port=endpoint.port
+        )
+        self.bound_port = server.sockets[0].getsockname()[1]
+        self._endpoint = endpoint._replace(port=self.bound_port)
+        return server
+
+    async def _serve(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._stopping = stopping = asyncio.Event()
+        server = await self._listen()
+        self._ready.set()
+        with self.log_context(listen=str(self._endpoint)) as log:
+            log.info("bot.agent.server.start")
+        async with server:
+            await stopping.wait()
+            server.close()
+            for writer, _ in list(self._sessions.values()):
+                writer.close()
+        if self._endpoint.scheme == "unix":
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(self._endpoint.path)
+
+    async def _send(
+        self,
+        writer: asyncio.StreamWriter,
+        payload: Mapping[str, object],
+        signer: FrameSigner | None = None,
+    ) -> None:
+        writer.write(encode_frame(payload, signer))
+        await writer.drain()
+
+    def _accepted_secrets(self, host_id: str) -> tuple[list[str], str]:
+        """Secrets ``host_id`` may use and the credential label they map to."""
+        bound = self._host_secrets.get(host_id)
+        if bound is not None:
+            return [bound], "host"
+        return list(self._secrets), "shared"
+
+    async def _authenticate(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> tuple[str, str, bytes]:
+        """Run the challenge; return the host id, its credential and the session key."""
+        nonce = new_challenge()
+        await self._send(
+            writer,
+            {
+                "type": FrameType.CHALLENGE,
+                "version": AGENT_PROTOCOL_VERSION,
+                "nonce": nonce,
+            },
+        )
+        hello = await read_frame(reader)
+        if (
+            hello["type"] != FrameType.HELLO
+            or hello.get("version") != AGENT_PROTOCOL_VERSION
+        ):
+            raise AgentProtocolError("Unsupported agent hello")
+        host_id = validate_host_id(hello.get("host"))
+        accepted, kind = self._accepted_secrets(host_id)
+        index = match_challenge(accepted, nonce, host_id, hello.get("mac"))
+        if index is None:
+            raise AgentProtocolError("Agent authentication failed")
+        session_key = derive_session_key(accepted[index], nonce, host_id)
+        return host_id, f"{kind}:{index}", session_key
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self._connections += 1
+        try:
+            if len(self._sessions) >= self._max_agents:
+                raise AgentProtocolError("Agent limit reached")
+            host_id, credential, session_key = await asyncio.wait_for(
+                self._authenticate(reader, writer),
+                timeout=AGENT_SERVER_HANDSHAKE_TIMEOUT_SECONDS,
+            )
+            # Checked right before the session is registered, with no await in
+            # between, so concurrent handshakes cannot race past it.
+            current = self._sessions.get(host_id)
+            if current is not None and current[1] != credential:
+                raise AgentProtocolError("Host is connected with another credential")
+        except (AgentProtocolError, TimeoutError, EOFError, OSError) as error:
+            self._rejected += 1
+            with self.log_context(error=str(error)) as log:
+                log.warning("bot.agent.server.handshake.reject")
+            with contextlib.suppress(OSError, AgentProtocolError):
+                await self._send(writer, {"type": FrameType.ERROR, "reason": "denied"})
+            writer.close()
+            return
+
+        previous = self._sessions.pop(host_id, None)
+        if previous is not None:
+            # The host reconnected with the same credential; its old channel is
+            # dead or a duplicate.
+            previous[0].close()
+        self._sessions[host_id] = (writer, credential)
+        self._registry.set_connected(host_id, True)
+        signer = FrameSigner(session_key, server=True)
+        try:
+            await self._send(
+                writer,
+                {"type": FrameType.WELCOME, "proof": session_proof(session_key)},
+            )
+            with self.log_context(host_id=host_id) as log:
+                log.info("bot.agent.server.host.connected")
+            await self._ingest(host_id, reader, writer, signer)
+        except (AgentProtocolError, EOFError, OSError) as error:
+            with self.log_context(host_id=host_id, error=str(error)) as log:
+                log.info("bot.agent.server.host.disconnected")
+        finally:
+            session = self._sessions.get(host_id)
+            if session is not None and session[0] is writer:
+                del self._sessions[host_id]
+                self._registry.set_connected(host_id, False)
+            writer.close()
+
+    async def _ingest(
+        self,
+        host_id: str,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        signer: FrameSigner,
+    ) -> None:
+        registry = self._registry
+        while True:
+            frame, size = await read_sized_frame(reader, signer)
+            seq = frame.get("seq")
+            if not isinstance(seq, int):
+                raise AgentProtocolError("Frame has no sequence number")
+            match frame["type"]:
+                case FrameType.SNAPSHOT:
+                    snapshot = frame.get("full")
+                    if not isinstance(snapshot, dict):
+                        raise AgentProtocolError("Snapshot frame has no body")
+                    registry.apply_full(host_id, seq, snapshot, size)
+                case FrameType.DELTA:
+                    changed = frame.get("set", {})
+                    removed = frame.get("unset", [])
+                    if not isinstance(changed, dict) or not isinstance(removed, list):
+                        raise AgentProtocolError("Malformed delta frame")
+                    if not registry.apply_delta(host_id, seq, changed, removed, size):
+                        await self._send(writer, {"type": FrameType.RESYNC}, signer)
+                case _:
+                    raise AgentProtocolError(f"Unexpected frame '{frame['type']}'")
+
+
+@functools.lru_cache(maxsize=1)
+def get_host_registry() -> HostRegistry:
+    """Return the process-wide registry of agent hosts (empty without agents)."""
+    return HostRegistry()
+
+
+_ingestion_lock = threading.Lock()
+_ingestion_server: AgentIngestionServer | None = None
+
+
+def start_agent_ingestion(
+    endpoint: AgentEndpoint,
+    secrets: Sequence[str],
+    *,
+    host_secrets: Mapping[str, str] | None = None,
+    stale_after_seconds: float = AGENT_DEFAULT_STALE_AFTER_SECONDS,
+    max_agents: int = AGENT_DEFAULT_MAX_AGENTS,
+) -> AgentIngestionServer:
+    """Start the process-wide ingestion server feeding :func:`get_host_registry`."""
+    global _ingestion_server
+    with _ingestion_lock:
+        if _ingestion_server is not None:
+            return _ingestion_server
+        registry = get_host_registry()
+        registry.set_stale_after(stale_after_seconds)
+        server = AgentIngestionServer(
+            endpoint,
+            secrets,
+            registry,
+            host_secrets=host_secrets,
+            max_agents=max_agents,
+        )
+        server.start()
+        _ingestion_server = server
+        return server
+
+
+def shutdown_agent_ingestion(
+    timeout: float = AGENT_SERVER_STOP_TIMEOUT_SECONDS,
+) -> None:
+    global _ingestion_server
+    with _ingestion_lock:
+        server, _ingestion_server = _ingestion_server, None
+    if server is not None:
+        server.stop(timeout)
+
+
+__all__ = [
+    "AgentHostStats",
+    "AgentHostView",
+    "AgentIngestionServer",
+    "AgentIngestionStats",
+    "HostRegistry",
+    "get_host_registry",
+    "shutdown_agent_ingestion",
+    "start_agent_ingestion",
+]
@@ -6,14 +6,16 @@ also providing basic information about the status of local servers.
 """
 
 from telebot import TeleBot
-from telebot.types import LinkPreviewOptions, Message
+from telebot.types import Message
 
 from pytmbot import exceptions
 from pytmbot.exceptions import ErrorContext
-from pytmbot.globals import __version__
-from pytmbot.handlers.handlers_util.utils import send_telegram_message
+from pytmbot.handlers.handlers_util.static_screens import (
+    StaticScreenName,
+    get_static_screen,
+    send_static_screen,
+)
 from pytmbot.logs import Logger
-from pytmbot.parsers.compiler import Compiler
 
 logger = Logger()
 
@@ -39,18 +41,11 @@ def handle_about_command(message: Message, bot: TeleBot) -> None:
         )
         bot.send_chat_action(message.chat.id, "typing")
 
-        template_data = {"username": user_name, "app_version": __version__}
-
-        response = Compiler.quick_render(
-            template_name="b_about_bot.jinja2", context=template_data
-        )
-
-        send_telegram_message(
-            bot=bot,
-            chat_id=message.chat.id,
-            text=response,
-            parse_mode="Markdown",
-            link_preview_options=LinkPreviewOptions(is_disabled=True),
+        send_static_screen(
+            bot,
+            message.chat.id,
+            get_static_screen(StaticScreenName.ABOUT),
+            user_name,
         )
 
     except Exception as error:
@@ -10,14 +10,14 @@ from telebot.types import Message
 
 from pytmbot import exceptions
 from pytmbot.exceptions import ErrorContext
-from pytmbot.globals import get_emoji_converter, get_keyboards
-from pytmbot.handlers.handlers_util.utils import send_telegram_message
+from pytmbot.handlers.handlers_util.static_screens import (
+    StaticScreenName,
+    get_static_screen,
+    send_static_screen,
+)
 from pytmbot.logs import Logger
-from pytmbot.parsers.compiler import Compiler
 
 logger = Logger()
-em = get_emoji_converter()
-keyboards = get_keyboards()
 
 
 @logger.session_decorator
@@ -34,26 +34,16 @@ def handle_navigation(message: Message, bot: TeleBot) -> None:
     """
     try:
         bot.send_chat_action(message.chat.id, "typing")
-        main_keyboard = keyboards.build_reply_keyboard()
 
         first_name = (
             message.from_user.first_name if message.from_user else None
         ) or "User"
 
-        emojis = {
-            "thought_balloon": em.get_emoji("thought_balloon"),
-        }
-
-        response = Compiler.quick_render(
-            template_name="b_back.jinja2", first_name=first_name, **emojis
-        )
-
-        send_telegram_message(
-            bot=bot,
-            chat_id=message.chat.id,
-            text=response,
-            reply_markup=main_keyboard,
-            parse_mode="HTML",
+        send_static_screen(
+            bot,
+            message.chat.id,
+            get_static_screen(StaticScreenName.NAVIGATION),
+            first_name,
         )
 
     except Exception as error:
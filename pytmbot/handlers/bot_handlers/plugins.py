@@ -10,15 +10,16 @@ from telebot.types import Message
 
 from pytmbot import exceptions
 from pytmbot.exceptions import ErrorContext
-from pytmbot.globals import get_emoji_converter, get_keyboards
+from pytmbot.handlers.handlers_util.static_screens import (
+    get_plugins_screen,
+    plugin_index_items,
+    send_static_screen,
+)
 from pytmbot.handlers.handlers_util.utils import send_telegram_message
 from pytmbot.logs import Logger
-from pytmbot.parsers.compiler import Compiler
 from pytmbot.plugins.plugin_manager import PluginManager
 
 logger = Logger()
-em = get_emoji_converter()
-keyboards = get_keyboards()
 plugin_manager = PluginManager()
 
 
@@ -40,12 +41,11 @@ def handle_plugins(message: Message, bot: TeleBot) -> None:
         ) or "User"
         bot.send_chat_action(message.chat.id, "typing")
 
-        # Fetch plugin information
-        keys = plugin_manager.get_merged_index_keys()
-        plugin_names = plugin_manager.get_plugin_names()
+        # Registry state is the screen's cache key
+        index_keys, plugins = plugin_index_items(plugin_manager)
 
         # Check if there are any plugins available
-        if not plugin_names:
+        if not plugins:
             send_telegram_message(
                 bot=bot,
                 chat_id=message.chat.id,
@@ -54,36 +54,11 @@ def handle_plugins(message: Message, bot: TeleBot) -> None:
             )
             return
 
-        # Continue with normal plugin handling if plugins exist
-        plugin_descriptions = plugin_manager.get_plugin_descriptions()
-
-        # Create plugin information dictionary
-        plugins = {
-            name: plugin_descriptions.get(name, "No description available")
-            for name in plugin_names
-        }
-
-        # Build the keyboard
-        plugins_keyboard = keyboards.build_reply_keyboard(plugin_keyboard_data=keys)
-
-        emojis = {
-            "thought_balloon": em.get_emoji("thought_balloon"),
-        }
-
-        # Compile the response using the template
-        response = Compiler.quick_render(
-            template_name="b_plugins.jinja2",
-            first_name=first_name,
-            plugins=plugins,
-            **emojis,
-        )
-
-        send_telegram_message(
-            bot=bot,
-            chat_id=message.chat.id,
-            text=response,
-            reply_markup=plugins_keyboard,
-            parse_mode="Markdown",
+        send_static_screen(
+            bot,
+            message.chat.id,
+            get_plugins_screen(index_keys, plugins),
+            first_name,
         )
 
     except Exception as error:
@@ -6,17 +6,18 @@ also providing basic information about the status of local servers.
 """
 
 from telebot import TeleBot
-from telebot.types import LinkPreviewOptions, Message
+from telebot.types import Message
 
 from pytmbot import exceptions
 from pytmbot.exceptions import ErrorContext
-from pytmbot.globals import get_keyboards
-from pytmbot.handlers.handlers_util.utils import send_telegram_message
+from pytmbot.handlers.handlers_util.static_screens import (
+    StaticScreenName,
+    get_static_screen,
+    send_static_screen,
+)
 from pytmbot.logs import Logger
-from pytmbot.parsers.compiler import Compiler
 
 logger = Logger()
-keyboards = get_keyboards()
 
 
 @logger.session_decorator
@@ -24,23 +25,15 @@ def handle_start(message: Message, bot: TeleBot) -> None:
     try:
         bot.send_chat_action(message.chat.id, "typing")
 
-        keyboard = keyboards.build_reply_keyboard()
-
         first_name = (
             message.from_user.first_name if message.from_user else None
         ) or "User"
 
-        answer = Compiler.quick_render(
-            template_name="b_index.jinja2", first_name=first_name
-        )
-
-        send_telegram_message(
-            bot=bot,
-            chat_id=message.chat.id,
-            text=answer,
-            reply_markup=keyboard,
-            parse_mode="Markdown",
-            link_preview_options=LinkPreviewOptions(is_disabled=True),
+        send_static_screen(
+            bot,
+            message.chat.id,
+            get_static_screen(StaticScreenName.START),
+            first_name,
         )
 
     except Exception as error:
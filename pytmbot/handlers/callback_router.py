@@ -0,0 +1,139 @@
+#!/usr/local/bin/python3
+"""
+(c) Copyright 2025, Denis Rozhnovskiy <pytelemonbot@mail.ru>
+pyTMBot - A simple Telegram bot to handle Docker containers and images,
+also providing basic information about the status of local servers.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Final
+
+from telebot import TeleBot
+from telebot.types import CallbackQuery
+
+type RouteCallback = Callable[..., object]
+
+# Set on the ``CallbackQuery`` by ``matches`` so ``dispatch`` does not resolve again.
+_ROUTE_ATTRIBUTE: Final[str] = "_pytmbot_callback_route"
+
+
+class CallbackMatch(StrEnum):
+    """How a callback-data key is compared against ``CallbackQuery.data``."""
+
+    # ``data == key`` or ``data.startswith(f"{key}:")``
+    SEGMENT = "segment"
+    # ``data.startswith(key)``
+    PREFIX = "prefix"
+
+
+@dataclass(frozen=True, slots=True)
+class CallbackPattern:
+    """One callback-data key a handler answers to."""
+
+    key: str
+    match: CallbackMatch = CallbackMatch.SEGMENT
+
+
+@dataclass(frozen=True, slots=True)
+class CallbackRoute:
+    """Handler reachable through the router; ``order`` is registration order."""
+
+    name: str
+    callback: RouteCallback
+    order: int
+
+
+class _TrieNode:
+    __slots__ = ("children", "prefix_route", "exact_route")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        self.prefix_route: CallbackRoute | None = None
+        self.exact_route: CallbackRoute | None = None
+
+
+def _earliest(
+    current: CallbackRoute | None, candidate: CallbackRoute | None
+) -> CallbackRoute | None:
+    if current is None:
+        return candidate
+    if candidate is None or current.order <= candidate.order:
+        return current
+    return candidate
+
+
+class CallbackRouter:
+    """
+    Prefix trie over callback-data keys, registered as one telebot handler.
+
+    Resolution walks ``data`` once, so its cost depends on the callback-data
+    length rather than on the number of handlers. When several keys match,
+    the route registered first wins, which is the order telebot applied when
+    every handler had its own filter.
+    """
+
+    __slots__ = ("_root", "_route_count")
+
+    def __init__(self) -> None:
+        self._root = _TrieNode()
+        self._route_count = 0
+
+    def add(
+        self, name: str, callback: RouteCallback, patterns: Iterable[CallbackPattern]
+    ) -> CallbackRoute:
+        route = CallbackRoute(name=name, callback=callback, order=self._route_count)
+        self._route_count += 1
+        for pattern in patterns:
+            if pattern.match is CallbackMatch.SEGMENT:
+                node = self._node_for(pattern.key)
+                node.exact_route = _earliest(node.exact_route, route)
+                node = self._node_for(f"{pattern.key}:")
+            else:
+                node = self._node_for(pattern.key)
+            node.prefix_route = _earliest(node.prefix_route, route)
+        return route
+
+    def _node_for(self, key: str) -> _TrieNode:
+        node = self._root
+        for char in key:
+            node = node.children.setdefault(char, _TrieNode())
+        return node
+
+    def resolve(self, data: str | None) -> CallbackRoute | None:
+        """Return the route for ``data``, or ``None`` when nothing matches."""
+        if data is None:
+            return None
+        node = self._root
+        best = node.prefix_route
+        for char in data:
+            child = node.children.get(char)
+            if child is None:
+                return best
+            node = child
+            best = _earliest(best, node.prefix_route)
+        return _earliest(best, node.exact_route)
+
+    def matches(self, call: CallbackQuery) -> bool:
+        """
+        Telebot ``func`` filter for the single registered callback handler.
+
+        The resolved route is kept on ``call`` for ``dispatch``, which telebot
+        calls with the same object once the filter has passed.
+        """
+        route = self.resolve(call.data)
+        if route is None:
+            return False
+        setattr(call, _ROUTE_ATTRIBUTE, route)
+        return True
+
+    def dispatch(self, call: CallbackQuery, bot: TeleBot) -> object:
+        route = getattr(call, _ROUTE_ATTRIBUTE, None)
+        if not isinstance(route, CallbackRoute):
+            route = self.resolve(call.data)
+        if route is None:
+            return None
+        return route.callback(call, bot=bot)
@@ -13,6 +13,7 @@ from telebot import TeleBot
 from telebot.types import InlineKeyboardMarkup, Message
 
 from pytmbot import exceptions
+from pytmbot.adapters.docker.client import docker_endpoint_names
 from pytmbot.adapters.docker.containers_info import retrieve_containers_stats
 from pytmbot.exceptions import ErrorContext
 from pytmbot.globals import ButtonDataType, get_emoji_converter, get_keyboards
@@ -32,6 +33,7 @@ em = get_emoji_converter()
 keyboards = get_keyboards()
 
 CONTAINERS_PAGE_CALLBACK_PREFIX: Final[str] = "__containers_page__"
+BACK_TO_CONTAINERS_CALLBACK: Final[str] = "back_to_containers"
 CONTAINERS_DEFAULT_PAGE_SIZE: Final[int] = 8
 
 
@@ -81,8 +83,10 @@ def _render_container_page_text(
     total_pages: int,
     total_items: int,
 ) -> str:
+    # The rows are the whole template input; equal rows render the same page.
     text = Compiler.quick_render(
         template_name="d_containers.jinja2",
+        cache_key=tuple(tuple(item.items()) for item in page_items),
         context=page_items,
         **_get_containers_emojis(),
     )
@@ -138,8 +142,12 @@ def _build_containers_keyboard(
     user_id: int,
 ) -> InlineKeyboardMarkup | None:
     keyboard_buttons = []
+    primary_endpoint = docker_endpoint_names()[0]
 
     for container in page_items:
+        # Container actions are routed to the primary Docker endpoint only.
+        if container.get("endpoint", primary_endpoint) != primary_endpoint:
+            continue
         container_name = str(container.get("name", "")).strip()
         container_id = str(container.get("id", "")).strip().lower()
         container_ref = container_id or container_name.lower()
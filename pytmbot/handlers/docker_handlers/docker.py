@@ -12,6 +12,10 @@ from pytmbot import exceptions
 from pytmbot.adapters.docker.containers_info import fetch_docker_counters
 from pytmbot.exceptions import ErrorContext
 from pytmbot.globals import get_emoji_converter, get_keyboards
+from pytmbot.handlers.handlers_util.agent_hosts import (
+    AgentHostScreen,
+    send_host_selector,
+)
 from pytmbot.handlers.handlers_util.utils import send_telegram_message
 from pytmbot.logs import Logger
 from pytmbot.parsers.compiler import Compiler
@@ -41,6 +45,7 @@ def handle_docker(message: Message, bot: TeleBot) -> None:
             reply_markup=reply_keyboard,
             parse_mode="HTML",
         )
+        send_host_selector(bot, message.chat.id, AgentHostScreen.DOCKER)
 
     except Exception as error:
         bot.send_message(
@@ -97,7 +102,10 @@ def _compile_message() -> str:
 
     try:
         return Compiler.quick_render(
-            template_name="d_docker.jinja2", context=docker_counters, **emojis
+            template_name="d_docker.jinja2",
+            cache_key=tuple(sorted(docker_counters.items())),
+            context=docker_counters,
+            **emojis,
         )
     except Exception as error:
         raise exceptions.TemplateError(
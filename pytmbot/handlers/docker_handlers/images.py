@@ -40,6 +40,7 @@ keyboards = get_keyboards()
 IMAGES_PAGE_CALLBACK_PREFIX: Final[str] = "__images_page__"
 IMAGE_INFO_CALLBACK_PREFIX: Final[str] = "__image_info__"
 IMAGE_EXTRA_CALLBACK_PREFIX: Final[str] = "__image_extra__"
+IMAGE_UPDATES_CALLBACK_PREFIX: Final[str] = "__check_updates__"
 IMAGES_DEFAULT_PAGE_SIZE: Final[int] = 2
 IMAGES_CACHE_TTL_SECONDS: Final[float] = 30.0
 
@@ -65,6 +66,8 @@ type UsageData = dict[str, object]
 
 _images_cache_lock = RLock()
 _images_cache: tuple[ImageList, float] | None = None
+# Bumped on every snapshot refresh; versions rendered pages in the parser cache.
+_images_generation = 0
 
 
 def _get_images_emojis() -> dict[str, str]:
@@ -78,12 +81,12 @@ def _get_images_emojis() -> dict[str, str]:
         "desktop_computer": em.get_emoji("desktop_computer"),
         "floppy_disk": em.get_emoji("floppy_disk"),
         "mantelpiece_clock": em.get_emoji("mantelpiece_clock"),
-        "person_technologist": em.get_emoji("person_technologist"),
+        "person_technologist": em.get_emoji("technologist"),
         "wrench": em.get_emoji("wrench"),
         "label": em.get_emoji("label"),
         "electric_plug": em.get_emoji("electric_plug"),
         "key": em.get_emoji("key"),
-        "arrow_right": em.get_emoji("arrow_right"),
+        "arrow_right": em.get_emoji("right_arrow"),
         "computer_mouse": em.get_emoji("computer_mouse"),
         "magnifying_glass": em.get_emoji("magnifying_glass_tilted_left"),
     }
@@ -317,16 +320,20 @@ def _prepare_images_for_listing(images: ImageList) -> ImageList:
     ]
 
 
-def _load_images_data() -> ImageList:
-    """Load image list with short-lived cache to speed up pagination navigation."""
-    global _images_cache
+def _load_images_snapshot() -> tuple[ImageList, int]:
+    """
+    Load image list with short-lived cache to speed up pagination navigation.
+
+    Returns the images together with the snapshot generation they belong to.
+    """
+    global _images_cache, _images_generation
 
     now = time.time()
     with _images_cache_lock:
         if _images_cache is not None:
             cached_images, cached_at = _images_cache
             if now - cached_at < IMAGES_CACHE_TTL_SECONDS:
-                return [dict(image) for image in cached_images]
+                return [dict(image) for image in cached_images], _images_generation
 
     images = fetch_image_details()
     if images is None:
@@ -341,8 +348,17 @@ def _load_images_data() -> ImageList:
     normalized = [image for image in images if isinstance(image, dict)]
     with _images_cache_lock:
         _images_cache = (normalized, now)
+        _images_generation += 1
+        generation = _images_generation
+    # Pages rendered from older generations can never be requested again.
+    Compiler.invalidate_results("d_images.jinja2")
 
-    return [dict(image) for image in normalized]
+    return [dict(image) for image in normalized], generation
+
+
+def _load_images_data() -> ImageList:
+    images, _ = _load_images_snapshot()
+    return images
 
 
 def _render_images_page_text(
@@ -351,13 +367,18 @@ def _render_images_page_text(
     page: int,
     total_pages: int,
     total_items: int,
+    generation: int | None = None,
 ) -> str:
     template_context = {
         "images": page_items,
         "emojis": _get_images_emojis(),
     }
+    # Within one snapshot generation, (page, total_pages, item count) pins the window.
     rendered = Compiler.quick_render(
         template_name="d_images.jinja2",
+        cache_key=None
+        if generation is None
+        else (generation, page, total_pages, len(page_items)),
         context=template_context,
     )
     footer = (
@@ -372,6 +393,7 @@ def _render_paginated_images_text(
     *,
     page: int,
     initial_page_size: int = IMAGES_DEFAULT_PAGE_SIZE,
+    generation: int | None = None,
 ) -> tuple[str, int, int, ImageList, int]:
     page_size = min(max(1, initial_page_size), max(1, len(images)))
 
@@ -382,6 +404,7 @@ def _render_paginated_images_text(
             page=window.page,
             total_pages=window.total_pages,
             total_items=window.total_items,
+            generation=generation,
         )
         if len(text) <= MAX_TELEGRAM_MESSAGE_LENGTH:
             start_index = (window.page - 1) * window.page_size
@@ -528,7 +551,7 @@ def _build_images_keyboard(
     keyboard_buttons.append(
         button_data(
             text="Check updates",
-            callback_data=f"__check_updates__:{user_id}",
+            callback_data=f"{IMAGE_UPDATES_CALLBACK_PREFIX}:{user_id}",
         )
     )
 
@@ -601,7 +624,7 @@ def _build_image_details_keyboard(
             ),
             button_data(
                 text="Check updates",
-                callback_data=f"__check_updates__:{user_id}",
+                callback_data=f"{IMAGE_UPDATES_CALLBACK_PREFIX}:{user_id}",
             ),
         ]
     )
@@ -810,13 +833,14 @@ def render_images_page(
     user_id: int,
 ) -> tuple[str, InlineKeyboardMarkup]:
     """Build paginated images text and keyboard for requested page."""
-    images = _load_images_data()
+    images, generation = _load_images_snapshot()
 
     prepared_images = _prepare_images_for_listing(images)
     text, safe_page, total_pages, page_items, start_index = (
         _render_paginated_images_text(
             prepared_images,
             page=page,
+            generation=generation,
         )
     )
     keyboard = _build_images_keyboard(
@@ -11,6 +11,7 @@ from telebot import TeleBot
 from telebot.types import CallbackQuery
 
 from pytmbot.handlers.docker_handlers.containers import (
+    BACK_TO_CONTAINERS_CALLBACK,
     CONTAINERS_PAGE_CALLBACK_PREFIX,
     get_list_of_containers_again,
 )
@@ -34,7 +35,7 @@ def _parse_back_callback_data(callback_data: str) -> tuple[int, int | None]:
     - 'back_to_containers' -> first page for current user
     - '__containers_page__:{page}:{user_id}'
     """
-    if callback_data == "back_to_containers":
+    if callback_data == BACK_TO_CONTAINERS_CALLBACK:
         return 1, None
 
     parsed = parse_page_callback_data(
@@ -16,6 +16,7 @@ from pytmbot.handlers.docker_handlers.inline.container_runtime_info import (
     CONTAINER_EXTRA_ACTION_VOLUMES,
     CONTAINER_EXTRA_CALLBACK_PREFIX,
 )
+from pytmbot.handlers.docker_handlers.inline.manage import MANAGE_CALLBACK_PREFIX
 from pytmbot.handlers.docker_handlers.pagination import (
     build_page_callback_data,
     parse_container_full_info_callback_data,
@@ -162,7 +163,7 @@ def handle_containers_full_info(call: CallbackQuery, bot: TeleBot) -> None:
                     ),
                     button_data(
                         text=f"{emojis.get('bullseye', '🎯')} Manage",
-                        callback_data=f"__manage__:{container_ref}:{call.from_user.id}",
+                        callback_data=f"{MANAGE_CALLBACK_PREFIX}:{container_ref}:{call.from_user.id}",
                     ),
                 ]
             )
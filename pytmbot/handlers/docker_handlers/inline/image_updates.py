@@ -12,7 +12,10 @@ from telebot.types import CallbackQuery, InlineKeyboardMarkup
 
 from pytmbot.adapters.docker.updates import DockerImageUpdater, UpdaterStatus
 from pytmbot.globals import ButtonDataType, get_keyboards
-from pytmbot.handlers.docker_handlers.images import IMAGES_PAGE_CALLBACK_PREFIX
+from pytmbot.handlers.docker_handlers.images import (
+    IMAGE_UPDATES_CALLBACK_PREFIX,
+    IMAGES_PAGE_CALLBACK_PREFIX,
+)
 from pytmbot.handlers.docker_handlers.pagination import build_page_callback_data
 from pytmbot.handlers.handlers_util.callback_auth import (
     authorize_callback_request,
@@ -28,11 +31,11 @@ keyboards = get_keyboards()
 
 
 def _build_image_updates_keyboard(target_user_id: int | None) -> InlineKeyboardMarkup:
-    check_updates_callback = "__check_updates__"
+    check_updates_callback = IMAGE_UPDATES_CALLBACK_PREFIX
     keyboard_buttons = []
 
     if target_user_id is not None:
-        check_updates_callback = f"__check_updates__:{target_user_id}"
+        check_updates_callback = f"{IMAGE_UPDATES_CALLBACK_PREFIX}:{target_user_id}"
         keyboard_buttons.append(
             button_data(
                 text="Back to images",
@@ -90,7 +93,7 @@ def _authorize_image_updates_callback(
 
     try:
         target_user_id = parse_callback_target_user(
-            call.data or "", "__check_updates__"
+            call.data or "", IMAGE_UPDATES_CALLBACK_PREFIX
         )
     except ValueError:
         return reject_callback("This image updates button is no longer valid.", None)
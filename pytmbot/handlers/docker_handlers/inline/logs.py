@@ -8,18 +8,27 @@ also providing basic information about the status of local servers.
 import hashlib
 import io
 import time
+from collections.abc import Callable
 from dataclasses import dataclass
 from threading import RLock
-from typing import Final
+from typing import IO, Final
 
 from telebot import TeleBot
 from telebot.types import CallbackQuery, InlineKeyboardMarkup
 
+from pytmbot.adapters.docker.container_logs import LogSearchResult, LogSeverity
 from pytmbot.exceptions import ContainerLogsUnavailableError
-from pytmbot.globals import ButtonDataType, get_emoji_converter, get_keyboards
+from pytmbot.globals import (
+    ButtonDataType,
+    get_emoji_converter,
+    get_keyboards,
+    settings,
+)
 from pytmbot.handlers.handlers_util.docker import (
     authorize_docker_callback_request,
+    export_sanitized_logs,
     get_sanitized_logs,
+    search_sanitized_logs,
     show_handler_info,
 )
 from pytmbot.handlers.server_handlers.inline.common import edit_callback_message_text
@@ -42,12 +51,21 @@ MAX_TELEGRAM_MESSAGE_LENGTH: Final[int] = 4096
 MAX_LOGS_PAGE_CHARS: Final[int] = 3200
 LOGS_SESSION_TTL_SECONDS: Final[int] = 300
 LOGS_CALLBACK_PREFIX: Final[str] = "__get_logs__"
+LOGS_SEARCH_CALLBACK_PREFIX: Final[str] = "__search_logs__"
+LOGS_EXPORT_CALLBACK_PREFIX: Final[str] = "__export_logs__"
 LOGS_ACTION_OPEN: Final[str] = "open"
 LOGS_ACTION_NAV: Final[str] = "nav"
 LOGS_ACTION_REFRESH: Final[str] = "refresh"
 LOGS_ACTION_FILE: Final[str] = "file"
+LOGS_ACTION_SEARCH: Final[str] = "search"
+LOGS_ACTION_EXPORT: Final[str] = "export"
 LOGS_TRUNCATION_NOTICE: Final[str] = "[LOGS TRUNCATED FOR TELEGRAM LENGTH LIMIT]\n"
 LOGS_EMPTY_MESSAGE: Final[str] = "No logs are available for this container."
+LOGS_SEARCH_EMPTY_MESSAGE: Final[str] = "No matching log lines were found."
+LOGS_SEARCH_LABELS: Final[dict[str, str]] = {
+    LogSeverity.ERROR: "Errors",
+    LogSeverity.WARNING: "Warnings",
+}
 LOGS_FILE_AUTO_DELETE_DELAY_SECONDS: Final[int] = 30
 LOGS_FILE_DELETION_NOTICE: Final[str] = (
     "This file will be automatically deleted in 30 seconds."
@@ -69,6 +87,7 @@ class ParsedLogsCallback:
     container_name: str | None = None
     session_id: str | None = None
     page_index: int = 0
+    search_severity: str | None = None
 
 
 @dataclass(slots=True)
@@ -79,6 +98,8 @@ class LogsSession:
     raw_logs: str
     chunks: list[str]
     created_at: float
+    search_severity: str | None = None
+    search_summary: str | None = None
 
 
 class LogsSessionStore:
@@ -109,6 +130,8 @@ class LogsSessionStore:
         user_id: int,
         raw_logs: str,
         chunks: list[str],
+        search_severity: str | None = None,
+        search_summary: str | None = None,
     ) -> LogsSession:
         now = time.time()
         with self._lock:
@@ -125,6 +148,8 @@ class LogsSessionStore:
                 raw_logs=raw_logs,
                 chunks=chunks,
                 created_at=now,
+                search_severity=search_severity,
+                search_summary=search_summary,
             )
             self._sessions[session_id] = session
             return session
@@ -223,12 +248,41 @@ def _parse_logs_callback_data(callback_data: str) -> ParsedLogsCallback:
     raise ValueError("Unsupported logs callback format")
 
 
+def _parse_logs_search_callback_data(callback_data: str) -> ParsedLogsCallback:
+    """Parse ``__search_logs__:<session_id>:<severity>:<user_id>``."""
+    parts = callback_data.split(":")
+    if len(parts) != 4 or parts[0] != LOGS_SEARCH_CALLBACK_PREFIX:
+        raise ValueError("Invalid logs search callback format")
+    if parts[2] not in LOGS_SEARCH_LABELS:
+        raise ValueError("Unsupported logs search severity")
+    return ParsedLogsCallback(
+        action=LOGS_ACTION_SEARCH,
+        session_id=parts[1],
+        search_severity=parts[2],
+        user_id=int(parts[3]),
+    )
+
+
+def _parse_logs_export_callback_data(callback_data: str) -> ParsedLogsCallback:
+    """Parse ``__export_logs__:<session_id>:<user_id>``."""
+    parts = callback_data.split(":")
+    if len(parts) != 3 or parts[0] != LOGS_EXPORT_CALLBACK_PREFIX:
+        raise ValueError("Invalid logs export callback format")
+    return ParsedLogsCallback(
+        action=LOGS_ACTION_EXPORT,
+        session_id=parts[1],
+        user_id=int(parts[2]),
+    )
+
+
 def _build_logs_chunks(
-    logs: str, max_chunk_chars: int = MAX_LOGS_PAGE_CHARS
+    logs: str,
+    max_chunk_chars: int = MAX_LOGS_PAGE_CHARS,
+    empty_message: str = LOGS_EMPTY_MESSAGE,
 ) -> list[str]:
     """Split logs into pages where index 0 contains newest logs."""
     if not logs.strip():
-        return [LOGS_EMPTY_MESSAGE]
+        return [empty_message]
 
     chunks: list[str] = []
     end = len(logs)
@@ -246,7 +300,20 @@ def _build_logs_chunks(
             chunks.append(chunk)
         end = start
 
-    return chunks or [LOGS_EMPTY_MESSAGE]
+    return chunks or [empty_message]
+
+
+def _build_search_summary(severity: str, result: LogSearchResult) -> str:
+    """Describe search scope so users know whether the result is partial."""
+    summary = (
+        f"{LOGS_SEARCH_LABELS.get(severity, severity)}: "
+        f"{result.match_count} match(es) in {result.scanned_lines} line(s)"
+    )
+    if result.timed_out:
+        return f"{summary}, time limit reached"
+    if result.limit_reached:
+        return f"{summary}, match limit reached, newest shown"
+    return summary
 
 
 def _is_logs_session_owner(call: CallbackQuery, session: LogsSession) -> bool:
@@ -323,6 +390,7 @@ def _render_logs_page(
     emojis: dict[str, str],
     page_index: int,
     total_pages: int,
+    search_summary: str | None = None,
 ) -> tuple[str, bool]:
     """
     Render one logs page and guarantee Telegram hard message limit.
@@ -331,6 +399,8 @@ def _render_logs_page(
         tuple[str, bool]: (rendered_text, was_truncated)
     """
     header = f"[Page {page_index + 1}/{total_pages} | Newest first]"
+    if search_summary:
+        header = f"{header}\n[{search_summary}]"
     logs_payload = f"{header}\n{logs_chunk}"
     context = _render_logs_template(
         logs=logs_payload, container_name=container_name, emojis=emojis
@@ -398,19 +468,51 @@ def _build_logs_keyboard(
             )
         )
 
+    keyboard_buttons.extend(
+        button_data(
+            text=label,
+            callback_data=(
+                f"{LOGS_SEARCH_CALLBACK_PREFIX}:"
+                f"{session.session_id}:{severity}:{session.user_id}"
+            ),
+        )
+        for severity, label in LOGS_SEARCH_LABELS.items()
+        if severity != session.search_severity
+    )
+
+    if session.search_severity:
+        keyboard_buttons.append(
+            button_data(
+                text="All logs",
+                callback_data=(
+                    f"{LOGS_CALLBACK_PREFIX}:{LOGS_ACTION_OPEN}:"
+                    f"{session.container_name}:{session.user_id}"
+                ),
+            )
+        )
+
+    # Refreshing a search result runs the same search again.
+    refresh_callback = (
+        f"{LOGS_SEARCH_CALLBACK_PREFIX}:{session.session_id}:"
+        f"{session.search_severity}:{session.user_id}"
+        if session.search_severity
+        else f"{LOGS_CALLBACK_PREFIX}:{LOGS_ACTION_REFRESH}:"
+        f"{session.session_id}:{session.user_id}"
+    )
     keyboard_buttons.extend(
         [
+            button_data(text="Refresh", callback_data=refresh_callback),
             button_data(
-                text="Refresh",
+                text="As file",
                 callback_data=(
-                    f"{LOGS_CALLBACK_PREFIX}:{LOGS_ACTION_REFRESH}:"
+                    f"{LOGS_CALLBACK_PREFIX}:{LOGS_ACTION_FILE}:"
                     f"{session.session_id}:{session.user_id}"
                 ),
             ),
             button_data(
-                text="As file",
+                text="Export full log",
                 callback_data=(
-                    f"{LOGS_CALLBACK_PREFIX}:{LOGS_ACTION_FILE}:"
+                    f"{LOGS_EXPORT_CALLBACK_PREFIX}:"
                     f"{session.session_id}:{session.user_id}"
                 ),
             ),
@@ -453,6 +555,7 @@ def _edit_logs_message(
         emojis=emojis,
         page_index=safe_page_index,
         total_pages=total_pages,
+        search_summary=session.search_summary,
     )
     inline_keyboard = _build_logs_keyboard(
         session=session, current_page=safe_page_index, total_pages=total_pages
@@ -520,6 +623,52 @@ def _open_logs_session(
     )
 
 
+def _open_logs_search(
+    call: CallbackQuery,
+    bot: TeleBot,
+    source_session: LogsSession,
+    severity: str,
+    emojis: dict[str, str],
+) -> bool:
+    container_name = source_session.container_name
+    logger.info(
+        "bot.handler.docker.logging.search.info",
+        container_name=container_name,
+        severity=severity,
+    )
+    try:
+        matches, result = search_sanitized_logs(
+            container_name, call, bot.token, severity
+        )
+    except ContainerLogsUnavailableError:
+        logger.info(
+            "bot.handler.docker.logging.logs.unavailable.info",
+            container_name=container_name,
+            reason="logging_driver_not_readable",
+        )
+        return show_handler_info(
+            call,
+            text=f"{container_name}: {LOGS_UNSUPPORTED_DRIVER_MESSAGE}",
+            bot=bot,
+        )
+
+    session = _logs_sessions.create(
+        container_name=container_name,
+        user_id=source_session.user_id,
+        raw_logs=matches,
+        chunks=_build_logs_chunks(matches, empty_message=LOGS_SEARCH_EMPTY_MESSAGE),
+        search_severity=severity,
+        search_summary=_build_search_summary(severity, result),
+    )
+    return _edit_logs_message(
+        call=call,
+        bot=bot,
+        session=session,
+        page_index=0,
+        emojis=emojis,
+    )
+
+
 def _get_session_or_show_error(
     call: CallbackQuery, session_id: str, bot: TeleBot
 ) -> LogsSession | None:
@@ -558,19 +707,104 @@ def _send_logs_as_file(call: CallbackQuery, bot: TeleBot, session: LogsSession)
             bot=bot,
         )
 
-    chat_id = call.message.chat.id
-    requester_user_id = int(call.from_user.id)
     filename = f"{session.container_name}-logs.txt"
     with io.BytesIO(session.raw_logs.encode("utf-8")) as logs_file:
         logs_file.name = filename
-        sent_message = bot.send_document(
-            chat_id=chat_id,
+        return _send_logs_document(
+            call=call,
+            bot=bot,
             document=logs_file,
-            caption=(
-                f"Logs file for {session.container_name}\n\n{LOGS_FILE_DELETION_NOTICE}"
-            ),
-            visible_file_name=filename,
+            filename=filename,
+            caption=f"Logs file for {session.container_name}",
+        )
+
+
+def _send_logs_export(call: CallbackQuery, bot: TeleBot, session: LogsSession) -> bool:
+    """Stream the full container log into a compressed archive and upload it."""
+    if not _validate_logs_session_access(
+        call=call,
+        bot=bot,
+        session=session,
+        requested_action=LOGS_ACTION_EXPORT,
+    ):
+        return False
+
+    if call.message is None:
+        logger.warning("bot.handler.docker.logging.cannot.send.warn")
+        return show_handler_info(
+            call,
+            text="This logs file can no longer be sent from this message.",
+            bot=bot,
+        )
+
+    try:
+        export = export_sanitized_logs(
+            session.container_name,
+            call,
+            bot.token,
+            compression=settings.docker.logs_export_compression,
+            max_bytes=settings.docker.logs_export_max_mb * 1024 * 1024,
+        )
+    except ContainerLogsUnavailableError:
+        logger.info(
+            "bot.handler.docker.logging.logs.unavailable.info",
+            container_name=session.container_name,
+            reason="logging_driver_not_readable",
+        )
+        return show_handler_info(
+            call,
+            text=f"{session.container_name}: {LOGS_UNSUPPORTED_DRIVER_MESSAGE}",
+            bot=bot,
+        )
+
+    with export:
+        if export.raw_bytes == 0:
+            return show_handler_info(
+                call,
+                text=f"{session.container_name}: No logs are available right now.",
+                bot=bot,
+            )
+
+        logger.info(
+            "bot.handler.docker.logging.logs.export.info",
+            container_name=session.container_name,
+            raw_bytes=export.raw_bytes,
+            compressed_bytes=export.compressed_bytes,
+            truncated=export.truncated,
         )
+        filename = f"{session.container_name}-logs.txt.{export.extension}"
+        caption = f"Full log archive for {session.container_name}"
+        if export.truncated:
+            caption = f"{caption} (truncated at size/time limit)"
+        return _send_logs_document(
+            call=call,
+            bot=bot,
+            document=export.file,
+            filename=filename,
+            caption=caption,
+        )
+
+
+def _send_logs_document(
+    call: CallbackQuery,
+    bot: TeleBot,
+    *,
+    document: IO[bytes],
+    filename: str,
+    caption: str,
+) -> bool:
+    """Upload a logs document and schedule its privacy auto-deletion."""
+    if call.message is None:
+        return False
+
+    chat_id = call.message.chat.id
+    requester_user_id = int(call.from_user.id)
+    sent_message = bot.send_document(
+        chat_id=chat_id,
+        document=document,
+        caption=f"{caption}\n\n{LOGS_FILE_DELETION_NOTICE}",
+        visible_file_name=filename,
+    )
 
     deletion_result = deletion_manager.schedule_deletion(
         bot=bot,
@@ -614,22 +848,14 @@ def _send_logs_as_file(call: CallbackQuery, bot: TeleBot, session: LogsSession)
     )
 
 
-# func=lambda call: call.data.startswith('__get_logs__')
-@logger.session_decorator
-@two_factor_auth_required
-def handle_get_logs(call: CallbackQuery, bot: TeleBot) -> None:
-    """
-    Handles the callback for getting logs of a container.
-
-    Args:
-        call (CallbackQuery): The callback query object.
-        bot (TeleBot): The Telegram bot object.
-
-    Returns:
-        None
-    """
+def _authorize_logs_callback(
+    call: CallbackQuery,
+    bot: TeleBot,
+    parse: Callable[[str], ParsedLogsCallback],
+) -> ParsedLogsCallback | None:
+    """Parse logs callback data and check that the caller may act for its user."""
     try:
-        parsed = _parse_logs_callback_data(call.data or "")
+        parsed = parse(call.data or "")
     except (ValueError, TypeError):
         logger.warning("bot.handler.docker.logging.invalid.logs.fail")
         show_handler_info(call, text="This logs button is no longer valid.", bot=bot)
@@ -645,6 +871,26 @@ def handle_get_logs(call: CallbackQuery, bot: TeleBot) -> None:
         )
         show_handler_info(call=call, text=f"Getting logs: {deny_reason}", bot=bot)
         return None
+    return parsed
+
+
+# func=lambda call: call.data.startswith('__get_logs__')
+@logger.session_decorator
+@two_factor_auth_required
+def handle_get_logs(call: CallbackQuery, bot: TeleBot) -> None:
+    """
+    Handles the callback for getting logs of a container.
+
+    Args:
+        call (CallbackQuery): The callback query object.
+        bot (TeleBot): The Telegram bot object.
+
+    Returns:
+        None
+    """
+    parsed = _authorize_logs_callback(call, bot, _parse_logs_callback_data)
+    if parsed is None:
+        return None
 
     emojis: dict[str, str] = {"thought_balloon": em.get_emoji("thought_balloon")}
 
@@ -741,3 +987,70 @@ def handle_get_logs(call: CallbackQuery, bot: TeleBot) -> None:
 
     show_handler_info(call, text="This logs action is not supported.", bot=bot)
     return None
+
+
+# func=lambda call: call.data.startswith('__search_logs__')
+@logger.session_decorator
+@two_factor_auth_required
+def handle_search_logs(call: CallbackQuery, bot: TeleBot) -> None:
+    """
+    Handles the callback for searching the logs of an open logs session.
+
+    Args:
+        call (CallbackQuery): The callback query object.
+        bot (TeleBot): The Telegram bot object.
+
+    Returns:
+        None
+    """
+    parsed = _authorize_logs_callback(call, bot, _parse_logs_search_callback_data)
+    if parsed is None or not parsed.session_id or not parsed.search_severity:
+        return None
+
+    session = _get_session_or_show_error(call, parsed.session_id, bot)
+    if not session:
+        return None
+    if not _validate_logs_session_access(
+        call=call,
+        bot=bot,
+        session=session,
+        requested_action=LOGS_ACTION_SEARCH,
+    ):
+        return None
+
+    if session.search_severity:
+        # The new results replace this search result in the same message.
+        _logs_sessions.remove(session.session_id)
+    _open_logs_search(
+        call=call,
+        bot=bot,
+        source_session=session,
+        severity=parsed.search_severity,
+        emojis={"thought_balloon": em.get_emoji("thought_balloon")},
+    )
+    return None
+
+
+# func=lambda call: call.data.startswith('__export_logs__')
+@logger.session_decorator
+@two_factor_auth_required
+def handle_export_logs(call: CallbackQuery, bot: TeleBot) -> None:
+    """
+    Handles the callback for exporting the full log of an open logs session.
+
+    Args:
+        call (CallbackQuery): The callback query object.
+        bot (TeleBot): The Telegram bot object.
+
+    Returns:
+        None
+    """
+    parsed = _authorize_logs_callback(call, bot, _parse_logs_export_callback_data)
+    if parsed is None or not parsed.session_id:
+        return None
+
+    session = _get_session_or_show_error(call, parsed.session_id, bot)
+    if not session:
+        return None
+    _send_logs_export(call=call, bot=bot, session=session)
+    return None
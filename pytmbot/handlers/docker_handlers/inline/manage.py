@@ -5,10 +5,13 @@ pyTMBot - A simple Telegram bot to handle Docker containers and images,
 also providing basic information about the status of local servers.
 """
 
+from typing import Final
+
 from telebot import TeleBot
 from telebot.types import CallbackQuery
 
 from pytmbot.adapters.docker.client import docker_client_context
+from pytmbot.adapters.docker.container_manager import get_compose_project
 from pytmbot.adapters.docker.utils import get_container_state
 from pytmbot.globals import ButtonDataType, get_emoji_converter, get_keyboards
 from pytmbot.handlers.handlers_util.docker import (
@@ -29,6 +32,8 @@ em = get_emoji_converter()
 keyboards = get_keyboards()
 container_state = ContainersState
 
+MANAGE_CALLBACK_PREFIX: Final[str] = "__manage__"
+
 
 # func=lambda call: call.data.startswith('__manage__')
 @logger.catch()
@@ -58,6 +63,7 @@ def handle_manage_container(call: CallbackQuery, bot: TeleBot) -> None:
     # Get container state
     with docker_client_context() as adapter:
         state = get_container_state(container_name, docker_client=adapter)
+        compose_project = get_compose_project(container_name, docker_client=adapter)
     logger.info("bot.handler.docker.manage.container.state.info")
 
     # Build keyboard buttons
@@ -92,6 +98,14 @@ def handle_manage_container(call: CallbackQuery, bot: TeleBot) -> None:
             )
         )
 
+    if compose_project:
+        keyboard_buttons.append(
+            button_data(
+                text=f"{em.get_emoji('recycling_symbol')} Restart project {compose_project}",
+                callback_data=f"__bulk_restart__:{container_name}:{auth_context.user_id}",
+            )
+        )
+
     # Always add back button
     keyboard_buttons.append(
         button_data(
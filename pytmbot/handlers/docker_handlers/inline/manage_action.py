@@ -6,12 +6,18 @@ also providing basic information about the status of local servers.
 """
 
 from collections.abc import Callable
+from typing import Final
 
 from telebot import TeleBot
 from telebot.types import CallbackQuery
 
-from pytmbot.adapters.docker.container_manager import ContainerManager
+from pytmbot.adapters.docker.container_manager import (
+    BulkContainerSelector,
+    ContainerManager,
+    get_compose_project,
+)
 from pytmbot.globals import ButtonDataType, get_keyboards
+from pytmbot.handlers.docker_handlers.inline.manage import MANAGE_CALLBACK_PREFIX
 from pytmbot.handlers.handlers_util.docker import (
     get_manage_container_callback_context as get_authorized_container_callback_context,
 )
@@ -28,25 +34,13 @@ button_data = ButtonDataType
 keyboards = get_keyboards()
 container_manager = ContainerManager()
 
-
-def managing_action_fabric(call: CallbackQuery) -> bool:
-    """
-    Checks if a callback query data starts with a specific action.
-
-    Args:
-        call (CallbackQuery): The callback query object.
-
-    Returns:
-        bool: True if the callback query data starts with '__start__', '__stop__', or '__restart__',
-        False otherwise.
-    """
-    action = [
-        "__start__",
-        "__stop__",
-        "__restart__",
-    ]
-    callback_data = call.data or ""
-    return any(callback_data.startswith(action_name) for action_name in action)
+MANAGE_ACTION_PREFIXES: Final[tuple[str, ...]] = (
+    "__start__",
+    "__stop__",
+    "__restart__",
+    "__bulk_restart__",
+    "__bulk_restart_run__",
+)
 
 
 def _get_manage_action_context(
@@ -64,7 +58,7 @@ def _get_manage_action_context(
     return context.callback_data, context.container_name
 
 
-# func=lambda call: managing_action_fabric(call)
+# func=lambda call: call.data.startswith(MANAGE_ACTION_PREFIXES)
 @logger.session_decorator
 @two_factor_auth_required
 def handle_manage_container_action(call: CallbackQuery, bot: TeleBot) -> None:
@@ -87,6 +81,8 @@ def handle_manage_container_action(call: CallbackQuery, bot: TeleBot) -> None:
         "__start__": __start_container,
         "__stop__": __stop_container,
         "__restart__": __restart_container,
+        "__bulk_restart__": __confirm_bulk_restart_project,
+        "__bulk_restart_run__": __bulk_restart_project,
     }
     managing_action = split_string_into_octets(callback_data, octet_index=0)
 
@@ -138,7 +134,7 @@ def __restart_container(call: CallbackQuery, container_name: str, bot: TeleBot)
     def _on_restart_success(user_id: int) -> None:
         keyboards_key = button_data(
             text=f"Back to {container_name}",
-            callback_data=f"__manage__:{container_name}:{user_id}",
+            callback_data=f"{MANAGE_CALLBACK_PREFIX}:{container_name}:{user_id}",
         )
         keyboard = keyboards.build_inline_keyboard(keyboards_key)
         edit_callback_message_text(
@@ -162,6 +158,113 @@ def __restart_container(call: CallbackQuery, container_name: str, bot: TeleBot)
     )
 
 
+def _resolve_bulk_restart_target(
+    call: CallbackQuery, container_name: str, bot: TeleBot
+) -> tuple[int, str] | None:
+    """Return the caller id and compose project, or show why there is none."""
+    user = call.from_user
+    if user is None or call.message is None:
+        show_handler_info(
+            call=call,
+            text=f"Restarting project of {container_name}: Missing callback context",
+            bot=bot,
+        )
+        return None
+
+    project = get_compose_project(container_name)
+    if project is None:
+        show_handler_info(
+            call=call,
+            text=f"{container_name} does not belong to a compose project",
+            bot=bot,
+        )
+        return None
+    return user.id, project
+
+
+def __confirm_bulk_restart_project(
+    call: CallbackQuery, container_name: str, bot: TeleBot
+) -> None:
+    """Ask before restarting every container of the compose project."""
+    target = _resolve_bulk_restart_target(call, container_name, bot)
+    if target is None:
+        return
+    user_id, project = target
+
+    keyboard = keyboards.build_inline_keyboard(
+        [
+            button_data(
+                text=f"Yes, restart project {project}",
+                callback_data=f"__bulk_restart_run__:{container_name}:{user_id}",
+            ),
+            button_data(
+                text="Cancel",
+                callback_data=f"{MANAGE_CALLBACK_PREFIX}:{container_name}:{user_id}",
+            ),
+        ]
+    )
+    edit_callback_message_text(
+        call=call,
+        bot=bot,
+        text=f"Restart every container of compose project {project}?",
+        reply_markup=keyboard,
+        not_modified_text=f"Restart of project {project} is awaiting confirmation.",
+    )
+
+
+def __bulk_restart_project(
+    call: CallbackQuery, container_name: str, bot: TeleBot
+) -> None:
+    """Restart every container of the compose project owning ``container_name``."""
+    target = _resolve_bulk_restart_target(call, container_name, bot)
+    if target is None:
+        return
+    user_id, project = target
+
+    try:
+        result = container_manager.bulk_operation(
+            user_id, "restart", BulkContainerSelector(compose_project=project)
+        )
+    except PermissionError as error:
+        logger.warning(
+            "bot.handler.docker.manage_action.bulk.restart.deny",
+            reason=str(error),
+        )
+        show_handler_info(
+            call=call,
+            text=f"Restarting project {project}: Access denied. {error}",
+            bot=bot,
+        )
+        return
+    except Exception:
+        logger.error("bot.handler.docker.manage_action.bulk.restart.fail")
+        show_handler_info(
+            call=call,
+            text=f"Restarting project {project}: Unexpected error occurred",
+            bot=bot,
+        )
+        return
+
+    logger.info(
+        "bot.handler.docker.manage_action.bulk.restart.ok",
+        succeeded=len(result.succeeded),
+        failed=len(result.failed),
+    )
+    keyboard = keyboards.build_inline_keyboard(
+        button_data(
+            text=f"Back to {container_name}",
+            callback_data=f"{MANAGE_CALLBACK_PREFIX}:{container_name}:{user_id}",
+        )
+    )
+    edit_callback_message_text(
+        call=call,
+        bot=bot,
+        text=result.summary(),
+        reply_markup=keyboard,
+        not_modified_text=f"Restart result for project {project} is already shown.",
+    )
+
+
 def _handle_container_action(
     call: CallbackQuery,
     container_name: str,
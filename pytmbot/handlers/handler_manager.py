@@ -24,14 +24,25 @@ from .auth_processing.twofa_processing import (
 )
 from .bot_handlers.about import handle_about_command
 from .bot_handlers.getmyid import handle_getmyid
-from .bot_handlers.inline.update import handle_update_info
+from .bot_handlers.inline.update import UPDATE_INFO_CALLBACK_PREFIX, handle_update_info
 from .bot_handlers.navigation import handle_navigation
 from .bot_handlers.plugins import handle_plugins
 from .bot_handlers.start import handle_start
 from .bot_handlers.updates import handle_bot_updates
-from .docker_handlers.containers import handle_containers
+from .callback_router import CallbackMatch, CallbackPattern, CallbackRouter
+from .docker_handlers.containers import (
+    BACK_TO_CONTAINERS_CALLBACK,
+    CONTAINERS_PAGE_CALLBACK_PREFIX,
+    handle_containers,
+)
 from .docker_handlers.docker import handle_docker
-from .docker_handlers.images import handle_images
+from .docker_handlers.images import (
+    IMAGE_EXTRA_CALLBACK_PREFIX,
+    IMAGE_INFO_CALLBACK_PREFIX,
+    IMAGE_UPDATES_CALLBACK_PREFIX,
+    IMAGES_PAGE_CALLBACK_PREFIX,
+    handle_images,
+)
 from .docker_handlers.inline.back import handle_back_to_containers
 from .docker_handlers.inline.container_info import (
     handle_containers_full_info,
@@ -44,20 +55,43 @@ from .docker_handlers.inline.image_extra import handle_image_extra_info
 from .docker_handlers.inline.image_info import handle_image_info
 from .docker_handlers.inline.image_updates import handle_image_updates
 from .docker_handlers.inline.images_page import handle_images_page
-from .docker_handlers.inline.logs import handle_get_logs
-from .docker_handlers.inline.manage import handle_manage_container
+from .docker_handlers.inline.logs import (
+    LOGS_CALLBACK_PREFIX,
+    LOGS_EXPORT_CALLBACK_PREFIX,
+    LOGS_SEARCH_CALLBACK_PREFIX,
+    handle_export_logs,
+    handle_get_logs,
+    handle_search_logs,
+)
+from .docker_handlers.inline.manage import (
+    MANAGE_CALLBACK_PREFIX,
+    handle_manage_container,
+)
 from .docker_handlers.inline.manage_action import (
+    MANAGE_ACTION_PREFIXES,
     handle_manage_container_action,
-    managing_action_fabric,
 )
-from .server_handlers.cpu import handle_cpu
-from .server_handlers.filesystem import handle_file_system
+from .docker_handlers.pagination import CONTAINER_FULL_INFO_CALLBACK_PREFIX
+from .handlers_util.agent_hosts import AGENT_HOST_PREFIX
+from .server_handlers.cpu import (
+    CPU_INFO_PREFIX,
+    CPU_PER_CORE_PREFIX,
+    CPU_TIMES_PREFIX,
+    PROCESS_INFO_PREFIX,
+    handle_cpu,
+)
+from .server_handlers.filesystem import (
+    DISK_IO_PREFIX,
+    FILESYSTEM_OVERVIEW_PREFIX,
+    handle_file_system,
+)
 from .server_handlers.health_summary import (
     HEALTH_REFRESH_PREFIX,
     handle_system_health,
     handle_system_health_refresh,
 )
-from .server_handlers.inline.swap import handle_swap_info
+from .server_handlers.inline.agent_host import handle_agent_host
+from .server_handlers.inline.swap import SWAP_INFO_CALLBACK_PREFIX, handle_swap_info
 from .server_handlers.inline.system_views import (
     handle_cpu_info,
     handle_cpu_per_core,
@@ -82,16 +116,32 @@ from .server_handlers.inline.top_process import (
 )
 from .server_handlers.load_average import handle_load_average
 from .server_handlers.memory import handle_memory
-from .server_handlers.network import handle_network
+from .server_handlers.network import (
+    NETWORK_CONNECTIONS_PREFIX,
+    NETWORK_INTERFACES_PREFIX,
+    NETWORK_OVERVIEW_PREFIX,
+    handle_network,
+)
 from .server_handlers.process import (
     PROCESS_INFO_FROM_PROCESS_PREFIX,
     PROCESS_OVERVIEW_PREFIX,
     handle_process,
 )
-from .server_handlers.quickview import handle_quick_view
-from .server_handlers.sensors import handle_sensors
+from .server_handlers.quickview import (
+    QUICKVIEW_CPU_PREFIX,
+    QUICKVIEW_DISK_PREFIX,
+    QUICKVIEW_MEMORY_PREFIX,
+    QUICKVIEW_OVERVIEW_PREFIX,
+    QUICKVIEW_SENSORS_PREFIX,
+    handle_quick_view,
+)
+from .server_handlers.sensors import (
+    FAN_SPEEDS_PREFIX,
+    SENSORS_OVERVIEW_PREFIX,
+    handle_sensors,
+)
 from .server_handlers.server import handle_server
-from .server_handlers.uptime import handle_uptime
+from .server_handlers.uptime import USERS_INFO_PREFIX, handle_uptime
 
 # Modern type aliases
 type MessageType = Message
@@ -114,6 +164,7 @@ class HandlerConfig:
     commands: list[str] | None = None
     regexp: str | None = None
     filter_func: FilterFunc | None = None
+    callback_patterns: tuple[CallbackPattern, ...] = ()
 
     def __post_init__(self) -> None:
         """Validate callback and filter are callable."""
@@ -151,219 +202,12 @@ class AdminFilter:
         return message.from_user.id in cls._get_admin_ids()
 
 
-def _callback_data(call: CallbackQueryType) -> str | None:
-    """Return callback data when present."""
-    return call.data
-
-
-def _starts_with(call: CallbackQueryType, prefix: str) -> bool:
-    """Match callback data by prefix."""
-    data = _callback_data(call)
-    return data is not None and data.startswith(prefix)
-
-
-def _matches_exact_or_prefix(call: CallbackQueryType, prefix: str) -> bool:
-    """Match callback data by exact value or ``prefix:...`` form."""
-    data = _callback_data(call)
-    return data is not None and (data == prefix or data.startswith(f"{prefix}:"))
-
-
-def _update_info_filter(call: CallbackQueryType) -> bool:
-    return _matches_exact_or_prefix(call, "__how_update__")
-
-
-def _get_logs_filter(call: CallbackQueryType) -> bool:
-    return _starts_with(call, "__get_logs__")
-
-
-def _containers_full_info_filter(call: CallbackQueryType) -> bool:
-    return _starts_with(call, "__get_full__")
-
-
-def _back_to_containers_filter(call: CallbackQueryType) -> bool:
-    return _matches_exact_or_prefix(call, "back_to_containers") or _starts_with(
-        call, "__containers_page__"
-    )
-
-
-def _manage_container_filter(call: CallbackQueryType) -> bool:
-    return _starts_with(call, "__manage__")
-
-
-def _container_extra_info_filter(call: CallbackQueryType) -> bool:
-    return _starts_with(call, CONTAINER_EXTRA_CALLBACK_PREFIX)
-
-
-def _image_updates_filter(call: CallbackQueryType) -> bool:
-    return _matches_exact_or_prefix(call, "__check_updates__")
-
-
-def _images_page_filter(call: CallbackQueryType) -> bool:
-    return _starts_with(call, "__images_page__")
-
-
-def _image_info_filter(call: CallbackQueryType) -> bool:
-    return _starts_with(call, "__image_info__")
-
-
-def _image_extra_filter(call: CallbackQueryType) -> bool:
-    return _starts_with(call, "__image_extra__")
-
-
-def _swap_info_filter(call: CallbackQueryType) -> bool:
-    return _matches_exact_or_prefix(call, "__swap_info__")
-
-
-def _process_info_filter(call: CallbackQueryType) -> bool:
-    data = _callback_data(call)
-    return data is not None and (
-        data == "__process_info__"
-        or data.startswith("__process_info__:")
-        or data == PROCESS_INFO_FROM_PROCESS_PREFIX
-        or data.startswith(f"{PROCESS_INFO_FROM_PROCESS_PREFIX}:")
-    )
-
-
-def _process_overview_filter(call: CallbackQueryType) -> bool:
-    return _matches_exact_or_prefix(call, PROCESS_OVERVIEW_PREFIX)
-
-
-def _cpu_info_filter(call: CallbackQueryType) -> bool:
-    return _matches_exact_or_prefix(call, "__cpu_info__")
-
-
-def _cpu_per_core_filter(call: CallbackQueryType) -> bool:
-    return _matches_exact_or_prefix(call, "__cpu_per_core__")
-
-
-def _cpu_times_filter(call: CallbackQueryType) -> bool:
-    return _matches_exact_or_prefix(call, "__cpu_times__")
-
-
-def _network_overview_filter(call: CallbackQueryType) -> bool:
-    return _matches_exact_or_prefix(call, "__network_overview__")
-
-
-def _network_interfaces_filter(call: CallbackQueryType) -> bool:
-    return _matches_exact_or_prefix(call, "__network_interfaces__")
-
-
-def _network_connections_filter(call: CallbackQueryType) -> bool:
-    return _matches_exact_or_prefix(call, "__network_connections__")
+def _segment(key: str) -> CallbackPattern:
+    return CallbackPattern(key, CallbackMatch.SEGMENT)
 
 
-def _filesystem_overview_filter(call: CallbackQueryType) -> bool:
-    return _matches_exact_or_prefix(call, "__filesystem_overview__")
-
-
-def _disk_io_filter(call: CallbackQueryType) -> bool:
-    return _matches_exact_or_prefix(call, "__disk_io__")
-
-
-def _users_info_filter(call: CallbackQueryType) -> bool:
-    return _matches_exact_or_prefix(call, "__users_info__")
-
-
-def _sensors_overview_filter(call: CallbackQueryType) -> bool:
-    return _matches_exact_or_prefix(call, "__sensors_overview__")
-
-
-def _fan_speeds_filter(call: CallbackQueryType) -> bool:
-    return _matches_exact_or_prefix(call, "__fan_speeds__")
-
-
-def _quickview_overview_filter(call: CallbackQueryType) -> bool:
-    return _matches_exact_or_prefix(call, "__quickview_overview__")
-
-
-def _quickview_memory_filter(call: CallbackQueryType) -> bool:
-    return _matches_exact_or_prefix(call, "__quickview_memory__")
-
-
-def _quickview_sensors_filter(call: CallbackQueryType) -> bool:
-    return _matches_exact_or_prefix(call, "__quickview_sensors__")
-
-
-def _quickview_cpu_filter(call: CallbackQueryType) -> bool:
-    return _matches_exact_or_prefix(call, "__quickview_cpu__")
-
-
-def _quickview_disk_filter(call: CallbackQueryType) -> bool:
-    return _matches_exact_or_prefix(call, "__quickview_disk__")
-
-
-def _health_refresh_filter(call: CallbackQueryType) -> bool:
-    return _matches_exact_or_prefix(call, HEALTH_REFRESH_PREFIX)
-
-
-@dataclass(frozen=True, slots=True)
-class _InlineFilterRegistry:
-    """Typed registry preserving the historical ``InlineFilters.*`` API."""
-
-    swap_info: CallbackFilterFunc
-    process_info: CallbackFilterFunc
-    process_overview: CallbackFilterFunc
-    cpu_info: CallbackFilterFunc
-    cpu_per_core: CallbackFilterFunc
-    cpu_times: CallbackFilterFunc
-    update_info: CallbackFilterFunc
-    get_logs: CallbackFilterFunc
-    containers_full_info: CallbackFilterFunc
-    back_to_containers: CallbackFilterFunc
-    manage_container: CallbackFilterFunc
-    container_extra_info: CallbackFilterFunc
-    image_updates: CallbackFilterFunc
-    images_page: CallbackFilterFunc
-    image_info: CallbackFilterFunc
-    image_extra: CallbackFilterFunc
-    network_overview: CallbackFilterFunc
-    network_interfaces: CallbackFilterFunc
-    network_connections: CallbackFilterFunc
-    filesystem_overview: CallbackFilterFunc
-    disk_io: CallbackFilterFunc
-    users_info: CallbackFilterFunc
-    sensors_overview: CallbackFilterFunc
-    fan_speeds: CallbackFilterFunc
-    quickview_overview: CallbackFilterFunc
-    quickview_memory: CallbackFilterFunc
-    quickview_sensors: CallbackFilterFunc
-    quickview_cpu: CallbackFilterFunc
-    quickview_disk: CallbackFilterFunc
-    health_refresh: CallbackFilterFunc
-
-
-InlineFilters: Final[_InlineFilterRegistry] = _InlineFilterRegistry(
-    swap_info=_swap_info_filter,
-    process_info=_process_info_filter,
-    process_overview=_process_overview_filter,
-    cpu_info=_cpu_info_filter,
-    cpu_per_core=_cpu_per_core_filter,
-    cpu_times=_cpu_times_filter,
-    update_info=_update_info_filter,
-    get_logs=_get_logs_filter,
-    containers_full_info=_containers_full_info_filter,
-    back_to_containers=_back_to_containers_filter,
-    manage_container=_manage_container_filter,
-    container_extra_info=_container_extra_info_filter,
-    image_updates=_image_updates_filter,
-    images_page=_images_page_filter,
-    image_info=_image_info_filter,
-    image_extra=_image_extra_filter,
-    network_overview=_network_overview_filter,
-    network_interfaces=_network_interfaces_filter,
-    network_connections=_network_connections_filter,
-    filesystem_overview=_filesystem_overview_filter,
-    disk_io=_disk_io_filter,
-    users_info=_users_info_filter,
-    sensors_overview=_sensors_overview_filter,
-    fan_speeds=_fan_speeds_filter,
-    quickview_overview=_quickview_overview_filter,
-    quickview_memory=_quickview_memory_filter,
-    quickview_sensors=_quickview_sensors_filter,
-    quickview_cpu=_quickview_cpu_filter,
-    quickview_disk=_quickview_disk_filter,
-    health_refresh=_health_refresh_filter,
-)
+def _prefix(key: str) -> CallbackPattern:
+    return CallbackPattern(key, CallbackMatch.PREFIX)
 
 
 @cache
@@ -446,167 +290,212 @@ def _get_inline_handler_configs() -> dict[str, list[HandlerConfig]]:
     return {
         "swap": [
             HandlerConfig(
-                callback=handle_swap_info, filter_func=InlineFilters.swap_info
+                callback=handle_swap_info,
+                callback_patterns=(_segment(SWAP_INFO_CALLBACK_PREFIX),),
             )
         ],
         "process_info": [
             HandlerConfig(
-                callback=handle_process_info, filter_func=InlineFilters.process_info
+                callback=handle_process_info,
+                callback_patterns=(
+                    _segment(PROCESS_INFO_PREFIX),
+                    _segment(PROCESS_INFO_FROM_PROCESS_PREFIX),
+                ),
             )
         ],
         "process_overview": [
             HandlerConfig(
                 callback=handle_process_overview,
-                filter_func=InlineFilters.process_overview,
+                callback_patterns=(_segment(PROCESS_OVERVIEW_PREFIX),),
             )
         ],
         "cpu_info": [
-            HandlerConfig(callback=handle_cpu_info, filter_func=InlineFilters.cpu_info)
+            HandlerConfig(
+                callback=handle_cpu_info, callback_patterns=(_segment(CPU_INFO_PREFIX),)
+            )
         ],
         "cpu_per_core": [
             HandlerConfig(
-                callback=handle_cpu_per_core, filter_func=InlineFilters.cpu_per_core
+                callback=handle_cpu_per_core,
+                callback_patterns=(_segment(CPU_PER_CORE_PREFIX),),
             )
         ],
         "cpu_times": [
             HandlerConfig(
-                callback=handle_cpu_times, filter_func=InlineFilters.cpu_times
+                callback=handle_cpu_times,
+                callback_patterns=(_segment(CPU_TIMES_PREFIX),),
             )
         ],
         "update_info": [
             HandlerConfig(
-                callback=handle_update_info, filter_func=InlineFilters.update_info
+                callback=handle_update_info,
+                callback_patterns=(_segment(UPDATE_INFO_CALLBACK_PREFIX),),
             )
         ],
         "get_logs": [
-            HandlerConfig(callback=handle_get_logs, filter_func=InlineFilters.get_logs)
+            HandlerConfig(
+                callback=handle_get_logs,
+                callback_patterns=(_prefix(LOGS_CALLBACK_PREFIX),),
+            )
+        ],
+        "search_logs": [
+            HandlerConfig(
+                callback=handle_search_logs,
+                callback_patterns=(_segment(LOGS_SEARCH_CALLBACK_PREFIX),),
+            )
+        ],
+        "export_logs": [
+            HandlerConfig(
+                callback=handle_export_logs,
+                callback_patterns=(_segment(LOGS_EXPORT_CALLBACK_PREFIX),),
+            )
         ],
         "containers_full_info": [
             HandlerConfig(
                 callback=handle_containers_full_info,
-                filter_func=InlineFilters.containers_full_info,
+                callback_patterns=(_prefix(CONTAINER_FULL_INFO_CALLBACK_PREFIX),),
             )
         ],
         "back_to_containers": [
             HandlerConfig(
                 callback=handle_back_to_containers,
-                filter_func=InlineFilters.back_to_containers,
+                callback_patterns=(
+                    _segment(BACK_TO_CONTAINERS_CALLBACK),
+                    _prefix(CONTAINERS_PAGE_CALLBACK_PREFIX),
+                ),
             )
         ],
         "manage": [
             HandlerConfig(
                 callback=handle_manage_container,
-                filter_func=InlineFilters.manage_container,
+                callback_patterns=(_prefix(MANAGE_CALLBACK_PREFIX),),
             )
         ],
         "container_extra_info": [
             HandlerConfig(
                 callback=handle_container_extra_info,
-                filter_func=InlineFilters.container_extra_info,
+                callback_patterns=(_prefix(CONTAINER_EXTRA_CALLBACK_PREFIX),),
             )
         ],
         "manage_action": [
             HandlerConfig(
                 callback=handle_manage_container_action,
-                filter_func=managing_action_fabric,
+                callback_patterns=(
+                    *(_prefix(action) for action in MANAGE_ACTION_PREFIXES),
+                ),
             )
         ],
         "image_updates": [
             HandlerConfig(
-                callback=handle_image_updates, filter_func=InlineFilters.image_updates
+                callback=handle_image_updates,
+                callback_patterns=(_segment(IMAGE_UPDATES_CALLBACK_PREFIX),),
             )
         ],
         "images_page": [
             HandlerConfig(
-                callback=handle_images_page, filter_func=InlineFilters.images_page
+                callback=handle_images_page,
+                callback_patterns=(_prefix(IMAGES_PAGE_CALLBACK_PREFIX),),
             )
         ],
         "image_info": [
             HandlerConfig(
-                callback=handle_image_info, filter_func=InlineFilters.image_info
+                callback=handle_image_info,
+                callback_patterns=(_prefix(IMAGE_INFO_CALLBACK_PREFIX),),
             )
         ],
         "image_extra": [
             HandlerConfig(
-                callback=handle_image_extra_info, filter_func=InlineFilters.image_extra
+                callback=handle_image_extra_info,
+                callback_patterns=(_prefix(IMAGE_EXTRA_CALLBACK_PREFIX),),
             )
         ],
         "network_overview": [
             HandlerConfig(
                 callback=handle_network_overview,
-                filter_func=InlineFilters.network_overview,
+                callback_patterns=(_segment(NETWORK_OVERVIEW_PREFIX),),
             )
         ],
         "network_interfaces": [
             HandlerConfig(
                 callback=handle_network_interfaces,
-                filter_func=InlineFilters.network_interfaces,
+                callback_patterns=(_segment(NETWORK_INTERFACES_PREFIX),),
             )
         ],
         "network_connections": [
             HandlerConfig(
                 callback=handle_network_connections,
-                filter_func=InlineFilters.network_connections,
+                callback_patterns=(_segment(NETWORK_CONNECTIONS_PREFIX),),
             )
         ],
         "filesystem_overview": [
             HandlerConfig(
                 callback=handle_filesystem_overview,
-                filter_func=InlineFilters.filesystem_overview,
+                callback_patterns=(_segment(FILESYSTEM_OVERVIEW_PREFIX),),
             )
         ],
         "disk_io": [
-            HandlerConfig(callback=handle_disk_io, filter_func=InlineFilters.disk_io)
+            HandlerConfig(
+                callback=handle_disk_io, callback_patterns=(_segment(DISK_IO_PREFIX),)
+            )
         ],
         "users_info": [
             HandlerConfig(
-                callback=handle_users_info, filter_func=InlineFilters.users_info
+                callback=handle_users_info,
+                callback_patterns=(_segment(USERS_INFO_PREFIX),),
             )
         ],
         "sensors_overview": [
             HandlerConfig(
                 callback=handle_sensors_overview,
-                filter_func=InlineFilters.sensors_overview,
+                callback_patterns=(_segment(SENSORS_OVERVIEW_PREFIX),),
             )
         ],
         "fan_speeds": [
             HandlerConfig(
-                callback=handle_fan_speeds, filter_func=InlineFilters.fan_speeds
+                callback=handle_fan_speeds,
+                callback_patterns=(_segment(FAN_SPEEDS_PREFIX),),
             )
         ],
         "quickview_overview": [
             HandlerConfig(
                 callback=handle_quickview_overview,
-                filter_func=InlineFilters.quickview_overview,
+                callback_patterns=(_segment(QUICKVIEW_OVERVIEW_PREFIX),),
             )
         ],
         "quickview_memory": [
             HandlerConfig(
                 callback=handle_quickview_memory,
-                filter_func=InlineFilters.quickview_memory,
+                callback_patterns=(_segment(QUICKVIEW_MEMORY_PREFIX),),
             )
         ],
         "quickview_sensors": [
             HandlerConfig(
                 callback=handle_quickview_sensors,
-                filter_func=InlineFilters.quickview_sensors,
+                callback_patterns=(_segment(QUICKVIEW_SENSORS_PREFIX),),
             )
         ],
         "quickview_cpu": [
             HandlerConfig(
-                callback=handle_quickview_cpu, filter_func=InlineFilters.quickview_cpu
+                callback=handle_quickview_cpu,
+                callback_patterns=(_segment(QUICKVIEW_CPU_PREFIX),),
             )
         ],
         "quickview_disk": [
             HandlerConfig(
                 callback=handle_quickview_disk,
-                filter_func=InlineFilters.quickview_disk,
+                callback_patterns=(_segment(QUICKVIEW_DISK_PREFIX),),
             )
         ],
         "health_refresh": [
             HandlerConfig(
                 callback=handle_system_health_refresh,
-                filter_func=InlineFilters.health_refresh,
+                callback_patterns=(_segment(HEALTH_REFRESH_PREFIX),),
+            )
+        ],
+        "agent_host": [
+            HandlerConfig(
+                callback=handle_agent_host,
+                callback_patterns=(_segment(AGENT_HOST_PREFIX),),
             )
         ],
     }
@@ -634,16 +523,35 @@ def handler_factory() -> HandlerType:
     return _create_handlers_from_configs(configs)
 
 
+@cache
+def callback_router() -> CallbackRouter:
+    """
+    Returns the cached router built from the inline handler configurations.
+
+    Routes keep the configuration order, so overlapping keys resolve to the
+    same handler the per-handler telebot filters used to pick.
+    """
+    router = CallbackRouter()
+    for category, configs in _get_inline_handler_configs().items():
+        for config in configs:
+            router.add(category, config.callback, config.callback_patterns)
+    return router
+
+
 @cache
 def inline_handler_factory() -> HandlerType:
     """
-    Returns a cached dictionary of HandlerManager objects for inline query handling.
+    Returns a cached dictionary with the single callback-query handler.
 
-    The factory uses HandlerConfig for cleaner handler creation and
-    better type safety. Results are cached for performance.
+    Every inline handler is reached through ``callback_router()``, so telebot
+    evaluates one filter per ``CallbackQuery`` instead of one per handler.
     """
-    configs = _get_inline_handler_configs()
-    return _create_handlers_from_configs(configs)
+    router = callback_router()
+    return {
+        "callback_router": [
+            HandlerManager(callback=router.dispatch, kwargs={"func": router.matches})
+        ]
+    }
 
 
 # Future echo handler implementation
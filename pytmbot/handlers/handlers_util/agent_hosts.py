@@ -0,0 +1,130 @@
+#!/usr/local/bin/python3
+"""
+(c) Copyright 2025, Denis Rozhnovskiy <pytelemonbot@mail.ru>
+pyTMBot - A simple Telegram bot to handle Docker containers and images,
+also providing basic information about the status of local servers.
+
+Remote host selector for the server and Docker menus.
+
+When agents report to this bot, both menus get a paged inline list of hosts. The
+callback data is ``__agent_host__:<screen>:<host_id>`` for a host view and
+``__agent_host__:<screen>:@<page>`` for a list page; host ids never contain ``@``.
+"""
+
+from __future__ import annotations
+
+from enum import StrEnum
+from typing import Final
+
+from telebot import TeleBot
+from telebot.types import InlineKeyboardMarkup
+
+from pytmbot.agent.server import HostRegistry, get_host_registry
+from pytmbot.globals import ButtonDataType, get_keyboards
+from pytmbot.handlers.handlers_util.utils import send_telegram_message
+
+AGENT_HOST_PREFIX: Final[str] = "__agent_host__"
+AGENT_HOSTS_PER_PAGE: Final[int] = 20
+_PAGE_MARKER: Final[str] = "@"
+
+
+class AgentHostScreen(StrEnum):
+    SERVER = "s"
+    DOCKER = "d"
+
+
+def host_callback_data(screen: AgentHostScreen, host_id: str) -> str:
+    return f"{AGENT_HOST_PREFIX}:{screen}:{host_id}"
+
+
+def page_callback_data(screen: AgentHostScreen, page: int) -> str:
+    return f"{AGENT_HOST_PREFIX}:{screen}:{_PAGE_MARKER}{page}"
+
+
+def parse_agent_host_callback(
+    data: str | None,
+) -> tuple[AgentHostScreen, str | None, int]:
+    """
+    Return ``(screen, host_id, page)``; ``host_id`` is ``None`` for a list page.
+
+    Raises ``ValueError`` for callback data this module did not produce.
+    """
+    prefix, _, rest = (data or "").partition(":")
+    raw_screen, _, target = rest.partition(":")
+    if prefix != AGENT_HOST_PREFIX or not target:
+        raise ValueError("Invalid agent host callback")
+    screen = AgentHostScreen(raw_screen)
+    if target.startswith(_PAGE_MARKER):
+        return screen, None, max(int(target[1:]), 0)
+    return screen, target, 0
+
+
+def host_status_badge(online: bool) -> str:
+    return "🟢" if online else "⚫"
+
+
+def build_host_selector(
+    screen: AgentHostScreen,
+    page: int = 0,
+    registry: HostRegistry | None = None,
+) -> InlineKeyboardMarkup | None:
+    """Paged host list, or ``None`` when no agent has reported yet."""
+    views = (registry or get_host_registry()).views()
+    if not views:
+        return None
+    pages = (len(views) + AGENT_HOSTS_PER_PAGE - 1) // AGENT_HOSTS_PER_PAGE
+    page = min(page, pages - 1)
+    start = page * AGENT_HOSTS_PER_PAGE
+    buttons = [
+        ButtonDataType(
+            text=f"{host_status_badge(view.online)} {view.host_id}",
+            callback_data=host_callback_data(screen, view.host_id),
+        )
+        for view in views[start : start + AGENT_HOSTS_PER_PAGE]
+    ]
+    if page > 0:
+        buttons.append(
+            ButtonDataType(
+                text="« Previous", callback_data=page_callback_data(screen, page - 1)
+            )
+        )
+    if page + 1 < pages:
+        buttons.append(
+            ButtonDataType(
+                text="Next »", callback_data=page_callback_data(screen, page + 1)
+            )
+        )
+    return get_keyboards().build_inline_keyboard(buttons)
+
+
+def host_selector_text(registry: HostRegistry | None = None) -> str:
+    views = (registry or get_host_registry()).views()
+    online = sum(1 for view in views if view.online)
+    return f"🛰 <b>Remote hosts:</b> {online}/{len(views)} online. Pick one:"
+
+
+def send_host_selector(bot: TeleBot, chat_id: int, screen: AgentHostScreen) -> bool:
+    """Send the host list below a menu; a no-op when no agents are connected."""
+    keyboard = build_host_selector(screen)
+    if keyboard is None:
+        return False
+    return send_telegram_message(
+        bot=bot,
+        chat_id=chat_id,
+        text=host_selector_text(),
+        reply_markup=keyboard,
+        parse_mode="HTML",
+    )
+
+
+__all__ = [
+    "AGENT_HOST_PREFIX",
+    "AgentHostScreen",
+    "build_host_selector",
+    "host_callback_data",
+    "host_selector_text",
+    "host_status_badge",
+    "page_callback_data",
+    "parse_agent_host_callback",
+    "send_host_selector",
+]
@@ -14,6 +14,14 @@ from typing import Final
 from telebot import TeleBot
 from telebot.types import CallbackQuery
 
+from pytmbot.adapters.docker.container_logs import (
+    LogExport,
+    LogExportCompression,
+    LogSearchResult,
+    LogSeverity,
+    export_container_logs,
+    search_container_logs,
+)
 from pytmbot.adapters.docker.containers_info import (
     fetch_container_logs,
     fetch_full_container_details,
@@ -335,6 +343,57 @@ def get_sanitized_logs(container_name: str, call: CallbackQuery, token: str) ->
     return sanitized_logs
 
 
+def search_sanitized_logs(
+    container_name: str,
+    call: CallbackQuery,
+    token: str,
+    severity: LogSeverity | str,
+) -> tuple[str, LogSearchResult]:
+    """
+    Search the newest part of a container's log stream and sanitize the newest matches.
+
+    Args:
+        container_name (str): The name of the container.
+        call (CallbackQuery): The callback query object.
+        token (str): The bot token.
+        severity (LogSeverity | str): Minimum severity of matching lines.
+
+    Returns:
+        tuple[str, LogSearchResult]: Sanitized rendered matches and search stats.
+    """
+    result = search_container_logs(container_name, severity=severity)
+    return sanitize_logs(result.render(), call, token), result
+
+
+def export_sanitized_logs(
+    container_name: str,
+    call: CallbackQuery,
+    token: str,
+    *,
+    compression: LogExportCompression | str,
+    max_bytes: int,
+) -> LogExport:
+    """
+    Stream the full log of a container into a sanitized, compressed export.
+
+    Args:
+        container_name (str): The name of the container.
+        call (CallbackQuery): The callback query object.
+        token (str): The bot token.
+        compression (LogExportCompression | str): Archive compression format.
+        max_bytes (int): Size cap of the compressed archive.
+
+    Returns:
+        LogExport: Rewound export file; the caller must close it.
+    """
+    return export_container_logs(
+        container_name,
+        compression=compression,
+        max_bytes=max_bytes,
+        text_filter=lambda text: sanitize_logs(text, call, token),
+    )
+
+
 def sanitize_environment_variables(env_list: list[str]) -> list[str]:
     """
     Filter out sensitive environment variables for display.
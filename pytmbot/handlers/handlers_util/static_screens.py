@@ -0,0 +1,217 @@
+#!/usr/local/bin/python3
+"""
+(c) Copyright 2025, Denis Rozhnovskiy <pytelemonbot@mail.ru>
+pyTMBot - A simple Telegram bot to handle Docker containers and images,
+also providing basic information about the status of local servers.
+
+Prerendered static screens.
+
+Start, about, navigation and the plugin index only vary by the user's name, so their
+templates are rendered once with a placeholder and their reply keyboards are
+serialized to JSON once. Sending one of them is a lookup, a join and the API call.
+Screens are built from the loaded settings and plugin registry; call
+``clear_static_screens`` if either changes at runtime.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import StrEnum
+from functools import lru_cache
+from typing import TYPE_CHECKING, Final
+
+from markupsafe import escape
+from telebot import TeleBot
+from telebot.types import LinkPreviewOptions, ReplyKeyboardMarkup
+
+from pytmbot.globals import __version__, get_emoji_converter, get_keyboards
+from pytmbot.handlers.handlers_util.utils import send_telegram_message
+from pytmbot.logs import Logger
+from pytmbot.parsers.compiler import Compiler
+
+if TYPE_CHECKING:
+    from pytmbot.plugins.plugin_manager import PluginManager
+
+logger = Logger()
+
+# Private-use code points: never produced by templates or escaping.
+_USER_NAME_PLACEHOLDER: Final[str] = "\ue000user_name\ue000"
+STATIC_SCREEN_CACHE_SIZE: Final[int] = 16
+
+type PluginIndexItems = tuple[tuple[str, str], ...]
+
+
+class StaticScreenName(StrEnum):
+    START = "start"
+    ABOUT = "about"
+    NAVIGATION = "navigation"
+
+
+class PreserializedMarkup(ReplyKeyboardMarkup):
+    """Reply keyboard serialized once; telebot sends ``to_json()`` as-is."""
+
+    def __init__(self, markup: ReplyKeyboardMarkup) -> None:
+        super().__init__()
+        self.keyboard = markup.keyboard
+        # Typed wrapper around telebot's untyped serializer.
+        serialize: Callable[[], str] = markup.to_json
+        self._json = serialize()
+
+    def to_json(self) -> str:
+        return self._json
+
+
+@dataclass(frozen=True, slots=True)
+class StaticScreen:
+    """Immutable prerendered response; ``text_parts`` are joined by the user name."""
+
+    text_parts: tuple[str, ...]
+    parse_mode: str
+    reply_markup: PreserializedMarkup | None = None
+    disable_link_preview: bool = False
+
+    def render(self, user_name: str) -> str:
+        # Same escaping the template's autoescape applies to the name.
+        return str(escape(user_name)).join(self.text_parts)
+
+
+def _prerender(template_name: str, **context: object) -> tuple[str, ...]:
+    rendered = Compiler.quick_render(template_name=template_name, **context)
+    return tuple(rendered.split(_USER_NAME_PLACEHOLDER))
+
+
+@lru_cache(maxsize=STATIC_SCREEN_CACHE_SIZE)
+def get_static_markup(keyboard_type: str | None = None) -> PreserializedMarkup:
+    """Serialized reply keyboard of ``keyboard_type`` (main keyboard by default)."""
+    return PreserializedMarkup(
+        get_keyboards().build_reply_keyboard(keyboard_type=keyboard_type)
+    )
+
+
+@lru_cache(maxsize=STATIC_SCREEN_CACHE_SIZE)
+def get_static_screen(screen: StaticScreenName) -> StaticScreen:
+    """Return the prerendered ``screen``, building it on first use."""
+    match screen:
+        case StaticScreenName.START:
+            return StaticScreen(
+                text_parts=_prerender(
+                    "b_index.jinja2", first_name=_USER_NAME_PLACEHOLDER
+                ),
+                parse_mode="Markdown",
+                reply_markup=get_static_markup(),
+                disable_link_preview=True,
+            )
+        case StaticScreenName.ABOUT:
+            return StaticScreen(
+                text_parts=_prerender(
+                    "b_about_bot.jinja2",
+                    context={
+                        "username": _USER_NAME_PLACEHOLDER,
+                        "app_version": __version__,
+                    },
+                ),
+                parse_mode="Markdown",
+                disable_link_preview=True,
+            )
+        case StaticScreenName.NAVIGATION:
+            return StaticScreen(
+                text_parts=_prerender(
+                    "b_back.jinja2",
+                    first_name=_USER_NAME_PLACEHOLDER,
+                    thought_balloon=get_emoji_converter().get_emoji("thought_balloon"),
+                ),
+                parse_mode="HTML",
+                reply_markup=get_static_markup(),
+            )
+
+
+@lru_cache(maxsize=STATIC_SCREEN_CACHE_SIZE)
+def get_plugins_screen(
+    index_keys: PluginIndexItems, plugins: PluginIndexItems
+) -> StaticScreen:
+    """
+    Return the plugin index screen for one plugin registry state.
+
+    ``index_keys`` are the merged keyboard entries and ``plugins`` maps plugin names
+    to descriptions; both are item tuples so the registry state is the cache key.
+    """
+    return StaticScreen(
+        text_parts=_prerender(
+            "b_plugins.jinja2",
+            first_name=_USER_NAME_PLACEHOLDER,
+            plugins=dict(plugins),
+            thought_balloon=get_emoji_converter().get_emoji("thought_balloon"),
+        ),
+        parse_mode="Markdown",
+        reply_markup=PreserializedMarkup(
+            get_keyboards().build_reply_keyboard(plugin_keyboard_data=dict(index_keys))
+        ),
+    )
+
+
+def plugin_index_items(
+    plugin_manager: PluginManager,
+) -> tuple[PluginIndexItems, PluginIndexItems]:
+    """Snapshot the registry state that the plugin index screen depends on."""
+    descriptions = plugin_manager.get_plugin_descriptions()
+    return (
+        tuple(plugin_manager.get_merged_index_keys().items()),
+        tuple(
+            (name, descriptions.get(name, "No description available"))
+            for name in plugin_manager.get_plugin_names()
+        ),
+    )
+
+
+def prebuild_static_screens(plugin_manager: PluginManager | None = None) -> None:
+    """Build every static screen up front; failures are retried on first use."""
+    try:
+        for screen in StaticScreenName:
+            get_static_screen(screen)
+        get_static_markup("back_keyboard")
+        if plugin_manager is not None:
+            index_keys, plugins = plugin_index_items(plugin_manager)
+            if plugins:
+                get_plugins_screen(index_keys, plugins)
+    except Exception as error:
+        logger.warning(
+            "bot.handlers.static_screens.prebuild.fail",
+            error=str(error),
+            error_type=type(error).__name__,
+        )
+
+
+def clear_static_screens() -> None:
+    get_static_screen.cache_clear()
+    get_plugins_screen.cache_clear()
+    get_static_markup.cache_clear()
+
+
+def send_static_screen(
+    bot: TeleBot, chat_id: int, screen: StaticScreen, user_name: str
+) -> bool:
+    return send_telegram_message(
+        bot=bot,
+        chat_id=chat_id,
+        text=screen.render(user_name),
+        reply_markup=screen.reply_markup,
+        parse_mode=screen.parse_mode,
+        link_preview_options=LinkPreviewOptions(is_disabled=True)
+        if screen.disable_link_preview
+        else None,
+    )
+
+
+__all__ = [
+    "PreserializedMarkup",
+    "StaticScreen",
+    "StaticScreenName",
+    "clear_static_screens",
+    "get_plugins_screen",
+    "get_static_markup",
+    "get_static_screen",
+    "plugin_index_items",
+    "prebuild_static_screens",
+    "send_static_screen",
+]
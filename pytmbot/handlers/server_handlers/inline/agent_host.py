@@ -0,0 +1,151 @@
+#!/usr/local/bin/python3
+"""
+(c) Copyright 2025, Denis Rozhnovskiy <pytelemonbot@mail.ru>
+pyTMBot - A simple Telegram bot to handle Docker containers and images,
+also providing basic information about the status of local servers.
+"""
+
+from __future__ import annotations
+
+from typing import Final
+
+from telebot import TeleBot
+from telebot.types import CallbackQuery, InlineKeyboardMarkup
+
+from pytmbot import exceptions
+from pytmbot.agent.server import AgentHostView, get_host_registry
+from pytmbot.exceptions import ErrorContext
+from pytmbot.globals import ButtonDataType, get_emoji_converter, get_keyboards
+from pytmbot.handlers.handlers_util.agent_hosts import (
+    AgentHostScreen,
+    build_host_selector,
+    host_callback_data,
+    host_selector_text,
+    host_status_badge,
+    page_callback_data,
+    parse_agent_host_callback,
+)
+from pytmbot.handlers.handlers_util.callback_auth import authorize_callback_request
+from pytmbot.handlers.handlers_util.docker import show_handler_info
+from pytmbot.handlers.server_handlers.inline.common import edit_callback_message_text
+from pytmbot.logs import Logger
+from pytmbot.parsers.compiler import Compiler
+
+logger = Logger()
+em = get_emoji_converter()
+keyboards = get_keyboards()
+
+# Keep rendered host views well below Telegram's 4096-character message limit.
+_MAX_DISKS: Final[int] = 15
+_MAX_CONTAINERS: Final[int] = 40
+_SYSTEM_SECTIONS: Final[tuple[str, ...]] = ("cpu", "memory", "swap", "processes")
+_TEMPLATES: Final[dict[AgentHostScreen, str]] = {
+    AgentHostScreen.SERVER: "b_agent_host.jinja2",
+    AgentHostScreen.DOCKER: "d_agent_host.jinja2",
+}
+
+
+def _as_dict(value: object) -> dict[str, object]:
+    return value if isinstance(value, dict) else {}
+
+
+def _host_context(view: AgentHostView) -> dict[str, object]:
+    snapshot = view.snapshot
+    system = dict(_as_dict(snapshot.get("system")))
+    docker = _as_dict(snapshot.get("docker"))
+    disks = _as_dict(system.get("disks"))
+    containers = _as_dict(docker.get("containers"))
+    # Agents may omit sections they failed to collect; templates expect mappings.
+    system.update({name: _as_dict(system.get(name)) for name in _SYSTEM_SECTIONS})
+    return {
+        "host_id": view.host_id,
+        "hostname": snapshot.get("hostname", view.host_id),
+        "badge": host_status_badge(view.online),
+        "online": view.online,
+        "age_seconds": int(view.age_seconds),
+        "system": system,
+        "disks": [
+            {"mnt_point": mnt_point, **_as_dict(stats)}
+            for mnt_point, stats in sorted(disks.items())[:_MAX_DISKS]
+        ],
+        "docker_enabled": bool(docker),
+        "docker": docker,
+        "containers": [
+            {"name": name, **_as_dict(stats)}
+            for name, stats in sorted(containers.items())[:_MAX_CONTAINERS]
+        ],
+        "containers_hidden": max(len(containers) - _MAX_CONTAINERS, 0),
+    }
+
+
+def _host_keyboard(screen: AgentHostScreen, host_id: str) -> InlineKeyboardMarkup:
+    return keyboards.build_inline_keyboard(
+        [
+            ButtonDataType(
+                text="🔄 Refresh", callback_data=host_callback_data(screen, host_id)
+            ),
+            ButtonDataType(text="« Hosts", callback_data=page_callback_data(screen, 0)),
+        ]
+    )
+
+
+def _render_host(screen: AgentHostScreen, view: AgentHostView) -> str:
+    return Compiler.quick_render(
+        template_name=_TEMPLATES[screen],
+        context=_host_context(view),
+        thought_balloon=em.get_emoji("thought_balloon"),
+        spouting_whale=em.get_emoji("spouting_whale"),
+    )
+
+
+@logger.session_decorator
+def handle_agent_host(call: CallbackQuery, bot: TeleBot) -> None:
+    """Show the host list or one remote host reported by an agent."""
+    is_allowed, deny_reason = authorize_callback_request(call)
+    if not is_allowed:
+        show_handler_info(call, deny_reason, bot)
+        return None
+    try:
+        screen, host_id, page = parse_agent_host_callback(call.data)
+    except ValueError:
+        show_handler_info(call, "This host button is no longer valid.", bot)
+        return None
+
+    try:
+        if host_id is not None:
+            view = get_host_registry().get(host_id)
+            if view is not None:
+                edit_callback_message_text(
+                    call=call,
+                    bot=bot,
+                    text=_render_host(screen, view),
+                    parse_mode="HTML",
+                    reply_markup=_host_keyboard(screen, host_id),
+                    not_modified_text="Host snapshot is already current.",
+                )
+                return None
+            # Unknown host (e.g. after a restart): fall back to the current list.
+
+        selector = build_host_selector(screen, page)
+        if selector is None:
+            edit_callback_message_text(
+                call=call, bot=bot, text="No remote hosts are reporting."
+            )
+            return None
+        edit_callback_message_text(
+            call=call,
+            bot=bot,
+            text=host_selector_text(),
+            parse_mode="HTML",
+            reply_markup=selector,
+            not_modified_text="Host list is already current.",
+        )
+        return None
+    except Exception as error:
+        raise exceptions.HandlingException(
+            ErrorContext(
+                message="Failed handling remote host view",
+                error_code="HAND_AGENT_001",
+                metadata={"exception": str(error)},
+            )
+        ) from error
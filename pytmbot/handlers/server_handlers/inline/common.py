@@ -7,7 +7,11 @@ also providing basic information about the status of local servers.
 
 from __future__ import annotations
 
+import hashlib
 import re
+import threading
+from collections import OrderedDict
+from typing import Final
 
 from telebot import TeleBot
 from telebot.apihelper import ApiTelegramException
@@ -20,6 +24,71 @@ from pytmbot.handlers.handlers_util.callback_auth import (
 
 _RETRY_AFTER_PATTERN = re.compile(r"retry after\s+(\d+)", re.IGNORECASE)
 
+EDIT_FINGERPRINT_CACHE_SIZE: Final[int] = 1024
+
+type MessageKey = tuple[int, int]
+
+
+class EditFingerprintCache:
+    """
+    Bounded LRU of the content last edited into each ``(chat_id, message_id)``.
+
+    Refresh buttons re-render the same view; comparing fingerprints lets the
+    edit helper skip the API round trip Telegram would answer with
+    "message is not modified".
+    """
+
+    __slots__ = ("_entries", "_lock", "_max_entries")
+
+    def __init__(self, max_entries: int = EDIT_FINGERPRINT_CACHE_SIZE) -> None:
+        self._entries: OrderedDict[MessageKey, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_entries = max_entries
+
+    def matches(self, key: MessageKey, fingerprint: bytes) -> bool:
+        with self._lock:
+            if self._entries.get(key) != fingerprint:
+                return False
+            self._entries.move_to_end(key)
+            return True
+
+    def remember(self, key: MessageKey, fingerprint: bytes) -> None:
+        with self._lock:
+            self._entries[key] = fingerprint
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def forget(self, key: MessageKey) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+edit_fingerprints: Final[EditFingerprintCache] = EditFingerprintCache()
+
+
+def _markup_json(reply_markup: InlineKeyboardMarkup) -> str:
+    to_json = getattr(reply_markup, "to_json", None)
+    return str(to_json()) if callable(to_json) else repr(reply_markup)
+
+
+def _edit_fingerprint(
+    text: str, parse_mode: str | None, reply_markup: InlineKeyboardMarkup | None
+) -> bytes:
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (
+        text,
+        parse_mode or "",
+        _markup_json(reply_markup) if reply_markup is not None else "",
+    ):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.digest()
+
 
 def _extract_retry_after_seconds(error: ApiTelegramException) -> int | None:
     retry_after_raw = getattr(error, "retry_after", None)
@@ -104,10 +173,21 @@ def edit_callback_message_text(
     reply_markup: InlineKeyboardMarkup | None = None,
     not_modified_text: str = "Already up to date.",
 ) -> bool:
-    """Edit callback-bound message and treat Telegram 'not modified' as a no-op."""
+    """
+    Edit callback-bound message and treat Telegram 'not modified' as a no-op.
+
+    An edit identical to the last one sent to the same message is skipped
+    without calling the API and only answers the callback query.
+    """
     if call.message is None:
         return False
 
+    message_key = (call.message.chat.id, call.message.message_id)
+    fingerprint = _edit_fingerprint(text, parse_mode, reply_markup)
+    if edit_fingerprints.matches(message_key, fingerprint):
+        _answer_not_modified(call, bot, not_modified_text)
+        return False
+
     try:
         if parse_mode is not None and reply_markup is not None:
             bot.edit_message_text(
@@ -137,6 +217,7 @@ def edit_callback_message_text(
                 message_id=call.message.message_id,
                 text=text,
             )
+        edit_fingerprints.remember(message_key, fingerprint)
         return True
     except ApiTelegramException as error:
         if getattr(error, "error_code", None) == 429:
@@ -160,12 +241,18 @@ def edit_callback_message_text(
             and "message is not modified" in str(error_description).lower()
         )
         if not is_not_modified:
+            edit_fingerprints.forget(message_key)
             raise
 
-        if getattr(call, "id", None) is not None:
-            bot.answer_callback_query(
-                callback_query_id=call.id,
-                text=not_modified_text,
-                show_alert=False,
-            )
+        edit_fingerprints.remember(message_key, fingerprint)
+        _answer_not_modified(call, bot, not_modified_text)
         return False
+
+
+def _answer_not_modified(call: CallbackQuery, bot: TeleBot, text: str) -> None:
+    if getattr(call, "id", None) is not None:
+        bot.answer_callback_query(
+            callback_query_id=call.id,
+            text=text,
+            show_alert=False,
+        )
@@ -11,6 +11,10 @@ from telebot.types import Message
 from pytmbot import exceptions
 from pytmbot.exceptions import ErrorContext
 from pytmbot.globals import get_emoji_converter, get_keyboards
+from pytmbot.handlers.handlers_util.agent_hosts import (
+    AgentHostScreen,
+    send_host_selector,
+)
 from pytmbot.logs import Logger
 from pytmbot.parsers.compiler import Compiler
 
@@ -63,6 +67,7 @@ def handle_server(message: Message, bot: TeleBot) -> None:
             reply_markup=server_keyboard,
             parse_mode="HTML",
         )
+        send_host_selector(bot, message.chat.id, AgentHostScreen.SERVER)
     except Exception as error:
         bot.send_message(
             message.chat.id, "⚠️ An error occurred while processing the command."
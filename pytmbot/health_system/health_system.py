@@ -11,6 +11,8 @@ import threading
 import time
 from abc import ABC, abstractmethod
 from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from dataclasses import dataclass, field
 from enum import IntEnum
 from typing import Final, Protocol, override, runtime_checkable
@@ -19,8 +21,13 @@ from weakref import ReferenceType, ref
 import telebot
 from telebot.apihelper import ApiTelegramException
 
+from pytmbot.health_system.telegram_activity import (
+    TelegramActivity,
+    telegram_activity,
+)
 from pytmbot.logs import BaseComponent
 from pytmbot.utils import to_float
+from pytmbot.utils.housekeeping import HousekeepingJob, get_housekeeping_scheduler
 
 RESOURCE_MEMORY_CRITICAL_THRESHOLD: Final[float] = 90.0
 RESOURCE_MEMORY_UNHEALTHY_THRESHOLD: Final[float] = 80.0
@@ -28,6 +35,9 @@ RESOURCE_MEMORY_DEGRADED_THRESHOLD: Final[float] = 70.0
 RESOURCE_CPU_CRITICAL_THRESHOLD: Final[float] = 95.0
 RESOURCE_CPU_UNHEALTHY_THRESHOLD: Final[float] = 90.0
 RESOURCE_CPU_DEGRADED_THRESHOLD: Final[float] = 80.0
+HEALTH_CHECK_MAX_WORKERS: Final[int] = 4
+HEALTH_CHECK_DEFAULT_TIMEOUT_SECONDS: Final[float] = 10.0
+TELEGRAM_SLOW_RESPONSE_MS: Final[float] = 3000.0
 
 
 class HealthLevel(IntEnum):
@@ -134,6 +144,11 @@ class BaseHealthChecker(ABC):
     def interval_seconds(self) -> float:
         return 60.0
 
+    @property
+    def timeout_seconds(self) -> float:
+        """Deadline the monitor applies when this checker runs concurrently."""
+        return HEALTH_CHECK_DEFAULT_TIMEOUT_SECONDS
+
     @abstractmethod
     def _perform_check(self) -> HealthResult:
         """Perform the actual health check - should be synchronous."""
@@ -173,13 +188,24 @@ class BaseHealthChecker(ABC):
 
 
 class TelegramApiChecker(BaseHealthChecker):
-    """Telegram API connectivity checker."""
+    """
+    Telegram API connectivity checker.
 
-    __slots__ = ("_bot_ref",)
+    Passive first: a successful ``getUpdates`` or send call recorded within
+    the check interval proves connectivity, so ``getMe`` is only issued when
+    the bot has seen no traffic for that long.
+    """
 
-    def __init__(self, bot_ref: ReferenceType[telebot.TeleBot]) -> None:
+    __slots__ = ("_bot_ref", "_activity")
+
+    def __init__(
+        self,
+        bot_ref: ReferenceType[telebot.TeleBot],
+        activity: TelegramActivity = telegram_activity,
+    ) -> None:
         super().__init__(cache_ttl=25.0)
         self._bot_ref = bot_ref
+        self._activity = activity
 
     @property
     def name(self) -> str:
@@ -189,6 +215,10 @@ class TelegramApiChecker(BaseHealthChecker):
     def interval_seconds(self) -> float:
         return 90.0
 
+    @property
+    def timeout_seconds(self) -> float:
+        return 5.0
+
     @override
     def _perform_check(self) -> HealthResult:
         bot = self._bot_ref()
@@ -200,69 +230,37 @@ class TelegramApiChecker(BaseHealthChecker):
                 details={"error": "bot_unavailable"},
             )
 
-        start_time = time.perf_counter()
-        try:
-            result: dict[str, object] = {}
-
-            def api_call() -> None:
-                try:
-                    result["bot_info"] = bot.get_me()
-                except Exception as error:
-                    result["error"] = error
-
-            thread = threading.Thread(
-                target=api_call,
-                name="HealthTelegramApiCheck",
-                daemon=True,
-            )
-            thread.start()
-            thread.join(timeout=5.0)
-            if thread.is_alive():
-                raise TimeoutError("API call timeout")
-
-            error = result.get("error")
-            if isinstance(error, Exception):
-                raise error
-
-            bot_info = result.get("bot_info")
-
-            latency = (time.perf_counter() - start_time) * 1000
-
-            if not bot_info:
-                return HealthResult(
-                    level=HealthLevel.CRITICAL,
-                    component=self.name,
-                    latency_ms=latency,
-                    details={"error": "no_bot_info"},
-                )
-
-            # Determine level based on latency
-            if latency > 3000:
-                level = HealthLevel.DEGRADED
-            else:
-                level = HealthLevel.HEALTHY
-
+        last_success = self._activity.last_success()
+        activity_age = self._activity.seconds_since_success()
+        if (
+            last_success is not None
+            and activity_age is not None
+            and activity_age < self.interval_seconds
+        ):
             return HealthResult(
-                level=level,
+                level=HealthLevel.HEALTHY,
                 component=self.name,
-                latency_ms=latency,
-                details=(
-                    {
-                        "bot_id": bot_info.id,
-                        "username": bot_info.username or "unknown",
-                    }
-                    if isinstance(bot_info, BotIdentity)
-                    else {"bot_id": "unknown", "username": "unknown"}
-                ),
+                latency_ms=0.0,
+                details={
+                    "mode": "passive",
+                    "last_method": last_success.method,
+                    "last_activity_age_s": round(activity_age, 1),
+                },
             )
 
+        return self._probe_get_me(bot)
+
+    def _probe_get_me(self, bot: telebot.TeleBot) -> HealthResult:
+        start_time = time.perf_counter()
+        try:
+            bot_info = bot.get_me()
         except (TimeoutError, OSError):
             latency = (time.perf_counter() - start_time) * 1000
             return HealthResult(
                 level=HealthLevel.UNHEALTHY,
                 component=self.name,
                 latency_ms=latency,
-                details={"error": "timeout"},
+                details={"mode": "active", "error": "timeout"},
             )
         except ApiTelegramException as e:
             latency = (time.perf_counter() - start_time) * 1000
@@ -278,9 +276,43 @@ class TelegramApiChecker(BaseHealthChecker):
                 level=level,
                 component=self.name,
                 latency_ms=latency,
-                details={"error_code": e.error_code, "description": e.description},
+                details={
+                    "mode": "active",
+                    "error_code": e.error_code,
+                    "description": e.description,
+                },
             )
 
+        latency = (time.perf_counter() - start_time) * 1000
+        if not bot_info:
+            return HealthResult(
+                level=HealthLevel.CRITICAL,
+                component=self.name,
+                latency_ms=latency,
+                details={"mode": "active", "error": "no_bot_info"},
+            )
+
+        return HealthResult(
+            level=(
+                HealthLevel.DEGRADED
+                if latency > TELEGRAM_SLOW_RESPONSE_MS
+                else HealthLevel.HEALTHY
+            ),
+            component=self.name,
+            latency_ms=latency,
+            details={
+                "mode": "active",
+                **(
+                    {
+                        "bot_id": bot_info.id,
+                        "username": bot_info.username or "unknown",
+                    }
+                    if isinstance(bot_info, BotIdentity)
+                    else {"bot_id": "unknown", "username": "unknown"}
+                ),
+            },
+        )
+
 
 class PollingChecker(BaseHealthChecker):
     """Polling state checker."""
@@ -505,10 +537,14 @@ class HealthMonitor(BaseComponent):
         "_latest",
         "_intervals",
         "_base_interval",
-        "_thread",
-        "_stop_event",
+        "_next_interval",
+        "_previous_level",
+        "_monitor_job",
         "_monitor_failures",
         "_max_monitor_failures",
+        "_executor",
+        "_in_flight",
+        "_round",
     )
 
     def __init__(self, max_history: int = 15) -> None:
@@ -521,10 +557,14 @@ class HealthMonitor(BaseComponent):
         self._latest: SystemHealth | None = None
         self._intervals: dict[str, float] = {}
         self._base_interval = 120.0
-        self._thread: threading.Thread | None = None
-        self._stop_event = threading.Event()
+        self._next_interval = 120.0
+        self._previous_level: HealthLevel | None = None
+        self._monitor_job: HousekeepingJob | None = None
         self._monitor_failures = 0
         self._max_monitor_failures = 3
+        self._executor: ThreadPoolExecutor | None = None
+        self._in_flight: dict[str, Future[HealthResult]] = {}
+        self._round: Future[None] | None = None
 
     def _publish_monitor_failure(self, error: Exception) -> None:
         """Publish internal monitor failure as health degradation signal."""
@@ -594,17 +634,7 @@ class HealthMonitor(BaseComponent):
         if latest_snapshot:
             components.update(latest_snapshot.components)
 
-        # Update checked components
-        for name, checker in to_check:
-            try:
-                components[name] = checker.check_sync()
-            except Exception as e:
-                components[name] = HealthResult(
-                    level=HealthLevel.CRITICAL,
-                    component=name,
-                    latency_ms=0.0,
-                    details={"error": "check_failed", "exception": str(e)},
-                )
+        components.update(self._run_checks(to_check))
 
         # Calculate overall health
         if not components:
@@ -633,8 +663,70 @@ class HealthMonitor(BaseComponent):
 
         return health
 
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._state_lock:
+            if self._executor is None:
+                # One extra worker drives the monitoring round itself.
+                self._executor = ThreadPoolExecutor(
+                    max_workers=HEALTH_CHECK_MAX_WORKERS + 1,
+                    thread_name_prefix="health-check",
+                )
+            return self._executor
+
+    def _run_checks(
+        self, to_check: list[tuple[str, HealthChecker]]
+    ) -> dict[str, HealthResult]:
+        """
+        Run due checkers concurrently, each bounded by its own timeout.
+
+        A checker still running from an earlier round is not resubmitted, so a
+        hung probe occupies at most one worker.
+        """
+        executor = self._get_executor()
+        started = time.perf_counter()
+        pending: list[tuple[str, Future[HealthResult], float]] = []
+        results: dict[str, HealthResult] = {}
+
+        with self._state_lock:
+            for name, checker in to_check:
+                future = self._in_flight.get(name)
+                if future is None or future.done():
+                    future = executor.submit(checker.check_sync)
+                    self._in_flight[name] = future
+                timeout = getattr(
+                    checker, "timeout_seconds", HEALTH_CHECK_DEFAULT_TIMEOUT_SECONDS
+                )
+                pending.append((name, future, started + timeout))
+
+        for name, future, deadline in pending:
+            try:
+                results[name] = future.result(
+                    timeout=max(0.0, deadline - time.perf_counter())
+                )
+            except FutureTimeoutError:
+                results[name] = HealthResult(
+                    level=HealthLevel.UNHEALTHY,
+                    component=name,
+                    latency_ms=(time.perf_counter() - started) * 1000,
+                    details={"error": "timeout"},
+                )
+            except Exception as e:
+                results[name] = HealthResult(
+                    level=HealthLevel.CRITICAL,
+                    component=name,
+                    latency_ms=0.0,
+                    details={"error": "check_failed", "exception": str(e)},
+                )
+
+        with self._state_lock:
+            for name, future, _ in pending:
+                if future.done() and self._in_flight.get(name) is future:
+                    del self._in_flight[name]
+
+        return results
+
     def start_monitoring(self, base_interval: float = 120.0) -> None:
-        """Start continuous monitoring in a separate thread."""
+        """Start continuous monitoring as a housekeeping job."""
         with self._state_lock:
             if self._running:
                 with self.log_context() as log:
@@ -642,15 +734,18 @@ class HealthMonitor(BaseComponent):
                 return
 
             self._base_interval = base_interval
+            self._next_interval = base_interval
+            self._previous_level = None
             self._running = True
-            self._stop_event.clear()
             checker_count = len(self._checkers)
-            thread = threading.Thread(
-                target=self._monitor_loop, name="HealthMonitor", daemon=True
+            self._monitor_job = get_housekeeping_scheduler().register(
+                f"health_monitor:{id(self):x}",
+                self._monitor_cycle,
+                interval=self._get_next_interval,
+                jitter=0.0,
+                initial_delay=0.0,
             )
-            self._thread = thread
 
-        thread.start()
         with self.log_context(checkers=checker_count, interval=base_interval) as log:
             log.info("bot.health.monitoring.start")
 
@@ -661,98 +756,113 @@ class HealthMonitor(BaseComponent):
                 return
 
             self._running = False
-            self._stop_event.set()
-            thread = self._thread
+            job, self._monitor_job = self._monitor_job, None
+            executor = self._executor
+            self._executor = None
+            self._in_flight.clear()
+            self._round = None
 
-        if thread and thread.is_alive():
-            thread.join(timeout=5.0)
+        if job is not None:
+            job.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
 
         with self.log_context() as log:
             log.info("bot.health.monitoring.stop")
 
-    def _monitor_loop(self) -> None:
-        """Main monitoring loop."""
-        with self.log_context() as log:
-            log.trace("bot.health.monitoring.loop.start")
+    def _get_next_interval(self) -> float:
+        with self._state_lock:
+            return self._next_interval
 
-        previous_level: HealthLevel | None = None
+    def _monitor_cycle(self) -> None:
+        """
+        Submit one monitoring round to the health executor and return.
 
-        while True:
-            with self._state_lock:
-                is_running = self._running
-                base_interval = self._base_interval
-            if not is_running or self._stop_event.is_set():
-                break
+        The housekeeping thread never waits on checker timeouts; a round still
+        running when the next one is due is not duplicated. The adaptive interval
+        picked by a round applies from the following reschedule.
+        """
+        with self._state_lock:
+            if not self._running:
+                return
+            if self._round is not None and not self._round.done():
+                with self.log_context() as log:
+                    log.trace("bot.health.monitoring.round.busy")
+                return
+            self._round = self._get_executor().submit(self._monitor_round)
 
-            try:
-                health = self.check_all()
-                is_first_check = previous_level is None
-                has_changed = (
-                    previous_level is not None and previous_level != health.overall
-                )
+    def _monitor_round(self) -> None:
+        """Run one monitoring pass and pick the adaptive interval for the next one."""
+        with self._state_lock:
+            if not self._running:
+                return
+            base_interval = self._base_interval
+            previous_level = self._previous_level
 
-                if is_first_check:
+        try:
+            health = self.check_all()
+            is_first_check = previous_level is None
+            has_changed = (
+                previous_level is not None and previous_level != health.overall
+            )
+
+            if is_first_check:
+                log_method = "info"
+            elif has_changed:
+                if health.overall == HealthLevel.HEALTHY:
                     log_method = "info"
-                elif has_changed:
-                    if health.overall == HealthLevel.HEALTHY:
-                        log_method = "info"
-                    elif health.overall in (
-                        HealthLevel.DEGRADED,
-                        HealthLevel.UNHEALTHY,
-                    ):
-                        log_method = "warning"
-                    else:
-                        log_method = "error"
-                elif health.overall == HealthLevel.HEALTHY:
-                    log_method = "trace"
-                elif health.overall in (HealthLevel.DEGRADED, HealthLevel.UNHEALTHY):
+                elif health.overall in (
+                    HealthLevel.DEGRADED,
+                    HealthLevel.UNHEALTHY,
+                ):
                     log_method = "warning"
                 else:
                     log_method = "error"
-
-                with self.log_context(
-                    overall=str(health.overall),
-                    operational=health.operational_count,
-                    total=health.total_count,
-                    health_ratio=f"{health.health_ratio:.1%}",
-                    duration_ms=f"{health.check_duration_ms:.1f}",
-                ) as log:
-                    if is_first_check:
-                        event = "bot.health.monitoring.initial.status"
-                    elif has_changed and health.overall == HealthLevel.HEALTHY:
-                        event = "bot.health.monitoring.recovered.status"
-                    else:
-                        event = "bot.health.monitoring.status"
-                    getattr(log, log_method)(event)
-
-                # Adaptive interval
-                if health.overall <= HealthLevel.UNHEALTHY:
-                    interval = base_interval * 0.5
-                elif health.overall == HealthLevel.DEGRADED:
-                    interval = base_interval * 0.75
+            elif health.overall == HealthLevel.HEALTHY:
+                log_method = "trace"
+            elif health.overall in (HealthLevel.DEGRADED, HealthLevel.UNHEALTHY):
+                log_method = "warning"
+            else:
+                log_method = "error"
+
+            with self.log_context(
+                overall=str(health.overall),
+                operational=health.operational_count,
+                total=health.total_count,
+                health_ratio=f"{health.health_ratio:.1%}",
+                duration_ms=f"{health.check_duration_ms:.1f}",
+            ) as log:
+                if is_first_check:
+                    event = "bot.health.monitoring.initial.status"
+                elif has_changed and health.overall == HealthLevel.HEALTHY:
+                    event = "bot.health.monitoring.recovered.status"
                 else:
-                    interval = base_interval
-
-                previous_level = health.overall
-                with self._state_lock:
-                    self._monitor_failures = 0
+                    event = "bot.health.monitoring.status"
+                getattr(log, log_method)(event)
+
+            # Adaptive interval
+            if health.overall <= HealthLevel.UNHEALTHY:
+                interval = base_interval * 0.5
+            elif health.overall == HealthLevel.DEGRADED:
+                interval = base_interval * 0.75
+            else:
+                interval = base_interval
 
-            except Exception as e:
-                with self._state_lock:
-                    self._monitor_failures += 1
-                    failures = self._monitor_failures
-                    interval = self._base_interval
-                self._publish_monitor_failure(e)
-                with self.log_context(error=str(e)) as log:
-                    log.error("bot.health.monitoring.fail")
-                    if failures >= self._max_monitor_failures:
-                        log.critical("bot.health.monitoring.degraded.fail")
-
-            # Sleep with early exit
-            self._stop_event.wait(timeout=interval)
+            with self._state_lock:
+                self._previous_level = health.overall
+                self._next_interval = interval
+                self._monitor_failures = 0
 
-        with self.log_context() as log:
-            log.debug("bot.health.monitoring.loop.debug")
+        except Exception as e:
+            with self._state_lock:
+                self._monitor_failures += 1
+                failures = self._monitor_failures
+                self._next_interval = self._base_interval
+            self._publish_monitor_failure(e)
+            with self.log_context(error=str(e)) as log:
+                log.error("bot.health.monitoring.fail")
+                if failures >= self._max_monitor_failures:
+                    log.critical("bot.health.monitoring.degraded.fail")
 
     @property
     def checker_count(self) -> int:
@@ -0,0 +1,89 @@
+#!/usr/local/bin/python3
+"""
+(c) Copyright 2025, Denis Rozhnovskiy <pytelemonbot@mail.ru>
+pyTMBot - A simple Telegram bot to handle Docker containers and images,
+also providing basic information about the status of local servers.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Final
+
+from telebot import apihelper
+
+from pytmbot.utils.outbound_queue import default_request_sender
+
+type RequestSender = Callable[..., object]
+
+_PROBE_ATTRIBUTE: Final[str] = "__pytmbot_activity_probe__"
+
+
+@dataclass(frozen=True, slots=True)
+class TelegramActivitySample:
+    """Last successful Bot API call seen by the process."""
+
+    method: str
+    timestamp: float
+
+
+class TelegramActivity:
+    """
+    Thread-safe record of successful Bot API traffic.
+
+    The bot feeds it from its own ``getUpdates`` and send calls, so health
+    checks can treat recent traffic as proof of connectivity instead of
+    issuing an extra ``getMe`` request.
+    """
+
+    __slots__ = ("_lock", "_last", "_clock")
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._lock = threading.Lock()
+        self._last: TelegramActivitySample | None = None
+        self._clock = clock
+
+    def record_success(self, method: str) -> None:
+        sample = TelegramActivitySample(method=method, timestamp=self._clock())
+        with self._lock:
+            self._last = sample
+
+    def last_success(self) -> TelegramActivitySample | None:
+        with self._lock:
+            return self._last
+
+    def seconds_since_success(self) -> float | None:
+        last = self.last_success()
+        return None if last is None else max(0.0, self._clock() - last.timestamp)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._last = None
+
+
+telegram_activity: Final[TelegramActivity] = TelegramActivity()
+
+
+def install_activity_probe(activity: TelegramActivity = telegram_activity) -> None:
+    """
+    Record successful Bot API responses through ``apihelper.CUSTOM_REQUEST_SENDER``.
+
+    An already configured sender is wrapped rather than replaced; installing
+    twice is a no-op.
+    """
+    current: RequestSender | None = getattr(apihelper, "CUSTOM_REQUEST_SENDER", None)
+    if getattr(current, _PROBE_ATTRIBUTE, False):
+        return
+    sender: RequestSender = current or default_request_sender
+
+    def _probing_sender(method: str, url: str, **kwargs: object) -> object:
+        response = sender(method, url, **kwargs)
+        if getattr(response, "status_code", None) == 200:
+            activity.record_success(url.rsplit("/", 1)[-1])
+        return response
+
+    setattr(_probing_sender, _PROBE_ATTRIBUTE, True)
+    setattr(apihelper, "CUSTOM_REQUEST_SENDER", _probing_sender)  # noqa: B010
@@ -11,7 +11,7 @@ import json
 import re
 import sys
 from collections import OrderedDict
-from collections.abc import Callable, Generator
+from collections.abc import Callable, Generator, Mapping
 from contextlib import contextmanager
 from contextvars import ContextVar, Token
 from dataclasses import dataclass
@@ -41,6 +41,7 @@ else:
 
 T = TypeVar("T")
 type TelegramObject = Update | Message | CallbackQuery | InlineQuery
+type ContextFactory = Callable[[], Mapping[str, object]]
 
 
 class LogLevel(StrEnum):
@@ -761,6 +762,12 @@ class SecureLoggerFilter:
         return value
 
 
+@lru_cache(maxsize=32)
+def _level_no(level: str) -> int:
+    """Resolve a level name to its loguru severity number."""
+    return logger.level(level.upper()).no
+
+
 class Logger:
     """
     Singleton logger with automatic data masking, context management,
@@ -773,6 +780,7 @@ class Logger:
         "_filter",
         "_initialized",
         "_traceback_enabled",
+        "_min_level_no",
     )
 
     _logger: LoguruLogger
@@ -780,6 +788,7 @@ class Logger:
     _filter: SecureLoggerFilter
     _initialized: bool
     _traceback_enabled: bool
+    _min_level_no: int
     _instance: Logger | None = None
     _lock: Final[RLock] = RLock()
     _context_data: ClassVar[ContextVar[dict[str, object] | None]] = ContextVar(
@@ -858,6 +867,7 @@ class Logger:
         """Configure the logger with optimized settings."""
         self._logger.remove()
         self._traceback_enabled = str(log_level).upper() == LogLevel.DEBUG.value
+        self._min_level_no = _level_no(log_level)
 
         def default_filter(record: object) -> bool:
             if not isinstance(record, dict):
@@ -957,6 +967,28 @@ class Logger:
 
         return self._extract_update_data(update_id, update_type, chat_id, user_id)
 
+    def is_enabled_for(self, level: str) -> bool:
+        """Return whether events at ``level`` pass the configured minimum level."""
+        return _level_no(level) >= self._min_level_no
+
+    def emit(
+        self,
+        level: str,
+        message: str,
+        context_factory: ContextFactory | None = None,
+    ) -> None:
+        """
+        Log ``message`` at ``level``, building its context only when enabled.
+
+        ``context_factory`` is not called at all for disabled levels, so any
+        masking or attribute lookups it performs cost nothing on hot paths.
+        """
+        if not self.is_enabled_for(level):
+            return
+        context = context_factory() if context_factory is not None else {}
+        with self.context(**context) as log:
+            getattr(log, level.lower())(message)
+
     @contextmanager
     def context(self, **kwargs: object) -> Generator[Logger, None, None]:
         """Context manager for temporarily binding additional data to the logger."""
@@ -1224,11 +1256,25 @@ class BaseComponent:
         with self._log.context(component=component, **kwargs) as log:
             yield log
 
+    def emit(
+        self,
+        level: str,
+        message: str,
+        context_factory: ContextFactory | None = None,
+    ) -> None:
+        """Level-gated logging with a lazily built component context."""
+        if not self._log.is_enabled_for(level):
+            return
+        context = context_factory() if context_factory is not None else {}
+        with self.log_context(**context) as log:
+            getattr(log, level.lower())(message)
+
 
 __all__ = [
     "Logger",
     "LogLevel",
     "BaseComponent",
+    "ContextFactory",
     "DataMasker",
     "MaskingConfig",
 ]
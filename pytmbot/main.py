@@ -25,11 +25,16 @@ from humanize import naturaltime
 
 from pytmbot import logs
 from pytmbot.adapters.docker.client import reset_docker_client_context
+from pytmbot.adapters.docker.container_manager import shutdown_container_executors
 from pytmbot.adapters.psutil.adapter import PsutilAdapter
+from pytmbot.agent.server import shutdown_agent_ingestion
 from pytmbot.exceptions import ErrorContext, InitializationError, ShutdownError
 from pytmbot.health_system import HealthManager, HealthStatus, create_health_manager
 from pytmbot.middleware.session_manager import SessionManager
 from pytmbot.utils import parse_cli_args
+from pytmbot.utils.housekeeping import shutdown_housekeeping_scheduler
+from pytmbot.utils.outbound_queue import shutdown_outbound_queue
+from pytmbot.utils.state_store import shutdown_state_store
 
 args: argparse.Namespace | None = None
 
@@ -96,11 +101,18 @@ class BotLauncher(logs.BaseComponent):
 
         try:
             if self.bot and hasattr(self.bot, "bot") and self.bot.bot:
+                self.bot.stop_async_polling()
                 stop_polling: Callable[[], object] = self.bot.bot.stop_polling
                 stop_polling()
                 self.bot.bot.remove_webhook()
+            shutdown_outbound_queue()
             self._session_manager.shutdown()
+            shutdown_housekeeping_scheduler()
+            shutdown_agent_ingestion()
+            shutdown_container_executors()
             reset_docker_client_context()
+            # Last: the steps above may still persist state while stopping.
+            shutdown_state_store()
         except Exception as e:
             if not silent:
                 with self.log_context(error=str(e)) as log:
@@ -18,6 +18,8 @@ from telebot.types import CallbackQuery, Message, User
 from pytmbot.globals import settings
 from pytmbot.logs import BaseComponent
 from pytmbot.utils import mask_chat_id, mask_user_id, mask_username
+from pytmbot.utils.housekeeping import HousekeepingJob, get_housekeeping_scheduler
+from pytmbot.utils.state_store import get_state_store
 
 
 class AccessControl(BaseMiddleware, BaseComponent):
@@ -34,14 +36,13 @@ class AccessControl(BaseMiddleware, BaseComponent):
     BLOCK_DURATION: Final[int] = 3600  # seconds
     CLEANUP_INTERVAL: Final[int] = 3600  # seconds
     ADMIN_NOTIFY_SUPPRESSION: Final[int] = 300  # seconds
-    CLEANUP_THREAD_JOIN_TIMEOUT: Final[float] = 2.0
 
     # Commands that unauthorized users can use within their attempt limit
     SETUP_COMMANDS: Final[set[str]] = {
         "/getmyid",
     }
 
-    def __init__(self, bot: TeleBot) -> None:
+    def __init__(self, bot: TeleBot, *, schedule_cleanup: bool = True) -> None:
         BaseComponent.__init__(self)
         self.bot = bot
         self.update_types = ["message", "callback_query"]
@@ -49,17 +50,19 @@ class AccessControl(BaseMiddleware, BaseComponent):
         self.allowed_user_ids = frozenset(settings.access_control.allowed_user_ids)
 
         self._attempt_count: defaultdict[int, int] = defaultdict(int)
-        self._blocked_until: dict[int, datetime] = {}
+        self._block_state = get_state_store().namespace("access_blocks")
+        # Blocks survive restarts; attempt counters and notices do not.
+        self._blocked_until: dict[int, datetime] = self._restore_blocks()
         self._last_admin_notify: dict[int, datetime] = {}
         self._state_lock = threading.RLock()
-        self._cleanup_stop_event = threading.Event()
-        self._cleanup_thread = threading.Thread(
-            target=self._periodic_cleanup,
-            daemon=True,
-            name="access_control_cleanup",
-        )
+        self._cleanup_job: HousekeepingJob | None = None
 
-        self._cleanup_thread.start()
+        if schedule_cleanup:
+            self._cleanup_job = get_housekeeping_scheduler().register(
+                f"access_control_cleanup:{id(self):x}",
+                self._cleanup_expired_blocks,
+                interval=self.CLEANUP_INTERVAL,
+            )
 
         context = {
             "operation": "initialization",
@@ -68,12 +71,24 @@ class AccessControl(BaseMiddleware, BaseComponent):
             "cleanup_interval": self.CLEANUP_INTERVAL,
             "allowed_users_count": len(self.allowed_user_ids),
             "setup_commands": list(self.SETUP_COMMANDS),
-            "thread_name": "access_control_cleanup",
+            "cleanup_scheduled": schedule_cleanup,
         }
 
         with self.log_context(**context) as logger:
             logger.info("bot.access.control.middleware.init")
 
+    def _restore_blocks(self) -> dict[int, datetime]:
+        self._block_state.purge_expired()
+        return {
+            int(user_id): datetime.fromtimestamp(until)
+            for user_id, until in self._block_state.items()
+            if user_id.lstrip("-").isdigit() and isinstance(until, int | float)
+        }
+
+    def _persist_block(self, user_id: int, block_until: datetime) -> None:
+        until_ts = block_until.timestamp()
+        self._block_state.put(str(user_id), until_ts, expires_at=until_ts)
+
     @staticmethod
     def _is_callback_update(update: object) -> bool:
         return isinstance(update, CallbackQuery) or (
@@ -203,21 +218,65 @@ class AccessControl(BaseMiddleware, BaseComponent):
             return CancelUpdate()
 
         user_id = user.id
-        username = self._resolve_user_label(user)
 
         if raw_text:
-            debug_context = {
-                "user_id": mask_user_id(user_id),
-                "chat_id": chat_id,
-                "text_length": len(raw_text),
-                "cmd": raw_text.lstrip().startswith("/"),
-                "update_type": update_type,
-            }
+            self.emit(
+                "DEBUG",
+                "bot.access.incoming.received.debug",
+                lambda: {
+                    "user_id": mask_user_id(user_id),
+                    "chat_id": chat_id,
+                    "text_length": len(raw_text),
+                    "cmd": raw_text.lstrip().startswith("/"),
+                    "update_type": update_type,
+                },
+            )
+
+        # Authorized users get full access without attempt counting
+        if user_id in self.allowed_user_ids and not self._should_block_request(user_id):
+            self.emit(
+                "TRACE",
+                "bot.access.granted.authorized.ok",
+                lambda: {
+                    **self._build_base_context(
+                        update, user, chat_id, message_id, update_type
+                    ),
+                    "operation": "access_granted",
+                    "access_status": "authorized",
+                },
+            )
+            return None
 
-            with self.log_context(**debug_context) as logger:
-                logger.debug("bot.access.incoming.received.debug")
+        username = self._resolve_user_label(user)
+        base_context = self._build_base_context(
+            update, user, chat_id, message_id, update_type
+        )
+
+        # Check if user is currently blocked
+        if self._should_block_request(user_id):
+            return self._deny_blocked_request(
+                update, base_context, self._get_block_until(user_id)
+            )
+
+        # Unauthorized users: check attempts and handle accordingly
+        return self._handle_unauthorized_access(
+            user_id=user_id,
+            username=username,
+            chat_id=chat_id,
+            update=update,
+            base_context=base_context,
+        )
 
-        base_context = {
+    def _build_base_context(
+        self,
+        update: Message | CallbackQuery,
+        user: User,
+        chat_id: int | None,
+        message_id: int | None,
+        update_type: str,
+    ) -> dict[str, object]:
+        """Build the masked per-update log context shared by access events."""
+        return {
             "operation": "pre_process",
             "message_id": message_id,
             "chat_id": chat_id,
@@ -230,56 +289,42 @@ class AccessControl(BaseMiddleware, BaseComponent):
                 if self._is_callback_update(update)
                 else getattr(getattr(update, "chat", None), "type", "unknown")
             ),
-            "user_id": mask_user_id(user_id),
-            "username": mask_username(username),
+            "user_id": mask_user_id(user.id),
+            "username": mask_username(self._resolve_user_label(user)),
             "user_is_bot": user.is_bot,
             "update_type": update_type,
         }
 
-        # Check if user is currently blocked
-        if self._should_block_request(user_id):
-            with self._state_lock:
-                block_until = self._blocked_until.get(user_id)
-            context = {
-                **base_context,
-                "operation": "access_blocked",
-                "block_expires": (
-                    block_until.isoformat() if block_until is not None else "unknown"
-                ),
-                "block_reason": "max_attempts_exceeded",
-            }
-
-            with self.log_context(**context) as logger:
-                logger.warning("bot.access.blocked.silent.deny")
-            if self._is_callback_update(update):
-                callback_update = cast(CallbackQuery, update)
-                self.bot.answer_callback_query(
-                    callback_update.id,
-                    text="Access denied.",
-                    show_alert=False,
-                )
-            return CancelUpdate()
-
-        # Authorized users get full access without attempt counting
-        if user_id in self.allowed_user_ids:
-            context = {
-                **base_context,
-                "operation": "access_granted",
-                "access_status": "authorized",
-            }
+    def _get_block_until(self, user_id: int) -> datetime | None:
+        with self._state_lock:
+            return self._blocked_until.get(user_id)
 
-            with self.log_context(**context) as logger:
-                logger.trace("bot.access.granted.authorized.ok")
-            return None
+    def _deny_blocked_request(
+        self,
+        update: Message | CallbackQuery,
+        base_context: dict[str, object],
+        block_until: datetime | None,
+    ) -> CancelUpdate:
+        """Silently reject an update from a temporarily blocked user."""
+        context = {
+            **base_context,
+            "operation": "access_blocked",
+            "block_expires": (
+                block_until.isoformat() if block_until is not None else "unknown"
+            ),
+            "block_reason": "max_attempts_exceeded",
+        }
 
-        # Unauthorized users: check attempts and handle accordingly
-        return self._handle_unauthorized_access(
-            user_id=user_id,
-            username=username,
-            chat_id=chat_id,
-            update=update,
-            base_context=base_context,
-        )
+        with self.log_context(**context) as logger:
+            logger.warning("bot.access.blocked.silent.deny")
+        if self._is_callback_update(update):
+            callback_update = cast(CallbackQuery, update)
+            self.bot.answer_callback_query(
+                callback_update.id,
+                text="Access denied.",
+                show_alert=False,
+            )
+        return CancelUpdate()
 
     def _should_block_request(self, user_id: int) -> bool:
         """Check if user should be blocked based on time."""
@@ -307,13 +352,7 @@ class AccessControl(BaseMiddleware, BaseComponent):
         base_context: dict[str, object],
     ) -> CancelUpdate | None:
         """Handle access for unauthorized users with attempt limits."""
-        block_until: datetime | None = None
-        with self._state_lock:
-            self._attempt_count[user_id] += 1
-            current_attempt = self._attempt_count[user_id]
-            if current_attempt >= self.MAX_ATTEMPTS:
-                block_until = datetime.now() + timedelta(seconds=self.BLOCK_DURATION)
-                self._blocked_until[user_id] = block_until
+        current_attempt, block_until = self._register_unauthorized_attempt(user_id)
         update_text = (
             getattr(update, "text", None)
             if not self._is_callback_update(update)
@@ -386,6 +425,33 @@ class AccessControl(BaseMiddleware, BaseComponent):
         self._notify_user_denied(update, attempt_count=current_attempt)
         return CancelUpdate()
 
+    def _register_unauthorized_attempt(
+        self, user_id: int
+    ) -> tuple[int, datetime | None]:
+        """Count an unauthorized attempt; return it and the block deadline if set."""
+        block_until: datetime | None = None
+        with self._state_lock:
+            self._attempt_count[user_id] += 1
+            current_attempt = self._attempt_count[user_id]
+            if current_attempt >= self.MAX_ATTEMPTS:
+                block_until = datetime.now() + timedelta(seconds=self.BLOCK_DURATION)
+                self._blocked_until[user_id] = block_until
+        if block_until is not None:
+            self._persist_block(user_id, block_until)
+        return current_attempt, block_until
+
+    def _claim_admin_notification(
+        self, user_id: int, now: datetime
+    ) -> tuple[bool, float]:
+        """Return (suppressed, seconds since last notice), claiming the slot if free."""
+        with self._state_lock:
+            last_notified = self._last_admin_notify.get(user_id, datetime.min)
+            time_since_last_notify = (now - last_notified).total_seconds()
+            should_suppress = time_since_last_notify < self.ADMIN_NOTIFY_SUPPRESSION
+            if not should_suppress:
+                self._last_admin_notify[user_id] = now
+        return should_suppress, time_since_last_notify
+
     def _notify_admin(
         self,
         user_id: int,
@@ -395,14 +461,9 @@ class AccessControl(BaseMiddleware, BaseComponent):
         is_setup_command: bool = False,
     ) -> None:
         """Notify admin about unauthorized access attempts."""
-        now = datetime.now()
-        time_since_last_notify = 0.0
-        with self._state_lock:
-            last_notified = self._last_admin_notify.get(user_id, datetime.min)
-            time_since_last_notify = (now - last_notified).total_seconds()
-            should_suppress = time_since_last_notify < self.ADMIN_NOTIFY_SUPPRESSION
-            if not should_suppress:
-                self._last_admin_notify[user_id] = now
+        should_suppress, time_since_last_notify = self._claim_admin_notification(
+            user_id, datetime.now()
+        )
 
         if should_suppress:
             context = {
@@ -498,105 +559,80 @@ class AccessControl(BaseMiddleware, BaseComponent):
             with self.log_context(**context) as logger:
                 logger.error("bot.access.admin.notification.fail")
 
-    def _wait_for_cleanup_interval(self) -> bool:
-        """Wait for cleanup interval; return True when shutdown was requested."""
-        return self._cleanup_stop_event.wait(timeout=self.CLEANUP_INTERVAL)
-
-    def _periodic_cleanup(self) -> None:
-        """Clean expired blocks and reset counters."""
-        # Ensure logging is available in thread context
-        if not hasattr(self, "_log") or self._log is None:
-            import logging
-
-            logging.warning("bot.access.control.log.warn")
-
+    def _cleanup_expired_blocks(self) -> None:
+        """Clean expired blocks and reset counters; runs as a housekeeping job."""
         context = {
             "operation": "periodic_cleanup",
             "cleanup_interval": self.CLEANUP_INTERVAL,
-            "thread_name": threading.current_thread().name,
         }
 
         try:
-            with self.log_context(**context) as logger:
-                logger.info("bot.access.periodic.cleanup.start")
-        except AttributeError:
-            # Fallback to basic logging if context logging fails
-            import logging
-
-            logging.info("bot.access.control.periodic.start")
-
-        while not self._cleanup_stop_event.is_set():
-            try:
-                if self._wait_for_cleanup_interval():
-                    break
-                now = datetime.now()
-                with self._state_lock:
-                    expired = [
-                        user_id
-                        for user_id, until in self._blocked_until.items()
-                        if now >= until
-                    ]
-                    total_blocked_users = len(self._blocked_until)
-
-                    for user_id in expired:
-                        del self._blocked_until[user_id]
-                        self._attempt_count[user_id] = 0
-                        self._last_admin_notify.pop(user_id, None)
-
-                    active_blocks = len(self._blocked_until)
-
-                cleanup_context = {
-                    **context,
-                    "operation": "cleanup_execution",
-                    "cleanup_timestamp": now.isoformat(),
-                    "total_blocked_users": total_blocked_users,
-                    "expired_count": len(expired),
-                    "active_blocks": active_blocks,
-                }
+            now = datetime.now()
+            with self._state_lock:
+                expired = [
+                    user_id
+                    for user_id, until in self._blocked_until.items()
+                    if now >= until
+                ]
+                total_blocked_users = len(self._blocked_until)
+
+                for user_id in expired:
+                    del self._blocked_until[user_id]
+                    self._attempt_count[user_id] = 0
+                    self._last_admin_notify.pop(user_id, None)
+
+                active_blocks = len(self._blocked_until)
+
+            cleanup_context = {
+                **context,
+                "operation": "cleanup_execution",
+                "cleanup_timestamp": now.isoformat(),
+                "total_blocked_users": total_blocked_users,
+                "expired_count": len(expired),
+                "active_blocks": active_blocks,
+            }
 
-                if expired:
-                    cleanup_context["expired_user_ids"] = [
-                        mask_user_id(user_id) for user_id in sorted(expired)
-                    ]
-                    try:
-                        with self.log_context(**cleanup_context) as logger:
-                            logger.info("bot.access.expired.blocks.info")
-                    except AttributeError:
-                        import logging
-
-                        logging.info("bot.access.control.expired.info")
-                else:
-                    try:
-                        with self.log_context(**cleanup_context) as logger:
-                            logger.debug("bot.access.no.expired.debug")
-                    except AttributeError:
-                        import logging
-
-                        logging.debug("bot.access.control.no.debug")
-
-            except Exception as e:
-                error_context = {
-                    **context,
-                    "operation": "cleanup_error",
-                    "error": str(e),
-                    "error_type": type(e).__name__,
-                }
+            if expired:
+                cleanup_context["expired_user_ids"] = [
+                    mask_user_id(user_id) for user_id in sorted(expired)
+                ]
+                try:
+                    with self.log_context(**cleanup_context) as logger:
+                        logger.info("bot.access.expired.blocks.info")
+                except AttributeError:
+                    import logging
 
+                    logging.info("bot.access.control.expired.info")
+            else:
                 try:
-                    with self.log_context(**error_context) as logger:
-                        logger.error("bot.access.cleanup.fail")
+                    with self.log_context(**cleanup_context) as logger:
+                        logger.debug("bot.access.no.expired.debug")
                 except AttributeError:
                     import logging
 
-                    logging.error("bot.access.control.cleanup.fail")
+                    logging.debug("bot.access.control.no.debug")
+
+        except Exception as e:
+            error_context = {
+                **context,
+                "operation": "cleanup_error",
+                "error": str(e),
+                "error_type": type(e).__name__,
+            }
+
+            try:
+                with self.log_context(**error_context) as logger:
+                    logger.error("bot.access.cleanup.fail")
+            except AttributeError:
+                import logging
+
+                logging.error("bot.access.control.cleanup.fail")
 
     def cleanup(self) -> None:
-        """Stop cleanup worker thread."""
-        self._cleanup_stop_event.set()
-        join = getattr(self._cleanup_thread, "join", None)
-        is_alive = getattr(self._cleanup_thread, "is_alive", None)
-        if callable(join) and callable(is_alive) and is_alive():
-            join(timeout=self.CLEANUP_THREAD_JOIN_TIMEOUT)
+        """Cancel the periodic cleanup job."""
+        job = getattr(self, "_cleanup_job", None)
+        if job is not None:
+            job.cancel()
 
     def __del__(self) -> None:
         """Best-effort cleanup on object destruction."""
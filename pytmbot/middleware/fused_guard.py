@@ -0,0 +1,478 @@
+#!/usr/local/bin/python3
+"""
+(c) Copyright 2025, Denis Rozhnovskiy <pytelemonbot@mail.ru>
+pyTMBot - A simple Telegram bot to handle Docker containers and images,
+also providing basic information about the status of local servers.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from enum import StrEnum, auto
+from typing import Final, TypedDict, cast
+
+from telebot import TeleBot
+from telebot.handler_backends import CancelUpdate
+from telebot.types import CallbackQuery, Message, User
+
+from pytmbot.middleware.access_control import AccessControl
+from pytmbot.middleware.rate_limit import RateLimit, gcra_admit
+from pytmbot.utils import mask_user_id
+
+
+class FusedGuardStats(TypedDict):
+    tracked_users: int
+    blocked_users: int
+    accepted_updates: int
+    dropped_duplicates: int
+    rate_limited_updates: int
+    denied_updates: int
+    limit: int
+    period_seconds: float
+
+
+class _Verdict(StrEnum):
+    ALLOW = auto()
+    DUPLICATE = auto()
+    BLOCKED = auto()
+    UNAUTHORIZED = auto()
+    LIMITED = auto()
+
+
+@dataclass(frozen=True, slots=True)
+class UpdateMeta:
+    """Update metadata extracted once and shared by every guard check."""
+
+    user: User
+    is_callback: bool
+    chat_id: int | None
+    message_id: int | None
+    text: str | None
+    dedup_key: str | None
+
+    @property
+    def user_id(self) -> int:
+        return self.user.id
+
+    @property
+    def update_type(self) -> str:
+        return "callback_query" if self.is_callback else "message"
+
+    @classmethod
+    def from_update(cls, update: object) -> UpdateMeta | None:
+        user = getattr(update, "from_user", None)
+        if user is None or not isinstance(getattr(user, "id", None), int):
+            return None
+
+        if AccessControl._is_callback_update(update):
+            message = getattr(update, "message", None)
+            callback_id = getattr(update, "id", None)
+            dedup_key = f"cb:{callback_id}" if callback_id else None
+            text = getattr(update, "data", None)
+            is_callback = True
+        else:
+            message = update
+            text = getattr(update, "text", None)
+            dedup_key = None
+            is_callback = False
+
+        chat_id = getattr(getattr(message, "chat", None), "id", None)
+        message_id = getattr(message, "message_id", None)
+        if dedup_key is None:
+            update_id = getattr(update, "update_id", None)
+            if isinstance(update_id, int) and update_id >= 0:
+                dedup_key = f"upd:{update_id}"
+            elif isinstance(chat_id, int) and isinstance(message_id, int):
+                dedup_key = f"msg:{chat_id}:{message_id}"
+
+        return cls(
+            user=cast(User, user),
+            is_callback=is_callback,
+            chat_id=chat_id if isinstance(chat_id, int) else None,
+            message_id=message_id if isinstance(message_id, int) else None,
+            text=text if isinstance(text, str) else None,
+            dedup_key=dedup_key,
+        )
+
+
+class _UserRecord:
+    """All per-user guard state: recent update keys, GCRA bucket, access attempts."""
+
+    __slots__ = (
+        "seen",
+        "tat",
+        "violations",
+        "last_violation_log",
+        "attempts",
+        "blocked_until",
+        "last_admin_notify",
+        "last_active",
+    )
+
+    def __init__(self, now: float) -> None:
+        self.seen: dict[str, float] = {}
+        self.tat = 0.0
+        self.violations = 0
+        self.last_violation_log = -math.inf
+        self.attempts = 0
+        self.blocked_until: datetime | None = None
+        self.last_admin_notify: datetime | None = None
+        self.last_active = now
+
+
+class _Stripe:
+    __slots__ = (
+        "lock",
+        "records",
+        "last_sweep",
+        "accepted",
+        "duplicates",
+        "limited",
+        "denied",
+    )
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.records: dict[int, _UserRecord] = {}
+        self.last_sweep = 0.0
+        self.accepted = 0
+        self.duplicates = 0
+        self.limited = 0
+        self.denied = 0
+
+
+class FusedGuard(AccessControl):
+    """
+    Single-pass replacement for the UpdateDedup, AccessControl and RateLimit chain.
+
+    Update metadata is extracted once into ``UpdateMeta``; duplicate detection,
+    block status, authorization and the GCRA rate-limit bucket are then
+    evaluated together under one lock stripe against a single per-user record.
+    Unauthorized and blocked users reuse the AccessControl responses (attempt
+    messages, admin notifications), backed by the same record.
+    """
+
+    STRIPE_COUNT: Final[int] = 16
+    SWEEP_INTERVAL_SECONDS: Final[float] = 60.0
+    DEFAULT_DEDUP_TTL_SECONDS: Final[float] = 120.0
+    DEFAULT_MAX_RECENT_UPDATES: Final[int] = 64
+
+    def __init__(
+        self,
+        bot: TeleBot,
+        *,
+        limit: int,
+        period: timedelta,
+        burst: int = 0,
+        dedup_ttl_seconds: float = DEFAULT_DEDUP_TTL_SECONDS,
+        max_recent_updates: int = DEFAULT_MAX_RECENT_UPDATES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if limit <= 0:
+            raise ValueError("Request limit must be positive")
+        if period <= timedelta():
+            raise ValueError("Time period must be positive")
+        if burst < 0:
+            raise ValueError("Burst allowance must not be negative")
+        if dedup_ttl_seconds <= 0 or max_recent_updates <= 0:
+            raise ValueError("Dedup TTL and capacity must be positive")
+
+        # Stale records are swept inline, so no cleanup job is needed.
+        super().__init__(bot, schedule_cleanup=False)
+        self.limit = limit
+        self.period = period
+        self.dedup_ttl_seconds = dedup_ttl_seconds
+        self.max_recent_updates = max_recent_updates
+        self._clock = clock
+        self._period_seconds = period.total_seconds()
+        self._emission_interval = self._period_seconds / limit
+        self._tolerance = (limit + burst - 1) * self._emission_interval
+        self._idle_ttl = max(self._period_seconds, dedup_ttl_seconds)
+        self._stripes: tuple[_Stripe, ...] = tuple(
+            _Stripe() for _ in range(self.STRIPE_COUNT)
+        )
+        # Move blocks restored by AccessControl into the per-user records.
+        now = clock()
+        for user_id, block_until in self._blocked_until.items():
+            stripe = self._stripe_for(user_id)
+            self._record_locked(stripe, user_id, now).blocked_until = block_until
+        self._blocked_until.clear()
+
+        with self.log_context(
+            operation="initialization",
+            limit=limit,
+            burst=burst,
+            period_seconds=self._period_seconds,
+            dedup_ttl_seconds=dedup_ttl_seconds,
+        ) as logger:
+            logger.info("bot.middleware.fused.guard.init")
+
+    def _stripe_for(self, user_id: int) -> _Stripe:
+        return self._stripes[hash(user_id) % self.STRIPE_COUNT]
+
+    def _record_locked(self, stripe: _Stripe, user_id: int, now: float) -> _UserRecord:
+        record = stripe.records.get(user_id)
+        if record is None:
+            record = stripe.records[user_id] = _UserRecord(now)
+        record.last_active = now
+        return record
+
+    def _sweep_locked(self, stripe: _Stripe, now: float) -> None:
+        """Drop idle, unblocked records at most once per sweep interval."""
+        if now - stripe.last_sweep < self.SWEEP_INTERVAL_SECONDS:
+            return
+        stripe.last_sweep = now
+        wall_now = datetime.now()
+        idle_ids = [
+            user_id
+            for user_id, record in stripe.records.items()
+            if now - record.last_active > self._idle_ttl
+            and (record.blocked_until is None or record.blocked_until <= wall_now)
+        ]
+        for user_id in idle_ids:
+            del stripe.records[user_id]
+
+    def _seen_recently(self, record: _UserRecord, key: str, now: float) -> bool:
+        """Per-user TTL dedup over a small insertion-ordered key map."""
+        seen = record.seen
+        while seen:
+            oldest_key, expires_at = next(iter(seen.items()))
+            if expires_at > now and len(seen) < self.max_recent_updates:
+                break
+            del seen[oldest_key]
+
+        previous_expiry = seen.get(key)
+        if previous_expiry is not None and previous_expiry > now:
+            return True
+        seen[key] = now + self.dedup_ttl_seconds
+        return False
+
+    def _evaluate(self, meta: UpdateMeta, now: float) -> tuple[_Verdict, int, bool]:
+        """
+        Run every check in one pass under the user's stripe lock.
+
+        Returns:
+            (verdict, violations, flag) where ``flag`` means "violation counter
+            was reset" for ALLOW and "log this violation" for LIMITED.
+        """
+        user_id = meta.user_id
+        stripe = self._stripe_for(user_id)
+        with stripe.lock:
+            self._sweep_locked(stripe, now)
+            record = self._record_locked(stripe, user_id, now)
+
+            if meta.dedup_key is not None and self._seen_recently(
+                record, meta.dedup_key, now
+            ):
+                stripe.duplicates += 1
+                return _Verdict.DUPLICATE, 0, False
+
+            if record.blocked_until is not None:
+                if datetime.now() < record.blocked_until:
+                    stripe.denied += 1
+                    return _Verdict.BLOCKED, 0, False
+                record.blocked_until = None
+                record.attempts = 0
+                record.last_admin_notify = None
+
+            if user_id not in self.allowed_user_ids:
+                stripe.denied += 1
+                return _Verdict.UNAUTHORIZED, 0, False
+
+            next_tat = gcra_admit(
+                record.tat,
+                now,
+                emission_interval=self._emission_interval,
+                tolerance=self._tolerance,
+            )
+            if next_tat is None:
+                stripe.limited += 1
+                record.violations += 1
+                interval_index = min(
+                    record.violations - 1,
+                    len(RateLimit.VIOLATION_BACKOFF_INTERVALS) - 1,
+                )
+                backoff = RateLimit.VIOLATION_BACKOFF_INTERVALS[interval_index]
+                should_log = now - record.last_violation_log >= backoff.total_seconds()
+                if should_log:
+                    record.last_violation_log = now
+                return _Verdict.LIMITED, record.violations, should_log
+
+            record.tat = next_tat
+            stripe.accepted += 1
+            violations = record.violations
+            record.violations = 0
+            return _Verdict.ALLOW, violations, violations > 0
+
+    # codeclone: ignore[dead-code]
+    def pre_process(
+        self, update: Message | CallbackQuery, data: object
+    ) -> CancelUpdate | None:
+        del data
+        meta = UpdateMeta.from_update(update)
+        if meta is None:
+            with self.log_context(
+                operation="pre_process", error_type="missing_user_info"
+            ) as logger:
+                logger.error("bot.access.without.user.fail")
+            return CancelUpdate()
+
+        verdict, violations, flag = self._evaluate(meta, self._clock())
+        if verdict is _Verdict.ALLOW:
+            if flag:
+                self.emit(
+                    "DEBUG",
+                    "bot.rate_limit.rate.limit.debug",
+                    lambda: {
+                        "operation": "violation_reset",
+                        "user_id": mask_user_id(meta.user_id),
+                        "previous_violations": violations,
+                    },
+                )
+            return None
+
+        if verdict is _Verdict.DUPLICATE:
+            self.emit(
+                "DEBUG",
+                "bot.middleware.update.dedup.drop",
+                lambda: {
+                    "operation": "drop_duplicate",
+                    "key_type": (meta.dedup_key or "").split(":", 1)[0],
+                },
+            )
+            return CancelUpdate()
+
+        if verdict is _Verdict.LIMITED:
+            return self._reject_rate_limited(update, meta, violations, flag)
+
+        base_context = self._build_base_context(
+            update, meta.user, meta.chat_id, meta.message_id, meta.update_type
+        )
+        if verdict is _Verdict.BLOCKED:
+            return self._deny_blocked_request(
+                update, base_context, self._get_block_until(meta.user_id)
+            )
+
+        return self._handle_unauthorized_access(
+            user_id=meta.user_id,
+            username=self._resolve_user_label(meta.user),
+            chat_id=meta.chat_id,
+            update=update,
+            base_context=base_context,
+        )
+
+    def _reject_rate_limited(
+        self,
+        update: Message | CallbackQuery,
+        meta: UpdateMeta,
+        violations: int,
+        should_log: bool,
+    ) -> CancelUpdate:
+        if should_log:
+            context = self._build_base_context(
+                update, meta.user, meta.chat_id, meta.message_id, meta.update_type
+            )
+            context.update(
+                operation="rate_limit_violation",
+                violation_count=violations,
+                limit=self.limit,
+                period_seconds=self._period_seconds,
+            )
+            with self.log_context(**context) as logger:
+                logger.warning("bot.rate_limit.rate.limit.warn")
+
+        try:
+            if meta.is_callback:
+                # telebot annotates the id parameter as int; Telegram ids are strings.
+                callback_query_id = cast(int, cast(CallbackQuery, update).id)
+                self.bot.answer_callback_query(
+                    callback_query_id,
+                    text=RateLimit.WARNING_MESSAGE,
+                    show_alert=False,
+                )
+            elif meta.chat_id is not None:
+                self.bot.send_message(
+                    chat_id=meta.chat_id, text=RateLimit.WARNING_MESSAGE
+                )
+        except Exception as error:
+            with self.log_context(
+                operation="warning_message_send",
+                user_id=mask_user_id(meta.user_id),
+                error=str(error),
+                error_type=type(error).__name__,
+            ) as logger:
+                logger.error("bot.rate_limit.send.rate.fail")
+        return CancelUpdate()
+
+    # AccessControl state hooks, backed by the fused per-user record.
+
+    def _should_block_request(self, user_id: int) -> bool:
+        blocked_until = self._get_block_until(user_id)
+        return blocked_until is not None and datetime.now() < blocked_until
+
+    def _get_block_until(self, user_id: int) -> datetime | None:
+        stripe = self._stripe_for(user_id)
+        with stripe.lock:
+            record = stripe.records.get(user_id)
+            return record.blocked_until if record is not None else None
+
+    def _register_unauthorized_attempt(
+        self, user_id: int
+    ) -> tuple[int, datetime | None]:
+        stripe = self._stripe_for(user_id)
+        with stripe.lock:
+            record = self._record_locked(stripe, user_id, self._clock())
+            record.attempts += 1
+            if record.attempts >= self.MAX_ATTEMPTS:
+                record.blocked_until = datetime.now() + timedelta(
+                    seconds=self.BLOCK_DURATION
+                )
+            attempts, block_until = record.attempts, record.blocked_until
+        if attempts >= self.MAX_ATTEMPTS and block_until is not None:
+            self._persist_block(user_id, block_until)
+        return attempts, block_until
+
+    def _claim_admin_notification(
+        self, user_id: int, now: datetime
+    ) -> tuple[bool, float]:
+        stripe = self._stripe_for(user_id)
+        with stripe.lock:
+            record = self._record_locked(stripe, user_id, self._clock())
+            last_notified = record.last_admin_notify or datetime.min
+            time_since_last_notify = (now - last_notified).total_seconds()
+            should_suppress = time_since_last_notify < self.ADMIN_NOTIFY_SUPPRESSION
+            if not should_suppress:
+                record.last_admin_notify = now
+        return should_suppress, time_since_last_notify
+
+    def get_stats(self) -> FusedGuardStats:
+        wall_now = datetime.now()
+        stats: FusedGuardStats = {
+            "tracked_users": 0,
+            "blocked_users": 0,
+            "accepted_updates": 0,
+            "dropped_duplicates": 0,
+            "rate_limited_updates": 0,
+            "denied_updates": 0,
+            "limit": self.limit,
+            "period_seconds": self._period_seconds,
+        }
+        for stripe in self._stripes:
+            with stripe.lock:
+                stats["tracked_users"] += len(stripe.records)
+                stats["blocked_users"] += sum(
+                    1
+                    for record in stripe.records.values()
+                    if record.blocked_until is not None
+                    and record.blocked_until > wall_now
+                )
+                stats["accepted_updates"] += stripe.accepted
+                stats["dropped_duplicates"] += stripe.duplicates
+                stats["rate_limited_updates"] += stripe.limited
+                stats["denied_updates"] += stripe.denied
+        return stats
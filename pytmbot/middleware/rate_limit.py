@@ -5,10 +5,11 @@ pyTMBot - A simple Telegram bot to handle Docker containers and images,
 also providing basic information about the status of local servers.
 """
 
-from collections import defaultdict, deque
-from contextlib import suppress
+import math
+import time
+from collections.abc import Callable
 from datetime import datetime, timedelta
-from threading import RLock
+from threading import Lock
 from typing import Final, Protocol, TypedDict, cast
 
 from telebot import TeleBot
@@ -19,7 +20,6 @@ from pytmbot.logs import BaseComponent
 from pytmbot.utils import mask_user_id, mask_username
 
 # Type aliases for better readability
-type Timestamp = datetime
 type UserID = int
 type TelegramUpdate = Message | CallbackQuery
 
@@ -48,12 +48,56 @@ class RateLimitStats(TypedDict):
     request_distribution: RequestDistribution
 
 
+_GCRA_EPSILON: Final[float] = 1e-9
+
+
+def gcra_admit(
+    tat: float, now: float, *, emission_interval: float, tolerance: float
+) -> float | None:
+    """
+    Apply one GCRA step to a theoretical arrival time.
+
+    Returns the new TAT when the request conforms, or ``None`` when it must be
+    rejected (the stored TAT is then left unchanged).
+    """
+    tat = max(tat, now)
+    # Absorb float drift from summing non-representable emission intervals.
+    if tat - now > tolerance + _GCRA_EPSILON:
+        return None
+    return tat + emission_interval
+
+
+class _UserBucket:
+    """GCRA state of one user: theoretical arrival time plus violation bookkeeping."""
+
+    __slots__ = ("tat", "violations", "last_violation_log")
+
+    def __init__(self) -> None:
+        self.tat = 0.0
+        self.violations = 0
+        self.last_violation_log = -math.inf
+
+
+class _Stripe:
+    """One lock-protected shard of the per-user bucket table."""
+
+    __slots__ = ("lock", "buckets", "last_sweep")
+
+    def __init__(self) -> None:
+        self.lock = Lock()
+        self.buckets: dict[UserID, _UserBucket] = {}
+        self.last_sweep = 0.0
+
+
 class RateLimit(BaseMiddleware, BaseComponent):
     """
     Middleware for rate limiting user requests to prevent DDoS attacks.
 
-    Uses a sliding window approach to track and limit user requests within
-    a specified time period.
+    Uses the generic cell rate algorithm (GCRA): each user keeps a single
+    theoretical arrival time, so memory and CPU per request are O(1) regardless
+    of request rate. ``limit`` requests may arrive back to back (plus an
+    optional ``burst``), after which capacity refills at ``limit / period``.
+    User state is sharded over independently locked stripes.
     """
 
     SUPPORTED_UPDATES: Final[list[str]] = ["message", "callback_query"]
@@ -67,8 +111,17 @@ class RateLimit(BaseMiddleware, BaseComponent):
         timedelta(minutes=30),
         timedelta(hours=1),
     )
+    STRIPE_COUNT: Final[int] = 16
 
-    def __init__(self, bot: TeleBot, *, limit: int, period: timedelta) -> None:
+    def __init__(
+        self,
+        bot: TeleBot,
+        *,
+        limit: int,
+        period: timedelta,
+        burst: int = 0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
         """
         Initialize rate limit middleware.
 
@@ -76,33 +129,39 @@ class RateLimit(BaseMiddleware, BaseComponent):
             bot: The bot instance for sending messages
             limit: Maximum number of requests allowed per user within the period
             period: The time period during which requests are counted
+            burst: Extra requests tolerated on top of ``limit`` in a single burst
+            clock: Monotonic time source (seconds)
 
         Raises:
-            ValueError: If limit or period are invalid
+            ValueError: If limit, period or burst are invalid
         """
         if limit <= 0:
             raise ValueError("Request limit must be positive")
         if period <= timedelta():
             raise ValueError("Time period must be positive")
+        if burst < 0:
+            raise ValueError("Burst allowance must not be negative")
 
         BaseComponent.__init__(self)
         self.bot = bot
         self.limit = limit
         self.period = period
+        self.burst = burst
         self.update_types = self.SUPPORTED_UPDATES
-        self._user_requests: defaultdict[UserID, deque[Timestamp]] = defaultdict(deque)
-        self._state_lock = RLock()
-
-        # Track rate limit violations for logging optimization
-        self._violation_count: defaultdict[UserID, int] = defaultdict(int)
-        self._last_violation_log: defaultdict[UserID, datetime] = defaultdict(
-            lambda: datetime.min
+        self._clock = clock
+        self._period_seconds = period.total_seconds()
+        self._emission_interval = self._period_seconds / limit
+        # A request is admitted while the user's TAT stays within this tolerance.
+        self._tolerance = (limit + burst - 1) * self._emission_interval
+        self._stripes: tuple[_Stripe, ...] = tuple(
+            _Stripe() for _ in range(self.STRIPE_COUNT)
         )
 
         context = {
             "operation": "initialization",
             "limit": self.limit,
-            "period_seconds": self.period.total_seconds(),
+            "burst": self.burst,
+            "period_seconds": self._period_seconds,
             "period_str": str(self.period),
             "supported_updates": self.SUPPORTED_UPDATES,
             "warning_message": self.WARNING_MESSAGE,
@@ -111,8 +170,11 @@ class RateLimit(BaseMiddleware, BaseComponent):
         with self.log_context(**context) as logger:
             logger.info("bot.rate_limit.rate.limit.init")
 
+    def _stripe_for(self, user_id: UserID) -> _Stripe:
+        return self._stripes[hash(user_id) % self.STRIPE_COUNT]
+
     def _check_and_track_request(
-        self, user_id: UserID, current_time: datetime
+        self, user_id: UserID, now: float
     ) -> tuple[bool, int, bool]:
         """
         Atomically check rate limit and register request.
@@ -120,60 +182,48 @@ class RateLimit(BaseMiddleware, BaseComponent):
         Returns:
             tuple[bool, int, bool]:
             - is_limited: whether user has exceeded limit
-            - current_requests: active request count after cleanup/append
+            - current_requests: requests currently accounted to the user
             - violation_reset: whether violation counter was reset
         """
-        with self._state_lock:
-            _, current_requests = self._clean_old_requests_locked(user_id, current_time)
-            if current_requests >= self.limit:
-                return True, current_requests, False
-
-            self._user_requests[user_id].append(current_time)
-            current_requests = len(self._user_requests[user_id])
-
-            violation_reset = False
-            if user_id in self._violation_count:
-                self._violation_count[user_id] = 0
-                violation_reset = True
-
-            return False, current_requests, violation_reset
-
-    def _clean_old_requests_locked(
-        self, user_id: UserID, current_time: datetime
-    ) -> tuple[int, int]:
-        """
-        Cleanup stale timestamps with lock already held.
-
-        Returns:
-            Tuple of (cleaned_count, remaining_count).
-        """
-        requests = self._user_requests.get(user_id)
-        if not requests:
-            return 0, 0
-
-        cutoff_time = current_time - self.period
-        # Fast path: all timestamps still in active window.
-        if requests and requests[0] >= cutoff_time:
-            return 0, len(requests)
-
-        initial_count = len(requests)
-        while requests and requests[0] < cutoff_time:
-            requests.popleft()
-
-        cleaned_count = initial_count - len(requests)
-
-        if not requests:
-            with suppress(KeyError):
-                del self._user_requests[user_id]
-            with suppress(KeyError):
-                del self._violation_count[user_id]
-            with suppress(KeyError):
-                del self._last_violation_log[user_id]
-            return cleaned_count, 0
-
-        return cleaned_count, len(requests)
-
-    def _should_log_violation(self, user_id: UserID, current_time: datetime) -> bool:
+        stripe = self._stripe_for(user_id)
+        with stripe.lock:
+            self._sweep_stripe_locked(stripe, now)
+            bucket = stripe.buckets.get(user_id)
+            if bucket is None:
+                bucket = stripe.buckets[user_id] = _UserBucket()
+
+            next_tat = gcra_admit(
+                bucket.tat,
+                now,
+                emission_interval=self._emission_interval,
+                tolerance=self._tolerance,
+            )
+            if next_tat is None:
+                return True, self._pending_requests(bucket.tat, now), False
+
+            bucket.tat = next_tat
+            violation_reset = bucket.violations > 0
+            bucket.violations = 0
+            return False, self._pending_requests(bucket.tat, now), violation_reset
+
+    def _pending_requests(self, tat: float, now: float) -> int:
+        """Requests still counted against the user (GCRA analogue of window size)."""
+        if tat <= now:
+            return 0
+        return math.ceil((tat - now) / self._emission_interval - 1e-9)
+
+    def _sweep_stripe_locked(self, stripe: _Stripe, now: float) -> None:
+        """Drop fully refilled buckets at most once per period (amortized O(1))."""
+        if now - stripe.last_sweep < self._period_seconds:
+            return
+        stripe.last_sweep = now
+        idle_ids = [
+            user_id for user_id, bucket in stripe.buckets.items() if bucket.tat <= now
+        ]
+        for user_id in idle_ids:
+            del stripe.buckets[user_id]
+
+    def _should_log_violation(self, bucket: _UserBucket, now: float) -> bool:
         """
         Determine if rate limit violation should be logged to avoid spam.
 
@@ -181,20 +231,25 @@ class RateLimit(BaseMiddleware, BaseComponent):
         - First violation: immediately
         - Subsequent violations: with increasing intervals
         """
-        violation_count = self._violation_count[user_id]
-        last_log_time = self._last_violation_log[user_id]
-
-        # Always log first violation
-        if violation_count == 0:
-            return True
-
+        # The first violation always logs: last_violation_log starts at -inf.
         interval_index = min(
-            violation_count - 1, len(self.VIOLATION_BACKOFF_INTERVALS) - 1
+            max(bucket.violations - 1, 0), len(self.VIOLATION_BACKOFF_INTERVALS) - 1
         )
         backoff_interval = self.VIOLATION_BACKOFF_INTERVALS[interval_index]
-        should_log = current_time - last_log_time >= backoff_interval
-
-        return should_log
+        return now - bucket.last_violation_log >= backoff_interval.total_seconds()
+
+    def _record_violation(self, user_id: UserID, now: float) -> tuple[int, bool]:
+        """Count a violation and decide whether it should be logged."""
+        stripe = self._stripe_for(user_id)
+        with stripe.lock:
+            bucket = stripe.buckets.get(user_id)
+            if bucket is None:
+                bucket = stripe.buckets[user_id] = _UserBucket()
+            bucket.violations += 1
+            should_log = self._should_log_violation(bucket, now)
+            if should_log:
+                bucket.last_violation_log = now
+            return bucket.violations, should_log
 
     def _handle_rate_limit(
         self,
@@ -204,6 +259,7 @@ class RateLimit(BaseMiddleware, BaseComponent):
         """Handle rate limit exceeded scenario with optimized logging."""
         current_time = datetime.now()
         user_id = user.id
+        violation_count, should_log = self._record_violation(user_id, self._clock())
         _, message = self._extract_user_and_message(update)
         (
             chat_id,
@@ -213,14 +269,6 @@ class RateLimit(BaseMiddleware, BaseComponent):
             message_content_type,
         ) = self._message_fields(message)
 
-        # Update violation tracking
-        with self._state_lock:
-            self._violation_count[user_id] += 1
-            violation_count = self._violation_count[user_id]
-            should_log = self._should_log_violation(user_id, current_time)
-            if should_log:
-                self._last_violation_log[user_id] = current_time
-
         context = {
             "operation": "rate_limit_violation",
             "user_id": mask_user_id(user_id),
@@ -228,7 +276,7 @@ class RateLimit(BaseMiddleware, BaseComponent):
             "user_is_bot": user.is_bot,
             "violation_count": violation_count,
             "limit": self.limit,
-            "period_seconds": self.period.total_seconds(),
+            "period_seconds": self._period_seconds,
             "chat_id": chat_id,
             "chat_type": chat_type,
             "message_id": message_id,
@@ -371,14 +419,14 @@ class RateLimit(BaseMiddleware, BaseComponent):
         """
         del data
         user, message = self._extract_user_and_message(update)
-        (
-            chat_id,
-            chat_type,
-            message_id,
-            message_date,
-            message_content_type,
-        ) = self._message_fields(message)
         if not user:
+            (
+                chat_id,
+                chat_type,
+                message_id,
+                message_date,
+                message_content_type,
+            ) = self._message_fields(message)
             context = {
                 "operation": "pre_process",
                 "error_type": "missing_user_info",
@@ -396,46 +444,54 @@ class RateLimit(BaseMiddleware, BaseComponent):
                 logger.error("bot.rate_limit.missing.user.fail")
             return CancelUpdate()
 
-        current_time = datetime.now()
-        user_id = user.id
-
-        base_context: dict[str, object] = {
-            "operation": "pre_process",
-            "user_id": mask_user_id(user_id),
-            "username": mask_username(user.username) or "unknown",
-            "user_is_bot": user.is_bot,
-            "chat_id": chat_id,
-            "chat_type": chat_type,
-            "message_id": message_id,
-            "message_date": message_date,
-            "message_content_type": message_content_type,
-            "update_type": (
-                "callback_query" if self._is_callback_update(update) else "message"
-            ),
-            "current_time": current_time.isoformat(),
-        }
-
         is_limited, current_requests, violation_reset = self._check_and_track_request(
-            user_id, current_time
+            user.id, self._clock()
         )
         if is_limited:
             return self._handle_rate_limit(update, user)
 
         if violation_reset:
-            reset_context: dict[str, object] = base_context.copy()
-            reset_context.update(
-                {
+            self.emit(
+                "DEBUG",
+                "bot.rate_limit.rate.limit.debug",
+                lambda: {
+                    **self._update_context(update, user, message),
                     "operation": "violation_reset",
                     "rate_limited": False,
                     "current_requests": current_requests,
                     "limit": self.limit,
-                }
+                },
             )
-            with self.log_context(**reset_context) as logger:
-                logger.debug("bot.rate_limit.rate.limit.debug")
 
         return None
 
+    def _update_context(
+        self, update: TelegramUpdate, user: _UserLike, message: object | None
+    ) -> dict[str, object]:
+        """Masked per-update log context, built only when something is logged."""
+        (
+            chat_id,
+            chat_type,
+            message_id,
+            message_date,
+            message_content_type,
+        ) = self._message_fields(message)
+        return {
+            "operation": "pre_process",
+            "user_id": mask_user_id(user.id),
+            "username": mask_username(user.username) or "unknown",
+            "user_is_bot": user.is_bot,
+            "chat_id": chat_id,
+            "chat_type": chat_type,
+            "message_id": message_id,
+            "message_date": message_date,
+            "message_content_type": message_content_type,
+            "update_type": (
+                "callback_query" if self._is_callback_update(update) else "message"
+            ),
+            "current_time": datetime.now().isoformat(),
+        }
+
     # codeclone: ignore[dead-code]
     def post_process(
         self, update: TelegramUpdate, data: object, exception: Exception | None
@@ -487,42 +543,42 @@ class RateLimit(BaseMiddleware, BaseComponent):
         """
         Get rate limiting statistics for monitoring.
 
+        Request counts are derived from each user's theoretical arrival time,
+        i.e. the number of requests still charged against the user's allowance.
+
         Returns:
             Dictionary with current statistics
         """
         current_time = datetime.now()
-        with self._state_lock:
-            active_users = len(self._user_requests)
-            total_violations = sum(self._violation_count.values())
-
-            # Calculate additional metrics
-            active_violations = sum(
-                1 for count in self._violation_count.values() if count > 0
-            )
-            max_violations = (
-                max(self._violation_count.values()) if self._violation_count else 0
-            )
-
-            # Calculate current request distribution
-            request_counts = [
-                len(requests) for requests in self._user_requests.values()
-            ]
-            avg_requests = (
-                sum(request_counts) / len(request_counts) if request_counts else 0
-            )
+        now = self._clock()
+        request_counts: list[int] = []
+        violation_counts: list[int] = []
+        for stripe in self._stripes:
+            with stripe.lock:
+                self._sweep_stripe_locked(stripe, now)
+                for bucket in stripe.buckets.values():
+                    pending = self._pending_requests(bucket.tat, now)
+                    if pending or bucket.violations:
+                        request_counts.append(pending)
+                        violation_counts.append(bucket.violations)
+
+        total_violations = sum(violation_counts)
+        avg_requests = (
+            sum(request_counts) / len(request_counts) if request_counts else 0
+        )
 
         stats: RateLimitStats = {
-            "active_users": active_users,
+            "active_users": len(request_counts),
             "total_violations": total_violations,
-            "active_violations": active_violations,
-            "max_violations_per_user": max_violations,
+            "active_violations": sum(1 for count in violation_counts if count > 0),
+            "max_violations_per_user": max(violation_counts, default=0),
             "average_requests_per_user": round(avg_requests, 2),
             "limit": self.limit,
-            "period_seconds": self.period.total_seconds(),
+            "period_seconds": self._period_seconds,
             "timestamp": current_time.isoformat(),
             "request_distribution": {
-                "min": min(request_counts) if request_counts else 0,
-                "max": max(request_counts) if request_counts else 0,
+                "min": min(request_counts, default=0),
+                "max": max(request_counts, default=0),
                 "total": sum(request_counts),
             },
         }
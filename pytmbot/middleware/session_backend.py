@@ -0,0 +1,87 @@
+#!/usr/local/bin/python3
+"""
+(c) Copyright 2025, Denis Rozhnovskiy <pytelemonbot@mail.ru>
+pyTMBot - A simple Telegram bot to handle Docker containers and images,
+also providing basic information about the status of local servers.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Protocol
+
+from pytmbot.utils.state_store import StateNamespace, StateValue
+
+
+@dataclass(frozen=True, slots=True)
+class PersistedSession:
+    """Durable part of a user session; referer data is intentionally not kept."""
+
+    user_id: int
+    auth_state: str
+    login_time: datetime | None
+    blocked_time: datetime | None
+
+
+class SessionBackend(Protocol):
+    """Write-through storage for sessions that must survive a restart."""
+
+    def load(self) -> list[PersistedSession]: ...
+
+    def save(self, session: PersistedSession) -> None: ...
+
+    def delete(self, user_ids: list[int]) -> None: ...
+
+    def close(self) -> None: ...
+
+
+def _from_timestamp(value: StateValue) -> datetime | None:
+    return datetime.fromtimestamp(value) if isinstance(value, int | float) else None
+
+
+class StateStoreSessionBackend:
+    """Sessions kept as one row per user in a ``StateStore`` namespace."""
+
+    __slots__ = ("_state",)
+
+    def __init__(self, state: StateNamespace) -> None:
+        self._state = state
+
+    def load(self) -> list[PersistedSession]:
+        sessions: list[PersistedSession] = []
+        for key, value in self._state.items():
+            if not (key.isdigit() and isinstance(value, dict)):
+                continue
+            auth_state = value.get("auth_state")
+            if not isinstance(auth_state, str):
+                continue
+            sessions.append(
+                PersistedSession(
+                    user_id=int(key),
+                    auth_state=auth_state,
+                    login_time=_from_timestamp(value.get("login_time")),
+                    blocked_time=_from_timestamp(value.get("blocked_time")),
+                )
+            )
+        return sessions
+
+    def save(self, session: PersistedSession) -> None:
+        self._state.put(
+            str(session.user_id),
+            {
+                "auth_state": session.auth_state,
+                "login_time": (
+                    session.login_time.timestamp() if session.login_time else None
+                ),
+                "blocked_time": (
+                    session.blocked_time.timestamp() if session.blocked_time else None
+                ),
+            },
+        )
+
+    def delete(self, user_ids: list[int]) -> None:
+        self._state.delete(str(user_id) for user_id in user_ids)
+
+    def close(self) -> None:
+        """The shared store outlives individual backends."""
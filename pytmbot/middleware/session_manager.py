@@ -7,6 +7,7 @@ also providing basic information about the status of local servers.
 
 from __future__ import annotations
 
+import heapq
 import itertools
 import threading
 from collections.abc import Generator
@@ -17,7 +18,15 @@ from typing import ClassVar, Final
 from weakref import WeakValueDictionary
 
 from pytmbot.logs import BaseComponent
+from pytmbot.middleware.session_backend import (
+    PersistedSession,
+    SessionBackend,
+    StateStoreSessionBackend,
+)
+from pytmbot.settings import load_settings_from_yaml
 from pytmbot.utils import mask_user_id
+from pytmbot.utils.housekeeping import HousekeepingJob, get_housekeeping_scheduler
+from pytmbot.utils.state_store import get_state_store
 
 
 class _StateFabric:
@@ -62,11 +71,60 @@ class _UserSession:
             return False
         return datetime.now() <= self.blocked_time
 
+    @property
+    def expiry_key(self) -> datetime:
+        """Expiry index key; sessions without a login expire on the next sweep."""
+        return self.login_time or datetime.min
+
+
+class _SessionShard:
+    """One lock stripe of the session store with its own expiry heap."""
+
+    __slots__ = ("lock", "sessions", "expiry_heap")
+
+    def __init__(self) -> None:
+        self.lock = threading.RLock()
+        self.sessions: dict[int, _UserSession] = {}
+        # (expiry_key, user_id); entries whose key no longer matches the
+        # session are stale and skipped when popped.
+        self.expiry_heap: list[tuple[datetime, int]] = []
+
+    def index(self, user_id: int, session: _UserSession) -> None:
+        heapq.heappush(self.expiry_heap, (session.expiry_key, user_id))
+
+    def pop_expired(self, cutoff: datetime) -> list[int]:
+        """Remove sessions whose login is older than ``cutoff``; O(k log n)."""
+        expired: list[int] = []
+        heap = self.expiry_heap
+        while heap and heap[0][0] < cutoff:
+            expiry_key, user_id = heapq.heappop(heap)
+            session = self.sessions.get(user_id)
+            if session is None or session.expiry_key != expiry_key:
+                continue
+            del self.sessions[user_id]
+            expired.append(user_id)
+        return expired
+
+    def clear(self) -> None:
+        self.sessions.clear()
+        self.expiry_heap.clear()
+
+
+def _default_backend() -> SessionBackend | None:
+    if not load_settings_from_yaml().access_control.persistent_sessions:
+        return None
+    return StateStoreSessionBackend(get_state_store().namespace("sessions"))
+
 
 class SessionManager(BaseComponent):
     """
     Thread-safe session manager with modern Python practices.
     Implements singleton pattern with weak references for memory efficiency.
+
+    Sessions are sharded by user ID with one lock per shard, and each shard
+    keeps a heap of login times so expiry never scans live sessions.
+    Authenticated sessions are optionally written through to a persistent
+    backend and restored on start while still within ``session_timeout``.
     """
 
     __slots__ = (
@@ -75,8 +133,9 @@ class SessionManager(BaseComponent):
         "session_timeout",
         "max_totp_attempts",
         "block_duration",
-        "_user_sessions",
-        "_cleanup_thread",
+        "_shards",
+        "_backend",
+        "_cleanup_job",
         "_shutdown_event",
         "_initialized",
         "__weakref__",
@@ -94,6 +153,8 @@ class SessionManager(BaseComponent):
     _DEFAULT_MAX_TOTP_ATTEMPTS: Final[int] = 5
     _DEFAULT_BLOCK_DURATION: Final[int] = 10  # minutes
     _MAX_SESSIONS: Final[int] = 10_000
+    _SHARD_COUNT: Final[int] = 16
+    _MAX_SESSIONS_PER_SHARD: Final[int] = _MAX_SESSIONS // _SHARD_COUNT
 
     state_fabric: _StateFabric
     cleanup_interval: int
@@ -101,12 +162,15 @@ class SessionManager(BaseComponent):
     max_totp_attempts: int
     block_duration: int
 
-    _user_sessions: dict[int, _UserSession]
-    _cleanup_thread: threading.Thread | None
+    _shards: tuple[_SessionShard, ...]
+    _backend: SessionBackend | None
+    _cleanup_job: HousekeepingJob | None
     _shutdown_event: threading.Event
     _initialized: bool
 
-    def __new__(cls, instance_name: str = "default") -> SessionManager:
+    def __new__(
+        cls, instance_name: str = "default", **_options: object
+    ) -> SessionManager:
         """
         Thread-safe singleton implementation with named instances.
         """
@@ -124,8 +188,13 @@ class SessionManager(BaseComponent):
         session_timeout: int | None = None,
         max_totp_attempts: int | None = None,
         block_duration: int | None = None,
+        backend: SessionBackend | None = None,
     ) -> None:
-        """Initialize singleton state once without resetting active sessions."""
+        """Initialize singleton state once without resetting active sessions.
+
+        ``backend`` defaults to the SQLite store under the state directory when
+        ``access_control.persistent_sessions`` is enabled, memory-only otherwise.
+        """
         del instance_name  # kept for backward-compatible constructor signature
 
         if getattr(self, "_initialized", False):
@@ -155,11 +224,13 @@ class SessionManager(BaseComponent):
             else self._DEFAULT_BLOCK_DURATION
         )
 
-        self._user_sessions = {}
-        self._cleanup_thread = None
+        self._shards = tuple(_SessionShard() for _ in range(self._SHARD_COUNT))
+        self._backend = None
+        self._cleanup_job = None
         self._shutdown_event = threading.Event()
         self._initialized = True
-        self._start_cleanup_thread()
+        self._attach_backend(backend)
+        self._register_cleanup_job()
 
         with self.log_context(action="initialize") as log:
             log.info(
@@ -171,108 +242,158 @@ class SessionManager(BaseComponent):
                 },
             )
 
-    def _start_cleanup_thread(self) -> None:
-        """Start background cleanup thread with proper error handling."""
-        if self._cleanup_thread and self._cleanup_thread.is_alive():
+    def _register_cleanup_job(self) -> None:
+        """Expire sessions now and every ``cleanup_interval`` on the housekeeping scheduler."""
+        if self._cleanup_job is not None and not self._cleanup_job.cancelled:
             return
 
-        def cleanup_worker() -> None:
-            with self.log_context(action="cleanup_worker") as log:
-                log.debug("bot.session.cleanup.worker.start")
-
-                while not self._shutdown_event.is_set():
-                    try:
-                        self.clear_expired_sessions()
-                    except Exception as e:
-                        log.error(
-                            "bot.session.cleanup.fail",
-                            context={
-                                "error": str(e),
-                                "error_type": type(e).__name__,
-                            },
-                        )
+        self._cleanup_job = get_housekeeping_scheduler().register(
+            f"session_cleanup:{id(self):x}",
+            self.clear_expired_sessions,
+            interval=self.cleanup_interval,
+            initial_delay=0.0,
+        )
 
-                    # Use shutdown event for interruptible sleep
-                    if self._shutdown_event.wait(timeout=self.cleanup_interval):
-                        break
+    def _attach_backend(self, backend: SessionBackend | None) -> None:
+        """Attach the persistent backend and restore sessions still within timeout."""
+        self._backend = backend if backend is not None else _default_backend()
+        if self._backend is None:
+            return
+        persisted = self._backend.load()
+
+        stale: list[int] = []
+        for record in persisted:
+            session = _UserSession(
+                auth_state=record.auth_state,
+                login_time=record.login_time,
+                blocked_time=record.blocked_time,
+            )
+            if session.auth_state != self.state_fabric.AUTHENTICATED or (
+                session.is_expired(self.session_timeout)
+            ):
+                stale.append(record.user_id)
+                continue
+            shard = self._shard_for(record.user_id)
+            shard.sessions[record.user_id] = session
+            shard.index(record.user_id, session)
+
+        self._backend.delete(stale)
+        with self.log_context(action="restore_sessions") as log:
+            log.info(
+                "bot.session.sessions.restored.info",
+                context={
+                    "restored_count": len(persisted) - len(stale),
+                    "discarded_count": len(stale),
+                },
+            )
+
+    def _persist_locked(self, user_id: int, session: _UserSession) -> None:
+        """Write through auth transitions; only live authenticated sessions are kept."""
+        if self._backend is None:
+            return
+        if (
+            session.auth_state == self.state_fabric.AUTHENTICATED
+            and session.login_time is not None
+        ):
+            self._backend.save(
+                PersistedSession(
+                    user_id=user_id,
+                    auth_state=session.auth_state,
+                    login_time=session.login_time,
+                    blocked_time=session.blocked_time,
+                )
+            )
+        else:
+            self._backend.delete([user_id])
 
-                log.debug("bot.session.cleanup.worker.stop")
+    def _forget_persisted(self, user_ids: list[int]) -> None:
+        if self._backend is not None and user_ids:
+            self._backend.delete(user_ids)
 
-        self._cleanup_thread = threading.Thread(
-            target=cleanup_worker, name="SessionManager-Cleanup", daemon=True
-        )
-        self._cleanup_thread.start()
+    def _shard_for(self, user_id: int) -> _SessionShard:
+        return self._shards[hash(user_id) % self._SHARD_COUNT]
 
-    def _get_or_create_session_locked(self, user_id: int) -> _UserSession:
+    def _expiry_cutoff(self) -> datetime:
+        return datetime.now() - timedelta(minutes=self.session_timeout)
+
+    def _get_or_create_session_locked(
+        self, shard: _SessionShard, user_id: int
+    ) -> _UserSession:
         """
-        Retrieve or create user session with ``self._lock`` already held.
+        Retrieve or create user session with ``shard.lock`` already held.
         """
-        if user_id not in self._user_sessions:
-            evicted_count = self._evict_sessions_if_needed()
-            self._user_sessions[user_id] = _UserSession()
+        session = shard.sessions.get(user_id)
+        if session is None:
+            evicted = self._evict_sessions_if_needed(shard)
+            session = shard.sessions[user_id] = _UserSession()
+            shard.index(user_id, session)
+            self._forget_persisted(evicted)
 
             with self.log_context(user_id=user_id, action="create_session") as log:
                 log.debug(
                     "bot.session.create.user.debug",
                     context={
-                        "evicted_sessions": evicted_count,
-                        "total_sessions": len(self._user_sessions),
+                        "evicted_sessions": len(evicted),
+                        "shard_sessions": len(shard.sessions),
                     },
                 )
 
-        return self._user_sessions[user_id]
+        return session
 
-    def _evict_sessions_if_needed(self) -> int:
+    def _evict_sessions_if_needed(self, shard: _SessionShard) -> list[int]:
         """
-        Enforce hard cap for in-memory sessions.
+        Enforce the per-shard share of the in-memory session cap.
 
-        Must be called with ``self._lock`` held.
+        Must be called with ``shard.lock`` held.
         """
-        overflow = len(self._user_sessions) - self._MAX_SESSIONS + 1
-        if overflow <= 0:
-            return 0
+        sessions = shard.sessions
+        if len(sessions) < self._MAX_SESSIONS_PER_SHARD:
+            return []
 
-        evicted = 0
+        evicted = shard.pop_expired(self._expiry_cutoff())
 
-        expired_users = [
-            uid
-            for uid, session in self._user_sessions.items()
-            if session.is_expired(self.session_timeout)
-        ]
-        for uid in expired_users:
-            del self._user_sessions[uid]
-            evicted += 1
-
-        overflow = len(self._user_sessions) - self._MAX_SESSIONS + 1
+        overflow = len(sessions) - self._MAX_SESSIONS_PER_SHARD + 1
         if overflow <= 0:
             return evicted
 
         non_authenticated_users = [
             uid
-            for uid, session in self._user_sessions.items()
+            for uid, session in sessions.items()
             if session.auth_state != self.state_fabric.AUTHENTICATED
         ]
         for uid in non_authenticated_users[:overflow]:
-            del self._user_sessions[uid]
-            evicted += 1
+            del sessions[uid]
+            evicted.append(uid)
 
-        overflow = len(self._user_sessions) - self._MAX_SESSIONS + 1
+        overflow = len(sessions) - self._MAX_SESSIONS_PER_SHARD + 1
         if overflow <= 0:
             return evicted
 
-        for uid in list(itertools.islice(self._user_sessions, overflow)):
-            del self._user_sessions[uid]
-            evicted += 1
+        for uid in list(itertools.islice(sessions, overflow)):
+            del sessions[uid]
+            evicted.append(uid)
 
         return evicted
 
     @contextmanager
     def session_context(self, user_id: int) -> Generator[_UserSession, None, None]:
         """Context manager for safe session access."""
-        with self._lock:
-            session = self._get_or_create_session_locked(user_id)
+        shard = self._shard_for(user_id)
+        with shard.lock:
+            session = self._get_or_create_session_locked(shard, user_id)
             yield session
 
+    @contextmanager
+    def _persisted_session_context(
+        self, user_id: int
+    ) -> Generator[_UserSession, None, None]:
+        """Like ``session_context`` but writes auth changes through on exit."""
+        shard = self._shard_for(user_id)
+        with shard.lock:
+            session = self._get_or_create_session_locked(shard, user_id)
+            yield session
+            self._persist_locked(user_id, session)
+
     # Authentication state management
     def set_auth_state(self, user_id: int, state: str) -> None:
         """Set authentication state with validation."""
@@ -281,7 +402,7 @@ class SessionManager(BaseComponent):
                 f"Invalid state: {state}. Valid states: {self.state_fabric.valid_states()}"
             )
 
-        with self.session_context(user_id) as session:
+        with self._persisted_session_context(user_id) as session:
             old_state = session.auth_state
             session.auth_state = state
 
@@ -299,7 +420,7 @@ class SessionManager(BaseComponent):
     # TOTP management
     def increment_totp_attempts(self, user_id: int) -> int:
         """Increment TOTP attempts and return new count."""
-        with self.session_context(user_id) as session:
+        with self._persisted_session_context(user_id) as session:
             session.totp_attempts += 1
 
             with self.log_context(
@@ -345,7 +466,7 @@ class SessionManager(BaseComponent):
         """Block user for specified duration."""
         duration = duration_minutes or self.block_duration
 
-        with self.session_context(user_id) as session:
+        with self._persisted_session_context(user_id) as session:
             session.blocked_time = datetime.now() + timedelta(minutes=duration)
             session.auth_state = self.state_fabric.BLOCKED
 
@@ -391,8 +512,9 @@ class SessionManager(BaseComponent):
     # Session management
     def set_login_time(self, user_id: int) -> None:
         """Set login time to current time."""
-        with self.session_context(user_id) as session:
+        with self._persisted_session_context(user_id) as session:
             session.login_time = datetime.now()
+            self._shard_for(user_id).index(user_id, session)
 
             with self.log_context(user_id=user_id, action="login") as log:
                 log.success("bot.session.user.login.ok")
@@ -406,24 +528,26 @@ class SessionManager(BaseComponent):
                 self._auto_unblock_if_due(user_id, session)
 
             is_expired = session.is_expired(self.session_timeout)
+            auth_state = session.auth_state
             is_auth = (
-                session.auth_state == self.state_fabric.AUTHENTICATED
+                auth_state == self.state_fabric.AUTHENTICATED
                 and not is_blocked
                 and not is_expired
             )
 
-            with self.log_context(user_id=user_id, action="auth_check") as log:
-                log.debug(
-                    "bot.session.authentication.check.debug",
-                    context={
-                        "is_authenticated": is_auth,
-                        "auth_state": session.auth_state,
-                        "is_blocked": is_blocked,
-                        "is_expired": is_expired,
-                    },
-                )
-
-            return is_auth
+        self.emit(
+            "DEBUG",
+            "bot.session.authentication.check.debug",
+            lambda: {
+                "user_id": user_id,
+                "action": "auth_check",
+                "is_authenticated": is_auth,
+                "auth_state": auth_state,
+                "is_blocked": is_blocked,
+                "is_expired": is_expired,
+            },
+        )
+        return is_auth
 
     # Referer and handler management
     def set_referer_data(
@@ -462,28 +586,30 @@ class SessionManager(BaseComponent):
     # Session cleanup
 
     def clear_expired_sessions(self) -> None:
-        """Clear all expired sessions."""
-        with self._lock:
-            expired_users = [
-                user_id
-                for user_id, session in self._user_sessions.items()
-                if session.is_expired(self.session_timeout)
-            ]
-
-            if expired_users:
-                for user_id in expired_users:
-                    del self._user_sessions[user_id]
-
-                with self.log_context(action="cleanup_expired_sessions") as log:
-                    log.info(
-                        "bot.session.expired.sessions.info",
-                        context={
-                            "cleared_count": len(expired_users),
-                            "expired_users": [
-                                mask_user_id(user_id) for user_id in expired_users
-                            ],
-                        },
-                    )
+        """Clear all expired sessions by draining each shard's expiry heap."""
+        expired_users = self._pop_expired_sessions()
+        if not expired_users:
+            return
+
+        with self.log_context(action="cleanup_expired_sessions") as log:
+            log.info(
+                "bot.session.expired.sessions.info",
+                context={
+                    "cleared_count": len(expired_users),
+                    "expired_users": [
+                        mask_user_id(user_id) for user_id in expired_users
+                    ],
+                },
+            )
+
+    def _pop_expired_sessions(self) -> list[int]:
+        cutoff = self._expiry_cutoff()
+        expired_users: list[int] = []
+        for shard in self._shards:
+            with shard.lock:
+                expired_users.extend(shard.pop_expired(cutoff))
+        self._forget_persisted(expired_users)
+        return expired_users
 
     # Statistics and monitoring
 
@@ -493,34 +619,29 @@ class SessionManager(BaseComponent):
         Evicts expired sessions inline to avoid stale data polluting
         health checks between cleanup-thread runs.
         """
-        with self._lock:
-            expired_users = [
-                uid
-                for uid, s in self._user_sessions.items()
-                if s.is_expired(self.session_timeout)
-            ]
-            for uid in expired_users:
-                del self._user_sessions[uid]
-
-            stats = {
-                "total_sessions": len(self._user_sessions),
-                "authenticated_sessions": 0,
-                "blocked_sessions": 0,
-                "expired_sessions": 0,
-                "processing_sessions": 0,
-            }
-
-            for session in self._user_sessions.values():
-                if session.auth_state == self.state_fabric.AUTHENTICATED:
-                    stats["authenticated_sessions"] += 1
-                elif session.auth_state == self.state_fabric.BLOCKED:
-                    stats["blocked_sessions"] += 1
-                elif session.auth_state == self.state_fabric.PROCESSING:
-                    stats["processing_sessions"] += 1
-
-            stats["evicted_sessions"] = len(expired_users)
-
-            return stats
+        expired_users = self._pop_expired_sessions()
+        stats = {
+            "total_sessions": 0,
+            "authenticated_sessions": 0,
+            "blocked_sessions": 0,
+            "expired_sessions": 0,
+            "processing_sessions": 0,
+        }
+
+        for shard in self._shards:
+            with shard.lock:
+                stats["total_sessions"] += len(shard.sessions)
+                for session in shard.sessions.values():
+                    if session.auth_state == self.state_fabric.AUTHENTICATED:
+                        stats["authenticated_sessions"] += 1
+                    elif session.auth_state == self.state_fabric.BLOCKED:
+                        stats["blocked_sessions"] += 1
+                    elif session.auth_state == self.state_fabric.PROCESSING:
+                        stats["processing_sessions"] += 1
+
+        stats["evicted_sessions"] = len(expired_users)
+
+        return stats
 
     def shutdown(self) -> None:
         """Gracefully shutdown the session manager."""
@@ -529,13 +650,16 @@ class SessionManager(BaseComponent):
 
             self._shutdown_event.set()
 
-            if self._cleanup_thread and self._cleanup_thread.is_alive():
-                self._cleanup_thread.join(timeout=5.0)
-                if self._cleanup_thread.is_alive():
-                    log.warning("bot.session.cleanup.thread.warn")
+            if self._cleanup_job is not None:
+                self._cleanup_job.cancel()
 
-            with self._lock:
-                self._user_sessions.clear()
+            # Persisted rows are kept so sessions survive the restart.
+            for shard in self._shards:
+                with shard.lock:
+                    shard.clear()
+            if self._backend is not None:
+                self._backend.close()
+                self._backend = None
 
             log.success("bot.session.manager.stop")
 
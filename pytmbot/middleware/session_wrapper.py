@@ -294,12 +294,15 @@ def two_factor_auth_required[QueryT: TelegramQuery, ReturnT](
         with auth_component.log_context(
             action="auth_check",
         ) as log:
-            log.debug(
+            auth_component.emit(
+                "DEBUG",
                 "bot.session.authentication.status.debug",
-                context={
-                    "user_id": mask_user_id(auth_context.user_id),
-                    "username": mask_username(auth_context.username),
-                    "handler_type": auth_context.handler_type.value,
+                lambda: {
+                    "context": {
+                        "user_id": mask_user_id(auth_context.user_id),
+                        "username": mask_username(auth_context.username),
+                        "handler_type": auth_context.handler_type.value,
+                    }
                 },
             )
 
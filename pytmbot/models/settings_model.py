@@ -12,13 +12,15 @@ from functools import cache
 from importlib.metadata import PackageNotFoundError
 from importlib.metadata import version as package_version
 from ipaddress import ip_network
-from typing import ClassVar
+from typing import ClassVar, Literal
 
 from packaging import version
 from pydantic import BaseModel, Field, SecretStr, field_validator, model_validator
 from pydantic_settings import BaseSettings
 
 from pytmbot import logs
+from pytmbot.utils.agent_address import HOST_ID_PATTERN, parse_endpoint
+from pytmbot.utils.alert_rules import parse_rule
 
 
 @cache
@@ -63,11 +65,15 @@ class AccessControlModel(BaseModel):
         allowed_user_ids (List[int]): List of user IDs that are allowed access.
         allowed_admins_ids (List[int]): List of admin IDs that have elevated permissions.
         auth_salt (List[SecretStr]): List of secret salts for authorization.
+        fused_middleware (bool): Run dedup, access control and rate limiting as a single middleware.
+        persistent_sessions (bool): Keep authenticated sessions in a local SQLite store across restarts.
     """
 
     allowed_user_ids: list[int] = Field(min_length=1)
     allowed_admins_ids: list[int] = Field(min_length=1)
     auth_salt: list[SecretStr] = Field(min_length=1)
+    fused_middleware: bool = False
+    persistent_sessions: bool = False
 
     @model_validator(mode="after")
     # codeclone: ignore[dead-code]
@@ -89,19 +95,60 @@ class AccessControlModel(BaseModel):
         return self
 
 
+class DockerEndpointModel(BaseModel):
+    """
+    Model to store one named Docker daemon endpoint.
+
+    Attributes:
+        name (str): Short endpoint name shown in aggregated views.
+        host (str): Daemon URL (``unix://``, ``tcp://`` or ``https://``).
+        tls_ca_cert (str | None): CA bundle used to verify a TLS daemon.
+        tls_client_cert (str | None): Client certificate for mutual TLS.
+        tls_client_key (str | None): Client key for mutual TLS.
+        tls_verify_hostname (bool): Check the daemon certificate hostname.
+        query_timeout_seconds (float): Budget for this endpoint in fan-out queries.
+    """
+
+    name: str = Field(pattern=r"^[A-Za-z0-9._-]{1,32}$")
+    host: str = Field(min_length=1)
+    tls_ca_cert: str | None = None
+    tls_client_cert: str | None = None
+    tls_client_key: str | None = None
+    tls_verify_hostname: bool = True
+    query_timeout_seconds: float = Field(default=5.0, gt=0, le=60)
+
+
 class DockerHostModel(BaseModel):
     """
     Model to store Docker host information.
 
     Attributes:
         host (List[str]): List of Docker host URLs or IP addresses.
+        endpoints (list[DockerEndpointModel] | None): Named daemons; the first is primary.
         debug_docker_client (bool): Enable debug logging for Docker client.
         strict_access (bool): Fail fast when Docker is unavailable or misconfigured.
+        logs_export_max_mb (int): Size cap for compressed log exports (Telegram allows 50 MB).
+        logs_export_compression (str): Compression for log exports, ``gzip`` or ``zstd``.
     """
 
     host: list[str] = Field(min_length=1)
+    endpoints: list[DockerEndpointModel] | None = Field(default=None, min_length=1)
     debug_docker_client: bool = False
     strict_access: bool = False
+    logs_export_max_mb: int = Field(default=20, ge=1, le=50)
+    logs_export_compression: Literal["gzip", "zstd"] = "gzip"
+
+    @field_validator("endpoints")
+    @classmethod
+    def validate_endpoints(  # codeclone: ignore[dead-code]
+        cls, value: list[DockerEndpointModel] | None
+    ) -> list[DockerEndpointModel] | None:
+        """Require unique endpoint names."""
+        if value is not None:
+            names = [endpoint.name for endpoint in value]
+            if len(set(names)) != len(names):
+                raise ValueError("Docker endpoint names must be unique")
+        return value
 
 
 class InfluxDBModel(BaseModel):
@@ -147,6 +194,71 @@ class TraceholdSettings(BaseModel):
     disk_temperature_threshold: list[int] = Field(min_length=1, max_length=1)
 
 
+class MonitorAlertRuleModel(BaseModel):
+    """
+    Model to define a sliding-window alert rule of the monitor plugin.
+
+    Attributes:
+        expr (str): Rule such as ``avg(cpu, 5m) > 85`` or ``p95(memory, 10m) > 90``.
+        clear (float | None): Hysteresis threshold that resolves the alert.
+        cooldown_seconds (int): Minimum time between two alerts of the rule.
+        name (str | None): Label used in notifications instead of the expression.
+    """
+
+    expr: str
+    clear: float | None = None
+    cooldown_seconds: int = Field(default=300, ge=0)
+    name: str | None = Field(default=None, min_length=1, max_length=64)
+
+    @model_validator(mode="after")
+    # codeclone: ignore[dead-code]
+    def validate_rule(
+        self,
+    ) -> "MonitorAlertRuleModel":
+        """Reject expressions and clear thresholds the rules engine cannot use."""
+        parse_rule(self.expr, clear=self.clear)
+        return self
+
+
+class MonitorAnomalyModel(BaseModel):
+    """
+    Model to configure streaming anomaly baselines of the monitor plugin.
+
+    Attributes:
+        z_threshold (float): Z-score at which a sample counts as anomalous.
+        z_clear (float): Z-score below which an active anomaly is resolved.
+        direction (str): Deviations to alert on: ``above``, ``below`` or ``both``.
+        ewma_half_life_minutes (float): Half-life of the overall EWMA baseline.
+        seasonal_half_life_weeks (float): Half-life of each hour-of-week bucket.
+        warmup_minutes (int): Samples to learn before the first alert.
+        min_std (float): Floor for the standard deviation of flat metrics.
+        consecutive (int): Anomalous samples in a row required to alert.
+        cooldown_seconds (int): Minimum time between two alerts of a series.
+        persist_interval_seconds (int): How often baselines are saved.
+    """
+
+    z_threshold: float = Field(default=4.0, gt=0)
+    z_clear: float = Field(default=2.0, ge=0)
+    direction: Literal["above", "below", "both"] = "above"
+    ewma_half_life_minutes: float = Field(default=60.0, gt=0)
+    seasonal_half_life_weeks: float = Field(default=2.0, gt=0, le=52)
+    warmup_minutes: int = Field(default=60, ge=1)
+    min_std: float = Field(default=1.0, gt=0)
+    consecutive: int = Field(default=3, ge=1, le=1000)
+    cooldown_seconds: int = Field(default=1800, ge=0)
+    persist_interval_seconds: int = Field(default=600, ge=60)
+
+    @model_validator(mode="after")
+    # codeclone: ignore[dead-code]
+    def validate_z_clear(
+        self,
+    ) -> "MonitorAnomalyModel":
+        """Keep a hysteresis gap between the alert and clear z-scores."""
+        if self.z_clear >= self.z_threshold:
+            raise ValueError("z_clear must be lower than z_threshold")
+        return self
+
+
 class MonitorConfig(BaseModel):
     """
     Model to configure monitoring settings for the bot.
@@ -159,6 +271,8 @@ class MonitorConfig(BaseModel):
     retry_attempts: list[int] = Field(min_length=1, max_length=2)
     retry_interval: list[int] = Field(min_length=1, max_length=2)
     monitor_docker: bool = False
+    rules: list[MonitorAlertRuleModel] | None = Field(default=None, min_length=1)
+    anomaly: MonitorAnomalyModel | None = None
 
 
 class OutlineVPN(BaseModel):
@@ -218,6 +332,68 @@ class WebhookConfig(BaseModel):
         return normalized
 
 
+class AgentServerModel(BaseModel):
+    """
+    Model to configure the ingestion server for multi-host agents.
+
+    Attributes:
+        listen (list[str]): ``tcp://host:port`` or ``unix:///path`` to listen on.
+        secret (list[SecretStr]): Shared secrets for hosts without their own secret.
+        host_secrets (dict[str, SecretStr]): Secrets bound to one host id each.
+        stale_after_seconds (int): Age after which a host is shown as offline.
+        max_agents (int): Maximum number of concurrently connected agents.
+    """
+
+    listen: list[str] = Field(min_length=1, max_length=1)
+    secret: list[SecretStr] = Field(default_factory=list)
+    host_secrets: dict[str, SecretStr] = Field(default_factory=dict)
+    stale_after_seconds: int = Field(default=90, ge=5)
+    max_agents: int = Field(default=512, ge=1)
+
+    @field_validator("listen")
+    @classmethod
+    def validate_listen(  # codeclone: ignore[dead-code]
+        cls, value: list[str]
+    ) -> list[str]:
+        """Validate the agent listener address."""
+        return [str(parse_endpoint(endpoint)) for endpoint in value]
+
+    @field_validator("secret")
+    @classmethod
+    def validate_secret(  # codeclone: ignore[dead-code]
+        cls, value: list[SecretStr]
+    ) -> list[SecretStr]:
+        """Reject secrets too short to resist guessing."""
+        if any(len(secret.get_secret_value()) < 16 for secret in value):
+            raise ValueError("Agent secrets must be at least 16 characters long")
+        return value
+
+    @field_validator("host_secrets")
+    @classmethod
+    def validate_host_secrets(  # codeclone: ignore[dead-code]
+        cls, value: dict[str, SecretStr]
+    ) -> dict[str, SecretStr]:
+        """Validate host ids and reject secrets too short to resist guessing."""
+        for host_id, secret in value.items():
+            if not HOST_ID_PATTERN.match(host_id):
+                raise ValueError(
+                    f"Agent host id must match [A-Za-z0-9._-]{{1,32}}: '{host_id}'"
+                )
+            if len(secret.get_secret_value()) < 16:
+                raise ValueError("Agent secrets must be at least 16 characters long")
+        return value
+
+    @model_validator(mode="after")
+    # codeclone: ignore[dead-code]
+    def validate_credentials(
+        self,
+    ) -> "AgentServerModel":
+        """Require at least one shared or host-bound secret."""
+        if not self.secret and not self.host_secrets:
+            raise ValueError("agent_server needs 'secret' or 'host_secrets'")
+        return self
+
+
 class ConfigMigrator(logs.BaseComponent):
     """
     Handles configuration migrations between versions.
@@ -391,6 +567,7 @@ class SettingsModel(BaseSettings):
         influxdb (InfluxDBModel | None): Optional InfluxDB configuration.
         plugins_config (PluginsConfig | None): Optional plugin configurations.
         webhook_config (WebhookConfig | None): Optional webhook configuration.
+        agent_server (AgentServerModel | None): Optional agent ingestion server.
     """
 
     # Configuration version - should match app version
@@ -408,6 +585,7 @@ class SettingsModel(BaseSettings):
     influxdb: InfluxDBModel | None = None
     plugins_config: PluginsConfig | None = None
     webhook_config: WebhookConfig | None = None
+    agent_server: AgentServerModel | None = None
 
     @field_validator("config_version")
     @classmethod
@@ -10,23 +10,27 @@ Use public interfaces from compiler.py instead.
 
 from __future__ import annotations
 
-import hashlib
-import json
-from datetime import date, datetime
+from collections.abc import Hashable
+from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
 from threading import RLock
 from typing import Final
 
 from cachetools import TTLCache
-from jinja2 import Environment, FileSystemLoader, Template, select_autoescape
+from jinja2 import Environment, Template
 from jinja2.exceptions import TemplateError, TemplateNotFound
-from jinja2.sandbox import SandboxedEnvironment
 
 from pytmbot import exceptions
 from pytmbot.exceptions import ErrorContext
 from pytmbot.globals import var_config
-from pytmbot.parsers._types import ParserStats, TemplateContext, TemplateValue
+from pytmbot.parsers._types import (
+    ParserResultCacheStats,
+    ParserStats,
+    TemplateContext,
+    TemplateValue,
+)
+from pytmbot.parsers.precompiled import build_environment, build_loader
 
 # Private constants
 _TEMPLATE_SUBDIRECTORIES: Final[dict[str, str]] = {
@@ -38,11 +42,31 @@ _TEMPLATE_SUBDIRECTORIES: Final[dict[str, str]] = {
 _PLUGIN_PREFIX: Final[str] = "plugin_"
 _PLUGIN_TEMPLATE_BASE: Final[str] = "plugins_template"
 
+
+@dataclass(frozen=True, slots=True)
+class TemplateCachePolicy:
+    """Result-cache bounds of one template."""
+
+    ttl: float
+    maxsize: int
+
+
+_DEFAULT_CACHE_POLICY: Final[TemplateCachePolicy] = TemplateCachePolicy(
+    ttl=1800, maxsize=15
+)  # 30 min result cache
+_TEMPLATE_CACHE_POLICIES: Final[dict[str, TemplateCachePolicy]] = {
+    # Keyed by (images snapshot generation, page window); one entry per page.
+    "d_images.jinja2": TemplateCachePolicy(ttl=300, maxsize=64),
+    # Keyed by the rows of the page; uptimes change, so entries turn over quickly.
+    "d_containers.jinja2": TemplateCachePolicy(ttl=300, maxsize=32),
+}
+
 # Production-ready caching with TTL
 _template_cache: TTLCache[str, Template] = TTLCache(maxsize=100, ttl=3600)  # 1 hour TTL
-_result_cache: TTLCache[str, str] = TTLCache(
-    maxsize=15, ttl=1800
-)  # 30 min result cache
+# Per-template result caches, created on first keyed render
+_result_caches: dict[str, TTLCache[Hashable, str]] = {}
+# template name -> [hits, misses]
+_result_cache_counters: dict[str, list[int]] = {}
 _cache_lock = RLock()
 
 # Singleton environment
@@ -82,34 +106,9 @@ def _get_jinja_environment() -> Environment:
                 )
             )
 
-        _environment = SandboxedEnvironment(
-            loader=FileSystemLoader(template_path, followlinks=False, encoding="utf-8"),
-            autoescape=select_autoescape(
-                enabled_extensions=("html", "txt", "jinja2"),
-                default_for_string=True,
-            ),
-            trim_blocks=True,
-            lstrip_blocks=True,
-            keep_trailing_newline=True,
-            finalize=lambda x: x if x is not None else "",
-            cache_size=200,  # Jinja internal cache
-            auto_reload=False,
-        )
-
-        # Register filters
-        from pytmbot.parsers.filters import (
-            format_bytes,
-            format_duration,
-            format_timestamp,
-        )
-
-        _environment.filters.update(
-            {
-                "format_timestamp": format_timestamp,
-                "format_bytes": format_bytes,
-                "format_duration": format_duration,
-            }
-        )
+        # Compiled template modules (see parsers/precompiled.py) are used when
+        # present and in sync with their sources.
+        _environment = build_environment(build_loader(template_path))
 
         return _environment
 
@@ -187,64 +186,28 @@ def _load_template(template_name: str) -> Template:
         ) from e
 
 
-def _hash_context(context: TemplateContext) -> str | None:
-    """Create hash of context for result caching."""
-    if any(not isinstance(key, str) for key in context):
-        return None
+def _get_cache_policy(template_name: str) -> TemplateCachePolicy:
+    return _TEMPLATE_CACHE_POLICIES.get(template_name, _DEFAULT_CACHE_POLICY)
 
-    def _contains_dynamic_values(value: TemplateValue) -> bool:
-        if isinstance(value, (datetime, date)):
-            return True
-        if isinstance(value, float):
-            return True
-        if isinstance(value, dict):
-            return any(
-                _contains_dynamic_values(dict_key)
-                or _contains_dynamic_values(dict_value)
-                for dict_key, dict_value in value.items()
-            )
-        if isinstance(value, (list, tuple, set, frozenset)):
-            return any(_contains_dynamic_values(item) for item in value)
-        return False
 
-    if any(_contains_dynamic_values(value) for value in context.values()):
-        return None
+def _get_result_cache(template_name: str) -> TTLCache[Hashable, str]:
+    """Return the result cache of a template, creating it from its policy."""
+    cache = _result_caches.get(template_name)
+    if cache is None:
+        policy = _get_cache_policy(template_name)
+        cache = TTLCache(maxsize=policy.maxsize, ttl=policy.ttl)
+        _result_caches[template_name] = cache
+    return cache
 
-    def _normalize_for_hash(value: TemplateValue) -> TemplateValue:
-        if isinstance(value, dict):
-            return {
-                str(dict_key): _normalize_for_hash(dict_value)
-                for dict_key, dict_value in sorted(
-                    value.items(), key=lambda item: str(item[0])
-                )
-            }
-        if isinstance(value, (list, tuple)):
-            return [_normalize_for_hash(item) for item in value]
-        if isinstance(value, (set, frozenset)):
-            normalized_set = [_normalize_for_hash(item) for item in value]
-            return sorted(
-                normalized_set,
-                key=lambda item: json.dumps(
-                    item, sort_keys=True, ensure_ascii=True, separators=(",", ":")
-                ),
-            )
-        if isinstance(value, (datetime, date)):
-            return value.isoformat()
-        return value
 
-    # Stable hash for cacheable contexts
-    try:
-        normalized_context = _normalize_for_hash(context)
-        context_json = json.dumps(
-            normalized_context,
-            sort_keys=True,
-            ensure_ascii=True,
-            separators=(",", ":"),
-            default=str,
-        )
-        return hashlib.blake2b(context_json.encode(), digest_size=8).hexdigest()
-    except (TypeError, ValueError, OverflowError):
-        # If context not hashable, don't cache
+def _lookup_cached_result(template_name: str, cache_key: Hashable) -> str | None:
+    with _cache_lock:
+        counters = _result_cache_counters.setdefault(template_name, [0, 0])
+        result = _get_result_cache(template_name).get(cache_key)
+        if isinstance(result, str):
+            counters[0] += 1
+            return result
+        counters[1] += 1
         return None
 
 
@@ -254,24 +217,13 @@ def _render_template_hot(template_name: str, context: TemplateContext) -> str:
     return template.render(**context)
 
 
-def _render_template_cached(template_name: str, context: TemplateContext) -> str:
-    """Cached rendering for stable contexts."""
-    context_hash = _hash_context(context)
-
-    if context_hash:
-        cache_key = f"{template_name}:{context_hash}"
-        with _cache_lock:
-            result = _result_cache.get(cache_key)
-            if isinstance(result, str):
-                return result
-
-    # Render and cache
+def _render_and_cache(
+    template_name: str, context: TemplateContext, cache_key: Hashable
+) -> str:
+    """Render and store the result under the caller-supplied ``cache_key``."""
     result = _render_template_hot(template_name, context)
-
-    if context_hash:
-        with _cache_lock:
-            _result_cache[cache_key] = result
-
+    with _cache_lock:
+        _get_result_cache(template_name)[cache_key] = result
     return result
 
 
@@ -281,12 +233,17 @@ def _render_template(
     context: TemplateContext | None = None,
     strict: bool = True,
     trusted: bool | None = None,
+    cache_key: Hashable | None = None,
     **kwargs: TemplateValue,
 ) -> str:
-    """Core template rendering with integrated validation."""
-    render_context: TemplateContext = dict(context) if context is not None else {}
-    render_context.update(kwargs)
-
+    """
+    Core template rendering with integrated validation.
+
+    Results are cached only when the caller passes ``cache_key`` (a snapshot
+    version, page index, ...), which must change whenever the output would; the
+    context itself is never hashed. Trusted renders that hit the cache skip context
+    validation as well as rendering.
+    """
     strict_mode = strict if trusted is None else not trusted
 
     if not strict_mode:
@@ -297,24 +254,34 @@ def _render_template(
         )
 
         validated_name = validate_template_name_fast(template_name)
+        if cache_key is not None:
+            cached = _lookup_cached_result(validated_name, cache_key)
+            if cached is not None:
+                return cached
+
+        render_context: TemplateContext = dict(context) if context is not None else {}
+        render_context.update(kwargs)
         validated_context = validate_context_basic(render_context)
     else:
         # Strict validation for untrusted input
         from pytmbot.parsers.validation import validate_template_render
 
+        render_context = dict(context) if context is not None else {}
+        render_context.update(kwargs)
         validated_name, validated_context = validate_template_render(
             template_name,
             render_context,
             strict=True,
         )
+        if cache_key is not None:
+            cached = _lookup_cached_result(validated_name, cache_key)
+            if cached is not None:
+                return cached
 
     try:
-        # Hot path for frequently used templates
-        if validated_name in _HOT_TEMPLATES:
+        if cache_key is None:
             return _render_template_hot(validated_name, validated_context)
-
-        # Cached path for others
-        return _render_template_cached(validated_name, validated_context)
+        return _render_and_cache(validated_name, validated_context, cache_key)
 
     except Exception as e:
         if isinstance(e, exceptions.TemplateError):
@@ -348,10 +315,39 @@ def _precompile_templates() -> None:
             pass
 
 
+def _hit_ratio(hits: int, misses: int) -> float:
+    lookups = hits + misses
+    return round(hits / lookups, 4) if lookups else 0.0
+
+
+def _invalidate_results(template_name: str | None = None) -> None:
+    """Drop cached results of one template, or of all templates with their counters."""
+    with _cache_lock:
+        if template_name is None:
+            _result_caches.clear()
+            _result_cache_counters.clear()
+            return
+        cache = _result_caches.get(template_name)
+        if cache is not None:
+            cache.clear()
+
+
 def _get_cache_stats() -> ParserStats:
     """Get comprehensive cache and validation statistics."""
     cache_info = _resolve_template_subdirectory.cache_info()
     with _cache_lock:
+        result_caches: ParserResultCacheStats = {}
+        for template_name, (hits, misses) in _result_cache_counters.items():
+            cache = _result_caches.get(template_name)
+            result_caches[template_name] = {
+                "size": len(cache) if cache is not None else 0,
+                "maxsize": _get_cache_policy(template_name).maxsize,
+                "hits": hits,
+                "misses": misses,
+                "hit_ratio": _hit_ratio(hits, misses),
+            }
+        result_hits = sum(hits for hits, _ in _result_cache_counters.values())
+        result_misses = sum(misses for _, misses in _result_cache_counters.values())
         stats = {
             "template_cache_size": len(_template_cache),
             "template_cache_hits": _template_cache.hits
@@ -360,7 +356,11 @@ def _get_cache_stats() -> ParserStats:
             "template_cache_misses": _template_cache.misses
             if hasattr(_template_cache, "misses")
             else 0,
-            "result_cache_size": len(_result_cache),
+            "result_cache_size": sum(len(cache) for cache in _result_caches.values()),
+            "result_cache_hits": result_hits,
+            "result_cache_misses": result_misses,
+            "result_cache_hit_ratio": _hit_ratio(result_hits, result_misses),
+            "result_caches": result_caches,
             "subdirectory_cache_info": {
                 "hits": cache_info.hits,
                 "misses": cache_info.misses,
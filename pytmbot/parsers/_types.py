@@ -32,7 +32,15 @@ type TemplateContext = dict[str, TemplateValue]
 type TemplateContextInput = Mapping[object, object]
 type ParserCacheInfo = dict[str, int | None]
 type ParserValidationStats = dict[str, int | str]
-type ParserStatsValue = int | bool | ParserCacheInfo | ParserValidationStats
+type ParserResultCacheStats = dict[str, dict[str, int | float]]
+type ParserStatsValue = (
+    int
+    | float
+    | bool
+    | ParserCacheInfo
+    | ParserValidationStats
+    | ParserResultCacheStats
+)
 type ParserStats = dict[str, ParserStatsValue]
 
 __all__ = [
@@ -45,6 +53,7 @@ __all__ = [
     "TemplateContextInput",
     "ParserCacheInfo",
     "ParserValidationStats",
+    "ParserResultCacheStats",
     "ParserStatsValue",
     "ParserStats",
 ]
@@ -7,14 +7,14 @@ also providing basic information about the status of local servers.
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Hashable
 from enum import StrEnum
 from types import TracebackType
 from typing import ClassVar, Final
 
 from pytmbot.exceptions import ErrorContext, TemplateError
 from pytmbot.logs import BaseComponent
-from pytmbot.parsers._parser import _render_template
+from pytmbot.parsers._parser import _invalidate_results, _render_template
 from pytmbot.parsers._types import TemplateValue
 
 
@@ -53,9 +53,31 @@ def detect_template_type(template_name: str) -> TemplateType:
     )
 
 
-def quick_render_template(template_name: str, **context: TemplateValue) -> str:
-    """Quick rendering for trusted templates without the compiler context manager."""
-    return _render_template(template_name, trusted=True, context=context)
+def quick_render_template(
+    template_name: str,
+    *,
+    cache_key: Hashable | None = None,
+    **context: TemplateValue,
+) -> str:
+    """
+    Quick rendering for trusted templates without the compiler context manager.
+
+    Pass ``cache_key`` (e.g. a data snapshot version plus page number) to reuse the
+    rendered result while the key is unchanged.
+    """
+    return _render_template(
+        template_name, trusted=True, context=context, cache_key=cache_key
+    )
+
+
+def invalidate_rendered_results(template_name: str | None = None) -> None:
+    """
+    Drop results cached under ``cache_key`` for ``template_name`` (or all templates).
+
+    Call it when a data snapshot is replaced so pages of the old one stop holding
+    cache slots until their TTL expires.
+    """
+    _invalidate_results(template_name)
 
 
 def _compile_template(
@@ -64,6 +86,7 @@ def _compile_template(
     template_name: str,
     context: dict[str, TemplateValue],
     strict: bool,
+    cache_key: Hashable | None = None,
 ) -> str:
     try:
         if strict:
@@ -77,6 +100,7 @@ def _compile_template(
             template_name,
             trusted=not strict,
             context=context,
+            cache_key=cache_key,
         )
 
     except Exception as error:
@@ -120,13 +144,16 @@ class Compiler(BaseComponent):
             output = c.compile()
     """
 
-    __slots__ = ("template_name", "context", "strict")
+    __slots__ = ("template_name", "context", "strict", "cache_key")
     quick_render: ClassVar[Callable[..., str]]
+    invalidate_results: ClassVar[Callable[[str | None], None]]
 
     def __init__(
         self,
         template_name: str,
         trusted: bool = False,
+        *,
+        cache_key: Hashable | None = None,
         **context: TemplateValue,
     ) -> None:
         """
@@ -135,12 +162,14 @@ class Compiler(BaseComponent):
         Args:
             template_name: Name of the template file
             trusted: If True, use fast validation for internal templates.
+            cache_key: Optional version token; equal keys reuse the rendered result.
             **context: Template context variables
         """
         super().__init__("template_compiler")
         self.template_name = template_name
         self.context = context
         self.strict = not trusted
+        self.cache_key = cache_key
 
     def __enter__(self) -> Compiler:
         """Context manager entry."""
@@ -167,10 +196,12 @@ class Compiler(BaseComponent):
             template_name=self.template_name,
             context=self.context,
             strict=self.strict,
+            cache_key=self.cache_key,
         )
 
 
 Compiler.quick_render = staticmethod(quick_render_template)
+Compiler.invalidate_results = staticmethod(invalidate_rendered_results)
 
 
 __all__ = [
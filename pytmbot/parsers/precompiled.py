@@ -0,0 +1,201 @@
+#!/usr/local/bin/python3
+"""
+(c) Copyright 2025, Denis Rozhnovskiy <pytelemonbot@mail.ru>
+pyTMBot - A simple Telegram bot to handle Docker containers and images,
+also providing basic information about the status of local servers.
+
+Ahead-of-time compiled templates.
+
+``python -m pytmbot.parsers.precompiled`` compiles every template under the
+template root into Python modules (Jinja ``compile_templates``) plus a manifest of
+source digests. At runtime ``build_loader`` serves a template from its compiled
+module only while the manifest digest still matches the source; anything else is
+loaded and compiled from source as before.
+
+This module must stay free of settings side effects: it runs during image builds.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import sys
+from collections.abc import MutableMapping
+from pathlib import Path
+from typing import Final
+
+import jinja2
+from jinja2 import (
+    BaseLoader,
+    ChoiceLoader,
+    Environment,
+    FileSystemLoader,
+    ModuleLoader,
+    Template,
+    select_autoescape,
+)
+from jinja2.exceptions import TemplateNotFound
+from jinja2.sandbox import SandboxedEnvironment
+
+TEMPLATE_ROOT: Final[Path] = Path(__file__).resolve().parents[1] / "templates"
+COMPILED_DIRNAME: Final[str] = "_compiled"
+MANIFEST_NAME: Final[str] = "manifest.json"
+TEMPLATE_SUFFIX: Final[str] = ".jinja2"
+
+
+def build_environment(loader: BaseLoader) -> Environment:
+    """Create the sandboxed environment used both to compile and to render templates."""
+    environment = SandboxedEnvironment(
+        loader=loader,
+        autoescape=select_autoescape(
+            enabled_extensions=("html", "txt", "jinja2"),
+            default_for_string=True,
+        ),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        keep_trailing_newline=True,
+        finalize=lambda x: x if x is not None else "",
+        cache_size=200,  # Jinja internal cache
+        auto_reload=False,
+    )
+
+    from pytmbot.parsers.filters import (
+        format_bytes,
+        format_duration,
+        format_timestamp,
+    )
+
+    environment.filters.update(
+        {
+            "format_timestamp": format_timestamp,
+            "format_bytes": format_bytes,
+            "format_duration": format_duration,
+        }
+    )
+    return environment
+
+
+def _is_template_name(name: str) -> bool:
+    return name.endswith(TEMPLATE_SUFFIX) and not name.startswith(
+        f"{COMPILED_DIRNAME}/"
+    )
+
+
+def source_digest(source_path: Path) -> str:
+    return hashlib.sha256(source_path.read_bytes()).hexdigest()
+
+
+def compile_template_modules(
+    template_root: Path = TEMPLATE_ROOT, target: Path | None = None
+) -> dict[str, str]:
+    """
+    Compile every template under ``template_root`` into ``target``.
+
+    Returns the manifest mapping template names to source digests.
+    """
+    target = target or template_root / COMPILED_DIRNAME
+    target.mkdir(parents=True, exist_ok=True)
+    for stale in (*target.glob("tmpl_*.py"), target / MANIFEST_NAME):
+        stale.unlink(missing_ok=True)
+
+    environment = build_environment(
+        FileSystemLoader(template_root, followlinks=False, encoding="utf-8")
+    )
+    environment.compile_templates(
+        str(target),
+        zip=None,
+        filter_func=_is_template_name,
+        ignore_errors=False,
+    )
+
+    digests = {
+        name: source_digest(template_root / name)
+        for name in environment.list_templates(filter_func=_is_template_name)
+    }
+    manifest = {"jinja2": jinja2.__version__, "templates": digests}
+    (target / MANIFEST_NAME).write_text(
+        json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+    )
+    return digests
+
+
+class VerifiedModuleLoader(ModuleLoader):
+    """
+    ``ModuleLoader`` restricted to templates whose source still matches the manifest.
+
+    Unverified names raise ``TemplateNotFound`` so a ``ChoiceLoader`` falls through to
+    the source loader.
+    """
+
+    def __init__(self, compiled_dir: Path, template_root: Path) -> None:
+        super().__init__(str(compiled_dir))
+        self.verified = self._verify(compiled_dir, template_root)
+
+    @staticmethod
+    def _verify(compiled_dir: Path, template_root: Path) -> frozenset[str]:
+        try:
+            manifest = json.loads(
+                (compiled_dir / MANIFEST_NAME).read_text(encoding="utf-8")
+            )
+        except (OSError, ValueError):
+            return frozenset()
+        if not isinstance(manifest, dict) or manifest.get("jinja2") != (
+            jinja2.__version__
+        ):
+            return frozenset()
+
+        templates = manifest.get("templates")
+        if not isinstance(templates, dict):
+            return frozenset()
+
+        verified: set[str] = set()
+        for name, digest in templates.items():
+            source_path = template_root / name
+            module_path = compiled_dir / ModuleLoader.get_module_filename(name)
+            try:
+                if module_path.is_file() and source_digest(source_path) == digest:
+                    verified.add(name)
+            except OSError:
+                continue
+        return frozenset(verified)
+
+    def load(
+        self,
+        environment: Environment,
+        name: str,
+        globals: MutableMapping[str, object] | None = None,
+    ) -> Template:
+        if name not in self.verified:
+            raise TemplateNotFound(name)
+        return super().load(environment, name, globals)
+
+
+def build_loader(template_root: Path) -> BaseLoader:
+    """Prefer verified compiled modules, falling back to template sources."""
+    source_loader = FileSystemLoader(template_root, followlinks=False, encoding="utf-8")
+    compiled_dir = template_root / COMPILED_DIRNAME
+    if not (compiled_dir / MANIFEST_NAME).is_file():
+        return source_loader
+
+    module_loader = VerifiedModuleLoader(compiled_dir, template_root)
+    if not module_loader.verified:
+        return source_loader
+    return ChoiceLoader([module_loader, source_loader])
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Compile pyTMBot templates into Python modules."
+    )
+    parser.add_argument("--template-root", type=Path, default=TEMPLATE_ROOT)
+    parser.add_argument("--target", type=Path, default=None)
+    args = parser.parse_args(argv)
+
+    manifest = compile_template_modules(args.template_root, args.target)
+    print(f"Compiled {len(manifest)} templates")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
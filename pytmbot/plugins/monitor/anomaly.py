@@ -0,0 +1,380 @@
+#!/usr/local/bin/python3
+"""
+(c) Copyright 2025, Denis Rozhnovskiy <pytelemonbot@mail.ru>
+pyTMBot - A simple Telegram bot to handle Docker containers and images,
+also providing basic information about the status of local servers.
+
+Streaming anomaly baselines for the monitor plugin.
+
+Every series produced by ``metric_samples`` gets an EWMA mean/variance and an
+hour-of-week seasonal profile (168 EWMA buckets). All statistics live in flat
+``array`` columns indexed by series slot, so one sample is a handful of float
+updates with no allocation. A sample is scored against the seasonal bucket once
+that bucket has seen a full hour of data, and against the EWMA before that.
+"""
+
+from __future__ import annotations
+
+import base64
+import math
+import sys
+import threading
+import time
+from array import array
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any, Final, Literal
+
+from pytmbot.utils.state_store import StateValue
+
+type AnomalyDirection = Literal["above", "below", "both"]
+
+HOURS_PER_WEEK: Final[int] = 168
+STATE_FORMAT_VERSION: Final[int] = 1
+_COUNT_LIMIT: Final[int] = 2**32 - 1
+
+
+def hour_of_week(timestamp: float) -> int:
+    """Local hour of the week, Monday 00:00 being ``0``."""
+    local = time.localtime(timestamp)
+    return local.tm_wday * 24 + local.tm_hour
+
+
+def half_life_alpha(sample_interval: float, half_life_seconds: float) -> float:
+    """EWMA weight at which a sample loses half its influence after ``half_life_seconds``."""
+    return 1.0 - math.pow(0.5, sample_interval / half_life_seconds)
+
+
+@dataclass(frozen=True, slots=True)
+class AnomalyConfig:
+    """Detector tuning derived from ``plugins_config.monitor.anomaly``."""
+
+    z_threshold: float = 4.0
+    z_clear: float = 2.0
+    direction: AnomalyDirection = "above"
+    alpha: float = 0.003
+    seasonal_alpha: float = 0.0003
+    min_samples: int = 720
+    seasonal_min_samples: int = 720
+    min_std: float = 1.0
+    consecutive: int = 3
+    cooldown_seconds: float = 1800.0
+
+
+@dataclass(frozen=True, slots=True)
+class AnomalyTransition:
+    """A series that started (``firing``) or stopped deviating from its baseline."""
+
+    series: str
+    value: float
+    baseline: float
+    z_score: float
+    seasonal: bool
+    firing: bool
+
+    @property
+    def event_type(self) -> str:
+        return f"anomaly:{self.series}"
+
+    @property
+    def label(self) -> str:
+        return f"Anomaly ({self.series})"
+
+
+class AnomalyDetector:
+    """
+    Per-series EWMA and hour-of-week baselines with z-score alerting.
+
+    ``observe`` runs on the monitor cycle and only touches in-memory arrays;
+    ``export_state`` / ``load_state`` are used by the persistence task.
+    """
+
+    __slots__ = (
+        "config",
+        "_lock",
+        "_slots",
+        "_mean",
+        "_var",
+        "_count",
+        "_season_mean",
+        "_season_var",
+        "_season_count",
+        "_streak",
+        "_active",
+        "_last_fired",
+        "_last_seen",
+    )
+
+    def __init__(self, config: AnomalyConfig) -> None:
+        self.config = config
+        self._lock = threading.Lock()
+        self._slots: dict[str, int] = {}
+        self._mean = array("d")
+        self._var = array("d")
+        self._count = array("I")
+        self._season_mean = array("d")
+        self._season_var = array("d")
+        self._season_count = array("I")
+        self._streak = array("H")
+        self._active = array("b")
+        self._last_fired = array("d")
+        self._last_seen = array("d")
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def _slot(self, series: str) -> int:
+        slot = self._slots.get(series)
+        if slot is None:
+            slot = len(self._slots)
+            self._slots[series] = slot
+            self._mean.append(0.0)
+            self._var.append(0.0)
+            self._count.append(0)
+            self._season_mean.extend([0.0] * HOURS_PER_WEEK)
+            self._season_var.extend([0.0] * HOURS_PER_WEEK)
+            self._season_count.extend([0] * HOURS_PER_WEEK)
+            self._streak.append(0)
+            self._active.append(0)
+            self._last_fired.append(-math.inf)
+            self._last_seen.append(0.0)
+        return slot
+
+    def observe(
+        self, samples: Mapping[str, float], now: float
+    ) -> list[AnomalyTransition]:
+        """Score each sample against its baseline, then fold it into the baseline."""
+        bucket_offset = hour_of_week(now)
+        transitions: list[AnomalyTransition] = []
+        with self._lock:
+            for series, value in samples.items():
+                if not math.isfinite(value):
+                    continue
+                transition = self._observe_one(
+                    self._slot(series), series, value, bucket_offset, now
+                )
+                if transition is not None:
+                    transitions.append(transition)
+        return transitions
+
+    def _observe_one(
+        self, slot: int, series: str, value: float, bucket_offset: int, now: float
+    ) -> AnomalyTransition | None:
+        config = self.config
+        bucket = slot * HOURS_PER_WEEK + bucket_offset
+        count = self._count[slot]
+        season_count = self._season_count[bucket]
+
+        seasonal = season_count >= config.seasonal_min_samples
+        if seasonal:
+            baseline, variance = self._season_mean[bucket], self._season_var[bucket]
+        else:
+            baseline, variance = self._mean[slot], self._var[slot]
+        z_score = (
+            (value - baseline) / max(math.sqrt(variance), config.min_std)
+            if count >= config.min_samples
+            else None
+        )
+
+        # 1/n weights while warming up make the first samples a plain average.
+        self._fold(
+            self._mean,
+            self._var,
+            slot,
+            value,
+            max(config.alpha, 1.0 / (count + 1)),
+            clip=count >= config.min_samples,
+        )
+        self._fold(
+            self._season_mean,
+            self._season_var,
+            bucket,
+            value,
+            max(config.seasonal_alpha, 1.0 / (season_count + 1)),
+            clip=seasonal,
+        )
+        self._count[slot] = min(count + 1, _COUNT_LIMIT)
+        self._season_count[bucket] = min(season_count + 1, _COUNT_LIMIT)
+        self._last_seen[slot] = now
+
+        if z_score is None:
+            return None
+        return self._evaluate(slot, series, value, baseline, z_score, seasonal, now)
+
+    def _fold(
+        self,
+        means: array[float],
+        variances: array[float],
+        index: int,
+        value: float,
+        alpha: float,
+        *,
+        clip: bool,
+    ) -> None:
+        """
+        Fold ``value`` into an exponentially weighted mean/variance pair.
+
+        Once warm, the value is clipped to ``z_threshold`` deviations so a spike
+        cannot inflate the variance it is judged by, while a lasting level shift
+        is still learned step by step.
+        """
+        mean = means[index]
+        if clip:
+            bound = self.config.z_threshold * max(
+                math.sqrt(variances[index]), self.config.min_std
+            )
+            value = min(max(value, mean - bound), mean + bound)
+        diff = value - mean
+        increment = alpha * diff
+        means[index] = mean + increment
+        variances[index] = (1.0 - alpha) * (variances[index] + diff * increment)
+
+    def _evaluate(
+        self,
+        slot: int,
+        series: str,
+        value: float,
+        baseline: float,
+        z_score: float,
+        seasonal: bool,
+        now: float,
+    ) -> AnomalyTransition | None:
+        config = self.config
+        match config.direction:
+            case "above":
+                score = z_score
+            case "below":
+                score = -z_score
+            case _:
+                score = abs(z_score)
+
+        if self._active[slot]:
+            if score < config.z_clear:
+                self._active[slot] = 0
+                return AnomalyTransition(
+                    series, value, baseline, z_score, seasonal, firing=False
+                )
+            return None
+
+        if score < config.z_threshold:
+            self._streak[slot] = 0
+            return None
+        self._streak[slot] = min(self._streak[slot] + 1, 0xFFFF)
+        if (
+            self._streak[slot] < config.consecutive
+            or now - self._last_fired[slot] < config.cooldown_seconds
+        ):
+            return None
+        self._streak[slot] = 0
+        self._active[slot] = 1
+        self._last_fired[slot] = now
+        return AnomalyTransition(series, value, baseline, z_score, seasonal, True)
+
+    def export_state(
+        self, retain_seconds: float
+    ) -> list[tuple[str, StateValue, float | None]]:
+        """
+        Serialize learned baselines (not alert state) as ``StateNamespace`` entries.
+
+        Each entry expires ``retain_seconds`` after its series was last observed,
+        so baselines of removed disks or sensors are eventually dropped.
+        """
+        with self._lock:
+            exported: list[tuple[str, StateValue, float | None]] = []
+            for series, slot in self._slots.items():
+                season = slice(slot * HOURS_PER_WEEK, (slot + 1) * HOURS_PER_WEEK)
+                payload: StateValue = {
+                    "version": STATE_FORMAT_VERSION,
+                    "byteorder": sys.byteorder,
+                    "mean": self._mean[slot],
+                    "var": self._var[slot],
+                    "count": self._count[slot],
+                    "season_mean": _encode(self._season_mean[season]),
+                    "season_var": _encode(self._season_var[season]),
+                    "season_count": _encode(self._season_count[season]),
+                    "last_seen": self._last_seen[slot],
+                }
+                exported.append(
+                    (series, payload, self._last_seen[slot] + retain_seconds)
+                )
+            return exported
+
+    def load_state(self, entries: Iterable[tuple[str, StateValue]]) -> int:
+        """Restore baselines saved by ``export_state``; invalid entries are skipped."""
+        restored = 0
+        with self._lock:
+            for series, payload in entries:
+                decoded = _decode_entry(payload)
+                if decoded is None:
+                    continue
+                mean, variance, count, last_seen, season = decoded
+                season_mean, season_var, season_count = season
+                slot = self._slot(series)
+                start = slot * HOURS_PER_WEEK
+                self._mean[slot] = mean
+                self._var[slot] = variance
+                self._count[slot] = count
+                self._last_seen[slot] = last_seen
+                self._season_mean[start : start + HOURS_PER_WEEK] = season_mean
+                self._season_var[start : start + HOURS_PER_WEEK] = season_var
+                self._season_count[start : start + HOURS_PER_WEEK] = season_count
+                restored += 1
+        return restored
+
+
+def _encode(values: array[Any]) -> str:
+    return base64.b64encode(values.tobytes()).decode("ascii")
+
+
+def _decode_array(typecode: str, payload: object, swap: bool) -> array[Any] | None:
+    if not isinstance(payload, str):
+        return None
+    values = array(typecode)
+    try:
+        values.frombytes(base64.b64decode(payload, validate=True))
+    except ValueError:
+        return None
+    if len(values) != HOURS_PER_WEEK:
+        return None
+    if swap:
+        values.byteswap()
+    return values
+
+
+def _decode_entry(
+    payload: StateValue,
+) -> tuple[float, float, int, float, tuple[array[Any], ...]] | None:
+    if not isinstance(payload, dict) or payload.get("version") != STATE_FORMAT_VERSION:
+        return None
+    mean, variance = payload.get("mean"), payload.get("var")
+    count, last_seen = payload.get("count"), payload.get("last_seen")
+    if not (
+        isinstance(mean, (int, float))
+        and isinstance(variance, (int, float))
+        and isinstance(last_seen, (int, float))
+        and isinstance(count, int)
+        and 0 <= count <= _COUNT_LIMIT
+    ):
+        return None
+    swap = payload.get("byteorder") != sys.byteorder
+    season_mean = _decode_array("d", payload.get("season_mean"), swap)
+    season_var = _decode_array("d", payload.get("season_var"), swap)
+    season_count = _decode_array("I", payload.get("season_count"), swap)
+    if season_mean is None or season_var is None or season_count is None:
+        return None
+    return (
+        float(mean),
+        float(variance),
+        count,
+        float(last_seen),
+        (season_mean, season_var, season_count),
+    )
+
+
+__all__ = [
+    "AnomalyConfig",
+    "AnomalyDetector",
+    "AnomalyTransition",
+    "half_life_alpha",
+    "hour_of_week",
+]
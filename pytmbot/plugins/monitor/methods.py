@@ -7,7 +7,8 @@ also providing basic information about the status of local servers.
 
 from __future__ import annotations
 
-import threading
+import html
+import math
 import time
 from collections.abc import Callable, Mapping, Sequence
 from typing import Literal
@@ -22,14 +23,28 @@ from pytmbot.adapters.psutil.adapter import PsutilAdapter
 from pytmbot.adapters.psutil.adapter_types import TopProcess
 from pytmbot.db.influxdb_interface import InfluxDBConfig, InfluxDBInterface
 from pytmbot.logs import Logger
+from pytmbot.plugins.monitor.anomaly import (
+    AnomalyConfig,
+    AnomalyDetector,
+    AnomalyTransition,
+    half_life_alpha,
+)
 from pytmbot.plugins.monitor.models import MonitoringState, ResourceThresholds
+from pytmbot.plugins.monitor.rules import (
+    AlertRuleEngine,
+    RuleTransition,
+    metric_samples,
+    parse_rule,
+)
 from pytmbot.plugins.monitor.utils import (
     EventTracker,
     SystemInfo,
     SystemMetrics,
 )
 from pytmbot.plugins.plugins_core import PluginCore
+from pytmbot.plugins.runtime import PluginRuntime, ScheduledTask
 from pytmbot.utils import is_running_in_docker, set_naturalsize
+from pytmbot.utils.state_store import StateNamespace, get_state_store
 
 logger = Logger()
 
@@ -40,7 +55,9 @@ class SystemMonitorPlugin(PluginCore):
     DEFAULT_DOCKER_COUNTERS_UPDATE_INTERVAL_SECONDS = 300
     DEFAULT_NOTIFICATION_RESET_WINDOW_SECONDS = 300
     MAX_CHECK_INTERVAL_SECONDS = 30
-    MONITOR_THREAD_JOIN_TIMEOUT_SECONDS = 2
+    MONITOR_TASK_STOP_TIMEOUT_SECONDS = 2
+    ANOMALY_BASELINE_NAMESPACE = "monitor_baselines"
+    ANOMALY_BASELINE_RETENTION_SECONDS = 35 * 24 * 3600
 
     __slots__ = (
         "bot",
@@ -61,16 +78,22 @@ class SystemMonitorPlugin(PluginCore):
         "_platform_metadata",
         "_active_event_ids",
         "_notification_reset_window_seconds",
-        "_monitor_thread",
-        "_supervisor_thread",
-        "_supervisor_stop_event",
-        "_monitor_thread_lock",
-        "_monitor_restart_count",
+        "_monitor_task",
+        "_next_cycle_delay",
         "_psutil_adapter",
+        "_rule_engine",
+        "_anomaly_detector",
+        "_baseline_store",
+        "_baseline_task",
     )
 
-    def __init__(self, bot: TeleBot, event_threshold_duration: float = 20) -> None:
-        super().__init__()
+    def __init__(
+        self,
+        bot: TeleBot,
+        runtime: PluginRuntime,
+        event_threshold_duration: float = 20,
+    ) -> None:
+        super().__init__(runtime)
 
         self.bot = bot
         plugins_config = self.settings.plugins_config
@@ -122,11 +145,84 @@ class SystemMonitorPlugin(PluginCore):
 
         self._psutil_adapter = PsutilAdapter()
         self.system_metrics = SystemMetrics(psutil_adapter=self._psutil_adapter)
-        self._monitor_thread: threading.Thread | None = None
-        self._supervisor_thread: threading.Thread | None = None
-        self._supervisor_stop_event = threading.Event()
-        self._monitor_thread_lock = threading.RLock()
-        self._monitor_restart_count = 0
+        self._monitor_task: ScheduledTask | None = None
+        self._next_cycle_delay = float(self.check_interval)
+        self._rule_engine = self._build_rule_engine()
+        self._anomaly_detector = self._build_anomaly_detector()
+        self._baseline_store: StateNamespace | None = None
+        self._baseline_task: ScheduledTask | None = None
+
+    def _build_rule_engine(self) -> AlertRuleEngine | None:
+        """Build the sliding-window rules engine when ``rules`` are configured."""
+        if not self.monitor_settings.rules:
+            return None
+        return AlertRuleEngine(
+            [
+                parse_rule(
+                    rule.expr,
+                    clear=rule.clear,
+                    cooldown_seconds=rule.cooldown_seconds,
+                    name=rule.name,
+                )
+                for rule in self.monitor_settings.rules
+            ],
+            sample_interval=self.check_interval,
+        )
+
+    def _build_anomaly_detector(self) -> AnomalyDetector | None:
+        """Build streaming anomaly baselines when ``anomaly`` is configured."""
+        anomaly = self.monitor_settings.anomaly
+        if anomaly is None:
+            return None
+        interval = float(self.check_interval)
+        # Each hour-of-week bucket receives one hour of samples per week.
+        return AnomalyDetector(
+            AnomalyConfig(
+                z_threshold=anomaly.z_threshold,
+                z_clear=anomaly.z_clear,
+                direction=anomaly.direction,
+                alpha=half_life_alpha(interval, anomaly.ewma_half_life_minutes * 60),
+                seasonal_alpha=half_life_alpha(
+                    interval, anomaly.seasonal_half_life_weeks * 3600
+                ),
+                min_samples=math.ceil(anomaly.warmup_minutes * 60 / interval),
+                seasonal_min_samples=math.ceil(3600 / interval),
+                min_std=anomaly.min_std,
+                consecutive=anomaly.consecutive,
+                cooldown_seconds=float(anomaly.cooldown_seconds),
+            )
+        )
+
+    def _start_anomaly_baselines(self) -> None:
+        """Restore saved baselines and schedule their periodic persistence."""
+        detector = self._anomaly_detector
+        anomaly = self.monitor_settings.anomaly
+        if detector is None or anomaly is None or self._baseline_task is not None:
+            return
+        if self._baseline_store is None:
+            self._baseline_store = get_state_store().namespace(
+                self.ANOMALY_BASELINE_NAMESPACE
+            )
+            restored = detector.load_state(self._baseline_store.items())
+            logger.info(
+                "bot.plugins.monitor.methods.anomaly.baselines.restored.info",
+                extra={"restored_series": restored},
+            )
+        self._baseline_task = self.runtime.schedule(
+            "monitor.baselines",
+            self._persist_anomaly_baselines,
+            interval=float(anomaly.persist_interval_seconds),
+        )
+
+    def _persist_anomaly_baselines(self) -> None:
+        """Save baselines in one state store batch; runs off the monitor cycle."""
+        detector, store = self._anomaly_detector, self._baseline_store
+        if detector is None or store is None:
+            return
+        entries = detector.export_state(self.ANOMALY_BASELINE_RETENTION_SECONDS)
+        with store.store.batch():
+            store.put_many(entries)
+            store.purge_expired()
 
     def _build_platform_metadata(self) -> dict[str, str]:
         return {
@@ -162,9 +258,7 @@ class SystemMonitorPlugin(PluginCore):
         if self.state.is_active:
             return
 
-        self._supervisor_stop_event.clear()
         self.state.is_active = True
-        self._monitor_restart_count = 0
 
         retry_attempts = self.monitor_settings.retry_attempts[0]
         retry_interval = max(1, self.monitor_settings.retry_interval[0])
@@ -172,14 +266,8 @@ class SystemMonitorPlugin(PluginCore):
         for attempt in range(retry_attempts):
             try:
                 self.influxdb_client.connect()
-                with self._monitor_thread_lock:
-                    self._monitor_thread = self._spawn_monitor_thread()
-                    self._supervisor_thread = threading.Thread(
-                        target=self._supervise_monitoring,
-                        name="SystemMonitorSupervisorThread",
-                        daemon=True,
-                    )
-                    self._supervisor_thread.start()
+                self._start_anomaly_baselines()
+                self._monitor_task = self._schedule_monitor_task()
 
                 with logger.context(
                     context={
@@ -211,78 +299,114 @@ class SystemMonitorPlugin(PluginCore):
                         "Failed to start monitoring after maximum attempts"
                     ) from e
 
-    def _spawn_monitor_thread(self) -> threading.Thread:
-        """Create and start monitor worker thread."""
-        thread = threading.Thread(
-            target=self._monitor_system,
-            name="SystemMonitorThread",
-            daemon=True,
+    def _schedule_monitor_task(self) -> ScheduledTask:
+        """Run monitoring cycles on the shared plugin scheduler."""
+        self._next_cycle_delay = float(self.check_interval)
+        return self.runtime.schedule(
+            "monitor.system",
+            self._run_monitor_cycle,
+            interval=self._get_next_cycle_delay,
+            initial_delay=0.0,
         )
-        thread.start()
-        return thread
 
-    def _supervise_monitoring(self) -> None:
-        """Watch monitor worker and restart it if it dies unexpectedly."""
-        retry_interval = max(1, self.monitor_settings.retry_interval[0])
-        while self.state.is_active:
-            try:
-                with self._monitor_thread_lock:
-                    monitor_thread = self._monitor_thread
-                    should_restart = (
-                        monitor_thread is None or not monitor_thread.is_alive()
-                    )
-                    if should_restart:
-                        self._monitor_thread = self._spawn_monitor_thread()
-                        self._monitor_restart_count += 1
-                        logger.warning(
-                            "bot.plugins.monitor.methods.monitoring.restarted.warn",
-                            extra={"restart_count": self._monitor_restart_count},
-                        )
-            except Exception as e:
-                logger.error(
-                    "bot.plugins.monitor.methods.monitoring.supervisor.fail", e
-                )
-            if self._supervisor_stop_event.wait(timeout=retry_interval):
-                break
+    def _get_next_cycle_delay(self) -> float:
+        return self._next_cycle_delay
 
-    def _monitor_system(self) -> None:
-        while self.state.is_active:
-            try:
-                cycle_cpu_usage = self._adjust_check_interval()
+    def _run_monitor_cycle(self) -> None:
+        """Collect, record and alert on one round of metrics."""
+        if not self.state.is_active:
+            return
+        try:
+            cycle_cpu_usage = self._adjust_check_interval()
 
-                # Collect and process metrics
-                metrics: dict[str, object] = dict(
-                    self.system_metrics.collect_metrics(cpu_usage=cycle_cpu_usage)
-                )
-                if self.monitor_settings.monitor_docker:
-                    self._process_docker_metrics(metrics)
+            # Collect and process metrics
+            metrics: dict[str, object] = dict(
+                self.system_metrics.collect_metrics(cpu_usage=cycle_cpu_usage)
+            )
+            if self.monitor_settings.monitor_docker:
+                self._process_docker_metrics(metrics)
 
-                # Record metrics and process alerts
-                self._record_metrics(metrics)
-                self._process_alerts(metrics)
+            # Record metrics and process alerts
+            self._record_metrics(metrics)
+            self._process_alerts(metrics)
 
-                time.sleep(self.check_interval)
+            self._next_cycle_delay = float(self.check_interval)
 
-            except Exception as e:
-                logger.error("bot.plugins.monitor.methods.monitoring.cycle.fail", e)
-                time.sleep(max(1, self.check_interval // 2))
+        except Exception as e:
+            logger.error("bot.plugins.monitor.methods.monitoring.cycle.fail", e)
+            self._next_cycle_delay = float(max(1, self.check_interval // 2))
 
     def _process_alerts(self, metrics: dict[str, object]) -> None:
+        # Metric families watched by rules skip the single-sample threshold checks.
+        rule_engine = self._rule_engine
+        covered = rule_engine.covers if rule_engine is not None else (lambda _: False)
+
         cpu_usage = metrics.get("cpu_usage")
-        if isinstance(cpu_usage, (int, float)):
+        if isinstance(cpu_usage, (int, float)) and not covered("cpu"):
             self._check_cpu_alert(float(cpu_usage))
 
         memory_usage = metrics.get("memory_usage")
-        if isinstance(memory_usage, (int, float)):
+        if isinstance(memory_usage, (int, float)) and not covered("memory"):
             self._check_memory_alert(float(memory_usage))
 
         temperatures = metrics.get("temperatures")
-        if isinstance(temperatures, dict):
+        if isinstance(temperatures, dict) and not covered("temp"):
             self._check_temperature_alerts(temperatures)
         disk_usage = metrics.get("disk_usage")
-        if isinstance(disk_usage, dict):
+        if isinstance(disk_usage, dict) and not covered("disk"):
             self._check_disk_alerts(disk_usage)
 
+        anomaly_detector = self._anomaly_detector
+        if rule_engine is None and anomaly_detector is None:
+            return
+        samples = metric_samples(metrics)
+        if rule_engine is not None:
+            self._process_rule_alerts(rule_engine, samples)
+        if anomaly_detector is not None:
+            self._process_anomaly_alerts(anomaly_detector, samples)
+
+    def _process_rule_alerts(
+        self, rule_engine: AlertRuleEngine, samples: dict[str, float]
+    ) -> None:
+        transitions = rule_engine.observe(samples, time.monotonic())
+        for transition in transitions:
+            if transition.firing:
+                self._create_or_notify_event(
+                    transition.event_type,
+                    {
+                        "rule": transition.rule.expr,
+                        "series": transition.series,
+                        "value": transition.value,
+                    },
+                    self._format_rule_alert,
+                    transition,
+                )
+            else:
+                self._resolve_event_and_notify(
+                    transition.event_type, html.escape(transition.label)
+                )
+
+    def _process_anomaly_alerts(
+        self, anomaly_detector: AnomalyDetector, samples: dict[str, float]
+    ) -> None:
+        for transition in anomaly_detector.observe(samples, time.time()):
+            if transition.firing:
+                self._create_or_notify_event(
+                    transition.event_type,
+                    {
+                        "series": transition.series,
+                        "value": transition.value,
+                        "baseline": transition.baseline,
+                        "z_score": transition.z_score,
+                    },
+                    self._format_anomaly_alert,
+                    transition,
+                )
+            else:
+                self._resolve_event_and_notify(
+                    transition.event_type, html.escape(transition.label)
+                )
+
     def _find_active_event_id(self, event_type: str) -> str | None:
         """Return unresolved event id by type."""
         indexed_event_id = self._active_event_ids.get(event_type)
@@ -730,6 +854,27 @@ class SystemMonitorPlugin(PluginCore):
             f"Current Usage: {usage:.1f}%"
         )
 
+    @staticmethod
+    def _format_rule_alert(event_id: str, transition: RuleTransition) -> str:
+        rule = transition.rule
+        return (
+            f"📈 <b>Alert Rule Triggered - {html.escape(transition.label)}</b>\n"
+            f"Event ID: {event_id}\n"
+            f"Rule: <code>{html.escape(rule.expr)}</code>\n"
+            f"Current: {transition.value:.1f} (clears at {rule.clear:g})"
+        )
+
+    @staticmethod
+    def _format_anomaly_alert(event_id: str, transition: AnomalyTransition) -> str:
+        baseline_kind = "hour-of-week profile" if transition.seasonal else "EWMA"
+        return (
+            f"🔍 <b>Anomaly Detected - {html.escape(transition.series)}</b>\n"
+            f"Event ID: {event_id}\n"
+            f"Current: {transition.value:.1f} "
+            f"(baseline {transition.baseline:.1f}, z={transition.z_score:+.1f})\n"
+            f"Baseline: {baseline_kind}"
+        )
+
     def _send_container_notification(self, container: Mapping[str, object]) -> None:
         container_name = str(container.get("name", "unknown"))
         image_name = str(container.get("image", "unknown"))
@@ -821,23 +966,15 @@ class SystemMonitorPlugin(PluginCore):
 
     def stop_monitoring(self) -> None:
         was_active = self.state.is_active
-        self._supervisor_stop_event.set()
+        monitor_task, self._monitor_task = self._monitor_task, None
+        baseline_task, self._baseline_task = self._baseline_task, None
         if self.state.is_active:
             self.state.is_active = False
-            with self._monitor_thread_lock:
-                monitor_thread = self._monitor_thread
-                supervisor_thread = self._supervisor_thread
-                self._monitor_thread = None
-                self._supervisor_thread = None
-
-            current_thread = threading.current_thread()
-            for thread in (monitor_thread, supervisor_thread):
-                if (
-                    thread is not None
-                    and thread.is_alive()
-                    and thread is not current_thread
-                ):
-                    thread.join(timeout=self.MONITOR_THREAD_JOIN_TIMEOUT_SECONDS)
+            if monitor_task is not None:
+                monitor_task.cancel(wait=self.MONITOR_TASK_STOP_TIMEOUT_SECONDS)
+            if baseline_task is not None:
+                baseline_task.cancel(wait=self.MONITOR_TASK_STOP_TIMEOUT_SECONDS)
+                self._persist_anomaly_baselines()
             logger.info("bot.plugins.monitor.methods.monitoring.stop")
         else:
             logger.warning("bot.plugins.monitor.methods.monitoring.not.warn")
@@ -532,7 +532,9 @@ class MonitoringPlugin(PluginInterface):
     def register(self) -> None:
         """Register SystemMonitorPlugin and start monitoring."""
         try:
-            self._monitor_plugin = SystemMonitorPlugin(bot=self.bot)
+            self._monitor_plugin = SystemMonitorPlugin(
+                bot=self.bot, runtime=self.runtime
+            )
             self._monitor_plugin.start_monitoring()
 
             self._register_text_handler(self.handle_monitoring, "Monitoring")
@@ -0,0 +1,336 @@
+#!/usr/local/bin/python3
+"""
+(c) Copyright 2025, Denis Rozhnovskiy <pytelemonbot@mail.ru>
+pyTMBot - A simple Telegram bot to handle Docker containers and images,
+also providing basic information about the status of local servers.
+
+Sliding-window alert rules for the monitor plugin.
+
+A rule such as ``avg(cpu, 5m) > 85`` is evaluated over the samples of the last
+five minutes instead of a single reading. Every (series, window) pair keeps its
+samples in a fixed-size ring of ``array('d')`` slots together with the running
+state its rules need: a running sum (``avg``), monotonic deques (``min``/``max``),
+the ring ends (``rate``) and a sorted array (``pNN``). Adding a sample and
+evaluating a rule are O(1), percentiles cost one binary search. The rule grammar
+lives in ``pytmbot.utils.alert_rules`` and is re-exported here.
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from bisect import bisect_left, insort
+from collections import deque
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import Final
+
+from pytmbot.utils.alert_rules import (
+    MAX_WINDOW_SECONDS,
+    METRIC_FAMILIES,
+    MULTI_SERIES_FAMILIES,
+    AggregateName,
+    AlertRule,
+    Comparison,
+    parse_rule,
+)
+
+__all__ = [
+    "MAX_WINDOW_SAMPLES",
+    "MAX_WINDOW_SECONDS",
+    "METRIC_FAMILIES",
+    "MULTI_SERIES_FAMILIES",
+    "AggregateName",
+    "AlertRule",
+    "AlertRuleEngine",
+    "Comparison",
+    "RuleTransition",
+    "SlidingWindow",
+    "metric_samples",
+    "parse_rule",
+]
+
+MAX_WINDOW_SAMPLES: Final[int] = 4096
+
+
+class SlidingWindow:
+    """Time-bounded ring of samples with incrementally maintained aggregates."""
+
+    __slots__ = (
+        "window_seconds",
+        "capacity",
+        "_times",
+        "_values",
+        "_head",
+        "_size",
+        "_next_seq",
+        "_sum",
+        "_started_at",
+        "_min_deque",
+        "_max_deque",
+        "_sorted",
+    )
+
+    def __init__(
+        self,
+        window_seconds: float,
+        capacity: int,
+        *,
+        track_extremes: bool = False,
+        track_order: bool = False,
+    ) -> None:
+        self.window_seconds = window_seconds
+        self.capacity = max(2, capacity)
+        self._times = array("d", bytes(8 * self.capacity))
+        self._values = array("d", bytes(8 * self.capacity))
+        self._head = 0
+        self._size = 0
+        self._next_seq = 0
+        self._sum = 0.0
+        self._started_at: float | None = None
+        # Monotonic deques of (sequence number, value); the front is the extreme.
+        self._min_deque: deque[tuple[int, float]] | None = (
+            deque() if track_extremes else None
+        )
+        self._max_deque: deque[tuple[int, float]] | None = (
+            deque() if track_extremes else None
+        )
+        self._sorted: array[float] | None = array("d") if track_order else None
+
+    def __len__(self) -> int:
+        return self._size
+
+    def push(self, timestamp: float, value: float) -> None:
+        if self._started_at is None:
+            self._started_at = timestamp
+        horizon = timestamp - self.window_seconds
+        while self._size and self._times[self._head] <= horizon:
+            self._evict_oldest()
+        if self._size == self.capacity:
+            self._evict_oldest()
+
+        tail = (self._head + self._size) % self.capacity
+        self._times[tail] = timestamp
+        self._values[tail] = value
+        self._size += 1
+        seq = self._next_seq
+        self._next_seq += 1
+
+        self._sum += value
+        if seq % self.capacity == 0:
+            # Re-anchor the running sum once per ring turn to cancel float drift.
+            self._sum = math.fsum(self._iter_values())
+        if self._min_deque is not None and self._max_deque is not None:
+            while self._min_deque and self._min_deque[-1][1] >= value:
+                self._min_deque.pop()
+            self._min_deque.append((seq, value))
+            while self._max_deque and self._max_deque[-1][1] <= value:
+                self._max_deque.pop()
+            self._max_deque.append((seq, value))
+        if self._sorted is not None:
+            insort(self._sorted, value)
+
+    def _evict_oldest(self) -> None:
+        value = self._values[self._head]
+        seq = self._next_seq - self._size
+        self._head = (self._head + 1) % self.capacity
+        self._size -= 1
+        self._sum -= value
+        if self._min_deque and self._min_deque[0][0] == seq:
+            self._min_deque.popleft()
+        if self._max_deque and self._max_deque[0][0] == seq:
+            self._max_deque.popleft()
+        if self._sorted is not None:
+            del self._sorted[bisect_left(self._sorted, value)]
+
+    def _iter_values(self) -> list[float]:
+        return [
+            self._values[(self._head + offset) % self.capacity]
+            for offset in range(self._size)
+        ]
+
+    def is_warm(self, now: float) -> bool:
+        """Whether samples have been collected for at least one full window."""
+        return (
+            self._started_at is not None
+            and now - self._started_at >= self.window_seconds
+        )
+
+    def aggregate(self, function: AggregateName, percentile: int = 0) -> float | None:
+        if not self._size:
+            return None
+        match function:
+            case "avg":
+                return self._sum / self._size
+            case "min":
+                return self._min_deque[0][1] if self._min_deque else None
+            case "max":
+                return self._max_deque[0][1] if self._max_deque else None
+            case "pct":
+                if not self._sorted:
+                    return None
+                rank = math.ceil(percentile / 100 * len(self._sorted))
+                return self._sorted[max(rank, 1) - 1]
+            case _:
+                if self._size < 2:
+                    return None
+                newest = (self._head + self._size - 1) % self.capacity
+                elapsed = self._times[newest] - self._times[self._head]
+                if elapsed <= 0:
+                    return None
+                delta = self._values[newest] - self._values[self._head]
+                return delta / elapsed * 60.0
+
+
+@dataclass(frozen=True, slots=True)
+class RuleTransition:
+    """A rule that started (``firing``) or stopped alerting for one series."""
+
+    rule: AlertRule
+    series: str
+    value: float
+    firing: bool
+
+    @property
+    def event_type(self) -> str:
+        return f"rule:{self.rule.name}:{self.series}"
+
+    @property
+    def label(self) -> str:
+        if self.series == self.rule.family:
+            return self.rule.name
+        return f"{self.rule.name} ({self.series})"
+
+
+class _RuleBinding:
+    __slots__ = ("rule", "window", "active", "last_fired_at")
+
+    def __init__(self, rule: AlertRule, window: SlidingWindow) -> None:
+        self.rule = rule
+        self.window = window
+        self.active = False
+        self.last_fired_at = -math.inf
+
+
+class AlertRuleEngine:
+    """
+    Evaluate alert rules against per-series sliding windows.
+
+    Windows are created on the first sample of a series and shared by every rule
+    with the same window length, so each sample is stored once per distinct window.
+    """
+
+    __slots__ = ("rules", "sample_interval", "_families", "_bindings", "_windows")
+
+    def __init__(self, rules: Sequence[AlertRule], sample_interval: float) -> None:
+        self.rules = tuple(rules)
+        self.sample_interval = max(1.0, float(sample_interval))
+        self._families = frozenset(rule.family for rule in self.rules)
+        self._bindings: dict[str, tuple[_RuleBinding, ...]] = {}
+        self._windows: dict[str, tuple[SlidingWindow, ...]] = {}
+
+    def covers(self, family: str) -> bool:
+        """Whether at least one rule watches ``family``."""
+        return family in self._families
+
+    def _bind(self, series_key: str) -> tuple[_RuleBinding, ...]:
+        matching = [rule for rule in self.rules if rule.matches(series_key)]
+        windows: dict[float, SlidingWindow] = {}
+        for window_seconds in sorted({rule.window_seconds for rule in matching}):
+            same_window = [r for r in matching if r.window_seconds == window_seconds]
+            windows[window_seconds] = SlidingWindow(
+                window_seconds,
+                min(
+                    MAX_WINDOW_SAMPLES,
+                    math.ceil(window_seconds / self.sample_interval) + 2,
+                ),
+                track_extremes=any(r.function in ("min", "max") for r in same_window),
+                track_order=any(r.function == "pct" for r in same_window),
+            )
+        bindings = tuple(
+            _RuleBinding(rule, windows[rule.window_seconds]) for rule in matching
+        )
+        self._bindings[series_key] = bindings
+        self._windows[series_key] = tuple(windows.values())
+        return bindings
+
+    def observe(self, samples: Mapping[str, float], now: float) -> list[RuleTransition]:
+        """Add one sample per series and return the rules that changed state."""
+        transitions: list[RuleTransition] = []
+        for series_key, value in samples.items():
+            bindings = self._bindings.get(series_key)
+            if bindings is None:
+                bindings = self._bind(series_key)
+            if not bindings:
+                continue
+            for window in self._windows[series_key]:
+                window.push(now, value)
+            for binding in bindings:
+                transition = self._evaluate(binding, series_key, now)
+                if transition is not None:
+                    transitions.append(transition)
+        return transitions
+
+    @staticmethod
+    def _evaluate(
+        binding: _RuleBinding, series_key: str, now: float
+    ) -> RuleTransition | None:
+        rule = binding.rule
+        if not binding.window.is_warm(now):
+            return None
+        value = binding.window.aggregate(rule.function, rule.percentile)
+        if value is None:
+            return None
+        if binding.active:
+            if rule.cleared(value):
+                binding.active = False
+                return RuleTransition(rule, series_key, value, firing=False)
+            return None
+        if rule.breached(value) and now - binding.last_fired_at >= (
+            rule.cooldown_seconds
+        ):
+            binding.active = True
+            binding.last_fired_at = now
+            return RuleTransition(rule, series_key, value, firing=True)
+        return None
+
+
+def metric_samples(metrics: Mapping[str, object]) -> dict[str, float]:
+    """Flatten one ``SystemMetrics.collect_metrics`` result into rule series keys."""
+    samples: dict[str, float] = {}
+    for family, key in (("cpu", "cpu_usage"), ("memory", "memory_usage")):
+        value = metrics.get(key)
+        if isinstance(value, (int, float)):
+            samples[family] = float(value)
+
+    load_averages = metrics.get("load_averages")
+    if isinstance(load_averages, (tuple, list)) and load_averages:
+        load = load_averages[0]
+        if isinstance(load, (int, float)):
+            samples["load"] = float(load)
+
+    disk_usage = metrics.get("disk_usage")
+    if isinstance(disk_usage, dict):
+        for disk, usage in disk_usage.items():
+            if isinstance(usage, (int, float)):
+                samples[f"disk:{disk}"] = float(usage)
+
+    for family, key in (("temp", "temperatures"), ("fan", "fan_speeds")):
+        sensors = metrics.get(key)
+        if not isinstance(sensors, dict):
+            continue
+        for sensor, data in sensors.items():
+            current = data.get("current") if isinstance(data, dict) else None
+            if isinstance(current, (int, float)):
+                samples[f"{family}:{sensor}"] = float(current)
+    return samples
+
+
+__all__ = [
+    "AlertRule",
+    "AlertRuleEngine",
+    "RuleTransition",
+    "SlidingWindow",
+    "metric_samples",
+    "parse_rule",
+]
@@ -9,15 +9,38 @@ from __future__ import annotations
 
 import asyncio
 import threading
-from collections.abc import Callable, Coroutine
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
 from importlib import import_module
 from types import TracebackType
-from typing import Literal, Protocol, TypeVar, runtime_checkable
+from typing import Final, Literal, Protocol, runtime_checkable
 
 from pytmbot.plugins.plugins_core import PluginCore
+from pytmbot.plugins.runtime import PluginRuntime
 
 type OutlinePayload = dict[str, object] | list[dict[str, object]]
-T = TypeVar("T")
+type OutlineAction = Literal[
+    "server_information", "traffic_information", "key_information"
+]
+
+OUTLINE_RESULT_TTL_SECONDS: Final[float] = 5.0
+OUTLINE_REQUEST_TIMEOUT_SECONDS: Final[float] = 30.0
+
+# action -> (legacy wrapper method, async client methods in preference order)
+_OUTLINE_ACTIONS: Final[dict[OutlineAction, tuple[str, tuple[str, ...]]]] = {
+    "server_information": ("get_server_info", ("get_server_info",)),
+    "traffic_information": ("get_metrics", ("get_transfer_metrics", "get_metrics")),
+    "key_information": ("get_access_keys", ("get_access_keys",)),
+}
+
+# action -> actions its view renders; stale ones are refreshed in one fetch.
+# The traffic view labels users from the key listing, so both are fetched together.
+_VIEW_ACTIONS: Final[dict[OutlineAction, tuple[OutlineAction, ...]]] = {
+    "server_information": ("server_information",),
+    "traffic_information": ("traffic_information", "key_information"),
+    "key_information": ("key_information",),
+}
 
 
 @runtime_checkable
@@ -59,13 +82,20 @@ class PluginMethods(PluginCore):
         "verify_tls",
         "_async_client_cls",
         "_legacy_client",
+        "_client_session",
+        "_snapshot",
+        "_snapshot_lock",
+        "_in_flight",
+        "_clock",
     )
 
-    def __init__(self) -> None:
+    def __init__(self, runtime: PluginRuntime) -> None:
         """
         Initializes the PluginMethods class and sets up the Outline API client.
+
+        :param runtime: Shared plugin runtime whose loop hosts the pooled client.
         """
-        super().__init__()
+        super().__init__(runtime)
         plugins_config = self.settings.plugins_config
         outline_config = plugins_config.outline if plugins_config else None
         if outline_config is None:
@@ -79,6 +109,15 @@ class PluginMethods(PluginCore):
         self.verify_tls = bool(getattr(self.plugin_config, "verify_tls", True))
         self._async_client_cls = self._resolve_async_client_class()
         self._legacy_client: object | None = None
+        # (context manager, entered client); only touched from the runtime loop thread.
+        self._client_session: tuple[_AsyncOutlineClient, _AsyncOutlineClient] | None = (
+            None
+        )
+        self._snapshot: dict[OutlineAction, tuple[float, OutlinePayload]] = {}
+        self._snapshot_lock = threading.Lock()
+        # Fetches in progress; concurrent callers wait on these instead of refetching.
+        self._in_flight: dict[OutlineAction, Future[OutlinePayload]] = {}
+        self._clock: Callable[[], float] = time.monotonic
 
         if self._async_client_cls is None:
             self._legacy_client = self._build_legacy_client()
@@ -180,56 +219,144 @@ class PluginMethods(PluginCore):
 
         raise TypeError(f"Unsupported outline payload type: {type(payload)!r}")
 
-    @staticmethod
-    def _run_coroutine(
-        coroutine_factory: Callable[[], Coroutine[object, object, T]],
-    ) -> T:
-        """Execute coroutine from sync context with running-loop fallback."""
-        try:
-            return asyncio.run(coroutine_factory())
-        except RuntimeError as error:
-            if "asyncio.run() cannot be called from a running event loop" not in str(
-                error
-            ):
-                raise
+    async def _acquire_client(self) -> _AsyncOutlineClient:
+        """Return the pooled client, entering a new one on first use or after a failure."""
+        if self._client_session is None:
+            client_context = self._create_async_client()
+            client = await client_context.__aenter__()
+            self._client_session = (client_context, client)
+        return self._client_session[1]
+
+    async def _release_client(self) -> None:
+        """Exit the pooled client so the next fetch reconnects."""
+        client_session, self._client_session = self._client_session, None
+        if client_session is not None:
+            await client_session[0].__aexit__(None, None, None)
+
+    async def _call_async_action(
+        self, client: _AsyncOutlineClient, method_names: tuple[str, ...]
+    ) -> OutlinePayload:
+        """Call the first supported client method and normalize its payload."""
+        for method_name in method_names:
+            method = getattr(client, method_name, None)
+            if callable(method):
+                payload = await method()
+                return self._normalize_payload(payload)
+        raise AttributeError(
+            f"Async outline client does not support methods: {method_names}"
+        )
 
-        result_box: dict[str, T] = {}
-        error_box: dict[str, BaseException] = {}
+    async def _gather_async_actions(
+        self, actions: tuple[OutlineAction, ...]
+    ) -> list[OutlinePayload | BaseException]:
+        """Fetch the given actions concurrently over the pooled client."""
+        client = await self._acquire_client()
+        results = await asyncio.gather(
+            *(
+                self._call_async_action(client, _OUTLINE_ACTIONS[action][1])
+                for action in actions
+            ),
+            return_exceptions=True,
+        )
+        if any(
+            isinstance(result, BaseException)
+            and not isinstance(result, (AttributeError, TypeError))
+            for result in results
+        ):
+            # Transport-level failure: do not keep a possibly broken connection pool.
+            await self._release_client()
+        return results
+
+    def _fetch_async_actions(
+        self, actions: tuple[OutlineAction, ...]
+    ) -> list[OutlinePayload | BaseException]:
+        """Run the concurrent fetch on the shared plugin event loop."""
+        return self.runtime.run_coroutine(
+            lambda: self._gather_async_actions(actions),
+            timeout=OUTLINE_REQUEST_TIMEOUT_SECONDS,
+        )
 
-        def _thread_runner() -> None:
+    def _fetch_legacy_actions(
+        self, actions: tuple[OutlineAction, ...]
+    ) -> list[OutlinePayload | BaseException]:
+        """Fetch the given actions one by one over the legacy sync client."""
+        results: list[OutlinePayload | BaseException] = []
+        for action in actions:
             try:
-                result_box["value"] = asyncio.run(coroutine_factory())
-            except BaseException as thread_error:  # noqa: BLE001
-                error_box["error"] = thread_error
-
-        worker = threading.Thread(
-            target=_thread_runner,
-            name="outline_async_bridge",
-            daemon=True,
-        )
-        worker.start()
-        worker.join()
-
-        if "error" in error_box:
-            raise error_box["error"]
-
-        return result_box["value"]
-
-    def _execute_async_action(self, method_names: tuple[str, ...]) -> OutlinePayload:
-        """Execute async outline action and normalize the returned payload."""
-
-        async def _call() -> OutlinePayload:
-            async with self._create_async_client() as client:
-                for method_name in method_names:
-                    method = getattr(client, method_name, None)
-                    if callable(method):
-                        payload = await method()
-                        return self._normalize_payload(payload)
-                raise AttributeError(
-                    f"Async outline client does not support methods: {method_names}"
-                )
+                results.append(self._execute_legacy_action(_OUTLINE_ACTIONS[action][0]))
+            except Exception as error:
+                results.append(error)
+        return results
 
-        return self._run_coroutine(_call)
+    def _get_action_payload(self, action: OutlineAction) -> OutlinePayload:
+        """
+        Return the payload for ``action``, refreshing the stale actions of its view.
+
+        Results are cached for ``OUTLINE_RESULT_TTL_SECONDS``. The network fetch runs
+        outside ``_snapshot_lock``; callers that need an action already being fetched
+        wait on its in-flight future instead of issuing a second request.
+        """
+        with self._snapshot_lock:
+            now = self._clock()
+            cached = self._snapshot.get(action)
+            if cached is not None and now - cached[0] < OUTLINE_RESULT_TTL_SECONDS:
+                return cached[1]
+            claimed: dict[OutlineAction, Future[OutlinePayload]] = {}
+            for name in _VIEW_ACTIONS[action]:
+                if name in self._in_flight:
+                    continue
+                entry = self._snapshot.get(name)
+                if (
+                    name != action
+                    and entry is not None
+                    and now - entry[0] < OUTLINE_RESULT_TTL_SECONDS
+                ):
+                    continue
+                claimed[name] = self._in_flight[name] = Future()
+            pending = self._in_flight[action]
+
+        if claimed:
+            self._refresh_actions(claimed)
+        return pending.result(timeout=OUTLINE_REQUEST_TIMEOUT_SECONDS)
+
+    def _refresh_actions(
+        self, claimed: dict[OutlineAction, Future[OutlinePayload]]
+    ) -> None:
+        """Fetch the claimed actions and settle their in-flight futures."""
+        actions = tuple(claimed)
+        results: list[OutlinePayload | BaseException]
+        try:
+            if self._async_client_cls is not None:
+                results = self._fetch_async_actions(actions)
+            else:
+                results = self._fetch_legacy_actions(actions)
+        except Exception as error:
+            results = [error] * len(actions)
+        fetched_at = self._clock()
+        with self._snapshot_lock:
+            for name, result in zip(actions, results, strict=True):
+                del self._in_flight[name]
+                if isinstance(result, BaseException):
+                    self._snapshot.pop(name, None)
+                else:
+                    self._snapshot[name] = (fetched_at, result)
+        for name, result in zip(actions, results, strict=True):
+            if isinstance(result, BaseException):
+                claimed[name].set_exception(result)
+            else:
+                claimed[name].set_result(result)
+
+    def close(self) -> None:
+        """Close the pooled client and drop cached results."""
+        with self._snapshot_lock:
+            self._snapshot.clear()
+        if self._client_session is not None:
+            try:
+                self.runtime.run_coroutine(
+                    self._release_client, timeout=OUTLINE_REQUEST_TIMEOUT_SECONDS
+                )
+            except Exception:
+                self.logger.exception("bot.plugins.outline.methods.client.close.fail")
 
     def _execute_legacy_action(self, method_name: str) -> OutlinePayload:
         """Execute legacy sync action and normalize the returned payload."""
@@ -247,14 +374,6 @@ class PluginMethods(PluginCore):
         payload = method()
         return self._normalize_payload(payload)
 
-    def _execute_action(
-        self, *, legacy_method: str, async_methods: tuple[str, ...]
-    ) -> OutlinePayload:
-        """Execute action against async client when available, otherwise legacy client."""
-        if self._async_client_cls is not None:
-            return self._execute_async_action(async_methods)
-        return self._execute_legacy_action(legacy_method)
-
     def _fetch_server_information(self) -> dict[str, object]:
         """
         Fetches server information from the Outline API.
@@ -262,10 +381,7 @@ class PluginMethods(PluginCore):
         Returns:
             Dict with outline server information.
         """
-        payload = self._execute_action(
-            legacy_method="get_server_info",
-            async_methods=("get_server_info",),
-        )
+        payload = self._get_action_payload("server_information")
         if not isinstance(payload, dict):
             raise TypeError("Server information payload must be a dict")
         return payload
@@ -277,10 +393,7 @@ class PluginMethods(PluginCore):
         Returns:
             Dict with transferred-data information.
         """
-        payload = self._execute_action(
-            legacy_method="get_metrics",
-            async_methods=("get_transfer_metrics", "get_metrics"),
-        )
+        payload = self._get_action_payload("traffic_information")
         if not isinstance(payload, dict):
             raise TypeError("Traffic information payload must be a dict")
         return payload
@@ -292,14 +405,11 @@ class PluginMethods(PluginCore):
         Returns:
             Dict/list payload with access key information.
         """
-        return self._execute_action(
-            legacy_method="get_access_keys",
-            async_methods=("get_access_keys",),
-        )
+        return self._get_action_payload("key_information")
 
     def outline_action_manager(
         self,
-        action: Literal["server_information", "traffic_information", "key_information"],
+        action: OutlineAction,
     ) -> OutlinePayload:
         """
         Manages actions based on the provided action string and returns the appropriate data.
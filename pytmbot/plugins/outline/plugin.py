@@ -41,9 +41,15 @@ class OutlinePlugin(PluginInterface):
     def _get_plugin_methods(self) -> PluginMethods:
         """Lazily initialize Outline methods to avoid import-time side effects."""
         if self._plugin_methods is None:
-            self._plugin_methods = PluginMethods()
+            self._plugin_methods = PluginMethods(self.runtime)
         return self._plugin_methods
 
+    def cleanup(self) -> None:
+        """Release the pooled Outline client."""
+        plugin_methods, self._plugin_methods = self._plugin_methods, None
+        if plugin_methods is not None:
+            plugin_methods.close()
+
     @staticmethod
     def _get_first_name(message: Message) -> str:
         """Resolve user's first name safely for templates."""
@@ -9,6 +9,8 @@ from abc import ABC, abstractmethod
 
 from telebot import TeleBot
 
+from pytmbot.plugins.runtime import PluginRuntime
+
 
 class PluginInterface(ABC):
     """
@@ -24,12 +26,32 @@ class PluginInterface(ABC):
         TypeError: If the provided bot instance is not a TeleBot object.
     """
 
-    __slots__ = ("bot",)
+    __slots__ = ("bot", "_runtime")
 
     def __init__(self, bot: TeleBot) -> None:
         if not isinstance(bot, TeleBot):
             raise TypeError("bot must be an instance of TeleBot")
         self.bot = bot
+        self._runtime: PluginRuntime | None = None
+
+    def bind_runtime(self, runtime: PluginRuntime) -> None:
+        """Attach the shared runtime; ``PluginManager`` calls this before ``register``."""
+        self._runtime = runtime
+
+    @property
+    def runtime(self) -> PluginRuntime:
+        """
+        Shared concurrency services owned by ``PluginManager``.
+
+        Use ``runtime.schedule`` for periodic work and ``runtime.run_coroutine`` for
+        asyncio clients instead of creating threads or event loops.
+
+        Raises:
+            RuntimeError: If the plugin was not registered through ``PluginManager``.
+        """
+        if self._runtime is None:
+            raise RuntimeError("Plugin runtime is not bound")
+        return self._runtime
 
     @abstractmethod
     def register(self) -> None:
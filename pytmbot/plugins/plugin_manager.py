@@ -24,6 +24,7 @@ from telebot import TeleBot
 from pytmbot.logs import Logger
 from pytmbot.plugins.models import PluginsPermissionsModel
 from pytmbot.plugins.plugin_interface import PluginInterface
+from pytmbot.plugins.runtime import PluginRuntime
 from pytmbot.utils import is_running_in_docker
 
 logger = Logger()
@@ -73,6 +74,7 @@ class PluginManager:
         "_plugin_instances",
         "_loaded_plugins",
         "_plugin_resources",
+        "_runtime",
     )
 
     _instance: PluginManager | None = None
@@ -112,6 +114,7 @@ class PluginManager:
                 "execution_timeout_sec": 30,
             }
         }
+        self._runtime = PluginRuntime()
         self._load_blacklist()
         cls = self.__class__
         with cls._instance_lock:
@@ -295,6 +298,11 @@ class PluginManager:
             logger.error("bot.plugins.plugin_manager.add.plugin.fail")
             return False
 
+    @property
+    def runtime(self) -> PluginRuntime:
+        """Runtime handed to every plugin; replaced by :meth:`cleanup_all_plugins`."""
+        return self._runtime
+
     def get_merged_index_keys(self) -> dict[str, str]:
         """
         Retrieves the merged index keys for all registered plugins.
@@ -389,6 +397,7 @@ class PluginManager:
 
             # Create plugin instance
             plugin_instance = plugin_classes[0](bot)
+            plugin_instance.bind_runtime(self._runtime)
 
             # Clean up existing plugin
             self._cleanup_plugin(plugin_name)
@@ -465,3 +474,8 @@ class PluginManager:
                 }
         except Exception:
             logger.error("bot.plugins.plugin_manager.cleaning.fail")
+        finally:
+            # Plugins are cleaned up first so they can still use the runtime to close clients.
+            # Its threads start lazily, so the replacement costs nothing until used.
+            runtime, self._runtime = self._runtime, PluginRuntime()
+            runtime.shutdown()
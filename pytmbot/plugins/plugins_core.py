@@ -12,6 +12,7 @@ from pytmbot import logs
 from pytmbot.keyboards import keyboards as kb
 from pytmbot.middleware.session_manager import SessionManager
 from pytmbot.models import handlers_model
+from pytmbot.plugins.runtime import PluginRuntime
 
 logger = logs.Logger()
 
@@ -28,12 +29,21 @@ class PluginCore:
         "keyboard",
         "handler_models",
         "session_manager",
+        "_runtime",
     )
 
-    def __init__(self) -> None:
+    def __init__(self, runtime: PluginRuntime | None = None) -> None:
         self.settings = g.settings
         self.var_config = g.var_config
         self.logger = logger
         self.keyboard = kb.Keyboards()
         self.handler_models = handlers_model.HandlerManager
         self.session_manager = SessionManager()
+        self._runtime = runtime
+
+    @property
+    def runtime(self) -> PluginRuntime:
+        """Shared event loop and scheduler passed in by the plugin; never start threads."""
+        if self._runtime is None:
+            raise RuntimeError("Plugin runtime is not bound")
+        return self._runtime
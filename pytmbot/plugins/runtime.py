@@ -0,0 +1,228 @@
+#!/usr/local/bin/python3
+"""
+(c) Copyright 2025, Denis Rozhnovskiy <pytelemonbot@mail.ru>
+pyTMBot - A simple Telegram bot to handle Docker containers and images,
+also providing basic information about the status of local servers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import threading
+import time
+from collections.abc import Callable, Coroutine
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Final, TypedDict, TypeVar
+
+from pytmbot.logs import Logger
+from pytmbot.utils.timer_heap import IntervalSource, PeriodicTask, TimerHeap
+
+logger = Logger()
+
+T = TypeVar("T")
+
+PLUGIN_EXECUTOR_MAX_WORKERS: Final[int] = 4
+PLUGIN_TASK_DEFAULT_JITTER: Final[float] = 0.1
+PLUGIN_RUNTIME_SHUTDOWN_TIMEOUT_SECONDS: Final[float] = 5.0
+
+
+class PluginRuntimeStats(TypedDict):
+    loop_running: bool
+    executor_workers: int
+    scheduled_tasks: int
+    task_runs: int
+    task_failures: int
+
+
+class _BackgroundEventLoop:
+    """Event loop running on one daemon thread, started on first use."""
+
+    __slots__ = ("_name", "_lock", "_loop", "_thread")
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+
+    @staticmethod
+    def _serve(loop: asyncio.AbstractEventLoop) -> None:
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+    @property
+    def running(self) -> bool:
+        return self._loop is not None
+
+    def in_loop_thread(self) -> bool:
+        return threading.current_thread() is self._thread
+
+    def ensure_started(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=self._serve, args=(loop,), name=self._name, daemon=True
+                )
+                thread.start()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    def stop(self, timeout: float) -> None:
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop, self._thread = None, None
+        if loop is None or thread is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=timeout)
+
+
+class ScheduledTask(PeriodicTask):
+    """Handle of a periodic task registered with :meth:`PluginRuntime.schedule`."""
+
+    __slots__ = ()
+
+
+def _log_task_failure(task: PeriodicTask, error: Exception) -> None:
+    logger.error(
+        "bot.plugins.runtime.task.fail",
+        task=task.name,
+        error=str(error),
+        error_type=type(error).__name__,
+    )
+
+
+class PluginRuntime:
+    """
+    Concurrency services shared by all plugins.
+
+    Provides one asyncio loop thread and a periodic scheduler whose tasks run on a
+    bounded executor. Each task is rescheduled only after its previous run finished,
+    so slow runs never overlap. All threads start lazily and are stopped by
+    :meth:`shutdown`. ``PluginManager`` owns the instance and hands it to plugins.
+    """
+
+    __slots__ = (
+        "_max_workers",
+        "_loop",
+        "_lock",
+        "_executor",
+        "_timers",
+        "_closed",
+    )
+
+    def __init__(
+        self,
+        *,
+        max_workers: int = PLUGIN_EXECUTOR_MAX_WORKERS,
+        clock: Callable[[], float] = time.monotonic,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        self._max_workers = max_workers
+        self._loop = _BackgroundEventLoop("plugin-event-loop")
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._timers = TimerHeap(
+            "plugin-scheduler",
+            clock=clock,
+            rng=rng,
+            on_error=_log_task_failure,
+            dispatch=self._dispatch_task,
+        )
+        self._closed = False
+
+    def _ensure_open(self) -> None:
+        if self._closed:
+            raise RuntimeError("Plugin runtime is shut down")
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            self._ensure_open()
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix="plugin-worker"
+                )
+            return self._executor
+
+    def submit_coroutine(self, coroutine: Coroutine[object, object, T]) -> Future[T]:
+        """Schedule a coroutine on the shared event loop thread."""
+        self._ensure_open()
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop.ensure_started())
+
+    def run_coroutine(
+        self,
+        coroutine_factory: Callable[[], Coroutine[object, object, T]],
+        *,
+        timeout: float,
+    ) -> T:
+        """Run a coroutine on the shared loop and block the caller for its result."""
+        if self._loop.in_loop_thread():
+            raise RuntimeError("Cannot block on the plugin event loop from itself")
+        future = self.submit_coroutine(coroutine_factory())
+        try:
+            return future.result(timeout=timeout)
+        except TimeoutError:
+            future.cancel()
+            raise
+
+    def schedule(
+        self,
+        name: str,
+        callback: Callable[[], object],
+        *,
+        interval: IntervalSource,
+        jitter: float = PLUGIN_TASK_DEFAULT_JITTER,
+        initial_delay: float | None = None,
+    ) -> ScheduledTask:
+        """
+        Run ``callback`` every ``interval`` seconds until cancelled.
+
+        ``interval`` may be a callable, which is re-evaluated after every run.
+        ``initial_delay`` defaults to one (jittered) interval.
+        """
+        task = ScheduledTask(name, callback, interval, jitter)
+        self._ensure_open()
+        self._timers.add(task, initial_delay)
+        return task
+
+    def _dispatch_task(self, run: Callable[[], None]) -> None:
+        self._get_executor().submit(run)
+
+    def get_stats(self) -> PluginRuntimeStats:
+        tasks = self._timers.tasks()
+        with self._lock:
+            executor_workers = (
+                len(self._executor._threads) if self._executor is not None else 0
+            )
+        return {
+            "loop_running": self._loop.running,
+            "executor_workers": executor_workers,
+            "scheduled_tasks": len(tasks),
+            "task_runs": sum(task.runs for task in tasks),
+            "task_failures": sum(task.failures for task in tasks),
+        }
+
+    def shutdown(
+        self, timeout: float = PLUGIN_RUNTIME_SHUTDOWN_TIMEOUT_SECONDS
+    ) -> None:
+        """Cancel scheduled tasks and stop the loop, scheduler and executor threads."""
+        with self._lock:
+            self._closed = True
+            executor, self._executor = self._executor, None
+        self._timers.shutdown(timeout)
+        self._loop.stop(timeout)
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+__all__ = [
+    "PluginRuntime",
+    "PluginRuntimeStats",
+    "ScheduledTask",
+]
@@ -0,0 +1,465 @@
+#!/usr/local/bin/python3
+"""
+(c) Copyright 2025, Denis Rozhnovskiy <pytelemonbot@mail.ru>
+pyTMBot - A simple Telegram bot to handle Docker containers and images,
+also providing basic information about the status of local servers.
+
+Asyncio long-polling engine.
+
+``getUpdates`` runs on one keep-alive aiohttp session and the next poll is issued as
+soon as a batch has been queued, so Telegram round trips overlap with handler work.
+Updates are dispatched by a bounded worker pool that keeps each chat's updates in
+order while different chats run concurrently; queueing blocks the poller once
+``max_pending`` updates are waiting. Handlers still run through
+``TeleBot.process_new_updates`` (middlewares included) on worker threads.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Final, TypedDict
+
+import aiohttp
+from telebot import TeleBot, apihelper
+from telebot.apihelper import ApiTelegramException
+from telebot.types import Update
+
+from pytmbot.health_system.telegram_activity import telegram_activity
+from pytmbot.logs import BaseComponent
+
+ASYNC_POLLING_WORKERS: Final[int] = 8
+ASYNC_POLLING_MAX_PENDING: Final[int] = 256
+ASYNC_POLLING_BACKOFF_BASE_SECONDS: Final[float] = 1.0
+ASYNC_POLLING_BACKOFF_MAX_SECONDS: Final[float] = 300.0
+ASYNC_POLLING_MAX_RETRY_AFTER_SECONDS: Final[float] = 300.0
+ASYNC_POLLING_DRAIN_TIMEOUT_SECONDS: Final[float] = 5.0
+ASYNC_POLLING_LATENCY_SAMPLES: Final[int] = 512
+
+_DEFAULT_API_URL: Final[str] = "https://api.telegram.org/bot{0}/{1}"
+# Retrying cannot fix these; they are raised for the caller's conflict and
+# critical-error handling.
+_FATAL_ERROR_CODES: Final[frozenset[int]] = frozenset({401, 403, 404, 409})
+# Paths to the chat (or, failing that, the user) that owns an update payload.
+_CHAT_KEY_PATHS: Final[tuple[tuple[str, ...], ...]] = (
+    ("chat", "id"),
+    ("message", "chat", "id"),
+    ("from", "id"),
+)
+
+type JsonObject = Mapping[str, object]
+type LaneKey = int | str
+
+
+class AsyncPollingStats(TypedDict):
+    running: bool
+    polls: int
+    updates_received: int
+    updates_dispatched: int
+    dispatch_failures: int
+    pending: int
+    retry_after_waits: int
+    backoff_waits: int
+    latency_ms_p95: float
+    latency_ms_max: float
+    updates_per_second: float
+
+
+def update_chat_key(raw_update: JsonObject) -> int | None:
+    """Chat (or user) whose updates must be handled in order, if any."""
+    for payload in raw_update.values():
+        if not isinstance(payload, Mapping):
+            continue
+        for path in _CHAT_KEY_PATHS:
+            value: object = payload
+            for key in path:
+                value = value.get(key) if isinstance(value, Mapping) else None
+            if isinstance(value, int):
+                return value
+    return None
+
+
+class PollingBackoff:
+    """Exponential backoff with ``±jitter`` spread; ``reset`` after a success."""
+
+    __slots__ = ("base", "maximum", "jitter", "attempts", "_rng")
+
+    def __init__(
+        self,
+        base: float = ASYNC_POLLING_BACKOFF_BASE_SECONDS,
+        maximum: float = ASYNC_POLLING_BACKOFF_MAX_SECONDS,
+        jitter: float = 0.1,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        self.base = base
+        self.maximum = maximum
+        self.jitter = jitter
+        self.attempts = 0
+        self._rng = rng
+
+    def next_delay(self) -> float:
+        delay = min(self.maximum, self.base * 2.0**self.attempts)
+        self.attempts += 1
+        return delay * (1.0 + self.jitter * (2.0 * self._rng() - 1.0))
+
+    def reset(self) -> None:
+        self.attempts = 0
+
+
+@dataclass(slots=True)
+class _QueuedUpdate:
+    update: Update
+    received_at: float
+
+
+@dataclass(slots=True)
+class _Counters:
+    polls: int = 0
+    updates_received: int = 0
+    updates_dispatched: int = 0
+    dispatch_failures: int = 0
+    retry_after_waits: int = 0
+    backoff_waits: int = 0
+    started_at: float | None = None
+    latencies_ms: deque[float] = field(
+        default_factory=lambda: deque(maxlen=ASYNC_POLLING_LATENCY_SAMPLES)
+    )
+
+
+class AsyncPoller(BaseComponent):
+    """
+    Long-poll Telegram on an asyncio loop and dispatch updates per chat in order.
+
+    :meth:`run` blocks the calling thread until :meth:`stop` is called (from any
+    thread) or a non-retryable API error is raised. Connection errors and 5xx
+    responses are retried with :class:`PollingBackoff`; 429 responses wait exactly
+    ``retry_after`` seconds. Stopping is final for an instance.
+    """
+
+    __slots__ = (
+        "_bot",
+        "_api_url",
+        "_long_polling_timeout",
+        "_request_timeout",
+        "_workers",
+        "_max_pending",
+        "_skip_pending",
+        "_backoff",
+        "_clock",
+        "_lock",
+        "_loop",
+        "_stop_event",
+        "_stop_requested",
+        "_running",
+        "_lanes",
+        "_ready",
+        "_capacity",
+        "_pending",
+        "_counters",
+    )
+
+    def __init__(
+        self,
+        bot: TeleBot,
+        *,
+        long_polling_timeout: int,
+        request_timeout: float,
+        workers: int = ASYNC_POLLING_WORKERS,
+        max_pending: int = ASYNC_POLLING_MAX_PENDING,
+        skip_pending: bool = True,
+        api_url: str | None = None,
+        backoff: PollingBackoff | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if workers <= 0 or max_pending <= 0:
+            raise ValueError("Workers and pending capacity must be positive")
+        super().__init__("async_polling")
+        self._bot = bot
+        self._api_url = (api_url or apihelper.API_URL or _DEFAULT_API_URL).format(
+            bot.token, "getUpdates"
+        )
+        self._long_polling_timeout = long_polling_timeout
+        self._request_timeout = request_timeout
+        self._workers = workers
+        self._max_pending = max_pending
+        self._skip_pending = skip_pending
+        self._backoff = backoff or PollingBackoff()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._stop_event: asyncio.Event | None = None
+        self._stop_requested = False
+        self._running = False
+        self._lanes: dict[LaneKey, deque[_QueuedUpdate]] = {}
+        self._ready: asyncio.Queue[LaneKey] | None = None
+        self._capacity: asyncio.Semaphore | None = None
+        self._pending = 0
+        self._counters = _Counters()
+
+    @property
+    def stop_requested(self) -> bool:
+        with self._lock:
+            return self._stop_requested
+
+    def run(self) -> None:
+        """Poll and dispatch until stopped; non-retryable API errors propagate."""
+        with self._lock:
+            if self._running:
+                raise RuntimeError("Async poller is already running")
+            if self._stop_requested:
+                return
+            self._running = True
+
+        # Handlers must run on our per-chat workers, not on telebot's thread pool.
+        previous_threaded = self._bot.threaded
+        self._bot.threaded = False
+        try:
+            asyncio.run(self._serve())
+        finally:
+            self._bot.threaded = previous_threaded
+            with self._lock:
+                self._running = False
+                self._loop = None
+                self._stop_event = None
+
+    def stop(self) -> None:
+        """Stop polling; queued updates get a short grace period to finish."""
+        with self._lock:
+            self._stop_requested = True
+            loop, stop_event = self._loop, self._stop_event
+        if loop is not None and stop_event is not None:
+            try:
+                loop.call_soon_threadsafe(stop_event.set)
+            except RuntimeError:
+                pass
+
+    async def _serve(self) -> None:
+        stop_event = asyncio.Event()
+        with self._lock:
+            self._loop = asyncio.get_running_loop()
+            self._stop_event = stop_event
+            if self._stop_requested:
+                return
+        self._ready = asyncio.Queue()
+        self._capacity = asyncio.Semaphore(self._max_pending)
+        self._counters.started_at = self._clock()
+
+        with self.log_context(
+            workers=self._workers,
+            max_pending=self._max_pending,
+            long_polling_timeout=self._long_polling_timeout,
+        ) as log:
+            log.info("bot.core.async.polling.start")
+
+        executor = ThreadPoolExecutor(
+            max_workers=self._workers, thread_name_prefix="async-polling"
+        )
+        connector = aiohttp.TCPConnector(limit=2, keepalive_timeout=75.0)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            workers = [
+                asyncio.create_task(self._worker(executor))
+                for _ in range(self._workers)
+            ]
+            poller = asyncio.create_task(self._poll_loop(session))
+            stopper = asyncio.create_task(stop_event.wait())
+            try:
+                await asyncio.wait(
+                    {poller, stopper}, return_when=asyncio.FIRST_COMPLETED
+                )
+                if poller.done():
+                    poller.result()
+            finally:
+                poller.cancel()
+                stopper.cancel()
+                await self._drain(ASYNC_POLLING_DRAIN_TIMEOUT_SECONDS)
+                for worker in workers:
+                    worker.cancel()
+                await asyncio.gather(*workers, poller, stopper, return_exceptions=True)
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        with self.log_context(**self.get_stats()) as log:
+            log.info("bot.core.async.polling.stop")
+
+    async def _poll_loop(self, session: aiohttp.ClientSession) -> None:
+        offset = 0
+        if self._skip_pending:
+            skipped = await self._fetch_updates(session, offset=-1, timeout=0)
+            offset = self._next_offset(skipped, offset)
+
+        while True:
+            raw_updates = await self._fetch_updates(
+                session, offset=offset, timeout=self._long_polling_timeout
+            )
+            received_at = self._clock()
+            offset = self._next_offset(raw_updates, offset)
+            for raw_update in raw_updates:
+                await self._enqueue(raw_update, received_at)
+
+    @staticmethod
+    def _next_offset(raw_updates: list[JsonObject], offset: int) -> int:
+        update_ids = [
+            update_id
+            for raw_update in raw_updates
+            if isinstance(update_id := raw_update.get("update_id"), int)
+        ]
+        return max(update_ids) + 1 if update_ids else offset
+
+    async def _fetch_updates(
+        self, session: aiohttp.ClientSession, *, offset: int, timeout: int
+    ) -> list[JsonObject]:
+        payload = {"offset": offset, "timeout": timeout}
+        request_timeout = aiohttp.ClientTimeout(total=timeout + self._request_timeout)
+        while True:
+            try:
+                async with session.post(
+                    self._api_url, json=payload, timeout=request_timeout
+                ) as response:
+                    status = response.status
+                    body: object = await response.json(content_type=None)
+            except (aiohttp.ClientError, TimeoutError, ValueError) as error:
+                await self._backoff_wait(type(error).__name__)
+                continue
+
+            result = body if isinstance(body, Mapping) else {}
+            self._counters.polls += 1
+            updates = result.get("result")
+            if result.get("ok") is True and isinstance(updates, list):
+                self._backoff.reset()
+                telegram_activity.record_success("getUpdates")
+                received = [update for update in updates if isinstance(update, Mapping)]
+                self._counters.updates_received += len(received)
+                return received
+
+            error_code = result.get("error_code", status)
+            parameters = result.get("parameters")
+            retry_after = (
+                parameters.get("retry_after")
+                if isinstance(parameters, Mapping)
+                else None
+            )
+            if error_code == 429 and isinstance(retry_after, int | float):
+                self._counters.retry_after_waits += 1
+                delay = min(float(retry_after), ASYNC_POLLING_MAX_RETRY_AFTER_SECONDS)
+                with self.log_context(retry_after=delay) as log:
+                    log.warning("bot.core.async.polling.retry_after.warn")
+                await asyncio.sleep(delay)
+                continue
+            if error_code in _FATAL_ERROR_CODES:
+                # Typed wrapper around telebot's untyped exception constructor.
+                api_error: Callable[..., ApiTelegramException] = ApiTelegramException
+                raise api_error(
+                    "getUpdates",
+                    response,
+                    {
+                        "error_code": error_code,
+                        "description": result.get("description", "getUpdates failed"),
+                    },
+                )
+            await self._backoff_wait(f"http_{error_code}")
+
+    async def _backoff_wait(self, reason: str) -> None:
+        delay = self._backoff.next_delay()
+        self._counters.backoff_waits += 1
+        with self.log_context(
+            reason=reason, attempt=self._backoff.attempts, retry_delay=round(delay, 2)
+        ) as log:
+            log.warning("bot.core.async.polling.backoff.warn")
+        await asyncio.sleep(delay)
+
+    async def _enqueue(self, raw_update: JsonObject, received_at: float) -> None:
+        # Typed wrapper around telebot's untyped parser.
+        parse_update: Callable[[dict[str, object]], Update | None] = Update.de_json
+        update = parse_update(dict(raw_update))
+        if update is None or self._capacity is None or self._ready is None:
+            return
+        await self._capacity.acquire()
+        self._pending += 1
+        # Updates without a chat are unordered: each gets a lane of its own.
+        chat_key = update_chat_key(raw_update)
+        lane_key: LaneKey = (
+            chat_key if chat_key is not None else f"update:{update.update_id}"
+        )
+        item = _QueuedUpdate(update=update, received_at=received_at)
+        lane = self._lanes.get(lane_key)
+        if lane is not None:
+            lane.append(item)
+            return
+        self._lanes[lane_key] = deque((item,))
+        self._ready.put_nowait(lane_key)
+
+    async def _worker(self, executor: ThreadPoolExecutor) -> None:
+        assert self._ready is not None and self._capacity is not None
+        loop = asyncio.get_running_loop()
+        while True:
+            lane_key = await self._ready.get()
+            lane = self._lanes[lane_key]
+            while lane:
+                item = lane.popleft()
+                self._counters.latencies_ms.append(
+                    (self._clock() - item.received_at) * 1000
+                )
+                try:
+                    await loop.run_in_executor(executor, self._dispatch, item.update)
+                    self._counters.updates_dispatched += 1
+                except Exception as error:
+                    self._counters.dispatch_failures += 1
+                    with self.log_context(
+                        update_id=item.update.update_id,
+                        error=str(error),
+                        error_type=type(error).__name__,
+                    ) as log:
+                        log.error("bot.core.async.polling.dispatch.fail")
+                finally:
+                    self._pending -= 1
+                    self._capacity.release()
+            del self._lanes[lane_key]
+
+    def _dispatch(self, update: Update) -> None:
+        self._bot.process_new_updates([update])
+
+    async def _drain(self, timeout: float) -> None:
+        deadline = self._clock() + timeout
+        while self._pending and self._clock() < deadline:
+            await asyncio.sleep(0.01)
+
+    def get_stats(self) -> AsyncPollingStats:
+        counters = self._counters
+        latencies = sorted(counters.latencies_ms)
+        elapsed = (
+            self._clock() - counters.started_at
+            if counters.started_at is not None
+            else 0.0
+        )
+        with self._lock:
+            running = self._running
+        return {
+            "running": running,
+            "polls": counters.polls,
+            "updates_received": counters.updates_received,
+            "updates_dispatched": counters.updates_dispatched,
+            "dispatch_failures": counters.dispatch_failures,
+            "pending": self._pending,
+            "retry_after_waits": counters.retry_after_waits,
+            "backoff_waits": counters.backoff_waits,
+            "latency_ms_p95": round(
+                latencies[int(0.95 * (len(latencies) - 1))] if latencies else 0.0, 3
+            ),
+            "latency_ms_max": round(latencies[-1] if latencies else 0.0, 3),
+            "updates_per_second": round(
+                counters.updates_dispatched / elapsed if elapsed > 0 else 0.0, 3
+            ),
+        }
+
+
+__all__ = [
+    "AsyncPoller",
+    "AsyncPollingStats",
+    "PollingBackoff",
+    "update_chat_key",
+]
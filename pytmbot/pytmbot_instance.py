@@ -26,6 +26,8 @@ from telebot.apihelper import ApiTelegramException
 from telebot.types import BotCommand
 
 from pytmbot import exceptions
+from pytmbot.agent.protocol import parse_endpoint
+from pytmbot.agent.server import start_agent_ingestion
 from pytmbot.exceptions import ErrorContext, InitializationError
 from pytmbot.globals import (
     __version__,
@@ -38,13 +40,20 @@ from pytmbot.handlers.handler_manager import (
     handler_factory,
     inline_handler_factory,
 )
+from pytmbot.handlers.handlers_util.static_screens import prebuild_static_screens
+from pytmbot.health_system.telegram_activity import install_activity_probe
 from pytmbot.logs import BaseComponent, Logger
 from pytmbot.middleware.access_control import AccessControl
+from pytmbot.middleware.fused_guard import FusedGuard
 from pytmbot.middleware.rate_limit import RateLimit
 from pytmbot.middleware.update_dedup import UpdateDedup
 from pytmbot.models.handlers_model import HandlerManager
 from pytmbot.plugins.plugin_manager import PluginManager
+from pytmbot.polling import AsyncPoller
 from pytmbot.utils import get_environment_state, parse_cli_args, sanitize_exception
+from pytmbot.utils.cli import PollingEngine
+from pytmbot.utils.housekeeping import get_housekeeping_stats
+from pytmbot.utils.outbound_queue import OutboundQueue, install_outbound_queue
 
 
 class BotState(Enum):
@@ -130,6 +139,13 @@ DEFAULT_MIDDLEWARES: Final[list[MiddlewareType]] = [
     (RateLimit, {"limit": 8, "period": timedelta(seconds=10)}),
 ]
 
+FUSED_MIDDLEWARES: Final[list[MiddlewareType]] = [
+    (
+        FusedGuard,
+        {"limit": 8, "period": timedelta(seconds=10), "dedup_ttl_seconds": 120.0},
+    ),
+]
+
 CONFLICT_RESOLUTION_STRATEGY: Final[ConflictResolutionStrategy] = (
     ConflictResolutionStrategy.GRACEFUL_SHUTDOWN
 )
@@ -164,6 +180,8 @@ class PyTMBot(BaseComponent):
         "_shutdown_timeout_occurred",
         "_rate_limit_consecutive",
         "_rate_limit_open_until",
+        "_outbound_queue",
+        "_async_poller",
     )
 
     def __init__(self) -> None:
@@ -177,6 +195,8 @@ class PyTMBot(BaseComponent):
         self._shutdown_timeout_occurred = False
         self._rate_limit_consecutive = 0
         self._rate_limit_open_until: datetime | None = None
+        self._outbound_queue: OutboundQueue | None = None
+        self._async_poller: AsyncPoller | None = None
 
         # Initialize session
         self._session = BotSession.create(
@@ -425,6 +445,7 @@ class PyTMBot(BaseComponent):
 
             def stop_polling_task() -> bool:
                 try:
+                    self.stop_async_polling()
                     bot = self.bot
                     if bot is None:
                         return True
@@ -522,13 +543,18 @@ class PyTMBot(BaseComponent):
     def _create_base_bot(self, bot_token: str) -> TeleBot:
         """Create base TeleBot instance."""
         try:
-            return telebot.TeleBot(
+            bot = telebot.TeleBot(
                 token=bot_token,
                 threaded=True,
                 use_class_middlewares=True,
                 exception_handler=exceptions.TelebotExceptionHandler(),
                 skip_pending=True,
             )
+            # Chat-bound calls are rate-shaped; successful API traffic doubles
+            # as the passive Telegram health signal.
+            self._outbound_queue = install_outbound_queue()
+            install_activity_probe()
+            return bot
         except Exception as e:
             with self.log_context(
                 error=sanitize_exception(e),
@@ -745,9 +771,15 @@ class PyTMBot(BaseComponent):
         try:
             # Group related operations with progress indicators
             self._setup_commands_and_description()
-            self._setup_middleware_chain(DEFAULT_MIDDLEWARES)
+            self._setup_middleware_chain(
+                FUSED_MIDDLEWARES
+                if settings.access_control.fused_middleware
+                else DEFAULT_MIDDLEWARES
+            )
             self._register_handler_chain()
             self._load_plugins()
+            prebuild_static_screens(self.plugin_manager)
+            self._start_agent_ingestion()
 
         except Exception as e:
             with self.log_context(
@@ -757,6 +789,29 @@ class PyTMBot(BaseComponent):
                 log.error("bot.core.config.fail")
             raise
 
+    def _start_agent_ingestion(self) -> None:
+        """Start the agent ingestion server when ``agent_server`` is configured."""
+        agent_settings = settings.agent_server
+        if agent_settings is None:
+            return
+        try:
+            server = start_agent_ingestion(
+                parse_endpoint(agent_settings.listen[0]),
+                [secret.get_secret_value() for secret in agent_settings.secret],
+                host_secrets={
+                    host_id: secret.get_secret_value()
+                    for host_id, secret in agent_settings.host_secrets.items()
+                },
+                stale_after_seconds=float(agent_settings.stale_after_seconds),
+                max_agents=agent_settings.max_agents,
+            )
+            with self.log_context(listen=server.get_stats()["listen"]) as log:
+                log.info("bot.core.agent.ingestion.start")
+        except Exception as e:
+            # Remote hosts are optional; the bot keeps serving the local one.
+            with self.log_context(error=sanitize_exception(e)) as log:
+                log.error("bot.core.agent.ingestion.fail")
+
     def initialize_bot_core(self) -> TeleBot:
         """Initialize bot core components."""
         try:
@@ -893,6 +948,26 @@ class PyTMBot(BaseComponent):
             log.critical("bot.core.unexpected.polling.fail")
         raise error
 
+    def _polling_engine(self) -> PollingEngine:
+        engine = getattr(self.args, "polling_engine", PollingEngine.THREADED)
+        return PollingEngine(engine)
+
+    def _run_async_polling(self, bot_instance: TeleBot) -> bool:
+        """Run the asyncio polling engine; return True once it was stopped on request."""
+        if self._async_poller is None:
+            self._async_poller = AsyncPoller(
+                bot_instance,
+                long_polling_timeout=var_config.bot_long_polling_timeout,
+                request_timeout=var_config.bot_polling_timeout,
+            )
+        self._async_poller.run()
+        return self._async_poller.stop_requested
+
+    def stop_async_polling(self) -> None:
+        """Stop the asyncio polling engine if it is in use."""
+        if self._async_poller is not None:
+            self._async_poller.stop()
+
     def _start_polling_loop(self, bot_instance: TeleBot) -> None:
         """Start polling loop with exponential backoff on errors."""
         current_sleep_time = DEFAULT_BASE_SLEEP_TIME
@@ -901,6 +976,7 @@ class PyTMBot(BaseComponent):
         with self.log_context(
             timeout=var_config.bot_polling_timeout,
             long_polling_timeout=var_config.bot_long_polling_timeout,
+            engine=str(self._polling_engine()),
             session_id=self._session.session_id if self._session else "unknown",
         ) as log:
             log.info("bot.core.polling.loop.start")
@@ -908,11 +984,15 @@ class PyTMBot(BaseComponent):
         with self._polling_safety_context():
             while True:
                 try:
-                    bot_instance.infinity_polling(
-                        skip_pending=True,
-                        timeout=var_config.bot_polling_timeout,
-                        long_polling_timeout=var_config.bot_long_polling_timeout,
-                    )
+                    if self._polling_engine() is PollingEngine.ASYNC:
+                        if self._run_async_polling(bot_instance):
+                            break
+                    else:
+                        bot_instance.infinity_polling(
+                            skip_pending=True,
+                            timeout=var_config.bot_polling_timeout,
+                            long_polling_timeout=var_config.bot_long_polling_timeout,
+                        )
 
                     # Reset backoff on successful polling
                     if consecutive_errors > 0:
@@ -982,4 +1062,12 @@ class PyTMBot(BaseComponent):
             if rate_limit_stats:
                 stats["rate_limit_stats"] = rate_limit_stats
 
+        if self._outbound_queue is not None:
+            stats["outbound_queue_stats"] = dict(self._outbound_queue.get_stats())
+        housekeeping_stats = get_housekeeping_stats()
+        if housekeeping_stats is not None:
+            stats["housekeeping_stats"] = dict(housekeeping_stats)
+        if self._async_poller is not None:
+            stats["async_polling_stats"] = dict(self._async_poller.get_stats())
+
         return stats
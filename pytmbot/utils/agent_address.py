@@ -0,0 +1,54 @@
+#!/usr/local/bin/python3
+"""
+(c) Copyright 2025, Denis Rozhnovskiy <pytelemonbot@mail.ru>
+pyTMBot - A simple Telegram bot to handle Docker containers and images,
+also providing basic information about the status of local servers.
+
+Agent addresses and host ids, shared by the settings model and the agent package.
+Stdlib-only, so the agent process stays small.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Final, NamedTuple
+
+HOST_ID_PATTERN: Final[re.Pattern[str]] = re.compile(r"^[A-Za-z0-9._-]{1,32}$")
+
+
+class AgentEndpoint(NamedTuple):
+    """Parsed ``tcp://host:port`` or ``unix:///path`` address."""
+
+    scheme: str
+    host: str = ""
+    port: int = 0
+    path: str = ""
+
+    def __str__(self) -> str:
+        if self.scheme == "unix":
+            return f"unix://{self.path}"
+        return f"tcp://{self.host}:{self.port}"
+
+
+def parse_endpoint(value: str) -> AgentEndpoint:
+    """Parse an agent channel address; raises ``ValueError`` on anything else."""
+    scheme, separator, rest = value.strip().partition("://")
+    if not separator or not rest:
+        raise ValueError(f"Invalid agent endpoint: '{value}'")
+    if scheme == "unix":
+        if not rest.startswith("/"):
+            raise ValueError(f"Unix agent endpoint must be absolute: '{value}'")
+        return AgentEndpoint("unix", path=rest)
+    if scheme == "tcp":
+        host, _, raw_port = rest.rpartition(":")
+        if not host or not raw_port.isdigit() or int(raw_port) > 65535:
+            raise ValueError(f"Invalid TCP agent endpoint: '{value}'")
+        return AgentEndpoint("tcp", host=host.strip("[]"), port=int(raw_port))
+    raise ValueError(f"Unsupported agent endpoint scheme: '{scheme}'")
+
+
+__all__ = [
+    "HOST_ID_PATTERN",
+    "AgentEndpoint",
+    "parse_endpoint",
+]
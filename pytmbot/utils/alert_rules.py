@@ -0,0 +1,133 @@
+#!/usr/local/bin/python3
+"""
+(c) Copyright 2025, Denis Rozhnovskiy <pytelemonbot@mail.ru>
+pyTMBot - A simple Telegram bot to handle Docker containers and images,
+also providing basic information about the status of local servers.
+
+Alert rule grammar, shared by the settings model and the monitor plugin.
+Stdlib-only, so validating the config does not import the plugin.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Final, Literal, cast
+
+type AggregateName = Literal["avg", "min", "max", "rate", "pct"]
+type Comparison = Literal[">", ">=", "<", "<="]
+
+METRIC_FAMILIES: Final[frozenset[str]] = frozenset(
+    {"cpu", "memory", "load", "disk", "temp", "fan"}
+)
+# Families whose samples come in several named series (``disk:/dev/sda1``).
+MULTI_SERIES_FAMILIES: Final[frozenset[str]] = frozenset({"disk", "temp", "fan"})
+MAX_WINDOW_SECONDS: Final[float] = 24 * 3600.0
+
+_UNIT_SECONDS: Final[dict[str, float]] = {"s": 1.0, "m": 60.0, "h": 3600.0}
+_RULE_PATTERN: Final = re.compile(
+    r"^\s*(?P<func>avg|min|max|rate|p(?P<pct>[1-9][0-9]?))\s*\(\s*"
+    r"(?P<family>[a-z]+)(?::(?P<series>[^,()]+?))?\s*,\s*"
+    r"(?P<window>[0-9]+(?:\.[0-9]+)?)(?P<unit>[smh])\s*\)\s*"
+    r"(?P<op>>=|<=|>|<)\s*(?P<threshold>-?[0-9]+(?:\.[0-9]+)?)\s*$"
+)
+
+
+@dataclass(frozen=True, slots=True)
+class AlertRule:
+    """A parsed ``func(metric, window) op threshold`` rule with hysteresis."""
+
+    name: str
+    expr: str
+    function: AggregateName
+    family: str
+    series: str | None
+    window_seconds: float
+    op: Comparison
+    threshold: float
+    clear: float
+    cooldown_seconds: float
+    percentile: int = 0
+
+    def matches(self, series_key: str) -> bool:
+        family, _, series = series_key.partition(":")
+        if family != self.family:
+            return False
+        return self.series is None or self.series == series
+
+    def breached(self, value: float) -> bool:
+        match self.op:
+            case ">":
+                return value > self.threshold
+            case ">=":
+                return value >= self.threshold
+            case "<":
+                return value < self.threshold
+            case _:
+                return value <= self.threshold
+
+    def cleared(self, value: float) -> bool:
+        """Whether ``value`` is back on the safe side of the clear threshold."""
+        if self.op in (">", ">="):
+            return value < self.clear
+        return value > self.clear
+
+
+def parse_rule(
+    expr: str,
+    *,
+    clear: float | None = None,
+    cooldown_seconds: float = 0.0,
+    name: str | None = None,
+) -> AlertRule:
+    """
+    Parse ``expr`` such as ``p95(memory, 10m) > 90`` or ``rate(disk:/dev/sda1, 1h) > 2``.
+
+    Functions are ``avg``, ``min``, ``max``, ``rate`` (change per minute) and
+    ``p1``..``p99``. ``disk``, ``temp`` and ``fan`` without a ``:series`` suffix apply
+    to every disk or sensor. ``clear`` is the hysteresis threshold that resolves the alert and
+    defaults to ``threshold``.
+
+    Raises:
+        ValueError: If the expression or the clear threshold is invalid.
+    """
+    matched = _RULE_PATTERN.match(expr)
+    if matched is None:
+        raise ValueError(f"Invalid alert rule expression: '{expr}'")
+
+    family = matched["family"]
+    if family not in METRIC_FAMILIES:
+        raise ValueError(f"Unknown metric '{family}' in alert rule: '{expr}'")
+    series = matched["series"].strip() if matched["series"] else None
+    if series is not None and family not in MULTI_SERIES_FAMILIES:
+        raise ValueError(f"Metric '{family}' has no named series: '{expr}'")
+
+    window_seconds = float(matched["window"]) * _UNIT_SECONDS[matched["unit"]]
+    if not 0 < window_seconds <= MAX_WINDOW_SECONDS:
+        raise ValueError(f"Alert rule window must be within 24h: '{expr}'")
+
+    op = cast(Comparison, matched["op"])
+    threshold = float(matched["threshold"])
+    clear_threshold = threshold if clear is None else float(clear)
+    if (op in (">", ">=") and clear_threshold > threshold) or (
+        op in ("<", "<=") and clear_threshold < threshold
+    ):
+        raise ValueError(
+            f"Clear threshold {clear_threshold:g} is on the alerting side of '{expr}'"
+        )
+
+    function = cast(AggregateName, "pct" if matched["pct"] else matched["func"])
+    normalized = " ".join(expr.split())
+    return AlertRule(
+        name=name or normalized,
+        expr=normalized,
+        function=function,
+        family=family,
+        series=series,
+        window_seconds=window_seconds,
+        op=op,
+        threshold=threshold,
+        clear=clear_threshold,
+        cooldown_seconds=max(0.0, float(cooldown_seconds)),
+        percentile=int(matched["pct"] or 0),
+    )
@@ -20,6 +20,13 @@ class BotMode(StrEnum):
     PROD = "prod"
 
 
+class PollingEngine(StrEnum):
+    """Long-polling implementations."""
+
+    THREADED = "threaded"
+    ASYNC = "async"
+
+
 class LogLevel(StrEnum):
     """Available log levels."""
 
@@ -53,6 +60,7 @@ class CLIDefaults:
     COLORIZE_LOGS: Final[bool] = True
     WEBHOOK: Final[bool] = False
     SOCKET_HOST: Final[str] = "127.0.0.1"
+    POLLING_ENGINE: Final[PollingEngine] = PollingEngine.THREADED
     PLUGINS: Final[list[str]] = []
     HEALTH_CHECK: Final[bool] = False
 
@@ -204,6 +212,15 @@ Examples:
         help=f"Socket host for webhook mode (default: {CLIDefaults.SOCKET_HOST})",
     )
 
+    parser.add_argument(
+        "--polling_engine",
+        type=PollingEngine,
+        choices=list(PollingEngine),
+        default=CLIDefaults.POLLING_ENGINE,
+        help="Polling implementation: telebot's threaded loop or the asyncio "
+        f"pipelined engine (default: {CLIDefaults.POLLING_ENGINE})",
+    )
+
     # Plugin configuration
     parser.add_argument(
         "--plugins",
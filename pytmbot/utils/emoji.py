@@ -5,9 +5,13 @@ pyTMBot - A simple Telegram bot to handle Docker containers and images,
 also providing basic information about the status of local servers.
 """
 
-from functools import cached_property
+from functools import lru_cache
 from importlib import import_module
-from typing import Protocol, cast, runtime_checkable
+from typing import Final, Protocol, cast, runtime_checkable
+
+from pytmbot.utils.emoji_table import EMOJI_TABLE
+
+EMOJI_FALLBACK_CACHE_SIZE: Final[int] = 256
 
 
 @runtime_checkable
@@ -15,14 +19,40 @@ class _EmojiModule(Protocol):
     def emojize(self, text: str) -> str: ...
 
 
-class EmojiConverter:
-    @cached_property
-    def emoji_library(self) -> _EmojiModule:
+@lru_cache(maxsize=1)
+def _load_emoji_library() -> _EmojiModule | None:
+    """Import the ``emoji`` package on demand; ``None`` when it is not installed."""
+    try:
         library = import_module("emoji")
-        if not callable(getattr(library, "emojize", None)):
-            raise TypeError("emoji module does not expose emojize(str) -> str")
-        return cast(_EmojiModule, library)
+    except ImportError:
+        return None
+    if not callable(getattr(library, "emojize", None)):
+        raise TypeError("emoji module does not expose emojize(str) -> str")
+    return cast(_EmojiModule, library)
+
+
+@lru_cache(maxsize=EMOJI_FALLBACK_CACHE_SIZE)
+def _emojize_fallback(emoji_name: str) -> str:
+    emoji_str = f":{emoji_name}:"
+    library = _load_emoji_library()
+    if library is None:
+        return emoji_str
+    return str(library.emojize(emoji_str))
+
+
+class EmojiConverter:
+    """
+    Resolve emoji aliases through the generated ``EMOJI_TABLE``.
+
+    Aliases missing from the table (e.g. custom keyboard settings) fall back to
+    ``emoji.emojize`` when the package is installed; unresolved names are returned
+    as ``:name:`` just like ``emojize`` does.
+    """
+
+    __slots__ = ()
 
     def get_emoji(self, emoji_name: str) -> str:
-        emoji_str = f":{emoji_name}:"
-        return str(self.emoji_library.emojize(emoji_str))
+        glyph = EMOJI_TABLE.get(emoji_name)
+        if glyph is not None:
+            return glyph
+        return _emojize_fallback(emoji_name)
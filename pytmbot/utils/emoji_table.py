@@ -0,0 +1,101 @@
+#!/usr/local/bin/python3
+"""
+(c) Copyright 2025, Denis Rozhnovskiy <pytelemonbot@mail.ru>
+pyTMBot - A simple Telegram bot to handle Docker containers and images,
+also providing basic information about the status of local servers.
+
+Generated by tools/build_emoji_table.py - do not edit by hand.
+"""
+
+from typing import Final
+
+EMOJI_TABLE: Final[dict[str, str]] = {
+    "BACK_arrow": "🔙",
+    "ID_button": "🆔",
+    "abacus": "🧮",
+    "aerial_tramway": "🚡",
+    "alarm_clock": "⏰",
+    "antenna_bars": "📶",
+    "anxious_face_with_sweat": "😰",
+    "backhand_index_pointing_down": "👇",
+    "banjo": "🪕",
+    "bar_chart": "📊",
+    "basket": "🧺",
+    "battery": "🔋",
+    "bookmark_tabs": "📑",
+    "books": "📚",
+    "brain": "🧠",
+    "briefcase": "💼",
+    "bullet_train": "🚅",
+    "bullseye": "🎯",
+    "calendar": "📅",
+    "chart_increasing": "📈",
+    "computer_disk": "💽",
+    "computer_mouse": "🖱️",
+    "cooking": "🍳",
+    "cross_mark": "❌",
+    "crying_face": "😢",
+    "desktop_computer": "🖥️",
+    "double_exclamation_mark": "‼️",
+    "down-right_arrow": "↘️",
+    "down_arrow": "⬇️",
+    "electric_plug": "🔌",
+    "eyes": "👀",
+    "first_quarter_moon": "🌓",
+    "flag_in_hole": "⛳",
+    "floppy_disk": "💾",
+    "flying_saucer": "🛸",
+    "fountain_pen": "🖋️",
+    "framed_picture": "🖼️",
+    "gear": "⚙️",
+    "globe_showing_Europe-Africa": "🌍",
+    "globe_with_meridians": "🌐",
+    "glowing_star": "🌟",
+    "herb": "🌿",
+    "horizontal_traffic_light": "🚥",
+    "hourglass_not_done": "⏳",
+    "house": "🏠",
+    "information": "ℹ️",
+    "key": "🔑",
+    "label": "🏷️",
+    "lollipop": "🍭",
+    "low_battery": "🪫",
+    "luggage": "🧳",
+    "magnifying_glass_tilted_left": "🔍",
+    "mantelpiece_clock": "🕰️",
+    "melting_face": "🫠",
+    "minus": "➖",
+    "mushroom": "🍄",
+    "next_track_button": "⏭️",
+    "no_entry": "⛔",
+    "oil_drum": "🛢️",
+    "package": "📦",
+    "pager": "📟",
+    "paperclip": "📎",
+    "puzzle_piece": "🧩",
+    "radio": "📻",
+    "radioactive": "☢️",
+    "railway_car": "🚃",
+    "recycling_symbol": "♻️",
+    "red_exclamation_mark": "❗",
+    "right_arrow": "➡️",
+    "ringed_planet": "🪐",
+    "rocket": "🚀",
+    "safety_pin": "🧷",
+    "saluting_face": "🫡",
+    "sandwich": "🥪",
+    "satellite": "🛰️",
+    "shield": "🛡️",
+    "smiling_face_with_open_hands": "🤗",
+    "spiral_calendar": "🗓️",
+    "spouting_whale": "🐳",
+    "stethoscope": "🩺",
+    "stopwatch": "⏱️",
+    "technologist": "🧑‍💻",
+    "thermometer": "🌡️",
+    "thought_balloon": "💭",
+    "toolbox": "🧰",
+    "warning": "⚠️",
+    "whale": "🐋",
+    "wrench": "🔧",
+}
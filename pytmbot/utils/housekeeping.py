@@ -0,0 +1,177 @@
+#!/usr/local/bin/python3
+"""
+(c) Copyright 2025, Denis Rozhnovskiy <pytelemonbot@mail.ru>
+pyTMBot - A simple Telegram bot to handle Docker containers and images,
+also providing basic information about the status of local servers.
+
+Core housekeeping scheduler.
+
+Periodic maintenance (session expiry, block cleanup, deletion bookkeeping, health
+monitoring, CPU sampling) runs as jobs on one ``TimerHeap`` thread instead of one
+sleeping thread per component. Jobs run inline and must stay short; a job is
+rescheduled one (jittered) interval after it finishes, so an overrunning job never
+overlaps itself or triggers a burst of catch-up runs. Bound-method callbacks are held
+weakly: a job cancels itself once its owner has been garbage collected.
+"""
+
+from __future__ import annotations
+
+import functools
+import random
+import threading
+import time
+from collections.abc import Callable
+from typing import Final, TypedDict
+
+from pytmbot.logs import BaseComponent
+from pytmbot.utils.timer_heap import IntervalSource, PeriodicTask, TimerHeap
+
+HOUSEKEEPING_DEFAULT_JITTER: Final[float] = 0.1
+HOUSEKEEPING_SHUTDOWN_TIMEOUT_SECONDS: Final[float] = 5.0
+
+type JobInterval = IntervalSource
+
+
+class HousekeepingJobStats(TypedDict):
+    interval_seconds: float
+    runs: int
+    failures: int
+    overruns: int
+    last_duration_ms: float
+    max_duration_ms: float
+    total_duration_ms: float
+
+
+class HousekeepingStats(TypedDict):
+    running: bool
+    jobs: dict[str, HousekeepingJobStats]
+
+
+class HousekeepingJob(PeriodicTask):
+    """Handle of a job registered with :meth:`HousekeepingScheduler.register`."""
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        name: str,
+        callback: Callable[[], object],
+        interval: JobInterval,
+        jitter: float,
+    ) -> None:
+        super().__init__(name, callback, interval, jitter, weak=True)
+
+    def get_stats(self) -> HousekeepingJobStats:
+        return {
+            "interval_seconds": self.interval,
+            "runs": self.runs,
+            "failures": self.failures,
+            "overruns": self.overruns,
+            "last_duration_ms": round(self.last_duration_ms, 3),
+            "max_duration_ms": round(self.max_duration_ms, 3),
+            "total_duration_ms": round(self.total_duration_ms, 3),
+        }
+
+
+class HousekeepingScheduler(BaseComponent):
+    """
+    Run registered maintenance jobs inline on a single timer-heap thread.
+
+    The thread starts with the first registration and sleeps until the next job is
+    due, so an idle process wakes up only when some job actually has work to do.
+    """
+
+    __slots__ = ("_timers", "_register_lock")
+
+    def __init__(
+        self,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        super().__init__("housekeeping")
+        self._timers = TimerHeap(
+            "housekeeping", clock=clock, rng=rng, on_error=self._log_job_failure
+        )
+        self._register_lock = threading.Lock()
+
+    def _log_job_failure(self, job: PeriodicTask, error: Exception) -> None:
+        with self.log_context(
+            job=job.name,
+            error=str(error),
+            error_type=type(error).__name__,
+        ) as log:
+            log.error("bot.utils.housekeeping.job.fail")
+
+    def register(
+        self,
+        name: str,
+        callback: Callable[[], object],
+        *,
+        interval: JobInterval,
+        jitter: float = HOUSEKEEPING_DEFAULT_JITTER,
+        initial_delay: float | None = None,
+    ) -> HousekeepingJob:
+        """
+        Run ``callback`` every ``interval`` seconds until the job is cancelled.
+
+        ``initial_delay`` defaults to one jittered interval. Registering a name that
+        is already taken cancels the previous job.
+        """
+        job = HousekeepingJob(name, callback, interval, jitter)
+        with self._register_lock:
+            for previous in self._timers.tasks():
+                if previous.name == name:
+                    previous.cancel()
+            try:
+                self._timers.add(job, initial_delay)
+            except RuntimeError:
+                raise RuntimeError("Housekeeping scheduler is shut down") from None
+        return job
+
+    def get_stats(self) -> HousekeepingStats:
+        return {
+            "running": self._timers.running,
+            "jobs": {
+                job.name: job.get_stats()
+                for job in self._timers.tasks()
+                if isinstance(job, HousekeepingJob)
+            },
+        }
+
+    def shutdown(self, timeout: float = HOUSEKEEPING_SHUTDOWN_TIMEOUT_SECONDS) -> None:
+        """Cancel all jobs and stop the scheduler thread."""
+        self._timers.shutdown(timeout)
+
+
+@functools.lru_cache(maxsize=1)
+def get_housekeeping_scheduler() -> HousekeepingScheduler:
+    """Return the process-wide housekeeping scheduler."""
+    return HousekeepingScheduler()
+
+
+def get_housekeeping_stats() -> HousekeepingStats | None:
+    """Per-job stats of the process-wide scheduler, without creating one."""
+    if not get_housekeeping_scheduler.cache_info().currsize:
+        return None
+    return get_housekeeping_scheduler().get_stats()
+
+
+def shutdown_housekeeping_scheduler(
+    timeout: float = HOUSEKEEPING_SHUTDOWN_TIMEOUT_SECONDS,
+) -> None:
+    """Shut down the process-wide scheduler if it exists; the next use recreates it."""
+    if get_housekeeping_scheduler.cache_info().currsize:
+        get_housekeeping_scheduler().shutdown(timeout)
+        get_housekeeping_scheduler.cache_clear()
+
+
+__all__ = [
+    "HousekeepingJob",
+    "HousekeepingJobStats",
+    "HousekeepingScheduler",
+    "HousekeepingStats",
+    "get_housekeeping_scheduler",
+    "get_housekeeping_stats",
+    "shutdown_housekeeping_scheduler",
+]
@@ -22,6 +22,7 @@ from telebot.apihelper import ApiTelegramException
 from telebot.types import ReplyKeyboardMarkup
 
 from pytmbot.logs import BaseComponent, Logger
+from pytmbot.utils.housekeeping import get_housekeeping_scheduler
 
 # Type aliases for better readability
 type _UserID = int
@@ -167,33 +168,17 @@ class _MessageDeletionManager(BaseComponent):
             "already_scheduled": 0,
         }
 
-        # Start cleanup daemon
-        self._start_cleanup_daemon()
+        # Periodic maintenance runs on the core housekeeping scheduler
+        self._cleanup_job = get_housekeeping_scheduler().register(
+            "message_deletion_cleanup",
+            self._cleanup_stale_references,
+            interval=self._DEFAULT_CLEANUP_INTERVAL,
+        )
         self._initialized = True
 
         with self.log_context(action="initialize") as log:
             log.info("bot.utils.message_deletion.deletion.manager.ok")
 
-    def _start_cleanup_daemon(self) -> None:
-        """Start the cleanup daemon thread for periodic maintenance."""
-
-        def _cleanup_worker() -> None:
-            """Worker function for periodic cleanup of stale data."""
-            with self.log_context(action="cleanup_daemon") as log:
-                log.debug("bot.utils.message_deletion.cleanup.daemon.start")
-
-                while True:
-                    try:
-                        time.sleep(self._DEFAULT_CLEANUP_INTERVAL)
-                        self._cleanup_stale_references()
-                    except Exception:
-                        log.error("bot.utils.message_deletion.cleanup.daemon.fail")
-
-        cleanup_thread = threading.Thread(
-            target=_cleanup_worker, name="MessageDeletionCleanup", daemon=True
-        )
-        cleanup_thread.start()
-
     def _cleanup_stale_references(self) -> None:
         """Remove stale weak references and expired tasks."""
         with self._deletion_lock:
@@ -474,10 +459,10 @@ _DEFAULT_POST_DELETE_NAVIGATION_TEXT: Final[str] = (
 
 
 def _build_back_navigation_keyboard() -> ReplyKeyboardMarkup:
-    """Build back-to-main-menu keyboard lazily to avoid import side effects."""
-    from pytmbot.globals import get_keyboards
+    """Return the prebuilt back-to-main-menu keyboard (imported lazily)."""
+    from pytmbot.handlers.handlers_util.static_screens import get_static_markup
 
-    return get_keyboards().build_reply_keyboard(keyboard_type="back_keyboard")
+    return get_static_markup("back_keyboard")
 
 
 def create_post_delete_navigation_callback(
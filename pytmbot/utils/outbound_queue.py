@@ -0,0 +1,545 @@
+#!/usr/local/bin/python3
+"""
+(c) Copyright 2025, Denis Rozhnovskiy <pytelemonbot@mail.ru>
+pyTMBot - A simple Telegram bot to handle Docker containers and images,
+also providing basic information about the status of local servers.
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import IO, Final, TypedDict, cast
+
+import requests
+from telebot import apihelper
+
+from pytmbot.logs import BaseComponent
+
+type RequestSender = Callable[..., object]
+
+# Telegram Bot API limits: ~30 messages/s overall, ~1 message/s per chat and
+# 20 messages/min per group; short bursts above the per-chat rate are allowed.
+OUTBOUND_GLOBAL_RATE: Final[float] = 30.0
+OUTBOUND_GLOBAL_BURST: Final[int] = 30
+OUTBOUND_CHAT_RATE: Final[float] = 1.0
+OUTBOUND_CHAT_BURST: Final[int] = 3
+OUTBOUND_GROUP_RATE: Final[float] = 20.0 / 60.0
+OUTBOUND_GROUP_BURST: Final[int] = 3
+OUTBOUND_WORKERS: Final[int] = 4
+OUTBOUND_MAX_RETRIES: Final[int] = 2
+OUTBOUND_MAX_RETRY_AFTER_SECONDS: Final[float] = 60.0
+# Used when a call carries no ``timeout``: telebot's connect + read timeouts.
+OUTBOUND_DEFAULT_REQUEST_TIMEOUT_SECONDS: Final[float] = 45.0
+OUTBOUND_WAIT_SAMPLES: Final[int] = 256
+# Idle per-chat state is dropped this often; it is recreated on the next call.
+OUTBOUND_CHAT_SWEEP_INTERVAL_SECONDS: Final[float] = 60.0
+
+# Chat-bound API calls that count towards Telegram's message limits.
+_SHAPED_METHOD_PREFIXES: Final[tuple[str, ...]] = (
+    "send",
+    "edit",
+    "copy",
+    "forward",
+    "deleteMessage",
+)
+_COALESCED_METHOD_PREFIX: Final[str] = "edit"
+_DISPATCHER_ATTRIBUTE: Final[str] = "__pytmbot_outbound_queue__"
+
+
+class OutboundStats(TypedDict):
+    queued: int
+    sent: int
+    coalesced: int
+    retried: int
+    failed: int
+    expired: int
+    wait_seconds_total: float
+    wait_seconds_max: float
+    wait_seconds_p95: float
+
+
+class TokenBucket:
+    """Token bucket refilled at ``rate`` tokens per second up to ``capacity``."""
+
+    __slots__ = ("rate", "capacity", "tokens", "updated_at")
+
+    def __init__(self, rate: float, capacity: int, now: float) -> None:
+        self.rate = rate
+        self.capacity = float(capacity)
+        self.tokens = float(capacity)
+        self.updated_at = now
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self.updated_at)
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self.updated_at = now
+
+    def delay(self, now: float) -> float:
+        """Seconds until one token is available (0 when it is available now)."""
+        self._refill(now)
+        return 0.0 if self.tokens >= 1.0 else (1.0 - self.tokens) / self.rate
+
+    def consume(self, now: float) -> None:
+        self._refill(now)
+        self.tokens -= 1.0
+
+    def is_full(self, now: float) -> bool:
+        self._refill(now)
+        return self.tokens >= self.capacity
+
+
+@dataclass(slots=True)
+class _ChatState:
+    bucket: TokenBucket
+    blocked_until: float = 0.0
+    in_flight: bool = False
+
+
+@dataclass(slots=True)
+class _OutboundJob:
+    http_method: str
+    url: str
+    kwargs: dict[str, object]
+    chat_key: str | None
+    coalesce_key: tuple[str, str, str] | None
+    enqueued_at: float
+    futures: list[Future[object]] = field(default_factory=list)
+    attempts: int = 0
+    # Upload streams and their start offsets; ``None`` when one cannot be rewound.
+    file_offsets: tuple[tuple[IO[bytes], int], ...] | None = ()
+
+
+def _api_method(url: str) -> str:
+    return url.rsplit("/", 1)[-1]
+
+
+def _request_params(kwargs: dict[str, object]) -> dict[str, object]:
+    params = kwargs.get("params")
+    return cast(dict[str, object], params) if isinstance(params, dict) else {}
+
+
+def _file_offsets(
+    kwargs: dict[str, object],
+) -> tuple[tuple[IO[bytes], int], ...] | None:
+    """
+    Start offsets of the upload streams in ``files``, so a retry re-sends them whole.
+
+    telebot passes each file as a stream or a ``(name, stream)`` tuple; ``None``
+    means a stream cannot be rewound and the call must not be retried.
+    """
+    files = kwargs.get("files")
+    if not isinstance(files, dict):
+        return ()
+    offsets: list[tuple[IO[bytes], int]] = []
+    for value in files.values():
+        stream = value[1] if isinstance(value, tuple) and len(value) > 1 else value
+        if isinstance(stream, bytes | str):
+            continue
+        seekable = getattr(stream, "seekable", None)
+        if not callable(seekable):
+            return None
+        try:
+            if not seekable():
+                return None
+            offsets.append((cast(IO[bytes], stream), stream.tell()))
+        except (OSError, ValueError):
+            return None
+    return tuple(offsets)
+
+
+def _rewind_files(job: _OutboundJob) -> bool:
+    """Seek the job's upload streams back to where the first attempt started."""
+    if job.file_offsets is None:
+        return False
+    try:
+        for stream, offset in job.file_offsets:
+            stream.seek(offset)
+    except (OSError, ValueError):
+        return False
+    return True
+
+
+def _retry_after_seconds(response: object) -> float | None:
+    if getattr(response, "status_code", None) != 429:
+        return None
+    try:
+        payload = cast(requests.Response, response).json()
+    except ValueError:
+        return 1.0
+    parameters = payload.get("parameters") if isinstance(payload, dict) else None
+    retry_after = (
+        parameters.get("retry_after") if isinstance(parameters, dict) else None
+    )
+    if not isinstance(retry_after, int | float) or retry_after <= 0:
+        return 1.0
+    return min(float(retry_after), OUTBOUND_MAX_RETRY_AFTER_SECONDS)
+
+
+def _request_timeout(kwargs: dict[str, object]) -> float:
+    """Worst-case duration of one attempt, from a ``timeout`` or ``(connect, read)``."""
+    timeout = kwargs.get("timeout")
+    if isinstance(timeout, int | float) and timeout > 0:
+        return float(timeout)
+    if isinstance(timeout, tuple) and timeout:
+        parts = [part for part in timeout if isinstance(part, int | float)]
+        if len(parts) == len(timeout):
+            return float(sum(parts))
+    return OUTBOUND_DEFAULT_REQUEST_TIMEOUT_SECONDS
+
+
+def _result_timeout(kwargs: dict[str, object]) -> float:
+    """
+    How long a caller waits for a queued call: every attempt may take the full
+    request timeout and every retry may be paused for the maximum ``retry_after``.
+    """
+    attempts = OUTBOUND_MAX_RETRIES + 1
+    retry_pauses = OUTBOUND_MAX_RETRIES * OUTBOUND_MAX_RETRY_AFTER_SECONDS
+    return attempts * _request_timeout(kwargs) + retry_pauses
+
+
+def default_request_sender(method: str, url: str, **kwargs: object) -> object:
+    """Send through telebot's per-thread ``requests`` session, as apihelper does."""
+    session_factory = cast(Callable[[], requests.Session], apihelper._get_req_session)
+    return session_factory().request(method, url, **kwargs)  # type: ignore[arg-type]
+
+
+class OutboundQueue(BaseComponent):
+    """
+    Rate-shaped queue for chat-bound Bot API calls.
+
+    Sends, edits and deletes are queued and released by a small worker pool
+    through a global token bucket and one bucket per chat, one call per chat
+    at a time so message order is kept. A newer edit of a message that is
+    still queued replaces the older one and both callers get its response.
+    A 429 pauses the chat for ``retry_after`` and the call is retried, with
+    upload streams rewound first; uploads that cannot be rewound get the 429.
+
+    Callers stay synchronous: the request sender blocks on the job's future for
+    at most ``_result_timeout``. On expiry a call that has not been picked up yet
+    is dropped, and the caller gets ``requests.Timeout`` like a slow request.
+    """
+
+    def __init__(
+        self,
+        sender: RequestSender = default_request_sender,
+        *,
+        workers: int = OUTBOUND_WORKERS,
+        global_rate: float = OUTBOUND_GLOBAL_RATE,
+        global_burst: int = OUTBOUND_GLOBAL_BURST,
+        chat_rate: float = OUTBOUND_CHAT_RATE,
+        chat_burst: int = OUTBOUND_CHAT_BURST,
+        group_rate: float = OUTBOUND_GROUP_RATE,
+        group_burst: int = OUTBOUND_GROUP_BURST,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__("OutboundQueue")
+        self._sender = sender
+        self._clock = clock
+        self._chat_rate = (chat_rate, chat_burst)
+        self._group_rate = (group_rate, group_burst)
+        self._condition = threading.Condition()
+        self._queue: deque[_OutboundJob] = deque()
+        self._pending_edits: dict[tuple[str, str, str], _OutboundJob] = {}
+        self._chats: dict[str, _ChatState] = {}
+        self._next_chat_sweep_at = clock() + OUTBOUND_CHAT_SWEEP_INTERVAL_SECONDS
+        self._global_bucket = TokenBucket(global_rate, global_burst, clock())
+        self._waits: deque[float] = deque(maxlen=OUTBOUND_WAIT_SAMPLES)
+        self._stats: OutboundStats = {
+            "queued": 0,
+            "sent": 0,
+            "coalesced": 0,
+            "retried": 0,
+            "failed": 0,
+            "expired": 0,
+            "wait_seconds_total": 0.0,
+            "wait_seconds_max": 0.0,
+            "wait_seconds_p95": 0.0,
+        }
+        self._stopping = False
+        self._workers = [
+            threading.Thread(
+                target=self._worker_loop, name=f"OutboundQueue-{index}", daemon=True
+            )
+            for index in range(workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    @staticmethod
+    def is_shaped(url: str) -> bool:
+        return _api_method(url).startswith(_SHAPED_METHOD_PREFIXES)
+
+    def send(self, method: str, url: str, **kwargs: object) -> object:
+        """Request-sender entry point; blocks until the call has been sent."""
+        if not self.is_shaped(url):
+            return self._sender(method, url, **kwargs)
+        future = self.submit(method, url, **kwargs)
+        if future is None:
+            return self._sender(method, url, **kwargs)
+        timeout = _result_timeout(kwargs)
+        try:
+            return future.result(timeout=timeout)
+        except TimeoutError:
+            dropped = future.cancel()
+            with self._condition:
+                self._stats["expired"] += 1
+            with self.log_context(
+                method=_api_method(url), timeout=timeout, dropped=dropped
+            ) as log:
+                log.warning("bot.outbound.result.timeout")
+            raise requests.Timeout(
+                f"{_api_method(url)} was not sent within {timeout:.0f}s"
+            ) from None
+
+    def submit(self, method: str, url: str, **kwargs: object) -> Future[object] | None:
+        """Queue a call; ``None`` once the queue is shutting down."""
+        params = _request_params(kwargs)
+        chat_id = params.get("chat_id")
+        chat_key = None if chat_id is None else str(chat_id)
+        api_method = _api_method(url)
+        coalesce_key = None
+        message_id = params.get("message_id")
+        if (
+            chat_key is not None
+            and message_id is not None
+            and api_method.startswith(_COALESCED_METHOD_PREFIX)
+        ):
+            coalesce_key = (api_method, chat_key, str(message_id))
+
+        file_offsets = _file_offsets(kwargs)
+        future: Future[object] = Future()
+        with self._condition:
+            if self._stopping:
+                return None
+            pending = self._pending_edits.get(coalesce_key) if coalesce_key else None
+            if pending is not None:
+                pending.http_method = method
+                pending.url = url
+                pending.kwargs = kwargs
+                pending.file_offsets = file_offsets
+                pending.futures.append(future)
+                self._stats["coalesced"] += 1
+                return future
+
+            job = _OutboundJob(
+                http_method=method,
+                url=url,
+                kwargs=kwargs,
+                chat_key=chat_key,
+                coalesce_key=coalesce_key,
+                enqueued_at=self._clock(),
+                futures=[future],
+                file_offsets=file_offsets,
+            )
+            self._queue.append(job)
+            if coalesce_key is not None:
+                self._pending_edits[coalesce_key] = job
+            self._stats["queued"] = len(self._queue)
+            self._condition.notify()
+        return future
+
+    def _chat_state(self, chat_key: str, now: float) -> _ChatState:
+        state = self._chats.get(chat_key)
+        if state is None:
+            rate, burst = (
+                self._group_rate if chat_key.startswith("-") else self._chat_rate
+            )
+            state = _ChatState(bucket=TokenBucket(rate, burst, now))
+            self._chats[chat_key] = state
+        return state
+
+    def _sweep_idle_chats_locked(self, now: float) -> None:
+        """Drop chat state that a fresh ``_ChatState`` would reproduce exactly."""
+        self._next_chat_sweep_at = now + OUTBOUND_CHAT_SWEEP_INTERVAL_SECONDS
+        idle = [
+            chat_key
+            for chat_key, state in self._chats.items()
+            if not state.in_flight
+            and state.blocked_until <= now
+            and state.bucket.is_full(now)
+        ]
+        for chat_key in idle:
+            del self._chats[chat_key]
+
+    def _next_job_locked(self, now: float) -> tuple[_OutboundJob | None, float | None]:
+        """Pick the oldest job whose chat may send now, or how long to wait."""
+        global_delay = self._global_bucket.delay(now)
+        if global_delay > 0 and self._queue:
+            return None, global_delay
+
+        wait: float | None = None
+        skipped: set[str] = set()
+        for job in self._queue:
+            if job.chat_key is None:
+                return job, None
+            if job.chat_key in skipped:
+                continue
+            state = self._chat_state(job.chat_key, now)
+            if state.in_flight:
+                skipped.add(job.chat_key)
+                continue
+            delay = max(state.blocked_until - now, state.bucket.delay(now))
+            if delay > 0:
+                skipped.add(job.chat_key)
+                wait = delay if wait is None else min(wait, delay)
+                continue
+            return job, None
+        return None, wait
+
+    @staticmethod
+    def _claim_futures(job: _OutboundJob) -> bool:
+        """Drop futures whose callers gave up (see ``send``); ``False`` if none remain."""
+        if job.attempts == 0:
+            job.futures = [
+                future
+                for future in job.futures
+                if future.set_running_or_notify_cancel()
+            ]
+        return bool(job.futures)
+
+    def _take_job(self) -> _OutboundJob | None:
+        with self._condition:
+            while True:
+                now = self._clock()
+                job, wait = self._next_job_locked(now)
+                if job is not None:
+                    self._queue.remove(job)
+                    if job.coalesce_key is not None:
+                        self._pending_edits.pop(job.coalesce_key, None)
+                    if self._claim_futures(job):
+                        break
+                    self._stats["queued"] = len(self._queue)
+                    continue
+                if self._stopping and not self._queue:
+                    return None
+                self._condition.wait(timeout=wait)
+
+            self._global_bucket.consume(now)
+            if job.chat_key is not None:
+                state = self._chat_state(job.chat_key, now)
+                state.bucket.consume(now)
+                state.in_flight = True
+            if job.attempts == 0:
+                self._record_wait(now - job.enqueued_at)
+            self._stats["queued"] = len(self._queue)
+            return job
+
+    def _record_wait(self, wait: float) -> None:
+        self._waits.append(wait)
+        self._stats["wait_seconds_total"] += wait
+        self._stats["wait_seconds_max"] = max(self._stats["wait_seconds_max"], wait)
+
+    def _worker_loop(self) -> None:
+        while (job := self._take_job()) is not None:
+            try:
+                response = self._sender(job.http_method, job.url, **job.kwargs)
+            except Exception as error:
+                self._finish(job, error=error)
+                continue
+            self._finish(job, response=response)
+
+    def _finish(
+        self,
+        job: _OutboundJob,
+        *,
+        response: object = None,
+        error: Exception | None = None,
+    ) -> None:
+        retry_after = None if error is not None else _retry_after_seconds(response)
+        retry = (
+            retry_after is not None
+            and job.attempts < OUTBOUND_MAX_RETRIES
+            and _rewind_files(job)
+        )
+        with self._condition:
+            now = self._clock()
+            state = self._chats.get(job.chat_key) if job.chat_key else None
+            if state is not None:
+                state.in_flight = False
+            if retry:
+                job.attempts += 1
+                if state is not None and retry_after is not None:
+                    state.blocked_until = now + retry_after
+                self._queue.appendleft(job)
+                self._stats["retried"] += 1
+                self._stats["queued"] = len(self._queue)
+                self._condition.notify_all()
+                retrying = True
+            else:
+                self._stats["sent" if error is None else "failed"] += 1
+                self._condition.notify_all()
+                retrying = False
+            if now >= self._next_chat_sweep_at:
+                self._sweep_idle_chats_locked(now)
+
+        if retrying:
+            with self.log_context(
+                method=_api_method(job.url),
+                retry_after=retry_after,
+                attempt=job.attempts,
+            ) as log:
+                log.warning("bot.outbound.rate.limited.retry")
+            return
+
+        for future in job.futures:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(response)
+
+    def get_stats(self) -> OutboundStats:
+        with self._condition:
+            stats = self._stats.copy()
+            waits = sorted(self._waits)
+        if waits:
+            stats["wait_seconds_p95"] = waits[
+                min(len(waits) - 1, len(waits) * 95 // 100)
+            ]
+        return stats
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Stop accepting calls and let workers drain what is already queued."""
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        deadline = time.monotonic() + timeout
+        for worker in self._workers:
+            worker.join(timeout=max(0.0, deadline - time.monotonic()))
+
+
+@functools.lru_cache(maxsize=1)
+def get_outbound_queue() -> OutboundQueue:
+    """Return the process-wide queue wrapping the current request sender."""
+    current: RequestSender | None = getattr(apihelper, "CUSTOM_REQUEST_SENDER", None)
+    return OutboundQueue(current or default_request_sender)
+
+
+def shutdown_outbound_queue(timeout: float = 5.0) -> None:
+    """
+    Drain the process-wide queue if it was created.
+
+    Later calls bypass the stopped queue and go straight to its sender.
+    """
+    if get_outbound_queue.cache_info().currsize:
+        get_outbound_queue().shutdown(timeout)
+
+
+def install_outbound_queue() -> OutboundQueue:
+    """Route Bot API calls through the outbound queue; idempotent."""
+    queue = get_outbound_queue()
+    current = getattr(apihelper, "CUSTOM_REQUEST_SENDER", None)
+    installed = getattr(current, _DISPATCHER_ATTRIBUTE, None) is queue
+    if not installed:
+
+        def _queued_sender(method: str, url: str, **kwargs: object) -> object:
+            return queue.send(method, url, **kwargs)
+
+        setattr(_queued_sender, _DISPATCHER_ATTRIBUTE, queue)
+        setattr(apihelper, "CUSTOM_REQUEST_SENDER", _queued_sender)  # noqa: B010
+    return queue
@@ -0,0 +1,256 @@
+#!/usr/local/bin/python3
+"""
+(c) Copyright 2025, Denis Rozhnovskiy <pytelemonbot@mail.ru>
+pyTMBot - A simple Telegram bot to handle Docker containers and images,
+also providing basic information about the status of local servers.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Generator, Iterable
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Final, TypedDict
+
+from pytmbot.logs import BaseComponent
+from pytmbot.utils.state_paths import ensure_private_directory, get_state_root_path
+
+type StateValue = (
+    str | int | float | bool | None | list["StateValue"] | dict[str, "StateValue"]
+)
+
+STATE_STORE_FILENAME: Final[str] = "state.sqlite3"
+
+
+class StateStoreStats(TypedDict):
+    path: str
+    persistent: bool
+    writes: int
+    deletes: int
+    transactions: int
+    errors: int
+    write_seconds: float
+
+
+class StateStore(BaseComponent):
+    """
+    Embedded key/value store for small runtime state (SQLite, WAL mode).
+
+    Components get a ``StateNamespace`` and write individual keys, so each
+    change is an O(1) row upsert instead of a rewrite of the whole state.
+    Durability is set once here: WAL with ``synchronous=NORMAL`` survives a
+    process crash and may lose only the last transactions on power loss.
+    Writes grouped in ``batch()`` share a single commit.
+
+    State is best-effort: SQLite errors are logged and counted, never raised,
+    so a read-only state directory degrades to in-memory behaviour.
+    """
+
+    SCHEMA_VERSION: Final[int] = 1
+
+    def __init__(self, path: Path | None) -> None:
+        super().__init__("StateStore")
+        self.path = path
+        self._lock = threading.RLock()
+        self._batch_depth = 0
+        self._stats: StateStoreStats = {
+            "path": os.fspath(path) if path is not None else ":memory:",
+            "persistent": path is not None,
+            "writes": 0,
+            "deletes": 0,
+            "transactions": 0,
+            "errors": 0,
+            "write_seconds": 0.0,
+        }
+        self._connection = self._open(path)
+
+    def _open(self, path: Path | None) -> sqlite3.Connection:
+        if path is not None:
+            try:
+                ensure_private_directory(path.parent)
+                connection = sqlite3.connect(
+                    path, check_same_thread=False, isolation_level=None
+                )
+                os.chmod(path, 0o600)
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute("PRAGMA synchronous=NORMAL")
+                self._migrate(connection)
+                return connection
+            except (OSError, sqlite3.Error) as error:
+                with self.log_context(
+                    action="open",
+                    path=os.fspath(path),
+                    error=str(error),
+                    error_type=type(error).__name__,
+                ) as log:
+                    log.warning("bot.state.store.open.fail.warn")
+                self._stats["persistent"] = False
+                self._stats["path"] = ":memory:"
+
+        connection = sqlite3.connect(
+            ":memory:", check_same_thread=False, isolation_level=None
+        )
+        self._migrate(connection)
+        return connection
+
+    def _migrate(self, connection: sqlite3.Connection) -> None:
+        """Single place for schema upgrades, keyed on ``PRAGMA user_version``."""
+        (version,) = connection.execute("PRAGMA user_version").fetchone()
+        if version < 1:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS state ("
+                "namespace TEXT NOT NULL, "
+                "key TEXT NOT NULL, "
+                "value TEXT NOT NULL, "
+                "expires_at REAL, "
+                "PRIMARY KEY (namespace, key)) WITHOUT ROWID"
+            )
+        connection.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+
+    def namespace(self, name: str) -> StateNamespace:
+        return StateNamespace(self, name)
+
+    @contextmanager
+    def batch(self) -> Generator[None, None, None]:
+        """Group writes into one transaction (and one commit)."""
+        with self._lock:
+            if self._batch_depth == 0 and not self._control("begin"):
+                # Without a transaction every write below commits on its own.
+                yield
+                return
+            self._batch_depth += 1
+            try:
+                yield
+            except BaseException:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self._control("rollback")
+                raise
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._control("commit"):
+                self._stats["transactions"] += 1
+
+    def _control(self, action: str) -> bool:
+        """Run BEGIN/COMMIT/ROLLBACK; failures are logged and counted like writes."""
+        try:
+            self._connection.execute(action.upper())
+        except sqlite3.Error as error:
+            self._record_error(action, error)
+            return False
+        return True
+
+    def _record_error(self, action: str, error: sqlite3.Error) -> None:
+        self._stats["errors"] += 1
+        with self.log_context(
+            action=action, error=str(error), error_type=type(error).__name__
+        ) as log:
+            log.warning("bot.state.store.io.fail.warn")
+
+    def _write(self, action: str, sql: str, rows: list[tuple[object, ...]]) -> None:
+        if not rows:
+            return
+        with self._lock:
+            started = time.perf_counter()
+            try:
+                self._connection.executemany(sql, rows)
+            except sqlite3.Error as error:
+                self._record_error(action, error)
+                return
+            self._stats["write_seconds"] += time.perf_counter() - started
+            self._stats["deletes" if action == "delete" else "writes"] += len(rows)
+            if self._batch_depth == 0:
+                self._stats["transactions"] += 1
+
+    def _read(self, sql: str, params: tuple[object, ...]) -> list[tuple[str, str]]:
+        with self._lock:
+            try:
+                return self._connection.execute(sql, params).fetchall()
+            except sqlite3.Error as error:
+                self._record_error("read", error)
+                return []
+
+    def get_stats(self) -> StateStoreStats:
+        with self._lock:
+            return self._stats.copy()
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+class StateNamespace:
+    """Typed view of one component's keys in the shared ``StateStore``."""
+
+    __slots__ = ("store", "name")
+
+    def __init__(self, store: StateStore, name: str) -> None:
+        self.store = store
+        self.name = name
+
+    def get(self, key: str, *, now: float | None = None) -> StateValue:
+        rows = self.store._read(
+            "SELECT key, value FROM state WHERE namespace = ? AND key = ? "
+            "AND (expires_at IS NULL OR expires_at > ?)",
+            (self.name, key, time.time() if now is None else now),
+        )
+        return json.loads(rows[0][1]) if rows else None
+
+    def items(self, *, now: float | None = None) -> list[tuple[str, StateValue]]:
+        """Return all live entries of this namespace."""
+        rows = self.store._read(
+            "SELECT key, value FROM state WHERE namespace = ? "
+            "AND (expires_at IS NULL OR expires_at > ?)",
+            (self.name, time.time() if now is None else now),
+        )
+        return [(key, json.loads(value)) for key, value in rows]
+
+    def put(
+        self, key: str, value: StateValue, *, expires_at: float | None = None
+    ) -> None:
+        self.put_many([(key, value, expires_at)])
+
+    def put_many(self, entries: Iterable[tuple[str, StateValue, float | None]]) -> None:
+        self.store._write(
+            "put",
+            "INSERT INTO state (namespace, key, value, expires_at) "
+            "VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(namespace, key) DO UPDATE SET "
+            "value = excluded.value, expires_at = excluded.expires_at",
+            [
+                (self.name, key, json.dumps(value, separators=(",", ":")), expires)
+                for key, value, expires in entries
+            ],
+        )
+
+    def delete(self, keys: Iterable[str]) -> None:
+        self.store._write(
+            "delete",
+            "DELETE FROM state WHERE namespace = ? AND key = ?",
+            [(self.name, key) for key in keys],
+        )
+
+    def purge_expired(self, *, now: float | None = None) -> None:
+        self.store._write(
+            "delete",
+            "DELETE FROM state WHERE namespace = ? AND expires_at <= ?",
+            [(self.name, time.time() if now is None else now)],
+        )
+
+
+@functools.lru_cache(maxsize=1)
+def get_state_store() -> StateStore:
+    """Return the process-wide state store under the runtime state directory."""
+    return StateStore(get_state_root_path() / STATE_STORE_FILENAME)
+
+
+def shutdown_state_store() -> None:
+    """Close the process-wide store if it was opened; the next use reopens it."""
+    if get_state_store.cache_info().currsize:
+        get_state_store().close()
+        get_state_store.cache_clear()
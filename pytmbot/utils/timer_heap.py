@@ -0,0 +1,261 @@
+#!/usr/local/bin/python3
+"""
+(c) Copyright 2025, Denis Rozhnovskiy <pytelemonbot@mail.ru>
+pyTMBot - A simple Telegram bot to handle Docker containers and images,
+also providing basic information about the status of local servers.
+
+Timer-heap scheduling primitive shared by the housekeeping scheduler and the
+plugin runtime.
+
+One daemon thread sleeps until the earliest task is due and then runs it, either
+inline or through a ``dispatch`` hook (e.g. an executor). A task is pushed back
+onto the heap one jittered interval after its run finished, so a slow run never
+overlaps itself or triggers a burst of catch-up runs.
+"""
+
+from __future__ import annotations
+
+import functools
+import heapq
+import itertools
+import threading
+import time
+import weakref
+from collections.abc import Callable
+
+type IntervalSource = float | Callable[[], float]
+type TaskErrorHandler = Callable[["PeriodicTask", Exception], None]
+type TaskDispatcher = Callable[[Callable[[], None]], object]
+
+
+def _weak_callable(
+    callback: Callable[[], object],
+) -> Callable[[], Callable[[], object] | None]:
+    """Resolve bound methods through a weak reference so tasks never pin their owner."""
+    if hasattr(callback, "__self__") and hasattr(callback, "__func__"):
+        try:
+            return weakref.WeakMethod(callback)
+        except TypeError:
+            pass
+    return lambda: callback
+
+
+class PeriodicTask:
+    """A callback run every ``interval`` seconds by a :class:`TimerHeap`."""
+
+    __slots__ = (
+        "name",
+        "_target",
+        "_interval",
+        "_jitter",
+        "_cancelled",
+        "_idle",
+        "_runner",
+        "runs",
+        "failures",
+        "overruns",
+        "last_duration_ms",
+        "max_duration_ms",
+        "total_duration_ms",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        callback: Callable[[], object],
+        interval: IntervalSource,
+        jitter: float,
+        *,
+        weak: bool = False,
+    ) -> None:
+        self.name = name
+        self._target = _weak_callable(callback) if weak else (lambda: callback)
+        self._interval = interval
+        self._jitter = jitter
+        self._cancelled = threading.Event()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._runner: threading.Thread | None = None
+        self.runs = 0
+        self.failures = 0
+        self.overruns = 0
+        self.last_duration_ms = 0.0
+        self.max_duration_ms = 0.0
+        self.total_duration_ms = 0.0
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    @property
+    def interval(self) -> float:
+        """Current interval; callable intervals are re-evaluated after every run."""
+        return float(self._interval() if callable(self._interval) else self._interval)
+
+    def cancel(self, wait: float | None = None) -> bool:
+        """
+        Stop future runs; a run already in progress is allowed to finish.
+
+        With ``wait``, block up to that many seconds for the in-progress run and
+        return whether the task is idle. Cancelling from inside the task never waits.
+        """
+        self._cancelled.set()
+        if wait is None or threading.current_thread() is self._runner:
+            return self._idle.is_set()
+        return self._idle.wait(timeout=wait)
+
+    def next_delay(self, rng: Callable[[], float]) -> float:
+        """Interval until the next run, spread by ``±jitter`` of the interval."""
+        spread = 1.0 + self._jitter * (2.0 * rng() - 1.0)
+        return max(0.0, self.interval * spread)
+
+    def run(self, on_error: TaskErrorHandler) -> None:
+        """Run the callback once, recording its duration; failures go to ``on_error``."""
+        callback = self._target()
+        if callback is None:
+            self.cancel()
+            return
+        self._idle.clear()
+        self._runner = threading.current_thread()
+        started = time.perf_counter()
+        try:
+            callback()
+        except Exception as error:
+            self.failures += 1
+            on_error(self, error)
+        finally:
+            duration_ms = (time.perf_counter() - started) * 1000
+            self.runs += 1
+            self.last_duration_ms = duration_ms
+            self.max_duration_ms = max(self.max_duration_ms, duration_ms)
+            self.total_duration_ms += duration_ms
+            if duration_ms / 1000 > self.interval:
+                self.overruns += 1
+            self._runner = None
+            self._idle.set()
+
+
+class TimerHeap:
+    """
+    Run :class:`PeriodicTask` instances from a heap on one lazily started thread.
+
+    Without ``dispatch`` tasks run inline on the timer thread and must stay short;
+    with it, each due run is handed to ``dispatch`` and rescheduled when it ends.
+    """
+
+    __slots__ = (
+        "_name",
+        "_clock",
+        "_rng",
+        "_on_error",
+        "_dispatch",
+        "_wakeup",
+        "_queue",
+        "_sequence",
+        "_tasks",
+        "_thread",
+        "_closed",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        clock: Callable[[], float],
+        rng: Callable[[], float],
+        on_error: TaskErrorHandler,
+        dispatch: TaskDispatcher | None = None,
+    ) -> None:
+        self._name = name
+        self._clock = clock
+        self._rng = rng
+        self._on_error = on_error
+        self._dispatch = dispatch
+        self._wakeup = threading.Condition(threading.Lock())
+        self._queue: list[tuple[float, int, PeriodicTask]] = []
+        self._sequence = itertools.count()
+        # Insertion-ordered set of live tasks.
+        self._tasks: dict[PeriodicTask, None] = {}
+        self._thread: threading.Thread | None = None
+        self._closed = False
+
+    @property
+    def running(self) -> bool:
+        with self._wakeup:
+            return self._thread is not None and not self._closed
+
+    def tasks(self) -> list[PeriodicTask]:
+        """Snapshot of tasks that have not been cancelled."""
+        with self._wakeup:
+            return [task for task in self._tasks if not task.cancelled]
+
+    def add(self, task: PeriodicTask, initial_delay: float | None = None) -> None:
+        """Schedule ``task``; ``initial_delay`` defaults to one jittered interval."""
+        delay = task.next_delay(self._rng) if initial_delay is None else initial_delay
+        with self._wakeup:
+            if self._closed:
+                raise RuntimeError(f"{self._name} is shut down")
+            self._tasks[task] = None
+            self._push_locked(task, delay)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._loop, name=self._name, daemon=True
+                )
+                self._thread.start()
+
+    def _push_locked(self, task: PeriodicTask, delay: float) -> None:
+        heapq.heappush(self._queue, (self._clock() + delay, next(self._sequence), task))
+        self._wakeup.notify()
+
+    def _next_due_task(self) -> PeriodicTask | None:
+        with self._wakeup:
+            while not self._closed:
+                if not self._queue:
+                    self._wakeup.wait()
+                    continue
+                due_at, _, task = self._queue[0]
+                if task.cancelled:
+                    heapq.heappop(self._queue)
+                    self._tasks.pop(task, None)
+                    continue
+                wait = due_at - self._clock()
+                if wait <= 0:
+                    heapq.heappop(self._queue)
+                    return task
+                self._wakeup.wait(timeout=wait)
+            return None
+
+    def _loop(self) -> None:
+        while (task := self._next_due_task()) is not None:
+            if self._dispatch is None:
+                self._run(task)
+                continue
+            try:
+                self._dispatch(functools.partial(self._run, task))
+            except RuntimeError:
+                # The dispatcher (e.g. its executor) was shut down.
+                return
+
+    def _run(self, task: PeriodicTask) -> None:
+        task.run(self._on_error)
+        with self._wakeup:
+            if task.cancelled or self._closed:
+                self._tasks.pop(task, None)
+                return
+            self._push_locked(task, task.next_delay(self._rng))
+
+    def shutdown(self, timeout: float) -> None:
+        """Cancel all tasks and stop the timer thread."""
+        with self._wakeup:
+            self._closed = True
+            for task in self._tasks:
+                task.cancel()
+            self._tasks.clear()
+            self._queue.clear()
+            self._wakeup.notify_all()
+            thread, self._thread = self._thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=timeout)
+
+
+__all__ = ["IntervalSource", "PeriodicTask", "TimerHeap"]
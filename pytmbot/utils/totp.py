@@ -10,14 +10,10 @@ from __future__ import annotations
 import base64
 import hashlib
 import io
-import json
-import os
 import re
-import tempfile
 import threading
 import time
 from datetime import UTC, datetime
-from pathlib import Path
 from typing import ClassVar, Final
 
 import pyotp
@@ -27,7 +23,7 @@ from qrcode.image.pure import PyPNGImage
 from pytmbot.exceptions import ErrorContext, QRCodeError, TOTPError
 from pytmbot.globals import settings
 from pytmbot.logs import BaseComponent
-from pytmbot.utils.state_paths import ensure_private_directory, get_state_root_path
+from pytmbot.utils.state_store import StateNamespace, get_state_store
 
 
 def _build_secret_key_material() -> str:
@@ -88,6 +84,10 @@ def _resolve_matching_step(
     return None
 
 
+def _replay_state() -> StateNamespace:
+    return get_state_store().namespace("totp_replay")
+
+
 def _load_replay_state_locked(
     auth_cls: type[TwoFactorAuthenticator], *, min_step: int
 ) -> None:
@@ -95,29 +95,13 @@ def _load_replay_state_locked(
         return
     auth_cls._replay_state_loaded = True
 
-    state_file = auth_cls._REPLAY_STATE_FILE
-    try:
-        payload_raw = state_file.read_text(encoding="utf-8")
-        payload = json.loads(payload_raw)
-    except (FileNotFoundError, OSError, json.JSONDecodeError):
-        return
-
-    if not isinstance(payload, dict):
-        return
-    replay_state = payload.get("replay")
-    if not isinstance(replay_state, dict):
-        return
-
+    replay_state = _replay_state()
+    replay_state.purge_expired()
     loaded_entries: dict[int, set[tuple[str, int]]] = {}
     for raw_user_id, markers in replay_state.items():
-        if not (
-            isinstance(raw_user_id, str)
-            and raw_user_id.isdigit()
-            and isinstance(markers, list)
-        ):
+        if not (raw_user_id.isdigit() and isinstance(markers, list)):
             continue
 
-        user_id = int(raw_user_id)
         user_markers: set[tuple[str, int]] = set()
         for marker in markers:
             if (
@@ -130,61 +114,29 @@ def _load_replay_state_locked(
                 user_markers.add((marker[0], marker[1]))
 
         if user_markers:
-            loaded_entries[user_id] = user_markers
+            loaded_entries[int(raw_user_id)] = user_markers
 
     if loaded_entries:
         auth_cls._used_totp_codes.update(loaded_entries)
 
 
 def _persist_replay_state_locked(
-    auth_cls: type[TwoFactorAuthenticator], *, min_step: int
+    auth_cls: type[TwoFactorAuthenticator], *, user_id: int
 ) -> None:
-    state_file = auth_cls._REPLAY_STATE_FILE
-    parent_dir = state_file.parent
-    try:
-        ensure_private_directory(parent_dir)
-    except OSError:
+    """Upsert one user's markers; the row expires with its newest marker."""
+    markers = auth_cls._used_totp_codes.get(user_id)
+    if not markers:
+        _replay_state().delete([str(user_id)])
         return
 
-    pruned_entries: dict[int, set[tuple[str, int]]] = {}
-    for user_id, markers in auth_cls._used_totp_codes.items():
-        active_markers = {
-            marker
-            for marker in markers
-            if isinstance(marker[0], str)
-            and isinstance(marker[1], int)
-            and marker[1] >= min_step
-        }
-        if active_markers:
-            pruned_entries[user_id] = active_markers
-
-    auth_cls._used_totp_codes = pruned_entries
-
-    payload = {
-        "replay": {
-            str(user_id): [[code, step] for code, step in sorted(markers)]
-            for user_id, markers in pruned_entries.items()
-        }
-    }
-
-    temp_path: str | None = None
-    try:
-        file_descriptor, temp_path = tempfile.mkstemp(
-            prefix=".totp_replay_",
-            suffix=".json",
-            dir=str(parent_dir),
-            text=True,
-        )
-        with os.fdopen(file_descriptor, "w", encoding="utf-8") as temp_file:
-            json.dump(payload, temp_file, separators=(",", ":"), sort_keys=True)
-        os.chmod(temp_path, 0o600)
-        os.replace(temp_path, state_file)
-    except OSError:
-        if temp_path is not None:
-            try:
-                os.unlink(temp_path)
-            except OSError:
-                pass
+    newest_step = max(step for _code, step in markers)
+    _replay_state().put(
+        str(user_id),
+        [[code, step] for code, step in sorted(markers)],
+        expires_at=float(
+            (newest_step + auth_cls._REPLAY_WINDOW_STEPS + 1) * auth_cls.TOTP_INTERVAL
+        ),
+    )
 
 
 def _register_code_usage(
@@ -206,7 +158,6 @@ def _register_code_usage(
         }
         if code_marker in user_entries:
             auth._used_totp_codes[auth.user_id] = user_entries
-            _persist_replay_state_locked(type(auth), min_step=min_step)
             return False
 
         user_entries.add(code_marker)
@@ -214,7 +165,7 @@ def _register_code_usage(
             sorted_entries = sorted(user_entries, key=lambda marker: marker[1])
             user_entries = set(sorted_entries[-auth._MAX_TRACKED_CODES_PER_USER :])
         auth._used_totp_codes[auth.user_id] = user_entries
-        _persist_replay_state_locked(type(auth), min_step=min_step)
+        _persist_replay_state_locked(type(auth), user_id=auth.user_id)
         return True
 
 
@@ -233,9 +184,6 @@ class TwoFactorAuthenticator(BaseComponent):
     TOTP_CODE_PATTERN: Final[re.Pattern[str]] = re.compile(r"^\d{6}$")
     _REPLAY_WINDOW_STEPS: ClassVar[int] = 4
     _MAX_TRACKED_CODES_PER_USER: ClassVar[int] = 64
-    _REPLAY_STATE_FILE: ClassVar[Path] = (
-        get_state_root_path() / "totp_replay_state.json"
-    )
     _used_totp_codes: ClassVar[dict[int, set[tuple[str, int]]]] = {}
     _backup_code_hashes: ClassVar[dict[int, set[str]]] = {}
     _used_totp_codes_lock: ClassVar[threading.RLock] = threading.RLock()
@@ -6,14 +6,13 @@ also providing basic information about the status of local servers.
 """
 
 import ipaddress
-import json
 import os
-import tempfile
 import threading
-from collections import deque
+from collections import OrderedDict, deque
 from collections.abc import AsyncGenerator, Callable
 from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
+from functools import lru_cache
 from time import time
 from typing import Annotated, Final
 
@@ -38,10 +37,13 @@ from pytmbot.utils import (
     mask_token_in_message,
     mask_webhook_path,
 )
-from pytmbot.utils.state_paths import get_state_root_path
+from pytmbot.utils.state_store import StateNamespace, get_state_store
 
 RATELIMIT_EXCEEDED_MESSAGE = "Rate limit exceeded"
 BAN_TTL_SECONDS = 3600
+RANGE_BAN_THRESHOLD: Final[int] = 4
+IPV4_AGGREGATION_PREFIX: Final[int] = 24
+IPV6_AGGREGATION_PREFIX: Final[int] = 64
 SSL_PLACEHOLDER_VALUES: Final[frozenset[str]] = frozenset(
     {"YOUR_CERTIFICATE", "YOUR_CERTIFICATE_KEY"}
 )
@@ -82,20 +84,46 @@ def _normalize_ssl_path(path: str | None) -> str | None:
     return normalized
 
 
+@lru_cache(maxsize=8192)
+def _aggregation_network(client_ip: str) -> str | None:
+    """Return the /24 (IPv4) or /64 (IPv6) network used to aggregate abuse."""
+    try:
+        address = ipaddress.ip_address(client_ip)
+    except ValueError:
+        return None
+    prefix = (
+        IPV4_AGGREGATION_PREFIX if address.version == 4 else IPV6_AGGREGATION_PREFIX
+    )
+    return str(ipaddress.ip_network(f"{address}/{prefix}", strict=False))
+
+
 class RateLimit(BaseComponent):
+    """
+    Per-IP webhook rate limiter with bans.
+
+    Tracked IPs live in an LRU ``OrderedDict`` so eviction and stale cleanup pop
+    from the cold end in O(1). When ``range_ban_threshold`` distinct addresses
+    of one /24 (IPv4) or /64 (IPv6) get banned within the ban TTL, the whole
+    network is banned. Bans are persisted one key per ban in a ``StateNamespace``
+    of the shared state store, expiring with the ban TTL. Rejected requests
+    still count toward ``ban_threshold``, and a ban only ends at its deadline.
+    """
+
     __slots__ = (
         "limit",
         "period",
         "ban_threshold",
+        "range_ban_threshold",
         "requests",
         "banned_ips",
+        "banned_networks",
+        "_network_offenders",
         "_last_seen",
         "max_tracked_ips",
         "_last_cleanup_ts",
         "_state_lock",
-        "_state_file",
+        "_state",
         "_state_loaded",
-        "_last_state_persist_ts",
         "_ban_ttl_seconds",
     )
 
@@ -105,7 +133,8 @@ class RateLimit(BaseComponent):
         period: int,
         ban_threshold: int = 50,
         max_tracked_ips: int = 4096,
-        state_file: str | None = None,
+        state: StateNamespace | None = None,
+        range_ban_threshold: int = RANGE_BAN_THRESHOLD,
     ) -> None:
         super().__init__()
 
@@ -114,43 +143,26 @@ class RateLimit(BaseComponent):
             period=period,
             ban_threshold=ban_threshold,
             max_tracked_ips=max_tracked_ips,
+            range_ban_threshold=range_ban_threshold,
         ) as log:
             log.debug("bot.webhook.rate.limiter.init")
             self.limit = limit
             self.period = period
             self.ban_threshold = ban_threshold
+            self.range_ban_threshold = max(2, range_ban_threshold)
             self.requests: dict[str, deque[float]] = {}
-            self.banned_ips: dict[str, datetime] = {}
-            self._last_seen: dict[str, float] = {}
+            # Both ban maps are kept in ban-time order so expiry pops from the front.
+            self.banned_ips: OrderedDict[str, datetime] = OrderedDict()
+            self.banned_networks: OrderedDict[str, datetime] = OrderedDict()
+            self._network_offenders: OrderedDict[str, deque[float]] = OrderedDict()
+            self._last_seen: OrderedDict[str, float] = OrderedDict()
             self.max_tracked_ips = max(128, max_tracked_ips)
             self._last_cleanup_ts = 0.0
             self._state_lock = threading.RLock()
-            self._state_file = self._prepare_state_file(state_file)
+            self._state = state
             self._state_loaded = False
-            self._last_state_persist_ts = 0.0
             self._ban_ttl_seconds = BAN_TTL_SECONDS
 
-    def _prepare_state_file(self, state_file: str | None) -> str | None:
-        """Ensure state persistence directory is private to current user."""
-        if not state_file:
-            return None
-
-        state_path = os.path.abspath(state_file)
-        state_dir = os.path.dirname(state_path)
-        try:
-            os.makedirs(state_dir, mode=0o700, exist_ok=True)
-            os.chmod(state_dir, 0o700)
-            return state_path
-        except OSError as error:
-            with self.log_context(
-                action="prepare_state_file",
-                state_file=state_path,
-                error=str(error),
-                error_type=type(error).__name__,
-            ) as log:
-                log.warning("bot.webhook.state.file.prepare.fail.warn")
-            return None
-
     def _ensure_state_loaded(self) -> None:
         """Lazily restore persisted state on first access."""
         if self._state_loaded:
@@ -159,105 +171,77 @@ class RateLimit(BaseComponent):
         self._state_loaded = True
 
     def _restore_state(self) -> None:
-        """Load persisted bans from disk if available."""
-        if not self._state_file:
-            return
-
-        try:
-            with open(self._state_file, encoding="utf-8") as state_stream:
-                payload = json.load(state_stream)
-        except FileNotFoundError:
-            return
-        except Exception as error:
-            with self.log_context(
-                action="restore_state",
-                state_file=self._state_file,
-                error=str(error),
-                error_type=type(error).__name__,
-            ) as log:
-                log.warning("bot.webhook.state.restore.fail.warn")
-            return
-
-        if not isinstance(payload, dict):
-            return
-
-        now = datetime.now()
-        restored_bans = payload.get("banned_ips", {})
-        if not isinstance(restored_bans, dict):
+        """Load bans that are still within their TTL from the state store."""
+        if self._state is None:
             return
 
-        for ip, iso_banned_at in restored_bans.items():
-            if not isinstance(ip, str) or not isinstance(iso_banned_at, str):
-                continue
-            try:
-                banned_at = datetime.fromisoformat(iso_banned_at)
-            except ValueError:
-                continue
-            if (now - banned_at).total_seconds() <= self._ban_ttl_seconds:
-                self.banned_ips[ip] = banned_at
-                self._last_seen[ip] = time()
-
-    def _persist_state(self, *, force: bool = False) -> None:
-        """Persist current ban state to disk."""
-        if not self._state_file:
-            return
-
-        now_ts = time()
-        if not force and now_ts - self._last_state_persist_ts < 5.0:
+        self._state.purge_expired()
+        restored = sorted(
+            (
+                (float(banned_ts), key)
+                for key, banned_ts in self._state.items()
+                if isinstance(banned_ts, int | float)
+            ),
+        )
+        for banned_ts, key in restored:
+            target = self.banned_networks if "/" in key else self.banned_ips
+            target[key] = datetime.fromtimestamp(banned_ts)
+        while len(self.banned_ips) > self.max_tracked_ips:
+            self.banned_ips.popitem(last=False)
+
+    def _persist_ban(self, key: str, banned_at: datetime) -> None:
+        if self._state is None:
             return
-
-        self._last_state_persist_ts = now_ts
-        payload = {
-            "banned_ips": {
-                ip: banned_at.isoformat() for ip, banned_at in self.banned_ips.items()
-            },
-            "saved_at": datetime.now().isoformat(),
-        }
-        state_dir = os.path.dirname(self._state_file)
-        tmp_state_path: str | None = None
-        try:
-            fd, tmp_state_path = tempfile.mkstemp(
-                prefix=".pytmbot_ratelimit_",
-                suffix=".tmp",
-                dir=state_dir,
-                text=True,
-            )
-            with os.fdopen(fd, "w", encoding="utf-8") as state_stream:
-                json.dump(payload, state_stream)
-            os.chmod(tmp_state_path, 0o600)
-            os.replace(tmp_state_path, self._state_file)
-        except Exception as error:
-            if tmp_state_path and os.path.exists(tmp_state_path):
-                try:
-                    os.unlink(tmp_state_path)
-                except OSError:
-                    pass
-            with self.log_context(
-                action="persist_state",
-                state_file=self._state_file,
-                error=str(error),
-                error_type=type(error).__name__,
-            ) as log:
-                log.warning("bot.webhook.state.persist.fail.warn")
+        banned_ts = banned_at.timestamp()
+        self._state.put(
+            key, round(banned_ts), expires_at=banned_ts + self._ban_ttl_seconds
+        )
 
     def _drop_ip_state(self, client_ip: str) -> None:
-        """Remove all in-memory state for an IP."""
+        """
+        Forget the request history of an IP.
+
+        Bans are deliberately kept: they live in ``banned_ips`` until their own
+        deadline, so idling or cycling source addresses cannot lift them.
+        """
         self.requests.pop(client_ip, None)
-        self.banned_ips.pop(client_ip, None)
         self._last_seen.pop(client_ip, None)
 
+    def _touch_ip(self, client_ip: str, current_time: float) -> None:
+        """Mark an IP as most recently seen, evicting the LRU entry when full."""
+        if client_ip in self._last_seen:
+            self._last_seen.pop(client_ip)
+        elif len(self._last_seen) >= self.max_tracked_ips:
+            self._evict_oldest_ip()
+        self._last_seen[client_ip] = current_time
+
     def _evict_oldest_ip(self) -> None:
         """Evict least recently seen IP to keep memory bounded."""
         if not self._last_seen:
             return
-        oldest_ip = min(self._last_seen, key=lambda ip: self._last_seen[ip])
+        oldest_ip = next(iter(self._last_seen))
         self._drop_ip_state(oldest_ip)
 
+    def _ban_expired(self, banned_at: datetime, now: datetime) -> bool:
+        return (now - banned_at).total_seconds() > self._ban_ttl_seconds
+
+    def _expire_bans(self, bans: OrderedDict[str, datetime], now: datetime) -> int:
+        """Pop expired bans from the front of a ban-time ordered map."""
+        expired = 0
+        while bans:
+            key, banned_at = next(iter(bans.items()))
+            if not self._ban_expired(banned_at, now):
+                break
+            bans.popitem(last=False)
+            expired += 1
+        return expired
+
     def _cleanup_state(self, current_time: float) -> None:
         """
         Cleanup stale in-memory state.
 
-        Runs at most once per minute unless cache is above hard limit.
+        Work is proportional to the number of stale entries: tracked IPs and
+        bans are both kept in age order, so cleanup stops at the first live one.
         """
         should_cleanup_now = current_time - self._last_cleanup_ts >= 60.0
         if not should_cleanup_now and len(self._last_seen) <= self.max_tracked_ips:
@@ -265,91 +249,108 @@ class RateLimit(BaseComponent):
 
         self._last_cleanup_ts = current_time
         now = datetime.now()
-        expired_bans = [
-            ip
-            for ip, banned_at in self.banned_ips.items()
-            if (now - banned_at).total_seconds() > self._ban_ttl_seconds
-        ]
-        for ip in expired_bans:
-            self.banned_ips.pop(ip, None)
+        self._expire_bans(self.banned_ips, now)
+        self._expire_bans(self.banned_networks, now)
 
-        stale_ips = [
-            ip
-            for ip, request_times in self.requests.items()
-            if not request_times and ip not in self.banned_ips
-        ]
-        for ip in stale_ips:
-            self._drop_ip_state(ip)
+        stale_before = current_time - self.period
+        while self._last_seen:
+            oldest_ip, last_seen = next(iter(self._last_seen.items()))
+            if last_seen >= stale_before:
+                break
+            self._drop_ip_state(oldest_ip)
 
         while len(self._last_seen) > self.max_tracked_ips:
             self._evict_oldest_ip()
+        while len(self._network_offenders) > self.max_tracked_ips:
+            self._network_offenders.popitem(last=False)
+
+    def _ban(self, bans: OrderedDict[str, datetime], key: str) -> None:
+        banned_at = datetime.now()
+        bans.pop(key, None)
+        bans[key] = banned_at
+        if bans is self.banned_ips:
+            while len(bans) > self.max_tracked_ips:
+                bans.popitem(last=False)
+        self._persist_ban(key, banned_at)
+
+    def _record_offender(self, client_ip: str, current_time: float) -> None:
+        """Escalate to a network ban once enough addresses of it are banned."""
+        network = _aggregation_network(client_ip)
+        if network is None or network in self.banned_networks:
+            return
 
-        if expired_bans or stale_ips:
-            self._persist_state()
+        offenders = self._network_offenders.pop(network, None) or deque(
+            maxlen=self.range_ban_threshold
+        )
+        self._network_offenders[network] = offenders
+        offenders.append(current_time)
+        window_start = current_time - self._ban_ttl_seconds
+        if len(offenders) >= self.range_ban_threshold and offenders[0] >= window_start:
+            del self._network_offenders[network]
+            self._ban(self.banned_networks, network)
+            with self.log_context(action="ban_network", network=network) as log:
+                log.warning("bot.webhook.network.banned.warn")
+
+    def _check_ban(
+        self, bans: OrderedDict[str, datetime], key: str | None, now: datetime
+    ) -> bool:
+        if key is None or (banned_at := bans.get(key)) is None:
+            return False
+        if self._ban_expired(banned_at, now):
+            with self.log_context(action="ban_expired", ip=key) as log:
+                log.info("bot.webhook.ban.expired.info")
+            del bans[key]
+            return False
+        return True
 
     def is_banned(self, client_ip: str) -> bool:
         with self._state_lock:
             self._ensure_state_loaded()
             self._cleanup_state(time())
-            with self.log_context(ip=client_ip, action="check_ban"):
-                if client_ip not in self.banned_ips:
-                    return False
-
-                ban_time = self.banned_ips[client_ip]
-                if (datetime.now() - ban_time).total_seconds() > self._ban_ttl_seconds:
-                    with self.log_context(action="ban_expired", ip=client_ip) as log:
-                        log.info("bot.webhook.ban.expired.info")
-                    del self.banned_ips[client_ip]
-                    self._persist_state()
-                    return False
-                with self.log_context(action="banned", ip=client_ip) as log:
-                    log.warning("bot.webhook.request.banned.warn")
-                return True
+            now = datetime.now()
+            if not (
+                self._check_ban(self.banned_ips, client_ip, now)
+                or self._check_ban(
+                    self.banned_networks, _aggregation_network(client_ip), now
+                )
+            ):
+                return False
+            with self.log_context(action="banned", ip=client_ip) as log:
+                log.warning("bot.webhook.request.banned.warn")
+            return True
 
     def is_rate_limited(self, client_ip: str) -> bool:
         with self._state_lock:
             self._ensure_state_loaded()
             current_time = time()
             self._cleanup_state(current_time)
+            self._touch_ip(client_ip, current_time)
 
-            if (
-                client_ip not in self.requests
-                and client_ip not in self._last_seen
-                and len(self._last_seen) >= self.max_tracked_ips
-            ):
-                self._evict_oldest_ip()
-            self._last_seen[client_ip] = current_time
-
-            with self.log_context(
-                ip=client_ip,
-                action="rate_check",
-                requests_count=len(self.requests.get(client_ip, [])),
-            ):
-                if self.is_banned(client_ip):
-                    return True
-
-                if client_ip not in self.requests:
-                    self.requests[client_ip] = deque()
-
-                request_times = self.requests[client_ip]
+            if self.is_banned(client_ip):
+                return True
 
-                while request_times and request_times[0] < current_time - self.period:
-                    request_times.popleft()
+            request_times = self.requests.get(client_ip)
+            if request_times is None:
+                request_times = self.requests[client_ip] = deque()
 
-                if len(request_times) >= self.ban_threshold:
-                    self.banned_ips[client_ip] = datetime.now()
-                    self._persist_state()
-                    with self.log_context(action="ban_ip", ip=client_ip) as log:
-                        log.warning("bot.webhook.ip.banned.warn")
-                    return True
+            while request_times and request_times[0] < current_time - self.period:
+                request_times.popleft()
 
-                if len(request_times) >= self.limit:
-                    with self.log_context(action="rate_limit", ip=client_ip) as log:
-                        log.warning("bot.webhook.rate.limit.warn")
-                    return True
+            if len(request_times) >= self.ban_threshold:
+                self._ban(self.banned_ips, client_ip)
+                with self.log_context(action="ban_ip", ip=client_ip) as log:
+                    log.warning("bot.webhook.ip.banned.warn")
+                self._record_offender(client_ip, current_time)
+                return True
 
-                request_times.append(current_time)
-                return False
+            # Rejected requests count toward the ban too, otherwise a client
+            # would never get past ``limit`` requests per period.
+            request_times.append(current_time)
+            if len(request_times) > self.limit:
+                with self.log_context(action="rate_limit", ip=client_ip) as log:
+                    log.warning("bot.webhook.rate.limit.warn")
+                return True
+            return False
 
 
 class WebhookManager(BaseComponent):
@@ -525,16 +526,14 @@ class WebhookServer(BaseComponent):
 
             self.app = self._create_app()
             enable_rate_state_persistence = "PYTEST_CURRENT_TEST" not in os.environ
-            state_dir = os.fspath(
-                get_state_root_path() / "webhook_ratelimit" / str(self.port)
-            )
+            state_store = get_state_store() if enable_rate_state_persistence else None
             self.rate_limiter = RateLimit(
                 limit=10,
                 period=10,
                 max_tracked_ips=4096,
-                state_file=(
-                    os.path.join(state_dir, "main.json")
-                    if enable_rate_state_persistence
+                state=(
+                    state_store.namespace(f"webhook_bans:{self.port}:main")
+                    if state_store is not None
                     else None
                 ),
             )
@@ -542,9 +541,9 @@ class WebhookServer(BaseComponent):
                 limit=5,
                 period=10,
                 max_tracked_ips=1024,
-                state_file=(
-                    os.path.join(state_dir, "404.json")
-                    if enable_rate_state_persistence
+                state=(
+                    state_store.namespace(f"webhook_bans:{self.port}:404")
+                    if state_store is not None
                     else None
                 ),
             )
@@ -4,11 +4,19 @@ import os
 import sys
 from collections.abc import Generator
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pytest
+from telebot import apihelper
 
+from pytmbot.health_system.telegram_activity import telegram_activity
 from pytmbot.utils.cli import parse_cli_args
 from pytmbot.utils.environment import get_environment_state, is_running_in_docker
+from pytmbot.utils.outbound_queue import get_outbound_queue
+from pytmbot.utils.state_store import get_state_store, shutdown_state_store
+
+if TYPE_CHECKING:
+    from pytmbot.plugins.runtime import PluginRuntime
 
 
 def pytest_sessionstart(session: pytest.Session) -> None:
@@ -25,10 +33,42 @@ def stable_process_state(
 ) -> Generator[None, None, None]:
     """Keep process-wide caches and argv deterministic across tests."""
     monkeypatch.setattr(sys, "argv", ["pytmbot-test"])
+    monkeypatch.setattr(apihelper, "CUSTOM_REQUEST_SENDER", None)
+    telegram_activity.reset()
     parse_cli_args.cache_clear()
     is_running_in_docker.cache_clear()
     get_environment_state.cache_clear()
+    # Imported here: handler and plugin modules load settings at import time.
+    from pytmbot.handlers.handlers_util.static_screens import clear_static_screens
+    from pytmbot.handlers.server_handlers.inline.common import edit_fingerprints
+
+    edit_fingerprints.clear()
+    clear_static_screens()
     yield
+    if get_outbound_queue.cache_info().currsize:
+        get_outbound_queue().shutdown(timeout=1.0)
+    get_outbound_queue.cache_clear()
     parse_cli_args.cache_clear()
     is_running_in_docker.cache_clear()
     get_environment_state.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def isolated_state_store(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> Generator[None, None, None]:
+    """Give every test its own runtime state directory and state store."""
+    monkeypatch.setenv("PYTMBOT_STATE_DIR", str(tmp_path / "state"))
+    get_state_store.cache_clear()
+    yield
+    shutdown_state_store()
+
+
+@pytest.fixture
+def plugin_runtime() -> Generator[PluginRuntime, None, None]:
+    """Plugin runtime for one test, shut down afterwards like PluginManager does."""
+    from pytmbot.plugins.runtime import PluginRuntime
+
+    runtime = PluginRuntime()
+    yield runtime
+    runtime.shutdown(timeout=1.0)
@@ -0,0 +1,417 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from pytmbot.agent.client import AgentClient, AgentConfig, reconnect_delay
+from pytmbot.agent.protocol import (
+    AGENT_PROTOCOL_VERSION,
+    AgentEndpoint,
+    AgentProtocolError,
+    FrameSigner,
+    FrameType,
+    Snapshot,
+    apply_delta,
+    derive_session_key,
+    diff_snapshot,
+    encode_frame,
+    parse_endpoint,
+    read_frame,
+    session_proof,
+    sign_challenge,
+    verify_challenge,
+)
+from pytmbot.agent.server import AgentIngestionServer, HostRegistry
+
+_SECRET = "agent-secret-0123456789"
+
+
+def _wait_until(predicate: Callable[[], bool], timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class _Collector:
+    """Snapshots a test can change between agent intervals."""
+
+    def __init__(self) -> None:
+        self.snapshot: Snapshot = {
+            "hostname": "edge-1",
+            "system": {"cpu": {"percent": 1.0}, "disks": {"/": {"percent": 10}}},
+        }
+
+    def __call__(self) -> Snapshot:
+        return self.snapshot
+
+
+def _start_client(
+    endpoint: AgentEndpoint, collect: _Collector, *, secret: str = _SECRET
+) -> tuple[AgentClient, threading.Thread]:
+    config = AgentConfig(
+        server=endpoint,
+        secret=secret,
+        host_id="edge-1",
+        interval_seconds=0.02,
+        docker_host=None,
+    )
+    client = AgentClient(config, collect)
+    thread = threading.Thread(target=client.run, daemon=True)
+    thread.start()
+    return client, thread
+
+
+def _snapshot_of(registry: HostRegistry, host_id: str) -> Snapshot | None:
+    view = registry.get(host_id)
+    return None if view is None else view.snapshot
+
+
+async def _open_session(
+    port: int, host_id: str, secret: str = _SECRET
+) -> tuple[asyncio.StreamReader, asyncio.StreamWriter, dict[str, object], FrameSigner]:
+    """Run the agent side of the handshake; returns the server's reply and a signer."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    challenge = await read_frame(reader)
+    nonce = challenge["nonce"]
+    assert isinstance(nonce, str)
+    writer.write(
+        encode_frame(
+            {
+                "type": FrameType.HELLO,
+                "version": AGENT_PROTOCOL_VERSION,
+                "host": host_id,
+                "mac": sign_challenge(secret, nonce, host_id),
+            }
+        )
+    )
+    reply = await read_frame(reader)
+    session_key = derive_session_key(secret, nonce, host_id)
+    if reply["type"] == FrameType.WELCOME:
+        assert reply["proof"] == session_proof(session_key)
+    return reader, writer, reply, FrameSigner(session_key, server=False)
+
+
+def test_diff_and_apply_roundtrip_without_mutating_previous() -> None:
+    previous: Snapshot = {
+        "hostname": "a",
+        "system": {"cpu": {"percent": 1.0, "count": 4}, "load": [0.1, 0.2]},
+        "docker": {"containers": {"web": {"status": "running"}}},
+    }
+    current: Snapshot = {
+        "hostname": "a",
+        "system": {"cpu": {"percent": 2.5, "count": 4}, "load": [0.1, 0.3]},
+        "docker": {"containers": {"db": {"status": "exited"}}},
+    }
+
+    changed, removed = diff_snapshot(previous, current)
+
+    assert changed == {
+        "system": {"cpu": {"percent": 2.5}, "load": [0.1, 0.3]},
+        "docker": {"containers": {"db": {"status": "exited"}}},
+    }
+    assert removed == [["docker", "containers", "web"]]
+    assert apply_delta(previous, changed, removed) == current
+    assert previous["docker"] == {"containers": {"web": {"status": "running"}}}
+    assert diff_snapshot(current, current) == ({}, [])
+
+
+def test_diff_treats_type_changes_as_changes() -> None:
+    changed, removed = diff_snapshot({"a": 1, "b": {"c": 1}}, {"a": 1.0, "b": 2})
+
+    assert changed == {"a": 1.0, "b": 2}
+    assert removed == []
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("tcp://0.0.0.0:9130", AgentEndpoint("tcp", host="0.0.0.0", port=9130)),
+        ("tcp://[::1]:0", AgentEndpoint("tcp", host="::1", port=0)),
+        (
+            "unix:///run/pytmbot/agent.sock",
+            AgentEndpoint("unix", path="/run/pytmbot/agent.sock"),
+        ),
+    ],
+)
+def test_parse_endpoint_accepts_tcp_and_unix(
+    value: str, expected: AgentEndpoint
+) -> None:
+    assert parse_endpoint(value) == expected
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "",
+        "localhost:9130",
+        "tcp://host",
+        "tcp://host:99999",
+        "unix://rel.sock",
+        "udp://h:1",
+    ],
+)
+def test_parse_endpoint_rejects_invalid_values(value: str) -> None:
+    with pytest.raises(ValueError):
+        parse_endpoint(value)
+
+
+def test_challenge_verification_accepts_any_configured_secret() -> None:
+    mac = sign_challenge(_SECRET, "nonce", "edge-1")
+
+    assert verify_challenge(["old-secret-value", _SECRET], "nonce", "edge-1", mac)
+    assert not verify_challenge([_SECRET], "nonce", "edge-2", mac)
+    assert not verify_challenge([_SECRET], "other", "edge-1", mac)
+    assert not verify_challenge([_SECRET], "nonce", "edge-1", None)
+
+
+def test_encode_frame_rejects_oversized_payload() -> None:
+    with pytest.raises(AgentProtocolError):
+        encode_frame({"type": "snapshot", "blob": "x" * (300 * 1024)})
+
+
+def test_agent_config_from_env() -> None:
+    config = AgentConfig.from_env(
+        {
+            "PYTMBOT_AGENT_SERVER": "tcp://bot.internal:9130",
+            "PYTMBOT_AGENT_SECRET": _SECRET,
+            "PYTMBOT_AGENT_HOST_ID": "edge-1",
+            "PYTMBOT_AGENT_INTERVAL": "5",
+            "PYTMBOT_AGENT_DOCKER_HOST": "",
+        }
+    )
+
+    assert config.server == AgentEndpoint("tcp", host="bot.internal", port=9130)
+    assert config.host_id == "edge-1"
+    assert config.interval_seconds == 5.0
+    assert config.docker_host is None
+
+    with pytest.raises(ValueError):
+        AgentConfig.from_env({"PYTMBOT_AGENT_SERVER": "tcp://bot:9130"})
+    with pytest.raises(ValueError):
+        AgentConfig.from_env(
+            {
+                "PYTMBOT_AGENT_SERVER": "tcp://bot:9130",
+                "PYTMBOT_AGENT_SECRET": _SECRET,
+                "PYTMBOT_AGENT_HOST_ID": "bad host",
+            }
+        )
+
+
+def test_reconnect_delay_is_jittered_and_capped() -> None:
+    assert reconnect_delay(1, rng=lambda: 0.0) == 0.5
+    assert reconnect_delay(3, rng=lambda: 1.0) == 4.0
+    assert reconnect_delay(50, rng=lambda: 1.0) == 60.0
+
+
+def test_registry_rejects_out_of_order_deltas_and_marks_stale_hosts() -> None:
+    now = [100.0]
+    registry = HostRegistry(stale_after_seconds=30, clock=lambda: now[0])
+
+    assert registry.apply_delta("edge-1", 1, {"a": 1}, []) is False
+    registry.set_connected("edge-1", True)
+    registry.apply_full("edge-1", 1, {"a": 1}, size=10)
+    assert registry.apply_delta("edge-1", 3, {"a": 2}, []) is False
+    assert registry.apply_delta("edge-1", 2, {"b": 2}, [["a"]], size=5) is True
+
+    view = registry.get("edge-1")
+    assert view is not None and view.online and view.snapshot == {"b": 2}
+    assert registry.get_stats()["edge-1"]["resyncs"] == 1
+    assert registry.get_stats()["edge-1"]["bytes_received"] == 15
+
+    now[0] += 31
+    view = registry.get("edge-1")
+    assert view is not None and not view.online
+    registry.set_connected("edge-1", False)
+    assert [view.host_id for view in registry.views()] == ["edge-1"]
+    assert registry.get("unknown") is None
+
+
+@pytest.mark.parametrize("scheme", ["tcp", "unix"])
+def test_loopback_agent_streams_full_and_delta_frames(
+    scheme: str, tmp_path: Path
+) -> None:
+    endpoint = (
+        parse_endpoint("tcp://127.0.0.1:0")
+        if scheme == "tcp"
+        else AgentEndpoint("unix", path=str(tmp_path / "agent.sock"))
+    )
+    registry = HostRegistry()
+    server = AgentIngestionServer(endpoint, [_SECRET], registry)
+    server.start()
+    if scheme == "tcp":
+        endpoint = endpoint._replace(port=server.bound_port)
+    collect = _Collector()
+    client, thread = _start_client(endpoint, collect)
+    try:
+        assert _wait_until(lambda: _snapshot_of(registry, "edge-1") == collect.snapshot)
+        collect.snapshot = {
+            "hostname": "edge-1",
+            "system": {"cpu": {"percent": 75.0}, "disks": {}},
+        }
+        assert _wait_until(lambda: _snapshot_of(registry, "edge-1") == collect.snapshot)
+
+        host_stats = registry.get_stats()["edge-1"]
+        assert host_stats["full_frames"] >= 1
+        assert host_stats["delta_frames"] >= 1
+        assert host_stats["resyncs"] == 0
+        assert client.get_stats()["connected"] is True
+        if scheme == "unix":
+            assert (tmp_path / "agent.sock").stat().st_mode & 0o777 == 0o600
+    finally:
+        client.stop()
+        thread.join(timeout=5.0)
+        assert not thread.is_alive()
+
+    assert _wait_until(lambda: not registry.views()[0].online)
+    server.stop()
+    assert server.get_stats()["running"] is False
+    if scheme == "unix":
+        assert not (tmp_path / "agent.sock").exists()
+
+
+def test_ingestion_rejects_agent_with_wrong_secret() -> None:
+    registry = HostRegistry()
+    server = AgentIngestionServer(
+        parse_endpoint("tcp://127.0.0.1:0"), [_SECRET], registry
+    )
+    server.start()
+    endpoint = AgentEndpoint("tcp", host="127.0.0.1", port=server.bound_port)
+    client, thread = _start_client(endpoint, _Collector(), secret="wrong-secret-value")
+    try:
+        assert _wait_until(lambda: server.get_stats()["rejected"] >= 1)
+        assert registry.views() == []
+        assert client.get_stats()["connects"] == 0
+    finally:
+        client.stop()
+        thread.join(timeout=5.0)
+        server.stop()
+
+
+def test_ingestion_requests_resync_after_sequence_gap() -> None:
+    registry = HostRegistry()
+    server = AgentIngestionServer(
+        parse_endpoint("tcp://127.0.0.1:0"), [_SECRET], registry
+    )
+    server.start()
+
+    async def _session() -> dict[str, object]:
+        reader, writer, reply, signer = await _open_session(server.bound_port, "edge-2")
+        assert reply["type"] == FrameType.WELCOME
+        writer.write(
+            encode_frame({"type": "snapshot", "seq": 1, "full": {"a": 1}}, signer)
+        )
+        writer.write(encode_frame({"type": "delta", "seq": 5, "set": {"a": 2}}, signer))
+        await writer.drain()
+        resync = await asyncio.wait_for(read_frame(reader, signer), timeout=5.0)
+        writer.close()
+        await writer.wait_closed()
+        return resync
+
+    try:
+        assert asyncio.run(_session())["type"] == FrameType.RESYNC
+        assert _snapshot_of(registry, "edge-2") == {"a": 1}
+        assert registry.get_stats()["edge-2"]["resyncs"] == 1
+    finally:
+        server.stop()
+
+
+def test_ingestion_binds_host_secrets_and_refuses_takeover() -> None:
+    host_secret = "edge-2-secret-0123456789"
+    registry = HostRegistry()
+    server = AgentIngestionServer(
+        parse_endpoint("tcp://127.0.0.1:0"),
+        [_SECRET],
+        registry,
+        host_secrets={"edge-2": host_secret},
+    )
+    server.start()
+    port = server.bound_port
+
+    async def _scenario() -> list[object]:
+        replies: list[object] = []
+        # The shared secret no longer authenticates a host with its own secret.
+        _, writer, reply, _ = await _open_session(port, "edge-2", _SECRET)
+        replies.append(reply["type"])
+        writer.close()
+
+        owner_reader, owner, reply, signer = await _open_session(
+            port, "edge-2", host_secret
+        )
+        replies.append(reply["type"])
+        owner.write(encode_frame({"type": "snapshot", "seq": 1, "full": {}}, signer))
+        await owner.drain()
+
+        # A shared-secret host cannot take over edge-1 once it is connected ...
+        _, first, reply, _ = await _open_session(port, "edge-1", _SECRET)
+        replies.append(reply["type"])
+        _, second, reply, _ = await _open_session(port, "edge-1", _SECRET)
+        replies.append(reply["type"])
+        # ... and edge-2's owner keeps its session against an impostor.
+        _, impostor, reply, _ = await _open_session(port, "edge-2", _SECRET)
+        replies.append(reply["type"])
+        for channel in (first, second, impostor):
+            channel.close()
+        replies.append(owner_reader.at_eof())
+        owner.close()
+        return replies
+
+    try:
+        assert asyncio.run(_scenario()) == [
+            FrameType.ERROR,
+            FrameType.WELCOME,
+            FrameType.WELCOME,
+            FrameType.WELCOME,
+            FrameType.ERROR,
+            False,
+        ]
+        assert server.get_stats()["rejected"] == 2
+    finally:
+        server.stop()
+
+
+def test_ingestion_drops_session_on_unsigned_forged_or_replayed_frame() -> None:
+    registry = HostRegistry()
+    server = AgentIngestionServer(
+        parse_endpoint("tcp://127.0.0.1:0"), [_SECRET], registry
+    )
+    server.start()
+
+    async def _send_then_wait_for_close(
+        build: Callable[[FrameSigner], list[bytes]],
+    ) -> bool:
+        reader, writer, _, signer = await _open_session(server.bound_port, "edge-3")
+        for frame in build(signer):
+            writer.write(frame)
+        await writer.drain()
+        closed = await asyncio.wait_for(reader.read(), timeout=5.0) == b""
+        writer.close()
+        return closed
+
+    snapshot: dict[str, object] = {"type": "snapshot", "seq": 1, "full": {"a": 1}}
+    forger = FrameSigner(b"k" * 32, server=False)
+    try:
+        assert asyncio.run(
+            _send_then_wait_for_close(lambda _: [encode_frame(snapshot)])
+        )
+        assert asyncio.run(
+            _send_then_wait_for_close(lambda _: [encode_frame(snapshot, forger)])
+        )
+        assert _snapshot_of(registry, "edge-3") is None
+        # A captured frame is accepted once; the replay breaks the counter.
+        assert asyncio.run(
+            _send_then_wait_for_close(
+                lambda signer: [encode_frame(snapshot, signer)] * 2
+            )
+        )
+        assert _snapshot_of(registry, "edge-3") == {"a": 1}
+        assert registry.get_stats()["edge-3"]["full_frames"] == 1
+    finally:
+        server.stop()
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Generator
+from dataclasses import dataclass, field
+from typing import cast
+
+import pytest
+from telebot import TeleBot
+from telebot.types import CallbackQuery
+
+import pytmbot.handlers.server_handlers.inline.agent_host as agent_host_module
+from pytmbot.agent.server import HostRegistry, get_host_registry
+from pytmbot.handlers.handlers_util.agent_hosts import (
+    AGENT_HOSTS_PER_PAGE,
+    AgentHostScreen,
+    build_host_selector,
+    host_callback_data,
+    page_callback_data,
+    parse_agent_host_callback,
+)
+from tests._inline_edit_helpers import assert_reply_markup_has_callbacks
+from tests._telebot_objects import (
+    record_callback_answer,
+    record_edited_message,
+    unwrap_handler,
+)
+
+type _PayloadValue = (
+    str | int | float | bool | None | dict[str, _PayloadValue] | list[_PayloadValue]
+)
+type _PayloadDict = dict[str, _PayloadValue]
+type _CallbackHandler = Callable[[CallbackQuery, TeleBot], None]
+
+
+@dataclass
+class _User:
+    id: int = 17
+
+
+@dataclass
+class _Chat:
+    id: int = 27
+
+
+@dataclass
+class _Message:
+    chat: _Chat = field(default_factory=_Chat)
+    message_id: int = 37
+
+
+@dataclass
+class _Call:
+    id: str = "cb-id"
+    data: str | None = "payload"
+    from_user: _User | None = field(default_factory=_User)
+    message: _Message | None = field(default_factory=_Message)
+
+
+@dataclass
+class _Bot:
+    callback_answers: list[_PayloadDict] = field(default_factory=list)
+    edited_messages: list[_PayloadDict] = field(default_factory=list)
+
+    def answer_callback_query(
+        self, callback_query_id: str, **kwargs: _PayloadValue
+    ) -> bool:
+        record_callback_answer(self.callback_answers, callback_query_id, **kwargs)
+        return True
+
+    def edit_message_text(self, **kwargs: _PayloadValue) -> str:
+        record_edited_message(self.edited_messages, **kwargs)
+        return "edited"
+
+
+@pytest.fixture
+def registry() -> Generator[HostRegistry, None, None]:
+    get_host_registry.cache_clear()
+    yield get_host_registry()
+    get_host_registry.cache_clear()
+
+
+def _report(registry: HostRegistry, host_id: str, snapshot: dict[str, object]) -> None:
+    registry.set_connected(host_id, True)
+    registry.apply_full(host_id, 1, snapshot)
+
+
+def _invoke(
+    monkeypatch: pytest.MonkeyPatch, bot: _Bot, data: str, allowed: bool = True
+) -> None:
+    monkeypatch.setattr(
+        agent_host_module,
+        "authorize_callback_request",
+        lambda _call: (allowed, "Access denied"),
+    )
+    handler = cast(
+        _CallbackHandler, unwrap_handler(agent_host_module.handle_agent_host, depth=2)
+    )
+    handler(cast(CallbackQuery, _Call(data=data)), cast(TeleBot, bot))
+
+
+def test_callback_data_roundtrip() -> None:
+    assert parse_agent_host_callback(
+        host_callback_data(AgentHostScreen.DOCKER, "edge-1")
+    ) == (AgentHostScreen.DOCKER, "edge-1", 0)
+    assert parse_agent_host_callback(page_callback_data(AgentHostScreen.SERVER, 2)) == (
+        AgentHostScreen.SERVER,
+        None,
+        2,
+    )
+    for data in (None, "__agent_host__", "__agent_host__:x:edge", "__other__:s:a"):
+        with pytest.raises(ValueError):
+            parse_agent_host_callback(data)
+
+
+def test_host_selector_pages_hosts() -> None:
+    registry = HostRegistry()
+    assert build_host_selector(AgentHostScreen.SERVER, registry=registry) is None
+    for index in range(AGENT_HOSTS_PER_PAGE + 1):
+        _report(registry, f"host-{index:02d}", {})
+
+    first = build_host_selector(AgentHostScreen.SERVER, 0, registry)
+    last = build_host_selector(AgentHostScreen.SERVER, 5, registry)
+
+    assert_reply_markup_has_callbacks(
+        first,
+        expected_callbacks=[
+            host_callback_data(AgentHostScreen.SERVER, "host-00"),
+            page_callback_data(AgentHostScreen.SERVER, 1),
+        ],
+    )
+    assert_reply_markup_has_callbacks(
+        last,
+        expected_callbacks=[
+            host_callback_data(AgentHostScreen.SERVER, f"host-{AGENT_HOSTS_PER_PAGE}"),
+            page_callback_data(AgentHostScreen.SERVER, 0),
+        ],
+    )
+
+
+@pytest.mark.parametrize(
+    ("screen", "expected"),
+    [(AgentHostScreen.SERVER, "42"), (AgentHostScreen.DOCKER, "web")],
+)
+def test_handle_agent_host_renders_host_view(
+    monkeypatch: pytest.MonkeyPatch,
+    registry: HostRegistry,
+    screen: AgentHostScreen,
+    expected: str,
+) -> None:
+    _report(
+        registry,
+        "edge-1",
+        {
+            "hostname": "edge-1.example",
+            "system": {
+                "uptime": "1 day",
+                "load_average": [0.1, 0.2, 0.3],
+                "cpu": {"percent": 42.0, "count": 4},
+                "memory": {"percent": 50.0, "used": "1 GB", "total": "2 GB"},
+                "disks": {"/": {"percent": 10.0, "used": "1 GB", "size": "10 GB"}},
+            },
+            "docker": {
+                "available": True,
+                "containers_count": 1,
+                "running_containers": 1,
+                "containers": {"web": {"status": "running", "image": "nginx"}},
+            },
+        },
+    )
+    bot = _Bot()
+
+    _invoke(monkeypatch, bot, host_callback_data(screen, "edge-1"))
+
+    (edited,) = bot.edited_messages
+    assert "edge-1" in str(edited["text"])
+    assert expected in str(edited["text"])
+    assert_reply_markup_has_callbacks(
+        edited["reply_markup"],
+        expected_callbacks=[
+            host_callback_data(screen, "edge-1"),
+            page_callback_data(screen, 0),
+        ],
+    )
+
+
+def test_handle_agent_host_falls_back_to_list_for_unknown_host(
+    monkeypatch: pytest.MonkeyPatch, registry: HostRegistry
+) -> None:
+    bot = _Bot()
+    _invoke(monkeypatch, bot, host_callback_data(AgentHostScreen.SERVER, "gone"))
+    assert bot.edited_messages[-1]["text"] == "No remote hosts are reporting."
+
+    _report(registry, "edge-1", {})
+    _invoke(monkeypatch, bot, host_callback_data(AgentHostScreen.SERVER, "gone"))
+    assert "1/1 online" in str(bot.edited_messages[-1]["text"])
+
+
+def test_handle_agent_host_rejects_denied_and_invalid_callbacks(
+    monkeypatch: pytest.MonkeyPatch, registry: HostRegistry
+) -> None:
+    bot = _Bot()
+
+    _invoke(monkeypatch, bot, page_callback_data(AgentHostScreen.SERVER, 0), False)
+    _invoke(monkeypatch, bot, "__agent_host__:z:edge-1")
+
+    assert [answer["text"] for answer in bot.callback_answers] == [
+        "Access denied",
+        "This host button is no longer valid.",
+    ]
+    assert bot.edited_messages == []
+    assert registry.views() == []
@@ -13,8 +13,10 @@ import pytmbot.handlers.bot_handlers.navigation as navigation_module
 import pytmbot.handlers.bot_handlers.start as start_module
 import pytmbot.handlers.docker_handlers.containers as containers_module
 import pytmbot.handlers.docker_handlers.docker as docker_module
+import pytmbot.handlers.handlers_util.static_screens as static_screens_module
 import pytmbot.handlers.server_handlers.server as server_module
 from pytmbot import exceptions
+from pytmbot.globals import get_emoji_converter, get_keyboards
 from pytmbot.parsers.compiler import Compiler
 
 type _PayloadValue = (
@@ -78,26 +80,20 @@ def _invoke_message_handler(
 def test_about_handler_success_and_error(monkeypatch: pytest.MonkeyPatch) -> None:
     sent_payloads: list[_PayloadDict] = []
     monkeypatch.setattr(
-        Compiler,
-        "quick_render",
-        lambda template_name, context: "about-text",
-    )
-    monkeypatch.setattr(
-        about_module,
+        static_screens_module,
         "send_telegram_message",
         lambda **kwargs: sent_payloads.append(kwargs),
     )
 
     bot = _Bot()
     handler = _raw_handler(about_module.handle_about_command)
-    _invoke_message_handler(
-        handler,
-        cast(TeleBot, bot),
-        sent_payloads=sent_payloads,
-        expected_text="about-text",
-    )
+    handler(cast(Message, _Message()), cast(TeleBot, bot))
     assert bot.actions == [(10, "typing")]
+    assert "Hello, *Denis*!" in str(sent_payloads[-1]["text"])
+    assert sent_payloads[-1]["reply_markup"] is None
+    assert sent_payloads[-1]["link_preview_options"] is not None
 
+    static_screens_module.clear_static_screens()
     monkeypatch.setattr(
         Compiler,
         "quick_render",
@@ -110,15 +106,55 @@ def test_about_handler_success_and_error(monkeypatch: pytest.MonkeyPatch) -> Non
     assert exc_info.value.context.error_code == "HAND_018"
 
 
-def test_navigation_start_and_server_handlers(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_static_screens_render_like_templates_and_reuse_markup(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
     sent_payloads: list[_PayloadDict] = []
     monkeypatch.setattr(
-        navigation_module,
+        static_screens_module,
         "send_telegram_message",
         lambda **kwargs: sent_payloads.append(kwargs),
     )
+    name = "<Den & Co>"
+    bot = _Bot()
+    message = _Message(from_user=_User(first_name=name))
+    _raw_handler(start_module.handle_start)(cast(Message, message), cast(TeleBot, bot))
+    _raw_handler(navigation_module.handle_navigation)(
+        cast(Message, message), cast(TeleBot, bot)
+    )
+    _raw_handler(start_module.handle_start)(cast(Message, message), cast(TeleBot, bot))
+
+    start, navigation, start_again = sent_payloads
+    assert start["text"] == Compiler.quick_render(
+        template_name="b_index.jinja2", first_name=name
+    )
+    assert navigation["text"] == Compiler.quick_render(
+        template_name="b_back.jinja2",
+        first_name=name,
+        thought_balloon=get_emoji_converter().get_emoji("thought_balloon"),
+    )
+    assert start["parse_mode"] == "Markdown" and navigation["parse_mode"] == "HTML"
+
+    markup = start["reply_markup"]
+    assert isinstance(markup, static_screens_module.PreserializedMarkup)
+    assert start_again["reply_markup"] is markup is navigation["reply_markup"]
+    assert markup.to_json() == (get_keyboards().build_reply_keyboard().to_json())
+
+
+def test_prebuild_static_screens_warms_every_screen() -> None:
+    static_screens_module.prebuild_static_screens()
+
+    assert static_screens_module.get_static_screen.cache_info().currsize == len(
+        static_screens_module.StaticScreenName
+    )
+    back_markup = static_screens_module.get_static_markup("back_keyboard")
+    assert "Back to main menu" in back_markup.to_json()
+
+
+def test_navigation_start_and_server_handlers(monkeypatch: pytest.MonkeyPatch) -> None:
+    sent_payloads: list[_PayloadDict] = []
     monkeypatch.setattr(
-        start_module,
+        static_screens_module,
         "send_telegram_message",
         lambda **kwargs: sent_payloads.append(kwargs),
     )
@@ -135,33 +171,6 @@ def test_navigation_start_and_server_handlers(monkeypatch: pytest.MonkeyPatch) -
             )
         ),
     )
-
-    monkeypatch.setattr(
-        navigation_module,
-        "keyboards",
-        type(
-            "_Kbd",
-            (),
-            {
-                "build_reply_keyboard": staticmethod(
-                    lambda keyboard_type=None: "nav-kbd"
-                )
-            },
-        )(),
-    )
-    monkeypatch.setattr(
-        start_module,
-        "keyboards",
-        type(
-            "_Kbd2",
-            (),
-            {
-                "build_reply_keyboard": staticmethod(
-                    lambda keyboard_type=None: "start-kbd"
-                )
-            },
-        )(),
-    )
     monkeypatch.setattr(
         server_module,
         "keyboards",
@@ -175,11 +184,6 @@ def test_navigation_start_and_server_handlers(monkeypatch: pytest.MonkeyPatch) -
             },
         )(),
     )
-    monkeypatch.setattr(
-        navigation_module,
-        "em",
-        type("_Em", (), {"get_emoji": staticmethod(lambda _name: "e")})(),
-    )
     monkeypatch.setattr(
         server_module,
         "em",
@@ -194,9 +198,10 @@ def test_navigation_start_and_server_handlers(monkeypatch: pytest.MonkeyPatch) -
     navigation_handler(cast(Message, _Message()), cast(TeleBot, bot))
     start_handler(cast(Message, _Message()), cast(TeleBot, bot))
     server_handler(cast(Message, _Message()), cast(TeleBot, bot))
-    assert len(sent_payloads) >= 2
-    assert any(str(payload["text"]).startswith("nav:") for payload in sent_payloads)
-    assert any(str(payload["text"]).startswith("start:") for payload in sent_payloads)
+    assert [payload["text"] for payload in sent_payloads] == [
+        "nav:Denis",
+        "start:Denis",
+    ]
     assert any(str(msg["text"]).startswith("server:") for msg in bot.sent_messages)
 
     monkeypatch.setattr(
@@ -294,6 +299,26 @@ def test_docker_fetch_compile_and_handle(monkeypatch: pytest.MonkeyPatch) -> Non
     assert exc_info.value.context.error_code == "HAND_011"
 
 
+def test_containers_page_reuses_render_for_equal_rows(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    keys: list[object] = []
+
+    def _render(template_name: str, cache_key: object, **kwargs: object) -> str:
+        keys.append(cache_key)
+        return template_name
+
+    monkeypatch.setattr(Compiler, "quick_render", _render)
+    rows = [{"name": "app", "id": "abc"}]
+    for page_items in (rows, [dict(row) for row in rows], [{"name": "db"}]):
+        containers_module._render_container_page_text(
+            page_items, page=1, total_pages=1, total_items=1
+        )
+
+    assert keys[0] == keys[1] != keys[2]
+    hash(keys[0])
+
+
 def test_containers_render_and_handler_paths(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(
         containers_module,
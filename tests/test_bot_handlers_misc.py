@@ -14,6 +14,7 @@ import pytmbot.handlers.bot_handlers.getmyid as getmyid_module
 import pytmbot.handlers.bot_handlers.inline.update as inline_update_module
 import pytmbot.handlers.bot_handlers.plugins as plugins_module
 import pytmbot.handlers.bot_handlers.updates as updates_module
+import pytmbot.handlers.handlers_util.static_screens as static_screens_module
 import pytmbot.handlers.server_handlers.inline.common as inline_common_module
 from pytmbot import exceptions
 from pytmbot.parsers.compiler import Compiler
@@ -248,22 +249,27 @@ def test_handle_plugins_paths(monkeypatch: pytest.MonkeyPatch) -> None:
 
     @dataclass
     class _PluginManagerStub:
-        keys: list[str]
-        names: list[str]
+        keys: dict[str, str]
+        names: dict[str, str]
         descriptions: dict[str, str]
 
-        def get_merged_index_keys(self) -> list[str]:
+        def get_merged_index_keys(self) -> dict[str, str]:
             return self.keys
 
-        def get_plugin_names(self) -> list[str]:
+        def get_plugin_names(self) -> dict[str, str]:
             return self.names
 
         def get_plugin_descriptions(self) -> dict[str, str]:
             return self.descriptions
 
-    manager_stub = _PluginManagerStub(keys=[], names=[], descriptions={})
+    manager_stub = _PluginManagerStub(keys={}, names={}, descriptions={})
     monkeypatch.setattr(plugins_module, "plugin_manager", manager_stub)
 
+    monkeypatch.setattr(
+        static_screens_module,
+        "send_telegram_message",
+        lambda **kwargs: sent_payloads.append(kwargs),
+    )
     monkeypatch.setattr(
         plugins_module,
         "send_telegram_message",
@@ -275,35 +281,28 @@ def test_handle_plugins_paths(monkeypatch: pytest.MonkeyPatch) -> None:
         sent_payloads[-1]["text"]
     )
 
-    manager_stub.keys = ["A"]
-    manager_stub.names = ["A"]
-    manager_stub.descriptions = {"A": "desc"}
-    monkeypatch.setattr(
-        plugins_module,
-        "keyboards",
-        type(
-            "_Kbd",
-            (),
-            {
-                "build_reply_keyboard": staticmethod(
-                    lambda plugin_keyboard_data=None: "plugins-kbd"
-                )
-            },
-        )(),
-    )
-    monkeypatch.setattr(
-        Compiler,
-        "quick_render",
-        lambda **kwargs: "plugins-rendered",
-    )
-    monkeypatch.setattr(
-        plugins_module,
-        "em",
-        type("_Em", (), {"get_emoji": staticmethod(lambda _key: "💭")})(),
-    )
+    manager_stub.keys = {"puzzle_piece": "Monitor"}
+    manager_stub.names = {"monitor": "1.0"}
+    manager_stub.descriptions = {"monitor": "<desc>"}
+    renders: list[str] = []
+
+    def _render(**kwargs: object) -> str:
+        renders.append(str(kwargs["template_name"]))
+        return f"plugins for {kwargs['first_name']}"
+
+    monkeypatch.setattr(Compiler, "quick_render", _render)
+
+    handler(cast(Message, _Message()), cast(TeleBot, bot))
+    handler(cast(Message, _Message()), cast(TeleBot, bot))
+    assert sent_payloads[-1]["text"] == "plugins for Test"
+    assert renders == ["b_plugins.jinja2"]
+    markup = sent_payloads[-1]["reply_markup"]
+    assert isinstance(markup, static_screens_module.PreserializedMarkup)
+    assert "Monitor" in markup.to_json()
 
+    manager_stub.descriptions = {"monitor": "changed"}
     handler(cast(Message, _Message()), cast(TeleBot, bot))
-    assert sent_payloads[-1]["text"] == "plugins-rendered"
+    assert renders == ["b_plugins.jinja2", "b_plugins.jinja2"]
 
     monkeypatch.setattr(
         manager_stub,
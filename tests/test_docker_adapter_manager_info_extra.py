@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import threading
 import time
 from collections.abc import Callable, Iterator
-from contextlib import contextmanager
+from contextlib import contextmanager, suppress
 from dataclasses import dataclass
 from datetime import datetime
 from types import ModuleType, SimpleNamespace, TracebackType
@@ -631,6 +632,55 @@ def test_enter_slow_path_reuse_and_old_client_close_suppression(
     adapter.__exit__(None, None, None)
 
 
+def test_shared_adapter_defers_closing_replaced_client_until_last_user_exits(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import pytmbot.adapters.docker._adapter as docker_adapter_module
+
+    monkeypatch.setattr(docker_adapter_module, "settings", _docker_settings_stub())
+    adapter = docker_adapter_module.DockerAdapter()
+    stale_client = _FakeDockerClient(ping_ok=False)
+    fresh_client = _FakeDockerClient()
+    adapter._client = stale_client
+    adapter._last_health_check = datetime.now()
+    monkeypatch.setattr(adapter, "_create_client", lambda: fresh_client)
+
+    holding = threading.Event()
+    release = threading.Event()
+    seen: dict[str, object] = {}
+
+    def _long_user() -> None:
+        with suppress(DockerException), adapter as client:
+            seen["holder_client"] = client
+            seen["holder_span"] = adapter._span_id
+            holding.set()
+            assert release.wait(timeout=2.0)
+            seen["holder_span_after"] = adapter._span_id
+            # The other thread's Docker error must not invalidate the new client.
+            raise DockerException("stale connection")
+
+    holder = threading.Thread(target=_long_user)
+    holder.start()
+    assert holding.wait(timeout=2.0)
+
+    # A failing ping on the next use swaps in a new client in this thread.
+    adapter._last_health_check = None
+    with adapter as client:
+        assert client is fresh_client
+        assert adapter._span_id != seen["holder_span"]
+    assert stale_client.closed is False
+    checked_at = adapter._last_health_check = datetime.now()
+
+    release.set()
+    holder.join(timeout=2.0)
+    assert seen["holder_client"] is stale_client
+    assert seen["holder_span_after"] == seen["holder_span"]
+    assert stale_client.closed is True
+    assert fresh_client.closed is False
+    assert adapter._last_health_check is checked_at
+    assert adapter._client_users == {} and adapter._retired_clients == {}
+
+
 def test_health_check_docker_connection_error_and_del_cleanup_warning(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
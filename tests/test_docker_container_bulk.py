@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import pytest
+
+import pytmbot.adapters.docker.container_manager as container_manager_module
+from pytmbot.adapters.docker.container_manager import (
+    BulkContainerSelector,
+    ContainerManager,
+)
+from pytmbot.models.docker_models import ContainerAction
+
+
+class _BulkContainer:
+    def __init__(self, name: str, *, delay: float = 0.0, fail: bool = False) -> None:
+        self.name = name
+        self.status = "running"
+        self.labels = {container_manager_module.COMPOSE_PROJECT_LABEL: "shop"}
+        self._delay = delay
+        self._fail = fail
+        self.restarts = 0
+
+    def restart(self, timeout: int) -> None:
+        del timeout
+        time.sleep(self._delay)
+        if self._fail:
+            raise RuntimeError("restart failed")
+        self.restarts += 1
+
+    def reload(self) -> None:
+        return
+
+
+def _patch_manager(
+    monkeypatch: pytest.MonkeyPatch, containers: dict[str, _BulkContainer]
+) -> list[dict[str, object]]:
+    list_calls: list[dict[str, object]] = []
+
+    def _list(**kwargs: object) -> list[_BulkContainer]:
+        list_calls.append(kwargs)
+        return list(containers.values())
+
+    @contextmanager
+    def _context() -> Iterator[SimpleNamespace]:
+        yield SimpleNamespace(containers=SimpleNamespace(list=_list))
+
+    monkeypatch.setattr(container_manager_module, "docker_client_context", _context)
+    monkeypatch.setattr(
+        container_manager_module,
+        "get_container_safely",
+        lambda cid, docker_client=None: containers[cid],
+    )
+    monkeypatch.setattr(
+        container_manager_module,
+        "settings",
+        SimpleNamespace(
+            access_control=SimpleNamespace(
+                allowed_admins_ids=[4001, 4002, 4003], max_session_age=3600
+            ),
+            docker=SimpleNamespace(start_timeout=5, stop_timeout=5, restart_timeout=5),
+        ),
+    )
+    monkeypatch.setattr(
+        container_manager_module,
+        "session_manager",
+        SimpleNamespace(
+            is_authenticated=lambda _uid: True,
+            get_session_info=lambda _uid: {"created_at": time.time()},
+        ),
+    )
+    return list_calls
+
+
+def test_bulk_selector_filters_and_requires_criterion() -> None:
+    selector = BulkContainerSelector(compose_project="shop", health="unhealthy")
+
+    assert selector.docker_filters() == {
+        "label": "com.docker.compose.project=shop",
+        "health": "unhealthy",
+    }
+    assert selector.describe() == "project=shop,health=unhealthy"
+    with pytest.raises(ValueError, match="at least one criterion"):
+        BulkContainerSelector()
+
+
+def test_bulk_restart_runs_in_parallel_and_aggregates_failures(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    containers = {
+        "api": _BulkContainer("api", delay=0.2),
+        "db": _BulkContainer("db", delay=0.2),
+        "worker": _BulkContainer("worker", fail=True),
+    }
+    list_calls = _patch_manager(monkeypatch, containers)
+
+    started = time.perf_counter()
+    result = ContainerManager().bulk_operation(
+        4001, "restart", BulkContainerSelector(compose_project="shop")
+    )
+    elapsed = time.perf_counter() - started
+
+    assert list_calls == [
+        {"all": True, "filters": {"label": "com.docker.compose.project=shop"}}
+    ]
+    assert elapsed < 0.35
+    assert [o.container_name for o in result.succeeded] == ["api", "db"]
+    assert [o.container_name for o in result.failed] == ["worker"]
+    assert containers["api"].restarts == 1
+    summary = result.summary()
+    assert summary.startswith("Bulk restart (project=shop): 2 ok, 1 failed")
+    assert "✗ worker:" in summary
+
+
+def test_bulk_operation_validates_access_once_and_rejects_rename(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _patch_manager(monkeypatch, {"api": _BulkContainer("api")})
+    manager = ContainerManager()
+    selector = BulkContainerSelector(compose_project="shop")
+
+    with pytest.raises(PermissionError):
+        manager.bulk_operation(999, ContainerAction.RESTART, selector)
+    with pytest.raises(ValueError, match="Unsupported bulk action"):
+        manager.bulk_operation(4002, ContainerAction.RENAME, selector)
+
+    result = manager.bulk_operation(4002, ContainerAction.RESTART, selector)
+    assert len(result.succeeded) == 1
+    with pytest.raises(PermissionError, match="Rate limit"):
+        manager.bulk_operation(4002, ContainerAction.RESTART, selector)
+
+
+def test_run_with_timeout_reuses_shared_executor() -> None:
+    manager = ContainerManager()
+    thread_names: list[str] = []
+
+    for _ in range(3):
+        manager._run_with_timeout(
+            "noop", lambda: thread_names.append(threading.current_thread().name), 1.0
+        )
+
+    assert all(name.startswith("docker-lifecycle") for name in thread_names)
+    assert "lifecycle" in container_manager_module._executors
+
+
+def test_bulk_operation_times_out_each_container_from_its_own_start(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    containers = {
+        "api": _BulkContainer("api"),
+        "cache": _BulkContainer("cache"),
+        "db": _BulkContainer("db"),
+        "hung": _BulkContainer("hung", delay=0.8),
+    }
+    _patch_manager(monkeypatch, containers)
+
+    started = time.perf_counter()
+    result = ContainerManager().bulk_operation(
+        4003,
+        "restart",
+        BulkContainerSelector(compose_project="shop"),
+        per_container_timeout=0.3,
+    )
+    elapsed = time.perf_counter() - started
+
+    # Two waves would allow 0.6s for the whole batch; the hung item gets 0.3s.
+    assert elapsed < 0.55
+    assert [o.container_name for o in result.succeeded] == ["api", "cache", "db"]
+    assert [o.container_name for o in result.failed] == ["hung"]
+    assert str(result.failed[0].error).startswith("timed out")
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import gzip
+import itertools
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import pytest
+from docker.errors import APIError
+
+import pytmbot.adapters.docker.container_logs as container_logs_module
+from pytmbot.adapters.docker.container_logs import (
+    LogSeverity,
+    build_log_line_matcher,
+    iter_log_lines,
+    search_log_lines,
+)
+from pytmbot.exceptions import ContainerLogsUnavailableError
+
+
+class _Stream:
+    def __init__(self, chunks: list[bytes]) -> None:
+        self._chunks = chunks
+        self.consumed = 0
+        self.closed = False
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self._chunks:
+            self.consumed += 1
+            yield chunk
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _patch_container(
+    monkeypatch: pytest.MonkeyPatch, stream: _Stream | Exception
+) -> list[dict[str, object]]:
+    calls: list[dict[str, object]] = []
+
+    def _logs(**kwargs: object) -> _Stream:
+        calls.append(kwargs)
+        if isinstance(stream, Exception):
+            raise stream
+        return stream
+
+    @contextmanager
+    def _context() -> Iterator[SimpleNamespace]:
+        yield SimpleNamespace()
+
+    monkeypatch.setattr(container_logs_module, "docker_client_context", _context)
+    monkeypatch.setattr(
+        container_logs_module,
+        "get_container_safely",
+        lambda _cid, docker_client=None: SimpleNamespace(logs=_logs),
+    )
+    return calls
+
+
+def test_iter_log_lines_reassembles_frames_and_bounds_long_lines() -> None:
+    chunks = [b"first li", b"ne\nsecond\n", b"x" * 50, b"y" * 50 + b"\nlast"]
+
+    lines = list(iter_log_lines(chunks, max_line_chars=10))
+
+    assert lines == ["first line", "second", "xxxxxxx...", "last"]
+
+
+def test_build_log_line_matcher_combines_severity_and_pattern() -> None:
+    errors = build_log_line_matcher(severity=LogSeverity.ERROR)
+    warnings = build_log_line_matcher(severity="warning")
+    errors_db = build_log_line_matcher(pattern=r"db", severity="error")
+
+    assert errors("2024 ERROR failed") and not errors("WARN slow")
+    assert warnings("WARN slow") and warnings("fatal: crash")
+    assert not warnings("terror is not a level")
+    assert errors_db("ERROR db down") and not errors_db("ERROR cache down")
+
+    with pytest.raises(ValueError, match="pattern or a severity"):
+        build_log_line_matcher()
+    with pytest.raises(ValueError, match="Invalid log search pattern"):
+        build_log_line_matcher(pattern="(")
+
+
+def test_search_log_lines_merges_context_and_keeps_newest_matches() -> None:
+    lines = [
+        "match old",
+        *(f"line {i}" for i in range(1, 9)),
+        "match a",
+        "gap",
+        "match b",
+        "tail",
+        "quiet",
+    ]
+
+    result = search_log_lines(
+        iter(lines),
+        lambda line: line.startswith("match"),
+        max_matches=2,
+        context_lines=1,
+    )
+
+    assert result.match_count == 3
+    assert result.scanned_lines == len(lines)
+    assert result.limit_reached is True
+    assert len(result.blocks) == 1
+    assert result.render() == "  line 8\n> match a\n  gap\n> match b\n  tail"
+
+
+def test_search_log_lines_evicts_within_a_merged_block() -> None:
+    lines = ["a", "match 1", "b", "match 2", "c", "d", "match 3", "e"]
+
+    result = search_log_lines(
+        iter(lines),
+        lambda line: line.startswith("match"),
+        max_matches=2,
+        context_lines=1,
+    )
+
+    assert result.render() == "  b\n> match 2\n  c\n  d\n> match 3\n  e"
+
+
+def test_search_log_lines_respects_time_budget() -> None:
+    ticks = itertools.count()
+
+    result = search_log_lines(
+        (f"line {i}" for i in range(100)),
+        lambda line: False,
+        time_budget_seconds=3,
+        clock=lambda: float(next(ticks)),
+    )
+
+    assert result.timed_out is True
+    assert result.scanned_lines < 5
+
+
+def test_search_container_logs_streams_and_closes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    stream = _Stream(
+        [b"INFO ok\nERROR one\n", b"INFO ok\n", b"ERROR two\n", b"ERROR three\n"]
+    )
+    calls = _patch_container(monkeypatch, stream)
+
+    result = container_logs_module.search_container_logs(
+        "api", severity="error", max_matches=1, context_lines=0
+    )
+
+    assert calls[0]["stream"] is True
+    assert calls[0]["follow"] is False
+    assert calls[0]["tail"] == container_logs_module.LOG_SEARCH_TAIL_LINES
+    assert result.render() == "> ERROR three"
+    assert result.match_count == 3
+    assert stream.consumed == 4
+    assert stream.closed is True
+
+
+def test_search_container_logs_maps_unreadable_driver(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _patch_container(
+        monkeypatch, APIError("configured logging driver does not support reading")
+    )
+
+    with pytest.raises(ContainerLogsUnavailableError):
+        container_logs_module.search_container_logs("api", severity="error")
+
+
+def test_write_compressed_log_export_streams_and_filters() -> None:
+    chunks = [b"token=secret one\n", b"two\nthr", b"ee\n"]
+
+    with container_logs_module.write_compressed_log_export(
+        chunks,
+        text_filter=lambda text: text.replace("secret", "******"),
+        spool_bytes=8,
+    ) as export:
+        payload = gzip.decompress(export.file.read())
+
+    assert payload == b"token=****** one\ntwo\nthree\n"
+    assert export.extension == "gz"
+    assert export.truncated is False
+    assert export.raw_bytes == len(payload)
+
+
+def test_write_compressed_log_export_truncates_at_size_cap() -> None:
+    noisy = [os.urandom(48).hex().encode() + b"\n" for _ in range(40_000)]
+
+    with container_logs_module.write_compressed_log_export(
+        iter(noisy), max_bytes=300 * 1024
+    ) as export:
+        payload = gzip.decompress(export.file.read())
+
+    assert export.truncated is True
+    assert export.compressed_bytes <= 300 * 1024
+    assert payload.endswith(container_logs_module.LOG_EXPORT_TRUNCATION_NOTICE)
+
+
+def test_write_compressed_log_export_rejects_oversized_cap() -> None:
+    with pytest.raises(ValueError, match="max_bytes"):
+        container_logs_module.write_compressed_log_export(
+            [], max_bytes=container_logs_module.TELEGRAM_MAX_UPLOAD_BYTES + 1
+        )
+
+
+def test_export_container_logs_closes_stream(monkeypatch: pytest.MonkeyPatch) -> None:
+    stream = _Stream([b"a\n", b"b\n"])
+    calls = _patch_container(monkeypatch, stream)
+
+    with container_logs_module.export_container_logs("api") as export:
+        assert gzip.decompress(export.file.read()) == b"a\nb\n"
+
+    assert calls[0]["stream"] is True
+    assert stream.closed is True
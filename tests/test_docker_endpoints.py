@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import json
+import re
+import socketserver
+import threading
+import time
+from collections.abc import Generator, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler
+from pathlib import Path
+
+import pytest
+
+import pytmbot.adapters.docker.client as client_module
+import pytmbot.adapters.docker.containers_info as containers_info_module
+from pytmbot.adapters.docker.client import (
+    docker_client_context,
+    docker_endpoint_names,
+    docker_fan_out,
+    reset_docker_client_context,
+)
+from pytmbot.adapters.docker.endpoints import DockerEndpoint
+from pytmbot.adapters.docker.updates import _list_local_images
+from pytmbot.exceptions import DockerConnectionError
+
+_VERSION_PREFIX = re.compile(r"^/v[0-9.]+")
+
+
+@dataclass
+class _Daemon:
+    """State served by one fake Docker Engine API daemon."""
+
+    containers: dict[str, tuple[str, str]]
+    images: dict[str, list[str]] = field(default_factory=dict)
+    list_delay: float = 0.0
+    requests: list[str] = field(default_factory=list)
+
+    def route(self, path: str) -> object:
+        if path == "/_ping":
+            return "OK"
+        if path == "/version":
+            return {"ApiVersion": "1.41", "Version": "24.0.0", "MinAPIVersion": "1.12"}
+        if path in ("/containers/json", "/images/json"):
+            time.sleep(self.list_delay)
+        if path == "/containers/json":
+            return [{"Id": container_id} for container_id in self.containers]
+        if match := re.fullmatch(r"/containers/([^/]+)/json", path):
+            name, status = self.containers[match.group(1)]
+            return {
+                "Id": match.group(1),
+                "Name": f"/{name}",
+                "Created": "2025-01-01T00:00:00Z",
+                "State": {"Status": status, "StartedAt": "0001-01-01T00:00:00Z"},
+                "Config": {"Image": "nginx:1.27"},
+            }
+        if path == "/images/json":
+            return [{"Id": image_id} for image_id in self.images]
+        if match := re.fullmatch(r"/images/([^/]+)/json", path):
+            return {
+                "Id": match.group(1),
+                "RepoTags": self.images[match.group(1)],
+                "RepoDigests": [],
+                "Created": "2025-01-01T00:00:00Z",
+            }
+        raise KeyError(path)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: _UnixHTTPServer
+
+    def do_GET(self) -> None:
+        path = _VERSION_PREFIX.sub("", self.path.split("?", 1)[0])
+        self.server.daemon.requests.append(path)
+        try:
+            payload = self.server.daemon.route(path)
+            status = 200
+        except KeyError:
+            payload, status = {"message": "not found"}, 404
+        body = (payload if isinstance(payload, str) else json.dumps(payload)).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        return
+
+
+class _UnixHTTPServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: str, daemon: _Daemon) -> None:
+        self.daemon = daemon
+        super().__init__(path, _Handler)
+
+
+@contextmanager
+def _serve(path: Path, daemon: _Daemon) -> Iterator[str]:
+    server = _UnixHTTPServer(str(path), daemon)
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    try:
+        yield f"unix://{path}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def daemons(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Generator[dict[str, _Daemon], None, None]:
+    """Serve ``alpha`` (fast) and ``beta`` (slow) daemons as named endpoints."""
+    fleet = {
+        "alpha": _Daemon(
+            containers={"a1": ("web", "running"), "a2": ("db", "exited")},
+            images={"sha256:i1": ["nginx:1.27"]},
+        ),
+        "beta": _Daemon(
+            containers={"b1": ("cache", "running")},
+            images={"sha256:i1": ["nginx:1.27"], "sha256:i2": ["redis:7"]},
+        ),
+    }
+    monkeypatch.setattr(containers_info_module, "_docker_counters_cache", None)
+    with _serve(tmp_path / "a.sock", fleet["alpha"]) as alpha_url:
+        with _serve(tmp_path / "b.sock", fleet["beta"]) as beta_url:
+            endpoints = (
+                DockerEndpoint("alpha", alpha_url, query_timeout_seconds=3.0),
+                DockerEndpoint("beta", beta_url, query_timeout_seconds=0.5),
+            )
+            monkeypatch.setattr(
+                client_module, "resolve_docker_endpoints", lambda _settings: endpoints
+            )
+            reset_docker_client_context()
+            yield fleet
+            reset_docker_client_context()
+
+
+def test_endpoints_share_one_pooled_client_per_daemon(
+    daemons: dict[str, _Daemon],
+) -> None:
+    assert docker_endpoint_names() == ("alpha", "beta")
+
+    with docker_client_context() as primary:
+        assert primary.api.base_url.startswith("http+docker://")
+    results: list[object] = []
+    worker = threading.Thread(
+        target=lambda: results.append(docker_client_context("alpha").__enter__())
+    )
+    worker.start()
+    worker.join()
+
+    assert results == [primary]
+    with docker_client_context("beta") as secondary:
+        assert secondary is not primary
+    with pytest.raises(KeyError):
+        with docker_client_context("gamma"):
+            pass
+
+
+def test_fan_out_merges_containers_and_counters(daemons: dict[str, _Daemon]) -> None:
+    containers = containers_info_module.retrieve_containers_stats()
+    counters = containers_info_module.fetch_docker_counters(force_refresh=True)
+
+    assert [(item["name"], item["endpoint"]) for item in containers] == [
+        ("Cache", "beta"),
+        ("Db", "alpha"),
+        ("Web", "alpha"),
+    ]
+    assert counters == {
+        "images_count": 3,
+        "containers_count": 3,
+        "running_containers": 2,
+        "stopped_containers": 1,
+        "unreachable_endpoints": 0,
+    }
+    assert containers_info_module._get_cached_docker_counters() == counters
+
+
+def test_slow_endpoint_yields_partial_results(daemons: dict[str, _Daemon]) -> None:
+    daemons["beta"].list_delay = 1.5
+    started = time.monotonic()
+
+    containers = containers_info_module.retrieve_containers_stats()
+    counters = containers_info_module.fetch_docker_counters(force_refresh=True)
+
+    assert time.monotonic() - started < 1.5
+    assert {item["endpoint"] for item in containers} == {"alpha"}
+    assert counters["containers_count"] == 2
+    assert counters["unreachable_endpoints"] == 1
+    assert containers_info_module._get_cached_docker_counters() is None
+
+    # The timed-out call still holds its worker, so beta is skipped, not queued.
+    outcome = docker_fan_out(lambda client: len(client.containers.list(all=True)))
+    assert outcome.results == {"alpha": 2}
+    assert outcome.failures == {"beta": "previous query still running"}
+    assert outcome.partial
+
+
+def test_local_images_are_collected_from_every_endpoint(
+    daemons: dict[str, _Daemon],
+) -> None:
+    tags = sorted(tag for image in _list_local_images() for tag in image.tags)
+
+    assert tags == ["nginx:1.27", "nginx:1.27", "redis:7"]
+    assert "/images/json" in daemons["alpha"].requests
+    assert "/images/json" in daemons["beta"].requests
+
+
+def test_fan_out_fails_only_when_every_endpoint_fails(
+    daemons: dict[str, _Daemon], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def _boom(_client: object) -> int:
+        raise RuntimeError("daemon exploded")
+
+    outcome = docker_fan_out(_boom)
+
+    assert outcome.results == {}
+    assert set(outcome.failures) == {"alpha", "beta"}
+    monkeypatch.setattr(containers_info_module, "_count_docker_objects", _boom)
+    with pytest.raises(DockerConnectionError, match="No Docker endpoint answered"):
+        containers_info_module.fetch_docker_counters(force_refresh=True)
@@ -577,6 +577,20 @@ def test_handle_manage_container_paths(monkeypatch: pytest.MonkeyPatch) -> None:
     running_values = [item["callback_data"] for item in running_callbacks]
     assert any(value.startswith("__stop__") for value in running_values)
     assert any(value.startswith("__restart__") for value in running_values)
+    assert not any(value.startswith("__bulk_restart__") for value in running_values)
+
+    monkeypatch.setattr(
+        manage_module,
+        "get_compose_project",
+        lambda container_name, docker_client: "shop",
+    )
+    handler(cast(CallbackQuery, _Call(data="__manage__:api:11")), cast(TeleBot, bot))
+    compose_callbacks = cast(
+        list[dict[str, str]], bot.edited_messages[-1]["reply_markup"]
+    )
+    assert "__bulk_restart__:api:11" in [
+        item["callback_data"] for item in compose_callbacks
+    ]
 
     _patch_manage_container_state(monkeypatch, state="exited")
     handler(cast(CallbackQuery, _Call(data="__manage__:api:11")), cast(TeleBot, bot))
@@ -3,7 +3,7 @@ from __future__ import annotations
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from types import SimpleNamespace
-from typing import cast
+from typing import Any, cast
 
 import pytest
 from telebot import TeleBot
@@ -11,16 +11,24 @@ from telebot.types import CallbackQuery
 
 import pytmbot.handlers.docker_handlers.inline.logs as logs_module
 import pytmbot.handlers.server_handlers.inline.common as inline_common_module
+from pytmbot.adapters.docker.container_logs import (
+    LogExport,
+    write_compressed_log_export,
+)
 from pytmbot.exceptions import ContainerLogsUnavailableError, ErrorContext
 from pytmbot.handlers.docker_handlers.inline.logs import (
+    LOGS_ACTION_EXPORT,
     LOGS_ACTION_FILE,
     LOGS_ACTION_NAV,
     LOGS_ACTION_OPEN,
     LOGS_ACTION_REFRESH,
+    LOGS_ACTION_SEARCH,
     LOGS_CALLBACK_PREFIX,
     LOGS_EMPTY_MESSAGE,
+    LOGS_EXPORT_CALLBACK_PREFIX,
     LOGS_FILE_AUTO_DELETE_DELAY_SECONDS,
     LOGS_FILE_DELETION_NOTICE,
+    LOGS_SEARCH_CALLBACK_PREFIX,
     LOGS_TRUNCATION_NOTICE,
     LogsSession,
     LogsSessionStore,
@@ -120,14 +128,16 @@ def _make_session(
     )
 
 
-def _raw_handle_get_logs() -> Callable[[CallbackQuery, TeleBot], None]:
-    first_layer = getattr(
-        logs_module.handle_get_logs, "__wrapped__", logs_module.handle_get_logs
-    )
+def _unwrap_logs_handler(handler: object) -> Callable[[CallbackQuery, TeleBot], None]:
+    first_layer = getattr(handler, "__wrapped__", handler)
     second_layer = getattr(first_layer, "__wrapped__", first_layer)
     return cast(Callable[[CallbackQuery, TeleBot], None], second_layer)
 
 
+def _raw_handle_get_logs() -> Callable[[CallbackQuery, TeleBot], None]:
+    return _unwrap_logs_handler(logs_module.handle_get_logs)
+
+
 def _dispatch_logs_callback(
     raw_handler: Callable[[CallbackQuery, TeleBot], None],
     bot: SimpleNamespace,
@@ -293,6 +303,7 @@ def test_parse_logs_callback_data_valid(
         "__get_logs__:open",
         "__get_logs__:nav:sess:not-int:100",
         "__get_logs__:open:nginx:not-int",
+        "__get_logs__:search:sess:debug:100",
     ],
 )
 def test_parse_logs_callback_data_invalid(data: str) -> None:
@@ -300,6 +311,44 @@ def test_parse_logs_callback_data_invalid(data: str) -> None:
         logs_module._parse_logs_callback_data(data)
 
 
+def test_parse_logs_search_callback_data() -> None:
+    parse = logs_module._parse_logs_search_callback_data
+
+    assert parse(f"{LOGS_SEARCH_CALLBACK_PREFIX}:sess:error:100") == (
+        ParsedLogsCallback(
+            action=LOGS_ACTION_SEARCH,
+            session_id="sess",
+            search_severity="error",
+            user_id=100,
+        )
+    )
+    for data in (
+        f"{LOGS_SEARCH_CALLBACK_PREFIX}:sess:debug:100",
+        f"{LOGS_SEARCH_CALLBACK_PREFIX}:sess:error",
+        f"{LOGS_CALLBACK_PREFIX}:sess:error:100",
+    ):
+        with pytest.raises(ValueError):
+            parse(data)
+
+
+def test_parse_logs_export_callback_data() -> None:
+    parse = logs_module._parse_logs_export_callback_data
+
+    assert parse(f"{LOGS_EXPORT_CALLBACK_PREFIX}:sess:100") == ParsedLogsCallback(
+        action=LOGS_ACTION_EXPORT, session_id="sess", user_id=100
+    )
+    for data in (
+        f"{LOGS_EXPORT_CALLBACK_PREFIX}:sess",
+        f"{LOGS_CALLBACK_PREFIX}:{LOGS_ACTION_EXPORT}:sess:100",
+    ):
+        with pytest.raises(ValueError):
+            parse(data)
+    with pytest.raises(ValueError):
+        logs_module._parse_logs_callback_data(
+            f"{LOGS_CALLBACK_PREFIX}:{LOGS_ACTION_EXPORT}:sess:100"
+        )
+
+
 def test_build_logs_chunks_handles_empty_and_newest_first() -> None:
     assert logs_module._build_logs_chunks("   ") == [LOGS_EMPTY_MESSAGE]
 
@@ -940,3 +989,168 @@ def test_send_logs_as_file_includes_expected_schedule_delay(
 
     assert captured_delay == [LOGS_FILE_AUTO_DELETE_DELAY_SECONDS]
     assert bot.callback_answers[0]["text"] == "Sent nginx-logs.txt. Auto-delete in 30s."
+
+
+def test_handle_search_logs_creates_filtered_session(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _allow_logs_actions(monkeypatch)
+    source = _make_session(session_id="src", container_name="api", user_id=333)
+    created: list[LogsSession] = []
+    edited: list[LogsSession] = []
+    removed: list[str] = []
+
+    class _Store:
+        def get(self, session_id: str) -> LogsSession | None:
+            if session_id == "src":
+                return source
+            return next((s for s in created if s.session_id == session_id), None)
+
+        def remove(self, session_id: str) -> None:
+            removed.append(session_id)
+
+        def create(self, **kwargs: object) -> LogsSession:
+            session = LogsSession(
+                session_id="found",
+                created_at=1.0,
+                **cast(dict[str, Any], kwargs),
+            )
+            created.append(session)
+            return session
+
+    search_result = SimpleNamespace(
+        match_count=1, scanned_lines=40, timed_out=False, limit_reached=True
+    )
+    monkeypatch.setattr(logs_module, "_logs_sessions", _Store())
+    monkeypatch.setattr(
+        logs_module,
+        "search_sanitized_logs",
+        lambda container_name, call, token, severity: (
+            "> ERROR boom",
+            search_result,
+        ),
+    )
+    monkeypatch.setattr(
+        logs_module,
+        "_edit_logs_message",
+        lambda call, bot, session, page_index, emojis: edited.append(session),
+    )
+
+    search_handler = _unwrap_logs_handler(logs_module.handle_search_logs)
+    _dispatch_logs_callback(
+        search_handler,
+        _make_dummy_bot(),
+        f"{LOGS_SEARCH_CALLBACK_PREFIX}:src:error:333",
+    )
+    # Refreshing the search result replaces it with a new one.
+    _dispatch_logs_callback(
+        search_handler,
+        _make_dummy_bot(),
+        f"{LOGS_SEARCH_CALLBACK_PREFIX}:found:error:333",
+    )
+
+    assert edited == created and len(created) == 2
+    assert removed == ["found"]
+    assert created[0].container_name == "api"
+    assert created[0].search_severity == "error"
+    assert created[0].chunks == ["> ERROR boom"]
+    assert created[0].search_summary == (
+        "Errors: 1 match(es) in 40 line(s), match limit reached, newest shown"
+    )
+
+
+def test_build_logs_keyboard_for_search_session_offers_other_filters(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        logs_module,
+        "button_data",
+        lambda text, callback_data: {"text": text, "callback_data": callback_data},
+    )
+    monkeypatch.setattr(
+        logs_module,
+        "keyboards",
+        SimpleNamespace(build_inline_keyboard=lambda buttons: buttons),
+    )
+    monkeypatch.setattr(logs_module, "em", SimpleNamespace(get_emoji=lambda key: ""))
+    session = _make_session(session_id="sid-1", container_name="api", user_id=77)
+    session.search_severity = "error"
+
+    buttons = cast(
+        list[dict[str, str]],
+        logs_module._build_logs_keyboard(
+            session=session, current_page=0, total_pages=1
+        ),
+    )
+    callbacks = [button["callback_data"] for button in buttons]
+    assert f"{LOGS_SEARCH_CALLBACK_PREFIX}:sid-1:warning:77" in callbacks
+    assert f"{LOGS_SEARCH_CALLBACK_PREFIX}:sid-1:error:77" == (
+        next(b["callback_data"] for b in buttons if b["text"] == "Refresh")
+    )
+    assert f"{LOGS_CALLBACK_PREFIX}:open:api:77" in callbacks
+    assert f"{LOGS_EXPORT_CALLBACK_PREFIX}:sid-1:77" in callbacks
+
+
+def test_send_logs_export_uploads_compressed_archive(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    bot, call, session = _build_logs_file_context(
+        monkeypatch,
+        schedule_result=DeletionResult(
+            status=DeletionStatus.SCHEDULED,
+            message_id=987,
+            user_id=99,
+            pending_count=1,
+        ),
+    )
+    export = write_compressed_log_export([b"full log\n"])
+    requested: list[dict[str, object]] = []
+
+    def _export(
+        container_name: str, call: object, token: str, **kwargs: object
+    ) -> LogExport:
+        requested.append({"container_name": container_name, **kwargs})
+        return export
+
+    monkeypatch.setattr(logs_module, "export_sanitized_logs", _export)
+
+    result = logs_module._send_logs_export(
+        call=cast(CallbackQuery, call),
+        bot=cast(TeleBot, bot),
+        session=session,
+    )
+
+    assert result is True
+    assert requested[0]["container_name"] == "api"
+    assert requested[0]["max_bytes"] == 20 * 1024 * 1024
+    assert bot.documents[0]["visible_file_name"] == "api-logs.txt.gz"
+    assert LOGS_FILE_DELETION_NOTICE in str(bot.documents[0]["caption"])
+    assert export.file.closed
+
+
+def test_handle_export_logs_sends_export_for_session(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _allow_logs_actions(monkeypatch)
+    session = _make_session(session_id="sid-1", container_name="api", user_id=333)
+    exported: list[LogsSession] = []
+
+    class _Store:
+        def get(self, session_id: str) -> LogsSession | None:
+            return session if session_id == "sid-1" else None
+
+    monkeypatch.setattr(logs_module, "_logs_sessions", _Store())
+
+    def _send_export(**kwargs: object) -> bool:
+        exported.append(cast(LogsSession, kwargs["session"]))
+        return True
+
+    monkeypatch.setattr(logs_module, "_send_logs_export", _send_export)
+
+    _dispatch_logs_callback(
+        _unwrap_logs_handler(logs_module.handle_export_logs),
+        _make_dummy_bot(),
+        f"{LOGS_EXPORT_CALLBACK_PREFIX}:sid-1:333",
+    )
+
+    assert exported == [session]
@@ -477,20 +477,7 @@ def test_handle_image_updates_paths(monkeypatch: pytest.MonkeyPatch) -> None:
     )
 
 
-def test_manage_action_fabric_and_dispatch(monkeypatch: pytest.MonkeyPatch) -> None:
-    assert (
-        manage_action_module.managing_action_fabric(
-            cast(CallbackQuery, _Call(data="__start__:c:1"))
-        )
-        is True
-    )
-    assert (
-        manage_action_module.managing_action_fabric(
-            cast(CallbackQuery, _Call(data="other"))
-        )
-        is False
-    )
-
+def test_manage_action_dispatch(monkeypatch: pytest.MonkeyPatch) -> None:
     handler = _raw_handler(manage_action_module.handle_manage_container_action)
     bot = _Bot()
 
@@ -673,6 +660,51 @@ def test_manage_action_private_functions(monkeypatch: pytest.MonkeyPatch) -> Non
     assert shown[-1] == "Restarting api: Unexpected error occurred"
 
 
+def test_bulk_restart_asks_for_confirmation_and_reports_access_denied(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    bot = _Bot()
+    shown: list[str] = []
+    runs: list[int] = []
+    monkeypatch.setattr(
+        manage_action_module,
+        "show_handler_info",
+        lambda call, text, bot: shown.append(text),
+    )
+    monkeypatch.setattr(
+        manage_action_module, "get_compose_project", lambda _name: "shop"
+    )
+
+    def _denied(user_id: int, action: str, selector: object) -> object:
+        runs.append(user_id)
+        raise PermissionError("Rate limit exceeded. Wait 1.0s between operations")
+
+    monkeypatch.setattr(
+        manage_action_module.container_manager, "bulk_operation", _denied
+    )
+
+    manage_action_module.__confirm_bulk_restart_project(
+        cast(CallbackQuery, _Call()), "api", cast(TeleBot, bot)
+    )
+    assert runs == []
+    assert bot.edited_messages[-1]["text"] == (
+        "Restart every container of compose project shop?"
+    )
+    assert_reply_markup_has_callbacks(
+        bot.edited_messages[-1].get("reply_markup"),
+        expected_callbacks=["__bulk_restart_run__:api:11", "__manage__:api:11"],
+    )
+
+    manage_action_module.__bulk_restart_project(
+        cast(CallbackQuery, _Call()), "api", cast(TeleBot, bot)
+    )
+    assert runs == [11]
+    assert shown[-1] == (
+        "Restarting project shop: Access denied. "
+        "Rate limit exceeded. Wait 1.0s between operations"
+    )
+
+
 def test_handle_back_to_containers_ignores_not_modified(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
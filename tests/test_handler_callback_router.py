@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import cast
+
+import pytest
+from telebot import TeleBot
+from telebot.types import CallbackQuery
+
+import pytmbot.handlers.handler_manager as factory_module
+from pytmbot.handlers.callback_router import (
+    CallbackMatch,
+    CallbackPattern,
+    CallbackRoute,
+    CallbackRouter,
+)
+
+
+def _linear_route(data: str | None) -> str | None:
+    """First configured handler whose pattern matches, as one filter per handler did."""
+    if data is None:
+        return None
+    for name, configs in factory_module._get_inline_handler_configs().items():
+        for config in configs:
+            for pattern in config.callback_patterns:
+                if pattern.match is CallbackMatch.PREFIX:
+                    matched = data.startswith(pattern.key)
+                else:
+                    matched = data == pattern.key or data.startswith(f"{pattern.key}:")
+                if matched:
+                    return name
+    return None
+
+
+_KEYS = [
+    "__swap_info__",
+    "__process_info__",
+    "__process_info_process__",
+    "__process_overview__",
+    "__cpu_info__",
+    "__cpu_per_core__",
+    "__cpu_times__",
+    "__how_update__",
+    "__get_logs__",
+    "__search_logs__",
+    "__export_logs__",
+    "__get_full__",
+    "back_to_containers",
+    "__containers_page__",
+    "__manage__",
+    "__container_extra__",
+    "__start__",
+    "__stop__",
+    "__restart__",
+    "__bulk_restart__",
+    "__bulk_restart_run__",
+    "__check_updates__",
+    "__images_page__",
+    "__image_info__",
+    "__image_extra__",
+    "__network_overview__",
+    "__network_interfaces__",
+    "__network_connections__",
+    "__filesystem_overview__",
+    "__disk_io__",
+    "__users_info__",
+    "__sensors_overview__",
+    "__fan_speeds__",
+    "__quickview_overview__",
+    "__quickview_memory__",
+    "__quickview_sensors__",
+    "__quickview_cpu__",
+    "__quickview_disk__",
+    "__health_refresh__",
+    "__agent_host__",
+]
+
+
+def _corpus() -> list[str | None]:
+    data: list[str | None] = [None, "", ":", "unknown", "__", "__swap", "back_to"]
+    for key in _KEYS:
+        data.extend(
+            [
+                key,
+                f"{key}:",
+                f"{key}:abc:1",
+                f"{key}x",
+                f"{key}_tail:1",
+                key[:-1],
+                key.upper(),
+            ]
+        )
+    return data
+
+
+def _query(data: str | None) -> CallbackQuery:
+    return cast(CallbackQuery, SimpleNamespace(data=data))
+
+
+def test_router_matches_first_configured_handler() -> None:
+    router = factory_module.callback_router()
+
+    for data in _corpus():
+        route = router.resolve(data)
+        assert (route.name if route else None) == _linear_route(data), data
+
+
+def test_router_prefers_first_registered_route_on_overlap() -> None:
+    router = CallbackRouter()
+    router.add(
+        "long",
+        lambda *_a, **_k: "long",
+        [CallbackPattern("__ab", CallbackMatch.PREFIX)],
+    )
+    router.add(
+        "short",
+        lambda *_a, **_k: "short",
+        [CallbackPattern("__a", CallbackMatch.PREFIX)],
+    )
+    router.add("exact", lambda *_a, **_k: "exact", [CallbackPattern("__abc")])
+
+    long_route = router.resolve("__abc")
+    short_route = router.resolve("__a:1")
+    assert long_route is not None and long_route.name == "long"
+    assert short_route is not None and short_route.name == "short"
+    assert router.resolve("_") is None
+
+
+def test_router_dispatch_passes_bot_and_skips_unrouted() -> None:
+    calls: list[tuple[str | None, object]] = []
+
+    def _handler(call: CallbackQuery, bot: TeleBot) -> None:
+        calls.append((call.data, bot))
+
+    router = CallbackRouter()
+    router.add("swap", _handler, [CallbackPattern("__swap_info__")])
+    bot = cast(TeleBot, object())
+
+    router.dispatch(_query("__swap_info__:1"), bot)
+    assert router.dispatch(_query("__cpu_info__"), bot) is None
+    assert calls == [("__swap_info__:1", bot)]
+
+
+def test_router_resolves_once_between_filter_and_dispatch(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    resolved: list[str | None] = []
+    resolve = CallbackRouter.resolve
+
+    def _counting_resolve(
+        self: CallbackRouter, data: str | None
+    ) -> CallbackRoute | None:
+        resolved.append(data)
+        return resolve(self, data)
+
+    monkeypatch.setattr(CallbackRouter, "resolve", _counting_resolve)
+    router = CallbackRouter()
+    router.add("swap", lambda call, bot: call.data, [CallbackPattern("__swap_info__")])
+    query = SimpleNamespace(data="__swap_info__:1")
+
+    assert router.matches(cast(CallbackQuery, query)) is True
+    assert router.dispatch(cast(CallbackQuery, query), cast(TeleBot, object())) == (
+        "__swap_info__:1"
+    )
+    assert resolved == ["__swap_info__:1"]
+
+
+def test_inline_handler_factory_registers_single_router_handler() -> None:
+    factory_module.callback_router.cache_clear()
+    factory_module.inline_handler_factory.cache_clear()
+
+    handlers = factory_module.inline_handler_factory()
+    (handler,) = handlers["callback_router"]
+    router = factory_module.callback_router()
+
+    assert list(handlers) == ["callback_router"]
+    assert handler.callback == router.dispatch
+    assert handler.kwargs["func"] == router.matches
@@ -5,7 +5,7 @@ from types import SimpleNamespace
 from typing import cast
 
 import pytest
-from telebot.types import CallbackQuery, Message
+from telebot.types import Message
 
 import pytmbot.handlers.handler_manager as factory_module
 from pytmbot.models.handlers_model import HandlerManager
@@ -58,7 +58,7 @@ class _Settings:
     access_control: _AccessControl
 
 
-def test_admin_filter_and_inline_filters(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_admin_filter(monkeypatch: pytest.MonkeyPatch) -> None:
     factory_module.AdminFilter._get_admin_ids.cache_clear()
     monkeypatch.setattr(
         factory_module,
@@ -85,100 +85,55 @@ def test_admin_filter_and_inline_filters(monkeypatch: pytest.MonkeyPatch) -> Non
         is False
     )
 
-    query = cast(CallbackQuery, SimpleNamespace(data=None))
-    assert factory_module.InlineFilters.swap_info(query) is False
-    assert factory_module.InlineFilters.process_info(query) is False
-    assert factory_module.InlineFilters.process_overview(query) is False
-    assert factory_module.InlineFilters.cpu_info(query) is False
-    assert factory_module.InlineFilters.cpu_per_core(query) is False
-    assert factory_module.InlineFilters.cpu_times(query) is False
-    assert factory_module.InlineFilters.update_info(query) is False
-    assert factory_module.InlineFilters.get_logs(query) is False
-    assert factory_module.InlineFilters.containers_full_info(query) is False
-    assert factory_module.InlineFilters.back_to_containers(query) is False
-    assert factory_module.InlineFilters.manage_container(query) is False
-    assert factory_module.InlineFilters.container_extra_info(query) is False
-    assert factory_module.InlineFilters.image_updates(query) is False
-    assert factory_module.InlineFilters.images_page(query) is False
-    assert factory_module.InlineFilters.image_info(query) is False
-    assert factory_module.InlineFilters.image_extra(query) is False
-    assert factory_module.InlineFilters.network_overview(query) is False
-    assert factory_module.InlineFilters.network_interfaces(query) is False
-    assert factory_module.InlineFilters.network_connections(query) is False
-    assert factory_module.InlineFilters.filesystem_overview(query) is False
-    assert factory_module.InlineFilters.disk_io(query) is False
-    assert factory_module.InlineFilters.users_info(query) is False
-    assert factory_module.InlineFilters.sensors_overview(query) is False
-    assert factory_module.InlineFilters.fan_speeds(query) is False
-    assert factory_module.InlineFilters.quickview_overview(query) is False
-    assert factory_module.InlineFilters.quickview_memory(query) is False
-    assert factory_module.InlineFilters.quickview_sensors(query) is False
-    assert factory_module.InlineFilters.quickview_cpu(query) is False
-    assert factory_module.InlineFilters.quickview_disk(query) is False
-    assert factory_module.InlineFilters.health_refresh(query) is False
-
-    query.data = "__swap_info__:abc"
-    assert factory_module.InlineFilters.swap_info(query) is True
-    query.data = "__process_info__:abc"
-    assert factory_module.InlineFilters.process_info(query) is True
-    query.data = "__process_info_process__:abc"
-    assert factory_module.InlineFilters.process_info(query) is True
-    query.data = "__process_overview__:abc"
-    assert factory_module.InlineFilters.process_overview(query) is True
-    query.data = "__cpu_info__:abc"
-    assert factory_module.InlineFilters.cpu_info(query) is True
-    query.data = "__cpu_per_core__:abc"
-    assert factory_module.InlineFilters.cpu_per_core(query) is True
-    query.data = "__cpu_times__:abc"
-    assert factory_module.InlineFilters.cpu_times(query) is True
-    query.data = "__how_update__"
-    assert factory_module.InlineFilters.update_info(query) is True
-    query.data = "__get_logs__:abc"
-    assert factory_module.InlineFilters.get_logs(query) is True
-    query.data = "__get_full__:abc"
-    assert factory_module.InlineFilters.containers_full_info(query) is True
-    query.data = "__containers_page__:2:1"
-    assert factory_module.InlineFilters.back_to_containers(query) is True
-    query.data = "__manage__:abc"
-    assert factory_module.InlineFilters.manage_container(query) is True
-    query.data = "__container_extra__:volumes:abc:1"
-    assert factory_module.InlineFilters.container_extra_info(query) is True
-    query.data = "__check_updates__:abc"
-    assert factory_module.InlineFilters.image_updates(query) is True
-    query.data = "__images_page__:3:1"
-    assert factory_module.InlineFilters.images_page(query) is True
-    query.data = "__image_info__:0:1:1"
-    assert factory_module.InlineFilters.image_info(query) is True
-    query.data = "__image_extra__:history:0:1:1"
-    assert factory_module.InlineFilters.image_extra(query) is True
-    query.data = "__network_overview__:1"
-    assert factory_module.InlineFilters.network_overview(query) is True
-    query.data = "__network_interfaces__:1"
-    assert factory_module.InlineFilters.network_interfaces(query) is True
-    query.data = "__network_connections__:1"
-    assert factory_module.InlineFilters.network_connections(query) is True
-    query.data = "__filesystem_overview__:1"
-    assert factory_module.InlineFilters.filesystem_overview(query) is True
-    query.data = "__disk_io__:1"
-    assert factory_module.InlineFilters.disk_io(query) is True
-    query.data = "__users_info__:1"
-    assert factory_module.InlineFilters.users_info(query) is True
-    query.data = "__sensors_overview__:1"
-    assert factory_module.InlineFilters.sensors_overview(query) is True
-    query.data = "__fan_speeds__:1"
-    assert factory_module.InlineFilters.fan_speeds(query) is True
-    query.data = "__quickview_overview__:1"
-    assert factory_module.InlineFilters.quickview_overview(query) is True
-    query.data = "__quickview_memory__:1"
-    assert factory_module.InlineFilters.quickview_memory(query) is True
-    query.data = "__quickview_sensors__:1"
-    assert factory_module.InlineFilters.quickview_sensors(query) is True
-    query.data = "__quickview_cpu__:1"
-    assert factory_module.InlineFilters.quickview_cpu(query) is True
-    query.data = "__quickview_disk__:1"
-    assert factory_module.InlineFilters.quickview_disk(query) is True
-    query.data = "__health_refresh__:1"
-    assert factory_module.InlineFilters.health_refresh(query) is True
+
+@pytest.mark.parametrize(
+    ("data", "route_name"),
+    [
+        (None, None),
+        ("unknown", None),
+        ("__swap_info__:abc", "swap"),
+        ("__process_info__:abc", "process_info"),
+        ("__process_info_process__:abc", "process_info"),
+        ("__process_overview__:abc", "process_overview"),
+        ("__cpu_info__:abc", "cpu_info"),
+        ("__cpu_per_core__:abc", "cpu_per_core"),
+        ("__cpu_times__:abc", "cpu_times"),
+        ("__how_update__", "update_info"),
+        ("__get_logs__:abc", "get_logs"),
+        ("__search_logs__:s:error:1", "search_logs"),
+        ("__export_logs__:s:1", "export_logs"),
+        ("__get_full__:abc", "containers_full_info"),
+        ("back_to_containers", "back_to_containers"),
+        ("__containers_page__:2:1", "back_to_containers"),
+        ("__manage__:abc", "manage"),
+        ("__container_extra__:volumes:abc:1", "container_extra_info"),
+        ("__start__:abc:1", "manage_action"),
+        ("__check_updates__:abc", "image_updates"),
+        ("__images_page__:3:1", "images_page"),
+        ("__image_info__:0:1:1", "image_info"),
+        ("__image_extra__:history:0:1:1", "image_extra"),
+        ("__network_overview__:1", "network_overview"),
+        ("__network_interfaces__:1", "network_interfaces"),
+        ("__network_connections__:1", "network_connections"),
+        ("__filesystem_overview__:1", "filesystem_overview"),
+        ("__disk_io__:1", "disk_io"),
+        ("__users_info__:1", "users_info"),
+        ("__sensors_overview__:1", "sensors_overview"),
+        ("__fan_speeds__:1", "fan_speeds"),
+        ("__quickview_overview__:1", "quickview_overview"),
+        ("__quickview_memory__:1", "quickview_memory"),
+        ("__quickview_sensors__:1", "quickview_sensors"),
+        ("__quickview_cpu__:1", "quickview_cpu"),
+        ("__quickview_disk__:1", "quickview_disk"),
+        ("__health_refresh__:1", "health_refresh"),
+        ("__agent_host__:web-1", "agent_host"),
+    ],
+)
+def test_callback_router_routes_every_inline_handler(
+    data: str | None, route_name: str | None
+) -> None:
+    route = factory_module.callback_router().resolve(data)
+    assert (route.name if route else None) == route_name
 
 
 def test_handler_factories_are_cached_and_produce_handlers() -> None:
@@ -194,14 +149,17 @@ def test_handler_factories_are_cached_and_produce_handlers() -> None:
     assert "start" in message_handlers
     assert "cpu" in message_handlers
     assert "health" in message_handlers
-    assert "get_logs" in inline_handlers
-    assert "cpu_info" in inline_handlers
-    assert "process_overview" in inline_handlers
-    assert "disk_io" in inline_handlers
-    assert "quickview_overview" in inline_handlers
-    assert "health_refresh" in inline_handlers
-    assert "container_extra_info" in inline_handlers
-    assert "image_info" in inline_handlers
-    assert "image_extra" in inline_handlers
+    assert list(inline_handlers) == ["callback_router"]
     assert all(isinstance(item, HandlerManager) for item in message_handlers["start"])
-    assert all(isinstance(item, HandlerManager) for item in inline_handlers["get_logs"])
+
+    assert set(factory_module._get_inline_handler_configs()) >= {
+        "get_logs",
+        "cpu_info",
+        "process_overview",
+        "disk_io",
+        "quickview_overview",
+        "health_refresh",
+        "container_extra_info",
+        "image_info",
+        "image_extra",
+    }
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 import threading
+import time
 from collections.abc import Callable
 from types import SimpleNamespace
 from typing import cast
 from weakref import ReferenceType, ref
 
 import pytest
-from telebot import TeleBot
+from telebot import TeleBot, apihelper
 from telebot.apihelper import ApiTelegramException
 from telebot.types import User
 
@@ -25,6 +26,10 @@ from pytmbot.health_system.health_system import (
     TelegramApiChecker,
     create_health_manager,
 )
+from pytmbot.health_system.telegram_activity import (
+    TelegramActivity,
+    install_activity_probe,
+)
 
 
 class _StaticChecker(BaseHealthChecker):
@@ -280,3 +285,131 @@ def test_health_factory_functions_add_core_checkers() -> None:
 
     manager = create_health_manager(bot, session_manager, psutil_adapter)
     assert isinstance(manager.get_summary(), dict)
+
+
+class _SlowChecker(_StaticChecker):
+    def __init__(self, name: str, delay: float, *, timeout: float = 5.0) -> None:
+        super().__init__(
+            name,
+            HealthResult(level=HealthLevel.HEALTHY, component=name, latency_ms=1.0),
+        )
+        self._delay = delay
+        self._timeout = timeout
+
+    @property
+    def timeout_seconds(self) -> float:
+        return self._timeout
+
+    def _perform_check(self) -> HealthResult:
+        time.sleep(self._delay)
+        return super()._perform_check()
+
+
+def test_health_monitor_runs_due_checkers_concurrently() -> None:
+    monitor = HealthMonitor()
+    for index in range(3):
+        monitor.add_checker(_SlowChecker(f"slow-{index}", 0.2))
+
+    started = time.perf_counter()
+    health = monitor.check_all()
+    elapsed = time.perf_counter() - started
+
+    assert health.overall == HealthLevel.HEALTHY
+    assert elapsed < 0.5
+    monitor.start_monitoring(base_interval=60.0)
+    monitor.stop_monitoring()
+    assert monitor._executor is None
+
+
+def test_health_monitor_times_out_hung_checker_without_resubmitting() -> None:
+    monitor = HealthMonitor()
+    hung = _SlowChecker("hung", 0.5, timeout=0.05)
+    monitor.add_checker(hung)
+
+    first = monitor.check_all().components["hung"]
+    assert first.level == HealthLevel.UNHEALTHY
+    assert first.details == {"error": "timeout"}
+    in_flight = monitor._in_flight["hung"]
+
+    assert monitor._run_checks([("hung", hung)])["hung"].level == (
+        HealthLevel.UNHEALTHY
+    )
+    assert monitor._in_flight["hung"] is in_flight
+
+    in_flight.result(timeout=2.0)
+    assert monitor._run_checks([("hung", hung)])["hung"].level == (HealthLevel.HEALTHY)
+    assert "hung" not in monitor._in_flight
+    assert hung.calls == 1
+
+
+def test_health_monitor_cycle_does_not_block_housekeeping() -> None:
+    monitor = HealthMonitor()
+    slow = _SlowChecker("slow", 0.3)
+    monitor.add_checker(slow)
+    monitor._running = True
+
+    started = time.perf_counter()
+    monitor._monitor_cycle()
+    round_future = monitor._round
+    monitor._monitor_cycle()
+    assert time.perf_counter() - started < 0.1
+    assert monitor._round is round_future and round_future is not None
+
+    round_future.result(timeout=2.0)
+    latest = monitor.latest
+    assert latest is not None and latest.overall == HealthLevel.HEALTHY
+    assert slow.calls == 1
+    monitor.stop_monitoring()
+
+
+def test_telegram_api_checker_is_passive_with_recent_traffic() -> None:
+    class _CountingBot(_FakeBot):
+        calls = 0
+
+        def get_me(self) -> User:
+            self.calls += 1
+            return super().get_me()
+
+    now = [1000.0]
+    activity = TelegramActivity(clock=lambda: now[0])
+    bot = _CountingBot(get_me_result=_build_user(user_id=1, username="bot"))
+    checker = TelegramApiChecker(_as_telebot_ref(bot), activity)
+
+    activity.record_success("getUpdates")
+    now[0] += 30.0
+    passive = checker._perform_check()
+    assert passive.level == HealthLevel.HEALTHY
+    assert passive.details["mode"] == "passive"
+    assert passive.details["last_method"] == "getUpdates"
+    assert bot.calls == 0
+
+    now[0] += checker.interval_seconds
+    active = checker._perform_check()
+    assert active.details["mode"] == "active"
+    assert bot.calls == 1
+
+
+def test_activity_probe_records_successful_api_calls(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sent: list[str] = []
+
+    def _sender(method: str, url: str, **kwargs: object) -> object:
+        del kwargs
+        sent.append(method)
+        status = 200 if url.endswith("getUpdates") else 502
+        return SimpleNamespace(status_code=status)
+
+    monkeypatch.setattr(apihelper, "CUSTOM_REQUEST_SENDER", _sender)
+    activity = TelegramActivity()
+    install_activity_probe(activity)
+    install_activity_probe(activity)
+    probe = cast(Callable[..., object], apihelper.CUSTOM_REQUEST_SENDER)
+
+    probe("post", "https://api.telegram.org/botX/sendMessage")
+    assert activity.last_success() is None
+    probe("get", "https://api.telegram.org/botX/getUpdates")
+
+    last = activity.last_success()
+    assert last is not None and last.method == "getUpdates"
+    assert sent == ["post", "get"]
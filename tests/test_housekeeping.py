@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import gc
+import threading
+import time
+
+import pytest
+
+from pytmbot.utils.housekeeping import (
+    HousekeepingJob,
+    HousekeepingScheduler,
+    get_housekeeping_scheduler,
+    get_housekeeping_stats,
+    shutdown_housekeeping_scheduler,
+)
+
+
+def _wait_until(predicate: object, timeout: float = 2.0) -> bool:
+    assert callable(predicate)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+def test_scheduler_runs_jobs_and_records_durations() -> None:
+    scheduler = HousekeepingScheduler(rng=lambda: 0.5)
+    calls: list[int] = []
+    try:
+        job = scheduler.register(
+            "tick", lambda: calls.append(1), interval=0.01, initial_delay=0.0
+        )
+        assert _wait_until(lambda: len(calls) >= 3)
+        stats = scheduler.get_stats()
+        assert stats["running"] is True
+        assert stats["jobs"]["tick"]["runs"] >= 3
+        assert stats["jobs"]["tick"]["failures"] == 0
+        assert job.total_duration_ms >= job.max_duration_ms >= 0.0
+    finally:
+        scheduler.shutdown(timeout=2.0)
+
+    assert job.cancelled
+    assert scheduler.get_stats() == {"running": False, "jobs": {}}
+    with pytest.raises(RuntimeError):
+        scheduler.register("late", lambda: None, interval=1.0)
+
+
+def test_scheduler_survives_failures_and_counts_overruns() -> None:
+    scheduler = HousekeepingScheduler(rng=lambda: 0.5)
+    calls = 0
+
+    def _slow_then_fail() -> None:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            time.sleep(0.03)
+            return
+        raise RuntimeError("boom")
+
+    try:
+        job = scheduler.register(
+            "flaky", _slow_then_fail, interval=0.01, initial_delay=0.0
+        )
+        assert _wait_until(lambda: job.failures >= 2)
+        assert job.overruns >= 1
+        assert job.runs >= 3
+    finally:
+        scheduler.shutdown(timeout=2.0)
+
+
+def test_scheduler_uses_callable_interval_and_jitter() -> None:
+    job = HousekeepingJob("adaptive", lambda: None, lambda: 10.0, 0.2)
+    assert job.next_delay(lambda: 0.0) == pytest.approx(8.0)
+    assert job.next_delay(lambda: 1.0) == pytest.approx(12.0)
+    assert job.get_stats()["interval_seconds"] == 10.0
+
+
+def test_register_replaces_job_with_same_name() -> None:
+    scheduler = HousekeepingScheduler()
+    try:
+        first = scheduler.register("cleanup", lambda: None, interval=60.0)
+        second = scheduler.register("cleanup", lambda: None, interval=60.0)
+        assert first.cancelled
+        assert not second.cancelled
+        assert list(scheduler.get_stats()["jobs"]) == ["cleanup"]
+    finally:
+        scheduler.shutdown(timeout=2.0)
+
+
+def test_bound_method_job_is_dropped_with_its_owner() -> None:
+    scheduler = HousekeepingScheduler()
+    ran = threading.Event()
+
+    class _Owner:
+        def tick(self) -> None:
+            ran.set()
+
+    owner = _Owner()
+    try:
+        job = scheduler.register("owned", owner.tick, interval=0.01, initial_delay=0.0)
+        assert ran.wait(timeout=2.0)
+        del owner
+        gc.collect()
+        assert _wait_until(lambda: job.cancelled)
+        assert _wait_until(lambda: "owned" not in scheduler.get_stats()["jobs"])
+    finally:
+        scheduler.shutdown(timeout=2.0)
+
+
+def test_shared_scheduler_is_recreated_after_shutdown() -> None:
+    scheduler = get_housekeeping_scheduler()
+    assert get_housekeeping_scheduler() is scheduler
+
+    assert get_housekeeping_stats() == scheduler.get_stats()
+
+    shutdown_housekeeping_scheduler(timeout=2.0)
+    assert get_housekeeping_stats() is None
+    assert get_housekeeping_scheduler() is not scheduler
@@ -138,12 +138,17 @@ def test_load_images_data_cache_and_errors(monkeypatch: pytest.MonkeyPatch) -> N
         return [{"name": "img"}, "bad"]
 
     monkeypatch.setattr(images_module, "fetch_image_details", _fetch)
+    invalidated: list[str | None] = []
+    monkeypatch.setattr(Compiler, "invalidate_results", invalidated.append)
 
-    first = images_module._load_images_data()
-    second = images_module._load_images_data()
+    first, first_generation = images_module._load_images_snapshot()
+    second, second_generation = images_module._load_images_snapshot()
     third = images_module._load_images_data()
 
     assert calls["count"] == 2
+    assert invalidated == ["d_images.jinja2", "d_images.jinja2"]
+    assert second_generation == first_generation
+    assert images_module._images_generation == first_generation + 1
     assert first == [{"name": "img"}]
     assert second == [{"name": "img"}]
     assert third == [{"name": "img"}]
@@ -165,7 +170,7 @@ def test_render_paginated_images_fallback(monkeypatch: pytest.MonkeyPatch) -> No
     monkeypatch.setattr(
         images_module,
         "_render_images_page_text",
-        lambda page_items, page, total_pages, total_items: "X" * 500,
+        lambda page_items, page, total_pages, total_items, generation: "X" * 500,
     )
     monkeypatch.setattr(
         images_module,
@@ -252,14 +257,16 @@ def test_build_keyboard_render_page_and_handle(monkeypatch: pytest.MonkeyPatch)
     ]
     assert callbacks_single == ["__check_updates__:7"]
 
-    monkeypatch.setattr(images_module, "_load_images_data", lambda: [{"name": "img"}])
+    monkeypatch.setattr(
+        images_module, "_load_images_snapshot", lambda: ([{"name": "img"}], 3)
+    )
     monkeypatch.setattr(
         images_module, "_prepare_images_for_listing", lambda images: [{"name": "img"}]
     )
     monkeypatch.setattr(
         images_module,
         "_render_paginated_images_text",
-        lambda images, page: ("images-page", 1, 1, [{"name": "img"}], 0),
+        lambda images, page, generation: ("images-page", 1, 1, [{"name": "img"}], 0),
     )
     monkeypatch.setattr(
         images_module,
@@ -204,3 +204,31 @@ def test_logger_exception_with_traceback_in_debug(
     method, message, _ = calls[0]
     assert method == "exception"
     assert message == "bot.test.fail"
+
+
+def test_logger_emit_skips_context_factory_for_disabled_levels(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    logger = Logger()
+    monkeypatch.setattr(logger, "_min_level_no", 20)
+    calls: list[tuple[str, str, dict[str, object]]] = []
+    monkeypatch.setattr(
+        Logger,
+        "_get_bound_logger",
+        lambda self: _FakeBoundLogger(calls),
+    )
+    built: list[str] = []
+
+    def _factory() -> dict[str, object]:
+        built.append("built")
+        return {"user_id": "**"}
+
+    logger.emit("DEBUG", "bot.test.debug", _factory)
+    assert built == []
+    assert calls == []
+    assert logger.is_enabled_for("TRACE") is False
+    assert logger.is_enabled_for("warning") is True
+
+    logger.emit("ERROR", "bot.test.fail", _factory)
+    assert built == ["built"]
+    assert calls == [("error", "bot.test.fail", {})]
@@ -422,12 +422,37 @@ def test_shutdown_bot_silently_and_cleanup_paths(
         stop_polling=lambda: calls.append("stop"),
         remove_webhook=lambda: calls.append("remove"),
     )
-    launcher.bot = SimpleNamespace(bot=bot_ok)
+    launcher.bot = SimpleNamespace(
+        bot=bot_ok, stop_async_polling=lambda: calls.append("async_stop")
+    )
     launcher._session_manager = SimpleNamespace(
         shutdown=lambda: calls.append("session")
     )
+    monkeypatch.setattr(
+        main_module, "shutdown_outbound_queue", lambda: calls.append("outbound")
+    )
+    monkeypatch.setattr(
+        main_module,
+        "shutdown_housekeeping_scheduler",
+        lambda: calls.append("housekeeping"),
+    )
+    monkeypatch.setattr(
+        main_module, "shutdown_container_executors", lambda: calls.append("docker")
+    )
+    monkeypatch.setattr(
+        main_module, "shutdown_state_store", lambda: calls.append("state")
+    )
     launcher._shutdown_bot_silently(silent=False)
-    assert calls == ["stop", "remove", "session"]
+    assert calls == [
+        "async_stop",
+        "stop",
+        "remove",
+        "outbound",
+        "session",
+        "housekeeping",
+        "docker",
+        "state",
+    ]
 
     launcher.bot = SimpleNamespace(
         bot=SimpleNamespace(
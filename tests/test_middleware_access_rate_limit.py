@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+import threading
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from types import SimpleNamespace, TracebackType
@@ -13,6 +14,7 @@ from telebot.types import Message
 
 import pytmbot.middleware.access_control as access_control_module
 import pytmbot.middleware.rate_limit as rate_limit_module
+from pytmbot.logs import Logger
 
 type _PayloadScalar = str | int | float | bool | None
 type _PayloadValue = _PayloadScalar | list["_PayloadValue"] | dict[str, "_PayloadValue"]
@@ -76,14 +78,6 @@ class _CapturedContext:
         return False
 
 
-class _NoopThread:
-    def __init__(self, **_kwargs: _PayloadValue) -> None:
-        return
-
-    def start(self) -> None:
-        return
-
-
 def _build_message(
     *,
     user_id: int,
@@ -146,10 +140,6 @@ def _build_access_control_middleware(
     allowed_user_ids: list[int] | None = None,
     admin_chat_id: int = 999,
 ) -> access_control_module.AccessControl:
-    monkeypatch.setattr(
-        "pytmbot.middleware.access_control.threading.Thread",
-        _NoopThread,
-    )
     monkeypatch.setattr(
         access_control_module,
         "settings",
@@ -174,18 +164,6 @@ def _install_log_capture(
     return captured
 
 
-def _raise_keyboard_interrupt_on_second_wait() -> Callable[[], bool]:
-    call_count = {"wait": 0}
-
-    def _wait() -> bool:
-        call_count["wait"] += 1
-        if call_count["wait"] > 1:
-            raise KeyboardInterrupt
-        return False
-
-    return _wait
-
-
 def test_access_control_authorized_user_passes(monkeypatch: pytest.MonkeyPatch) -> None:
     bot = _BotStub()
     middleware = _build_access_control_middleware(
@@ -254,6 +232,39 @@ def test_access_control_callback_query_is_checked_and_denied(
     assert callback_kwargs["show_alert"] is True
 
 
+def test_authorized_update_skips_log_context_work_at_info(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(Logger(), "_min_level_no", 20)
+    masked: list[object] = []
+
+    def _counting_mask(value: object) -> str:
+        masked.append(value)
+        return "**"
+
+    for module in (access_control_module, rate_limit_module):
+        monkeypatch.setattr(module, "mask_user_id", _counting_mask)
+        monkeypatch.setattr(module, "mask_username", _counting_mask)
+
+    bot = _BotStub()
+    access = _build_access_control_middleware(monkeypatch, bot, allowed_user_ids=[42])
+    limiter = rate_limit_module.RateLimit(
+        cast(TeleBot, bot), limit=100_000, period=timedelta(seconds=10)
+    )
+    captured = _install_log_capture(monkeypatch, access)
+    message = _build_message(user_id=42, text="/status")
+
+    started = time.perf_counter()
+    for _ in range(10_000):
+        assert access.pre_process(message, {}) is None
+        assert limiter.pre_process(message, {}) is None
+    elapsed = time.perf_counter() - started
+
+    assert masked == []
+    assert captured == []
+    assert elapsed < 2.0
+
+
 def test_rate_limit_enforces_limit_and_tracks_stats() -> None:
     bot = _BotStub()
     middleware = rate_limit_module.RateLimit(
@@ -274,6 +285,63 @@ def test_rate_limit_enforces_limit_and_tracks_stats() -> None:
     assert stats["active_users"] >= 1
 
 
+def test_rate_limit_gcra_refills_and_honours_burst() -> None:
+    now = [100.0]
+    middleware = rate_limit_module.RateLimit(
+        cast(TeleBot, _BotStub()),
+        limit=2,
+        period=timedelta(seconds=10),
+        burst=1,
+        clock=lambda: now[0],
+    )
+
+    admitted = [middleware._check_and_track_request(7, now[0]) for _ in range(4)]
+    assert [limited for limited, _, _ in admitted] == [False, False, False, True]
+    assert admitted[2][1] == 3
+
+    now[0] += 5.0  # one emission interval refills a single slot
+    assert middleware._check_and_track_request(7, now[0])[0] is False
+    assert middleware._check_and_track_request(7, now[0])[0] is True
+
+    now[0] += 60.0
+    assert middleware.get_stats()["active_users"] == 0
+    assert not any(stripe.buckets for stripe in middleware._stripes)
+
+
+def test_rate_limit_concurrent_users_keep_exact_budgets() -> None:
+    middleware = rate_limit_module.RateLimit(
+        cast(TeleBot, _BotStub()),
+        limit=5,
+        period=timedelta(hours=1),
+    )
+    users = range(1, 2001)
+    admitted: list[int] = []
+    admitted_lock = threading.Lock()
+
+    def _worker(offset: int) -> None:
+        local = 0
+        for user_id in users:
+            for _ in range(2):
+                now = time.monotonic()
+                if not middleware._check_and_track_request(user_id + offset, now)[0]:
+                    local += 1
+        with admitted_lock:
+            admitted.append(local)
+
+    threads = [threading.Thread(target=_worker, args=(0,)) for _ in range(8)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    # 8 threads x 2 requests race on each user; exactly ``limit`` must pass.
+    assert sum(admitted) == 5 * len(users)
+    assert middleware.get_stats()["request_distribution"]["max"] == 5
+    assert elapsed < 5.0
+
+
 def test_rate_limit_handles_callback_query_updates() -> None:
     bot = _BotStub()
     middleware = rate_limit_module.RateLimit(
@@ -296,9 +364,6 @@ def test_access_control_setup_command_with_bot_suffix(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     bot = _BotStub()
-    monkeypatch.setattr(
-        "pytmbot.middleware.access_control.threading.Thread", _NoopThread
-    )
     monkeypatch.setattr(
         access_control_module,
         "settings",
@@ -415,7 +480,7 @@ def test_access_control_admin_notification_masks_admin_chat_id_in_logs(
     assert info_logs[0]["admin_chat_id"] == "-497****716"
 
 
-def test_access_control_periodic_cleanup_removes_expired_state(
+def test_access_control_cleanup_job_removes_expired_state(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     bot = _BotStub()
@@ -428,14 +493,7 @@ def test_access_control_periodic_cleanup_removes_expired_state(
     middleware._attempt_count[expired_user] = 2
     middleware._last_admin_notify[expired_user] = datetime.now()
 
-    monkeypatch.setattr(
-        middleware,
-        "_wait_for_cleanup_interval",
-        _raise_keyboard_interrupt_on_second_wait(),
-    )
-
-    with pytest.raises(KeyboardInterrupt):
-        middleware._periodic_cleanup()
+    middleware._cleanup_expired_blocks()
 
     assert expired_user not in middleware._blocked_until
     assert middleware._attempt_count[expired_user] == 0
@@ -443,7 +501,7 @@ def test_access_control_periodic_cleanup_removes_expired_state(
     assert active_user in middleware._blocked_until
 
 
-def test_access_control_periodic_cleanup_masks_expired_ids_in_logs(
+def test_access_control_cleanup_job_masks_expired_ids_in_logs(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     bot = _BotStub()
@@ -453,14 +511,7 @@ def test_access_control_periodic_cleanup_masks_expired_ids_in_logs(
 
     captured = _install_log_capture(monkeypatch, middleware)
 
-    monkeypatch.setattr(
-        middleware,
-        "_wait_for_cleanup_interval",
-        _raise_keyboard_interrupt_on_second_wait(),
-    )
-
-    with pytest.raises(KeyboardInterrupt):
-        middleware._periodic_cleanup()
+    middleware._cleanup_expired_blocks()
 
     expired_logs = [
         context
@@ -495,15 +546,31 @@ def test_rate_limit_send_message_outside_state_lock(
     message = _build_message(user_id=55, text="spam")
     lock_probe = {"was_available": False}
 
+    user_lock = middleware._stripe_for(55).lock
+
     def _send_message(**kwargs: _PayloadValue) -> None:
         _ = kwargs
-        acquired = middleware._state_lock.acquire(blocking=False)
+        acquired = user_lock.acquire(blocking=False)
         lock_probe["was_available"] = acquired
         if acquired:
-            middleware._state_lock.release()
+            user_lock.release()
 
     monkeypatch.setattr(bot, "send_message", _send_message)
     assert message.from_user is not None
     middleware._handle_rate_limit(message, message.from_user)
 
     assert lock_probe["was_available"] is True
+
+
+def test_access_control_blocks_survive_restart(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    middleware = _build_access_control_middleware(monkeypatch, _BotStub())
+    message = _build_message(user_id=10, text="not-allowed")
+    for _ in range(middleware.MAX_ATTEMPTS):
+        middleware.pre_process(message, {})
+
+    restarted = _build_access_control_middleware(monkeypatch, _BotStub())
+
+    assert restarted._should_block_request(10) is True
+    assert restarted._should_block_request(11) is False
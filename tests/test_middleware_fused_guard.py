@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from datetime import timedelta
+from types import SimpleNamespace
+from typing import cast
+
+import pytest
+from telebot import TeleBot
+from telebot.handler_backends import CancelUpdate
+from telebot.types import Message
+
+import pytmbot.middleware.access_control as access_control_module
+from pytmbot.middleware.fused_guard import FusedGuard, UpdateMeta
+from pytmbot.middleware.rate_limit import RateLimit
+
+
+@dataclass
+class _BotStub:
+    sent_messages: list[dict[str, object]] = field(default_factory=list)
+    answered_callbacks: list[dict[str, object]] = field(default_factory=list)
+
+    def send_message(self, **kwargs: object) -> None:
+        self.sent_messages.append(dict(kwargs))
+
+    def answer_callback_query(self, *args: object, **kwargs: object) -> None:
+        self.answered_callbacks.append({"args": list(args), **kwargs})
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _message(user_id: int, message_id: int, *, text: str = "hello") -> Message:
+    return cast(
+        Message,
+        SimpleNamespace(
+            from_user=SimpleNamespace(
+                id=user_id,
+                username="user",
+                first_name=None,
+                last_name=None,
+                is_bot=False,
+            ),
+            chat=SimpleNamespace(id=100, type="private"),
+            message_id=message_id,
+            text=text,
+            date=0,
+            content_type="text",
+        ),
+    )
+
+
+def _callback(user_id: int, callback_id: str) -> Message:
+    return cast(
+        Message,
+        SimpleNamespace(
+            id=callback_id,
+            data="d:containers",
+            from_user=SimpleNamespace(
+                id=user_id, username="user", first_name=None, last_name=None
+            ),
+            message=SimpleNamespace(
+                chat=SimpleNamespace(id=100, type="private"), message_id=5
+            ),
+        ),
+    )
+
+
+def _build_guard(
+    monkeypatch: pytest.MonkeyPatch,
+    bot: _BotStub,
+    *,
+    allowed_user_ids: list[int],
+    limit: int = 3,
+    clock: _Clock | None = None,
+) -> FusedGuard:
+    monkeypatch.setattr(
+        access_control_module,
+        "settings",
+        SimpleNamespace(
+            access_control=SimpleNamespace(allowed_user_ids=allowed_user_ids),
+            chat_id=SimpleNamespace(global_chat_id=[999]),
+        ),
+    )
+    return FusedGuard(
+        cast(TeleBot, bot),
+        limit=limit,
+        period=timedelta(seconds=10),
+        clock=clock or _Clock(),
+    )
+
+
+def test_update_meta_builds_dedup_keys() -> None:
+    message_meta = UpdateMeta.from_update(_message(1, 7))
+    callback_meta = UpdateMeta.from_update(_callback(1, "cb-9"))
+
+    assert message_meta is not None and callback_meta is not None
+    assert message_meta.dedup_key == "msg:100:7"
+    assert message_meta.update_type == "message"
+    assert callback_meta.dedup_key == "cb:cb-9"
+    assert callback_meta.is_callback and callback_meta.message_id == 5
+    assert UpdateMeta.from_update(SimpleNamespace(from_user=None)) is None
+
+
+def test_fused_guard_allows_authorized_and_drops_duplicates(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    bot = _BotStub()
+    guard = _build_guard(monkeypatch, bot, allowed_user_ids=[42])
+
+    assert guard._cleanup_job is None
+    assert guard.pre_process(_message(42, 1), {}) is None
+    assert isinstance(guard.pre_process(_message(42, 1), {}), CancelUpdate)
+    assert guard.pre_process(_message(42, 2), {}) is None
+
+    stats = guard.get_stats()
+    assert stats["tracked_users"] == 1
+    assert stats["accepted_updates"] == 2
+    assert stats["dropped_duplicates"] == 1
+    assert bot.sent_messages == []
+
+
+def test_fused_guard_rate_limits_with_single_warning_path(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    bot = _BotStub()
+    clock = _Clock()
+    guard = _build_guard(monkeypatch, bot, allowed_user_ids=[42], clock=clock)
+
+    results = [guard.pre_process(_message(42, i), {}) for i in range(4)]
+    assert results[:3] == [None, None, None]
+    assert isinstance(results[3], CancelUpdate)
+    assert bot.sent_messages == [{"chat_id": 100, "text": RateLimit.WARNING_MESSAGE}]
+
+    assert isinstance(guard.pre_process(_callback(42, "cb-1"), {}), CancelUpdate)
+    assert bot.answered_callbacks[0]["text"] == RateLimit.WARNING_MESSAGE
+
+    clock.now += 10 / 3
+    assert guard.pre_process(_message(42, 10), {}) is None
+    assert guard.get_stats()["rate_limited_updates"] == 2
+
+
+def test_fused_guard_blocks_unauthorized_after_max_attempts(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    bot = _BotStub()
+    guard = _build_guard(monkeypatch, bot, allowed_user_ids=[42])
+
+    for message_id in range(guard.MAX_ATTEMPTS + 1):
+        result = guard.pre_process(_message(10, message_id, text="nope"), {})
+        assert isinstance(result, CancelUpdate)
+
+    assert guard._should_block_request(10)
+    assert guard.get_stats()["blocked_users"] == 1
+    # Admin notified once; one warning per attempt; blocked request is silent.
+    admin_messages = [msg for msg in bot.sent_messages if msg["chat_id"] == 999]
+    assert len(admin_messages) == 1
+    assert guard.get_stats()["denied_updates"] == guard.MAX_ATTEMPTS + 1
+
+
+def test_fused_guard_setup_command_passes_for_unknown_user(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    bot = _BotStub()
+    guard = _build_guard(monkeypatch, bot, allowed_user_ids=[42])
+
+    assert guard.pre_process(_message(77, 1, text="/getmyid"), {}) is None
+
+
+def test_fused_guard_concurrent_users_keep_exact_budgets(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    bot = _BotStub()
+    users = list(range(1, 201))
+    guard = _build_guard(monkeypatch, bot, allowed_user_ids=users, limit=5)
+    errors: list[BaseException] = []
+
+    def _worker(offset: int) -> None:
+        try:
+            for user_id in users:
+                guard.pre_process(_message(user_id, offset), {})
+        except BaseException as error:  # pragma: no cover - surfaced below
+            errors.append(error)
+
+    threads = [threading.Thread(target=_worker, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = guard.get_stats()
+    assert errors == []
+    assert stats["accepted_updates"] == len(users) * 5
+    assert stats["rate_limited_updates"] == len(users) * 3
+
+
+def test_fused_guard_restores_persisted_blocks(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    guard = _build_guard(monkeypatch, _BotStub(), allowed_user_ids=[42])
+    for message_id in range(guard.MAX_ATTEMPTS):
+        guard.pre_process(_message(10, message_id, text="nope"), {})
+
+    bot = _BotStub()
+    restarted = _build_guard(monkeypatch, bot, allowed_user_ids=[42])
+
+    assert restarted._should_block_request(10) is True
+    assert restarted._blocked_until == {}
+    assert isinstance(restarted.pre_process(_message(10, 99), {}), CancelUpdate)
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import base64
+import statistics
+import sys
+from array import array
+
+import pytest
+
+import pytmbot.plugins.monitor.anomaly as anomaly_module
+from pytmbot.plugins.monitor.anomaly import (
+    HOURS_PER_WEEK,
+    AnomalyConfig,
+    AnomalyDetector,
+    half_life_alpha,
+)
+from pytmbot.utils.state_store import StateStore
+
+_HOUR = 3600.0
+
+
+@pytest.fixture(autouse=True)
+def _utc_hours(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Bucket by whole UTC hours so tests do not depend on the local timezone."""
+    monkeypatch.setattr(
+        anomaly_module, "hour_of_week", lambda ts: int(ts // _HOUR) % HOURS_PER_WEEK
+    )
+
+
+def _config(**overrides: object) -> AnomalyConfig:
+    values: dict[str, object] = {
+        "alpha": 0.05,
+        "seasonal_alpha": 0.05,
+        "min_samples": 20,
+        "seasonal_min_samples": 1_000_000,
+        "min_std": 0.5,
+        "consecutive": 2,
+        "cooldown_seconds": 0.0,
+    }
+    values.update(overrides)
+    return AnomalyConfig(**values)  # type: ignore[arg-type]
+
+
+def _feed(
+    detector: AnomalyDetector, values: list[float], start: float, step: float = 10.0
+) -> list[tuple[bool, float]]:
+    transitions = []
+    for index, value in enumerate(values):
+        for transition in detector.observe({"cpu": value}, start + index * step):
+            transitions.append((transition.firing, transition.value))
+    return transitions
+
+
+def test_half_life_alpha_halves_weight_after_half_life() -> None:
+    alpha = half_life_alpha(5.0, 600.0)
+    assert (1 - alpha) ** (600 / 5) == pytest.approx(0.5)
+
+
+def test_warmup_uses_running_mean_and_population_variance() -> None:
+    detector = AnomalyDetector(_config(alpha=0.001))
+    values = [10.0, 14.0, 9.0, 11.0, 16.0]
+    _feed(detector, values, start=0.0)
+
+    ((_series, payload, _expires),) = detector.export_state(retain_seconds=60.0)
+    assert isinstance(payload, dict)
+    assert payload["mean"] == pytest.approx(statistics.fmean(values))
+    assert payload["var"] == pytest.approx(statistics.pvariance(values))
+    assert payload["count"] == 5
+
+
+def test_sustained_deviation_fires_once_and_clears_with_hysteresis() -> None:
+    detector = AnomalyDetector(_config())
+    normal = [10.0, 12.0] * 15
+
+    assert _feed(detector, normal, start=0.0) == []
+    # One spike is not enough, the second consecutive one fires.
+    assert _feed(detector, [40.0], start=300.0) == []
+    assert _feed(detector, [11.0], start=310.0) == []
+    assert _feed(detector, [40.0, 41.0, 42.0], start=320.0) == [(True, 41.0)]
+    # Still elevated: no repeat; back to normal: resolved.
+    assert _feed(detector, [11.0], start=350.0) == [(False, 11.0)]
+
+
+def test_direction_and_cooldown_limit_alerts() -> None:
+    detector = AnomalyDetector(_config(direction="both", cooldown_seconds=1000.0))
+    _feed(detector, [10.0, 12.0] * 15, start=0.0)
+
+    assert _feed(detector, [0.0, 0.0], start=300.0) == [(True, 0.0)]
+    assert _feed(detector, [11.0], start=320.0) == [(False, 11.0)]
+    assert _feed(detector, [-5.0, -5.0, -5.0], start=330.0) == []
+
+    above_only = AnomalyDetector(_config())
+    _feed(above_only, [10.0, 12.0] * 15, start=0.0)
+    assert _feed(above_only, [0.0, 0.0, 0.0], start=300.0) == []
+
+
+def test_seasonal_profile_replaces_ewma_once_bucket_is_learned() -> None:
+    detector = AnomalyDetector(
+        _config(alpha=0.5, seasonal_alpha=0.01, seasonal_min_samples=30)
+    )
+    # Busy hour 0 (about 80), then quiet hour 1 (about 10) that pulls the EWMA down.
+    _feed(detector, [79.0, 81.0] * 20, start=0.0)
+    _feed(detector, [9.0, 11.0] * 20, start=_HOUR)
+
+    # Back in hour 0 next week, 80 matches the profile although the EWMA is ~10.
+    transitions = detector.observe({"cpu": 80.0}, HOURS_PER_WEEK * _HOUR)
+    assert transitions == []
+    transitions = detector.observe({"cpu": 80.0}, HOURS_PER_WEEK * _HOUR + 10)
+    assert transitions == []
+
+    ewma_only = AnomalyDetector(_config(alpha=0.5, seasonal_min_samples=1_000_000))
+    _feed(ewma_only, [79.0, 81.0] * 20, start=0.0)
+    _feed(ewma_only, [9.0, 11.0] * 20, start=_HOUR)
+    _feed(ewma_only, [80.0], start=HOURS_PER_WEEK * _HOUR)
+    (transition,) = ewma_only.observe({"cpu": 80.0}, HOURS_PER_WEEK * _HOUR + 10)
+    assert transition.firing and not transition.seasonal
+    assert transition.event_type == "anomaly:cpu"
+
+
+def test_baselines_survive_a_state_store_roundtrip() -> None:
+    detector = AnomalyDetector(_config())
+    _feed(detector, [10.0, 12.0] * 15, start=0.0)
+    store = StateStore(None).namespace("monitor_baselines")
+    store.put_many(detector.export_state(retain_seconds=_HOUR))
+    store.put("broken", {"version": 1, "mean": "x"})
+
+    restored = AnomalyDetector(_config())
+    assert restored.load_state(store.items(now=0.0)) == 1
+    assert len(restored) == 1
+    assert restored.export_state(_HOUR) == detector.export_state(_HOUR)
+    # Restored baselines are warm: the first anomalous pair fires right away.
+    assert _feed(restored, [40.0, 40.0], start=300.0) == [(True, 40.0)]
+    # Entries expire one retention period after the series was last seen.
+    assert store.items(now=290.0 + _HOUR + 1) == [
+        ("broken", {"version": 1, "mean": "x"})
+    ]
+
+
+def test_load_state_swaps_foreign_byte_order() -> None:
+    detector = AnomalyDetector(_config())
+    _feed(detector, [10.0, 12.0] * 15, start=0.0)
+    ((series, payload, _expires),) = detector.export_state(_HOUR)
+    assert isinstance(payload, dict)
+
+    swapped = dict(payload)
+    swapped["byteorder"] = "big" if sys.byteorder == "little" else "little"
+    for key, typecode in (
+        ("season_mean", "d"),
+        ("season_var", "d"),
+        ("season_count", "I"),
+    ):
+        values = array(typecode, base64.b64decode(str(payload[key])))
+        values.byteswap()
+        swapped[key] = base64.b64encode(values.tobytes()).decode("ascii")
+
+    restored = AnomalyDetector(_config())
+    assert restored.load_state([(series, swapped)]) == 1
+    assert restored.export_state(_HOUR) == detector.export_state(_HOUR)
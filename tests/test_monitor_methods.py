@@ -14,6 +14,7 @@ from pytmbot.adapters.psutil.adapter_types import CPUUsageStats, TopProcess
 from pytmbot.db.influxdb_interface import InfluxDBInterface
 from pytmbot.models.settings_model import (
     ChatIdModel,
+    MonitorAnomalyModel,
     MonitorConfig,
     SettingsModel,
     TraceholdSettings,
@@ -24,7 +25,10 @@ from pytmbot.plugins.monitor.models import (
     ResourceMetrics,
     ResourceThresholds,
 )
+from pytmbot.plugins.monitor.rules import AlertRuleEngine, parse_rule
 from pytmbot.plugins.monitor.utils import SystemMetrics
+from pytmbot.plugins.runtime import PluginRuntime, ScheduledTask
+from pytmbot.utils.state_store import StateStore
 
 type _PayloadScalar = str | int | float | bool | None
 type _PayloadValue = _PayloadScalar | list["_PayloadValue"] | dict[str, "_PayloadValue"]
@@ -116,8 +120,10 @@ def _build_monitor(
     *,
     max_notifications: int = 2,
     reset_window_seconds: int = 300,
+    runtime: PluginRuntime | None = None,
 ) -> tuple[SystemMonitorPlugin, _BotStub]:
     monitor = SystemMonitorPlugin.__new__(SystemMonitorPlugin)
+    monitor._runtime = runtime
     bot = _BotStub()
     monitor.bot = cast(TeleBot, bot)
     monitor.monitor_settings = MonitorConfig(
@@ -173,12 +179,13 @@ def _build_monitor(
             "load_averages": (0.1, 0.1, 0.1),
         }
     )
-    monitor._monitor_thread = None
-    monitor._supervisor_thread = None
-    monitor._supervisor_stop_event = threading.Event()
-    monitor._monitor_thread_lock = threading.RLock()
-    monitor._monitor_restart_count = 0
+    monitor._monitor_task = None
+    monitor._next_cycle_delay = 5.0
     monitor._psutil_adapter = _PsutilStub()
+    monitor._rule_engine = None
+    monitor._anomaly_detector = None
+    monitor._baseline_store = None
+    monitor._baseline_task = None
     return monitor, bot
 
 
@@ -188,7 +195,7 @@ def test_send_notification_does_not_spawn_timer_threads(
     monitor, bot = _build_monitor(max_notifications=2, reset_window_seconds=300)
     monkeypatch.setattr("pytmbot.plugins.monitor.methods.time.time", lambda: 100.0)
     monkeypatch.setattr(
-        "pytmbot.plugins.monitor.methods.threading.Timer",
+        "threading.Timer",
         lambda *_args, **_kwargs: (_ for _ in ()).throw(
             AssertionError("Timer must not be used")
         ),
@@ -223,43 +230,32 @@ def test_send_notification_resets_budget_lazily_after_window(
     assert monitor.state.next_notification_reset_at == 800.0
 
 
-def test_supervisor_restarts_dead_monitor_thread(
-    monkeypatch: pytest.MonkeyPatch,
+def test_monitor_task_runs_on_shared_scheduler(
+    monkeypatch: pytest.MonkeyPatch, plugin_runtime: PluginRuntime
 ) -> None:
-    monitor, _bot = _build_monitor(max_notifications=2, reset_window_seconds=300)
+    monitor, _bot = _build_monitor(
+        max_notifications=2, reset_window_seconds=300, runtime=plugin_runtime
+    )
     monitor.state.is_active = True
-    monitor._supervisor_stop_event.set()
-
-    class _DeadThread(threading.Thread):
-        def __init__(self) -> None:
-            super().__init__(daemon=True)
+    cycles = threading.Semaphore(0)
 
-        def is_alive(self) -> bool:
-            return False
-
-    class _LiveThread(threading.Thread):
-        def __init__(self) -> None:
-            super().__init__(daemon=True)
+    def _cycle(self: SystemMonitorPlugin) -> None:
+        self._next_cycle_delay = 0.01
+        cycles.release()
 
-        def is_alive(self) -> bool:
-            return True
-
-    monitor._monitor_thread = _DeadThread()
-
-    def _spawn() -> threading.Thread:
-        monitor.state.is_active = False
-        return _LiveThread()
-
-    monkeypatch.setattr(
-        SystemMonitorPlugin,
-        "_spawn_monitor_thread",
-        lambda self: _spawn(),
-    )
+    monkeypatch.setattr(SystemMonitorPlugin, "_run_monitor_cycle", _cycle)
 
-    monitor._supervise_monitoring()
+    task = monitor._schedule_monitor_task()
+    try:
+        assert cycles.acquire(timeout=2.0)
+        assert cycles.acquire(timeout=2.0)
+        assert not any(
+            thread.name.startswith("SystemMonitor") for thread in threading.enumerate()
+        )
+    finally:
+        assert task.cancel(wait=2.0) is True
 
-    assert isinstance(monitor._monitor_thread, _LiveThread)
-    assert monitor._monitor_restart_count == 1
+    assert task.runs >= 2 and task.failures == 0
 
 
 def test_sanitize_fields_flattens_nested_values() -> None:
@@ -412,6 +408,80 @@ def test_alert_checks_route_to_create_or_resolve(
     assert ("disk_sdb", "Disk usage (sdb)") in resolved
 
 
+def test_rules_replace_single_sample_checks_for_covered_families(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monitor, bot = _build_monitor(max_notifications=10)
+    monitor._rule_engine = AlertRuleEngine(
+        [parse_rule("avg(cpu, 10s) > 80", clear=50, name="CPU <sustained>")],
+        sample_interval=5,
+    )
+    clock = [1000.0]
+    monkeypatch.setattr(
+        "pytmbot.plugins.monitor.methods.time.monotonic", lambda: clock[0]
+    )
+    checked: list[float] = []
+    monkeypatch.setattr(
+        SystemMonitorPlugin,
+        "_check_memory_alert",
+        lambda self, usage: checked.append(usage),
+    )
+
+    for cpu_usage in (99.0, 99.0, 99.0, 60.0, 10.0):
+        monitor._process_alerts({"cpu_usage": cpu_usage, "memory_usage": 20.0})
+        clock[0] += 5.0
+
+    assert checked == [20.0] * 5
+    assert "cpu_usage" not in monitor._active_event_ids
+    texts = [str(message["text"]) for message in bot.sent_messages]
+    assert len(texts) == 2
+    assert "Alert Rule Triggered - CPU &lt;sustained&gt;" in texts[0]
+    assert "<code>avg(cpu, 10s) &gt; 80</code>" in texts[0]
+    assert "CPU &lt;sustained&gt; has normalized" in texts[1]
+    assert monitor.state.active_events == {}
+
+
+def test_anomaly_baselines_alert_and_survive_restart(
+    monkeypatch: pytest.MonkeyPatch, plugin_runtime: PluginRuntime
+) -> None:
+    store = StateStore(None)
+    clock = [1_000_000.0]
+    monkeypatch.setattr(monitor_methods_module, "get_state_store", lambda: store)
+    monkeypatch.setattr("pytmbot.plugins.monitor.methods.time.time", lambda: clock[0])
+
+    def _start() -> tuple[SystemMonitorPlugin, _BotStub]:
+        monitor, bot = _build_monitor(max_notifications=10, runtime=plugin_runtime)
+        monitor.monitor_settings.anomaly = MonitorAnomalyModel(
+            warmup_minutes=1, consecutive=1
+        )
+        monitor._anomaly_detector = monitor._build_anomaly_detector()
+        monitor._start_anomaly_baselines()
+        monitor.state.is_active = True
+        return monitor, bot
+
+    monitor, bot = _start()
+    for _ in range(12):
+        monitor._process_alerts({"cpu_usage": 10.0, "memory_usage": 20.0})
+        clock[0] += 5.0
+    assert bot.sent_messages == []
+    monitor._process_alerts({"cpu_usage": 10.0, "memory_usage": 45.0})
+    monitor.stop_monitoring()
+
+    (alert,) = [str(message["text"]) for message in bot.sent_messages]
+    assert "Anomaly Detected - memory" in alert
+    assert "baseline 20.0, z=+25.0" in alert
+    assert monitor._baseline_task is None
+
+    restarted, restarted_bot = _start()
+    try:
+        detector = restarted._anomaly_detector
+        assert detector is not None and len(detector) == 2
+        restarted._process_alerts({"cpu_usage": 10.0, "memory_usage": 45.0})
+        assert len(restarted_bot.sent_messages) == 1
+    finally:
+        restarted.stop_monitoring()
+
+
 def test_process_docker_metrics_and_detect_changes(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -640,43 +710,30 @@ def test_monitor_cycle_and_stop_monitoring(monkeypatch: pytest.MonkeyPatch) -> N
     def _process_alerts(self: SystemMonitorPlugin, metrics: _PayloadDict) -> None:
         del self, metrics
         called.append("alerts")
-        monitor.state.is_active = False
 
     monkeypatch.setattr(SystemMonitorPlugin, "_process_alerts", _process_alerts)
-    monkeypatch.setattr(
-        "pytmbot.plugins.monitor.methods.time.sleep", lambda seconds: None
-    )
-    monitor._monitor_system()
+    monitor._run_monitor_cycle()
     assert called == ["adjust", "docker", "record", "alerts"]
+    assert monitor._next_cycle_delay == 4.0
 
-    monitor.state.is_active = True
     monkeypatch.setattr(
         SystemMonitorPlugin,
         "_adjust_check_interval",
         lambda self: (_ for _ in ()).throw(RuntimeError("cycle-fail")),
     )
-    monkeypatch.setattr(
-        "pytmbot.plugins.monitor.methods.time.sleep",
-        lambda seconds: setattr(monitor.state, "is_active", False),
-    )
-    monitor._monitor_system()
+    monitor._run_monitor_cycle()
+    assert monitor._next_cycle_delay == 2.0
 
-    class _ThreadStub(threading.Thread):
+    class _TaskStub:
         def __init__(self) -> None:
-            super().__init__(daemon=True)
-            self.join_calls: list[float | None] = []
+            self.cancel_calls: list[float | None] = []
 
-        def is_alive(self) -> bool:
+        def cancel(self, wait: float | None = None) -> bool:
+            self.cancel_calls.append(wait)
             return True
 
-        def join(self, timeout: float | None = None) -> None:
-            self.join_calls.append(timeout)
-
-    monitor.state.is_active = True
-    monitor_thread = _ThreadStub()
-    supervisor_thread = _ThreadStub()
-    monitor._monitor_thread = monitor_thread
-    monitor._supervisor_thread = supervisor_thread
+    task = _TaskStub()
+    monitor._monitor_task = cast(ScheduledTask, task)
 
     class _ShutdownInflux(_InfluxStub):
         __slots__ = ("calls", "close_called")
@@ -694,16 +751,10 @@ def test_monitor_cycle_and_stop_monitoring(monkeypatch: pytest.MonkeyPatch) -> N
 
     shutdown_capture = _ShutdownInflux()
     monitor.influxdb_client = shutdown_capture
-    monkeypatch.setattr(
-        "pytmbot.plugins.monitor.methods.threading.current_thread",
-        threading.current_thread,
-    )
     monitor.stop_monitoring()
     assert monitor.state.is_active is False
-    assert monitor._monitor_thread is None
-    assert monitor._supervisor_thread is None
-    assert monitor_thread.join_calls == [monitor.MONITOR_THREAD_JOIN_TIMEOUT_SECONDS]
-    assert supervisor_thread.join_calls == [monitor.MONITOR_THREAD_JOIN_TIMEOUT_SECONDS]
+    assert monitor._monitor_task is None
+    assert task.cancel_calls == [monitor.MONITOR_TASK_STOP_TIMEOUT_SECONDS]
     assert shutdown_capture.calls == [True]
     assert shutdown_capture.close_called is True
 
@@ -715,23 +766,11 @@ def test_start_monitoring_happy_path_and_failure(
     monitor.monitor_settings.retry_attempts = [2]
     monitor.monitor_settings.retry_interval = [1]
     monitor.state.is_active = False
-
-    class _ThreadStub(threading.Thread):
-        def __init__(self) -> None:
-            super().__init__(daemon=True)
-            self.started = False
-
-        def start(self) -> None:
-            self.started = True
-
+    scheduled_task = cast(ScheduledTask, object())
     monkeypatch.setattr(
         SystemMonitorPlugin,
-        "_spawn_monitor_thread",
-        lambda self: _ThreadStub(),
-    )
-    monkeypatch.setattr(
-        "pytmbot.plugins.monitor.methods.threading.Thread",
-        lambda *args, **kwargs: _ThreadStub(),
+        "_schedule_monitor_task",
+        lambda self: scheduled_task,
     )
 
     class _LogCtx:
@@ -757,16 +796,15 @@ def test_start_monitoring_happy_path_and_failure(
     monkeypatch.setattr(monitor_methods_module, "logger", logger_stub)
     monitor.start_monitoring()
     assert monitor.state.is_active is True
-    assert monitor._monitor_thread is not None
-    assert monitor._supervisor_thread is not None
+    assert monitor._monitor_task is scheduled_task
 
     failing_monitor, _bot2 = _build_monitor()
     failing_monitor.monitor_settings.retry_attempts = [2]
     failing_monitor.monitor_settings.retry_interval = [1]
     monkeypatch.setattr(
         SystemMonitorPlugin,
-        "_spawn_monitor_thread",
-        lambda self: (_ for _ in ()).throw(RuntimeError("spawn fail")),
+        "_schedule_monitor_task",
+        lambda self: (_ for _ in ()).throw(RuntimeError("schedule fail")),
     )
     monkeypatch.setattr(
         "pytmbot.plugins.monitor.methods.time.sleep", lambda seconds: None
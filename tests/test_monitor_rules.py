@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import pytest
+
+from pytmbot.plugins.monitor.rules import (
+    AlertRuleEngine,
+    SlidingWindow,
+    metric_samples,
+    parse_rule,
+)
+
+
+def test_parse_rule_accepts_supported_functions_and_series() -> None:
+    rule = parse_rule("p95( memory , 10m )>90", clear=80, cooldown_seconds=60)
+    assert (rule.function, rule.percentile, rule.family, rule.series) == (
+        "pct",
+        95,
+        "memory",
+        None,
+    )
+    assert (rule.window_seconds, rule.op, rule.threshold, rule.clear) == (
+        600.0,
+        ">",
+        90.0,
+        80.0,
+    )
+    assert rule.name == rule.expr == "p95( memory , 10m )>90"
+
+    disk = parse_rule("rate(disk:/dev/sda1, 1h) >= 0.5", name="disk growth")
+    assert disk.series == "/dev/sda1"
+    assert disk.matches("disk:/dev/sda1") and not disk.matches("disk:/dev/sdb1")
+    assert parse_rule("min(temp, 30s) < 10").matches("temp:coretemp_Package id 0")
+
+
+@pytest.mark.parametrize(
+    ("expr", "clear"),
+    [
+        ("avg(cpu) > 85", None),
+        ("median(cpu, 5m) > 85", None),
+        ("avg(network, 5m) > 85", None),
+        ("avg(cpu:core0, 5m) > 85", None),
+        ("avg(cpu, 2d) > 85", None),
+        ("avg(cpu, 25h) > 85", None),
+        ("avg(cpu, 5m) > 85", 90),
+        ("avg(cpu, 5m) < 10", 5),
+    ],
+)
+def test_parse_rule_rejects_invalid_rules(expr: str, clear: float | None) -> None:
+    with pytest.raises(ValueError):
+        parse_rule(expr, clear=clear)
+
+
+def test_sliding_window_aggregates_follow_evictions() -> None:
+    window = SlidingWindow(10.0, capacity=64, track_extremes=True, track_order=True)
+    for timestamp, value in enumerate([5.0, 1.0, 9.0, 3.0, 7.0]):
+        window.push(float(timestamp), value)
+
+    assert window.aggregate("avg") == 5.0
+    assert (window.aggregate("min"), window.aggregate("max")) == (1.0, 9.0)
+    assert window.aggregate("pct", 50) == 5.0
+    assert window.aggregate("pct", 95) == 9.0
+    assert window.aggregate("rate") == pytest.approx((7.0 - 5.0) / 4 * 60)
+
+    # t=12 evicts the samples taken at t<=2, including the minimum and maximum.
+    window.push(12.0, 4.0)
+    assert len(window) == 3
+    assert window.aggregate("avg") == pytest.approx(14.0 / 3)
+    assert (window.aggregate("min"), window.aggregate("max")) == (3.0, 7.0)
+    assert window.aggregate("pct", 99) == 7.0
+
+
+def test_sliding_window_is_a_fixed_size_ring() -> None:
+    window = SlidingWindow(1000.0, capacity=4)
+    for timestamp in range(10):
+        window.push(float(timestamp), float(timestamp))
+
+    assert len(window) == 4
+    assert window.aggregate("avg") == 7.5
+    assert window.aggregate("min") is None
+    assert not window.is_warm(999.0) and window.is_warm(1000.0)
+
+
+def test_engine_applies_warmup_hysteresis_and_cooldown() -> None:
+    engine = AlertRuleEngine(
+        [parse_rule("avg(cpu, 30s) > 80", clear=60, cooldown_seconds=100)],
+        sample_interval=10,
+    )
+    assert engine.covers("cpu") and not engine.covers("disk")
+
+    def _step(now: float, value: float) -> list[tuple[bool, float]]:
+        return [
+            (transition.firing, transition.value)
+            for transition in engine.observe({"cpu": value, "memory": 1.0}, now)
+        ]
+
+    # No verdict before one full window of samples, even on a spike.
+    assert _step(0, 99.0) == [] and _step(10, 99.0) == [] and _step(20, 99.0) == []
+    assert _step(30, 99.0) == [(True, 99.0)]
+    # Between the clear and alert thresholds the alert stays up without repeats.
+    assert _step(40, 30.0) == []
+    assert _step(50, 30.0) == [(False, 53.0)]
+    # Breaching again within the cooldown is held back until it expires.
+    assert _step(60, 99.0) == [] and _step(80, 99.0) == [] and _step(120, 99.0) == []
+    assert _step(130, 99.0) == [(True, 99.0)]
+
+
+def test_engine_tracks_each_series_of_a_family() -> None:
+    engine = AlertRuleEngine(
+        [parse_rule("max(disk, 10s) > 90"), parse_rule("rate(disk, 10s) > 60")],
+        sample_interval=5,
+    )
+    metrics: dict[str, object] = {
+        "cpu_usage": 10.0,
+        "disk_usage": {"/dev/sda1": 50.0, "/dev/sdb1": 95.0},
+        "temperatures": {"cpu": {"current": 40.0}, "gpu": {"current": None}},
+        "fan_speeds": {"thinkpad_default": {"current": 2400}},
+        "load_averages": (0.5, 0.4, 0.3),
+    }
+    assert metric_samples(metrics) == {
+        "cpu": 10.0,
+        "load": 0.5,
+        "disk:/dev/sda1": 50.0,
+        "disk:/dev/sdb1": 95.0,
+        "temp:cpu": 40.0,
+        "fan:thinkpad_default": 2400.0,
+    }
+
+    for now, sda1_usage in ((0.0, 50.0), (5.0, 60.0)):
+        metrics["disk_usage"] = {"/dev/sda1": sda1_usage, "/dev/sdb1": 95.0}
+        assert engine.observe(metric_samples(metrics), now) == []
+    metrics["disk_usage"] = {"/dev/sda1": 70.0, "/dev/sdb1": 95.0}
+    transitions = engine.observe(metric_samples(metrics), 10.0)
+
+    assert sorted((t.event_type, t.label) for t in transitions) == [
+        (
+            "rule:max(disk, 10s) > 90:disk:/dev/sdb1",
+            "max(disk, 10s) > 90 (disk:/dev/sdb1)",
+        ),
+        (
+            "rule:rate(disk, 10s) > 60:disk:/dev/sda1",
+            "rate(disk, 10s) > 60 (disk:/dev/sda1)",
+        ),
+    ]
@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+import io
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+from types import SimpleNamespace
+
+import pytest
+import requests
+from telebot import apihelper
+
+import pytmbot.utils.outbound_queue as outbound_module
+from pytmbot.utils.outbound_queue import (
+    OutboundQueue,
+    TokenBucket,
+    get_outbound_queue,
+    install_outbound_queue,
+)
+
+_URL = "https://api.telegram.org/bot123:ABC/{}"
+
+
+class _Response(SimpleNamespace):
+    def json(self) -> object:
+        return getattr(self, "payload", {})
+
+
+class _RecordingSender:
+    def __init__(self, responses: list[_Response] | None = None) -> None:
+        self.calls: list[tuple[str, dict[str, object], float]] = []
+        self._responses = list(responses or [])
+        self._lock = threading.Lock()
+        self.release = threading.Event()
+        self.release.set()
+
+    def __call__(self, method: str, url: str, **kwargs: object) -> object:
+        self.release.wait(timeout=2.0)
+        params = kwargs.get("params")
+        with self._lock:
+            self.calls.append(
+                (
+                    url.rsplit("/", 1)[-1],
+                    dict(params) if isinstance(params, dict) else {},
+                    time.monotonic(),
+                )
+            )
+            if self._responses:
+                return self._responses.pop(0)
+        return _Response(status_code=200, payload={"ok": True, "result": True})
+
+
+def _queue(sender: Callable[..., object], **kwargs: float) -> OutboundQueue:
+    options: dict[str, float] = {"chat_rate": 50.0, "chat_burst": 1}
+    options.update(kwargs)
+    return OutboundQueue(
+        sender,
+        workers=2,
+        chat_rate=options["chat_rate"],
+        chat_burst=int(options["chat_burst"]),
+    )
+
+
+def test_token_bucket_refills_at_rate() -> None:
+    bucket = TokenBucket(rate=2.0, capacity=1, now=0.0)
+    assert bucket.delay(0.0) == 0.0
+    bucket.consume(0.0)
+    assert bucket.delay(0.0) == 0.5
+    assert bucket.delay(0.5) == 0.0
+
+
+def test_queue_spaces_calls_per_chat_and_keeps_order() -> None:
+    sender = _RecordingSender()
+    queue = _queue(sender, chat_rate=20.0)
+    try:
+        futures = [
+            queue.submit(
+                "post", _URL.format("sendMessage"), params={"chat_id": 1, "n": n}
+            )
+            for n in range(3)
+        ]
+        other = queue.submit(
+            "post", _URL.format("sendMessage"), params={"chat_id": 2, "n": 9}
+        )
+        for future in [*futures, other]:
+            assert future is not None
+            future.result(timeout=2.0)
+    finally:
+        queue.shutdown()
+
+    chat_calls = [
+        (params["n"], at) for _, params, at in sender.calls if params["chat_id"] == 1
+    ]
+    assert [n for n, _ in chat_calls] == [0, 1, 2]
+    assert chat_calls[2][1] - chat_calls[0][1] >= 0.08
+    stats = queue.get_stats()
+    assert stats["sent"] == 4
+    assert stats["queued"] == 0
+    assert stats["wait_seconds_max"] >= stats["wait_seconds_p95"] > 0
+
+
+def test_queue_coalesces_superseded_edits() -> None:
+    sender = _RecordingSender()
+    sender.release.clear()
+    queue = _queue(sender)
+    try:
+        blocker = queue.submit(
+            "post", _URL.format("sendMessage"), params={"chat_id": 5, "text": "x"}
+        )
+        edits = [
+            queue.submit(
+                "post",
+                _URL.format("editMessageText"),
+                params={"chat_id": 5, "message_id": 7, "text": f"v{n}"},
+            )
+            for n in range(3)
+        ]
+        sender.release.set()
+        results = [future.result(timeout=2.0) for future in edits if future]
+        assert blocker is not None
+        blocker.result(timeout=2.0)
+    finally:
+        queue.shutdown()
+
+    edit_texts = [
+        params["text"]
+        for method, params, _ in sender.calls
+        if method == "editMessageText"
+    ]
+    assert edit_texts == ["v2"]
+    assert len(results) == 3 and results[0] is results[2]
+    assert queue.get_stats()["coalesced"] == 2
+
+
+def test_queue_honours_retry_after() -> None:
+    limited = _Response(
+        status_code=429,
+        payload={"ok": False, "parameters": {"retry_after": 0.2}},
+    )
+    sender = _RecordingSender([limited])
+    queue = _queue(sender)
+    try:
+        future = queue.submit("post", _URL.format("sendMessage"), params={"chat_id": 3})
+        assert future is not None
+        response = future.result(timeout=2.0)
+    finally:
+        queue.shutdown()
+
+    assert isinstance(response, _Response) and response.status_code == 200
+    assert len(sender.calls) == 2
+    assert sender.calls[1][2] - sender.calls[0][2] >= 0.18
+    assert queue.get_stats()["retried"] == 1
+
+
+def test_queue_propagates_sender_errors_and_bypasses_unshaped_calls() -> None:
+    def _failing(method: str, url: str, **kwargs: object) -> object:
+        if url.endswith("getUpdates"):
+            return _Response(status_code=200)
+        raise ConnectionError("down")
+
+    queue = _queue(_failing)
+    try:
+        polled = queue.send("get", _URL.format("getUpdates"))
+        assert isinstance(polled, _Response) and polled.status_code == 200
+        future: Future[object] | None = queue.submit(
+            "post", _URL.format("sendMessage"), params={"chat_id": 1}
+        )
+        assert future is not None
+        assert isinstance(future.exception(timeout=2.0), ConnectionError)
+    finally:
+        queue.shutdown()
+
+    assert queue.get_stats()["failed"] == 1
+    assert queue.submit("post", _URL.format("sendMessage"), params={}) is None
+
+
+def test_install_outbound_queue_is_idempotent() -> None:
+    queue = install_outbound_queue()
+    sender = apihelper.CUSTOM_REQUEST_SENDER
+
+    assert install_outbound_queue() is queue is get_outbound_queue()
+    assert apihelper.CUSTOM_REQUEST_SENDER is sender
+
+
+def test_send_times_out_and_drops_a_call_that_was_never_picked_up(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(outbound_module, "OUTBOUND_MAX_RETRY_AFTER_SECONDS", 0.0)
+    sender = _RecordingSender()
+    sender.release.clear()
+    queue = _queue(sender)
+    url = _URL.format("sendMessage")
+    try:
+        blocking = queue.submit("post", url, params={"chat_id": 9, "text": "a"})
+        assert blocking is not None
+        with pytest.raises(requests.Timeout):
+            queue.send("post", url, params={"chat_id": 9, "text": "b"}, timeout=0.05)
+        sender.release.set()
+        blocking.result(timeout=2.0)
+        assert queue.submit("post", url, params={"chat_id": 9, "text": "c"}) is not None
+    finally:
+        queue.shutdown()
+
+    assert [params["text"] for _, params, _ in sender.calls] == ["a", "c"]
+    assert queue.get_stats()["expired"] == 1
+
+
+def test_retry_rewinds_upload_streams_and_fails_unrewindable_uploads() -> None:
+    limited = _Response(
+        status_code=429, payload={"ok": False, "parameters": {"retry_after": 0.01}}
+    )
+    uploads: list[bytes] = []
+    responses = [limited, limited]
+
+    def _sender(method: str, url: str, **kwargs: object) -> object:
+        files = kwargs["files"]
+        assert isinstance(files, dict)
+        uploads.append(files["document"][1].read())
+        return responses.pop(0) if responses else _Response(status_code=200)
+
+    class _Pipe(io.RawIOBase):
+        def readable(self) -> bool:
+            return True
+
+        def read(self, size: int = -1) -> bytes:
+            return b"stream"
+
+    queue = _queue(_sender)
+    url = _URL.format("sendDocument")
+    try:
+        document = io.BytesIO(b"header:log-body")
+        document.seek(7)
+        future = queue.submit(
+            "post", url, params={"chat_id": 4}, files={"document": ("a.log", document)}
+        )
+        assert future is not None
+        response = future.result(timeout=2.0)
+        assert isinstance(response, _Response) and response.status_code == 200
+
+        responses.append(limited)
+        piped = queue.submit(
+            "post", url, params={"chat_id": 4}, files={"document": ("b.log", _Pipe())}
+        )
+        assert piped is not None
+        response = piped.result(timeout=2.0)
+        assert isinstance(response, _Response) and response.status_code == 429
+    finally:
+        queue.shutdown()
+
+    assert uploads == [b"log-body", b"log-body", b"log-body", b"stream"]
+    assert queue.get_stats()["retried"] == 2
+
+
+def test_queue_drops_idle_chat_state(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(outbound_module, "OUTBOUND_CHAT_SWEEP_INTERVAL_SECONDS", 0.0)
+    sender = _RecordingSender()
+    queue = _queue(sender, chat_rate=1000.0)
+    url = _URL.format("sendMessage")
+    try:
+        for chat_id in range(50):
+            future = queue.submit("post", url, params={"chat_id": chat_id})
+            assert future is not None
+            future.result(timeout=2.0)
+        time.sleep(0.01)
+        last = queue.submit("post", url, params={"chat_id": 99})
+        assert last is not None
+        last.result(timeout=2.0)
+    finally:
+        queue.shutdown()
+
+    assert len(queue._chats) <= 1
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import asyncio
+import threading
+import time
 from collections.abc import Callable
 from types import ModuleType, SimpleNamespace, TracebackType
 from typing import cast
@@ -10,6 +13,7 @@ import pytmbot.plugins.outline.methods as outline_methods_module
 from pytmbot.logs import Logger
 from pytmbot.models.settings_model import SettingsModel
 from pytmbot.plugins.outline.methods import OutlinePayload, PluginMethods
+from pytmbot.plugins.runtime import PluginRuntime
 
 
 class _SecretStub:
@@ -20,8 +24,9 @@ class _SecretStub:
         return self._value
 
 
-def _patch_plugin_core_init() -> Callable[[PluginMethods], None]:
-    def _fake_init(self: PluginMethods) -> None:
+def _patch_plugin_core_init() -> Callable[[PluginMethods, PluginRuntime], None]:
+    def _fake_init(self: PluginMethods, runtime: PluginRuntime) -> None:
+        self._runtime = runtime
         self.settings = cast(
             SettingsModel,
             SimpleNamespace(
@@ -43,7 +48,7 @@ def _patch_plugin_core_init() -> Callable[[PluginMethods], None]:
 
 
 def test_outline_methods_uses_async_client_when_available(
-    monkeypatch: pytest.MonkeyPatch,
+    monkeypatch: pytest.MonkeyPatch, plugin_runtime: PluginRuntime
 ) -> None:
     monkeypatch.setattr(
         "pytmbot.plugins.plugins_core.PluginCore.__init__",
@@ -90,7 +95,7 @@ def test_outline_methods_uses_async_client_when_available(
 
     monkeypatch.setattr(outline_methods_module, "import_module", _fake_import_module)
 
-    plugin_methods = PluginMethods()
+    plugin_methods = PluginMethods(plugin_runtime)
     assert plugin_methods.outline_action_manager("server_information") == {
         "name": "server",
         "metricsEnabled": True,
@@ -101,10 +106,11 @@ def test_outline_methods_uses_async_client_when_available(
     assert plugin_methods.outline_action_manager("key_information") == [
         {"id": "1", "name": "Alice"}
     ]
+    plugin_methods.close()
 
 
 def test_outline_methods_traffic_fallback_to_get_metrics(
-    monkeypatch: pytest.MonkeyPatch,
+    monkeypatch: pytest.MonkeyPatch, plugin_runtime: PluginRuntime
 ) -> None:
     monkeypatch.setattr(
         "pytmbot.plugins.plugins_core.PluginCore.__init__",
@@ -149,14 +155,15 @@ def test_outline_methods_traffic_fallback_to_get_metrics(
 
     monkeypatch.setattr(outline_methods_module, "import_module", _fake_import_module)
 
-    plugin_methods = PluginMethods()
+    plugin_methods = PluginMethods(plugin_runtime)
     assert plugin_methods.outline_action_manager("traffic_information") == {
         "bytes_transferred_by_user_id": {"42": 2048}
     }
+    plugin_methods.close()
 
 
 def test_outline_methods_falls_back_to_legacy_wrapper(
-    monkeypatch: pytest.MonkeyPatch,
+    monkeypatch: pytest.MonkeyPatch, plugin_runtime: PluginRuntime
 ) -> None:
     monkeypatch.setattr(
         "pytmbot.plugins.plugins_core.PluginCore.__init__",
@@ -192,7 +199,7 @@ def test_outline_methods_falls_back_to_legacy_wrapper(
 
     monkeypatch.setattr(outline_methods_module, "import_module", _fake_import_module)
 
-    plugin_methods = PluginMethods()
+    plugin_methods = PluginMethods(plugin_runtime)
     assert plugin_methods.outline_action_manager("server_information") == {
         "name": "legacy"
     }
@@ -205,7 +212,7 @@ def test_outline_methods_falls_back_to_legacy_wrapper(
 
 
 def test_outline_methods_rejects_unknown_action(
-    monkeypatch: pytest.MonkeyPatch,
+    monkeypatch: pytest.MonkeyPatch, plugin_runtime: PluginRuntime
 ) -> None:
     monkeypatch.setattr(
         "pytmbot.plugins.plugins_core.PluginCore.__init__",
@@ -242,8 +249,215 @@ def test_outline_methods_rejects_unknown_action(
 
     monkeypatch.setattr(outline_methods_module, "import_module", _fake_import_module)
 
-    plugin_methods = PluginMethods()
+    plugin_methods = PluginMethods(plugin_runtime)
     action_name = "outline_action_manager"
     action_manager = getattr(plugin_methods, action_name)
     with pytest.raises(ValueError):
         action_manager("bad_action")
+
+
+class _PooledClient:
+    """Fake async client recording lifecycle and overlapping calls."""
+
+    created = 0
+    entered = 0
+    exited = 0
+    calls: list[str] = []
+    max_concurrent = 0
+    fail_next = False
+
+    def __init__(self, *, api_url: str, cert_sha256: str, json_format: bool) -> None:
+        del api_url, cert_sha256, json_format
+        type(self).created += 1
+        self._active = 0
+
+    @classmethod
+    def reset(cls) -> None:
+        cls.created = cls.entered = cls.exited = 0
+        cls.calls = []
+        cls.max_concurrent = 0
+        cls.fail_next = False
+
+    async def __aenter__(self) -> _PooledClient:
+        type(self).entered += 1
+        return self
+
+    async def __aexit__(
+        self,
+        _exc_type: type[BaseException] | None,
+        _exc_val: BaseException | None,
+        _exc_tb: TracebackType | None,
+    ) -> None:
+        type(self).exited += 1
+
+    async def _call(self, name: str, payload: OutlinePayload) -> OutlinePayload:
+        type(self).calls.append(name)
+        self._active += 1
+        type(self).max_concurrent = max(type(self).max_concurrent, self._active)
+        # Yield so that requests gathered together overlap.
+        await asyncio.sleep(0.01)
+        self._active -= 1
+        if type(self).fail_next and name == "get_server_info":
+            type(self).fail_next = False
+            raise ConnectionError("reset by peer")
+        return payload
+
+    async def get_server_info(self) -> OutlinePayload:
+        return await self._call("get_server_info", {"name": "server"})
+
+    async def get_transfer_metrics(self) -> OutlinePayload:
+        return await self._call(
+            "get_transfer_metrics", {"bytesTransferredByUserId": {"1": 1}}
+        )
+
+    async def get_access_keys(self) -> OutlinePayload:
+        return await self._call("get_access_keys", [{"id": "1", "name": "Alice"}])
+
+
+def _pooled_methods(
+    monkeypatch: pytest.MonkeyPatch, plugin_runtime: PluginRuntime
+) -> PluginMethods:
+    monkeypatch.setattr(
+        "pytmbot.plugins.plugins_core.PluginCore.__init__",
+        _patch_plugin_core_init(),
+    )
+
+    def _fake_import_module(module_name: str) -> ModuleType:
+        module = ModuleType(module_name)
+        module.__dict__["AsyncOutlineClient"] = _PooledClient
+        return module
+
+    monkeypatch.setattr(outline_methods_module, "import_module", _fake_import_module)
+    _PooledClient.reset()
+    return PluginMethods(plugin_runtime)
+
+
+def test_outline_methods_refreshes_only_the_actions_of_the_view(
+    monkeypatch: pytest.MonkeyPatch, plugin_runtime: PluginRuntime
+) -> None:
+    plugin_methods = _pooled_methods(monkeypatch, plugin_runtime)
+    now = [100.0]
+    plugin_methods._clock = lambda: now[0]
+    try:
+        # The traffic view also labels users, so the key listing comes along.
+        assert plugin_methods.outline_action_manager("traffic_information") == {
+            "bytesTransferredByUserId": {"1": 1}
+        }
+        assert sorted(_PooledClient.calls) == [
+            "get_access_keys",
+            "get_transfer_metrics",
+        ]
+        assert _PooledClient.max_concurrent == 2
+        assert plugin_methods.outline_action_manager("key_information") == [
+            {"id": "1", "name": "Alice"}
+        ]
+        assert len(_PooledClient.calls) == 2
+
+        # The server-info view does not refetch the key listing.
+        assert plugin_methods.outline_action_manager("server_information") == {
+            "name": "server"
+        }
+        assert _PooledClient.calls[2:] == ["get_server_info"]
+
+        now[0] += outline_methods_module.OUTLINE_RESULT_TTL_SECONDS
+        plugin_methods.outline_action_manager("server_information")
+        assert _PooledClient.calls[3:] == ["get_server_info"]
+        assert (_PooledClient.created, _PooledClient.entered) == (1, 1)
+    finally:
+        plugin_methods.close()
+
+    assert _PooledClient.exited == 1
+    assert plugin_methods._client_session is None
+
+
+def test_outline_methods_fetches_outside_the_lock_and_shares_in_flight_requests(
+    monkeypatch: pytest.MonkeyPatch, plugin_runtime: PluginRuntime
+) -> None:
+    monkeypatch.setattr(
+        "pytmbot.plugins.plugins_core.PluginCore.__init__",
+        _patch_plugin_core_init(),
+    )
+    release = threading.Event()
+    calls: list[str] = []
+
+    class _SlowWrapper:
+        def __init__(self, api_url: str, cert: str, verify_tls: bool) -> None:
+            del api_url, cert, verify_tls
+
+        @staticmethod
+        def get_server_info() -> OutlinePayload:
+            calls.append("get_server_info")
+            assert release.wait(timeout=2.0)
+            return {"name": "slow"}
+
+        @staticmethod
+        def get_access_keys() -> OutlinePayload:
+            calls.append("get_access_keys")
+            return [{"id": "1", "name": "Alice"}]
+
+    def _fake_import_module(module_name: str) -> ModuleType:
+        if module_name == "pyoutlineapi.client":
+            module = ModuleType(module_name)
+            module.__dict__["PyOutlineWrapper"] = _SlowWrapper
+            return module
+        raise ImportError(module_name)
+
+    monkeypatch.setattr(outline_methods_module, "import_module", _fake_import_module)
+    plugin_methods = PluginMethods(plugin_runtime)
+    results: list[OutlinePayload] = []
+
+    def _fetch_server() -> None:
+        results.append(plugin_methods.outline_action_manager("server_information"))
+
+    callers = [threading.Thread(target=_fetch_server) for _ in range(3)]
+    for caller in callers:
+        caller.start()
+    deadline = time.monotonic() + 2.0
+    while len(plugin_methods._in_flight) == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    # The slow server fetch does not hold the lock other views need.
+    assert plugin_methods.outline_action_manager("key_information") == [
+        {"id": "1", "name": "Alice"}
+    ]
+    release.set()
+    for caller in callers:
+        caller.join(timeout=2.0)
+
+    assert results == [{"name": "slow"}] * 3
+    assert calls.count("get_server_info") == 1
+    assert plugin_methods._in_flight == {}
+
+
+def test_outline_methods_reconnects_after_transport_failure(
+    monkeypatch: pytest.MonkeyPatch, plugin_runtime: PluginRuntime
+) -> None:
+    plugin_methods = _pooled_methods(monkeypatch, plugin_runtime)
+    _PooledClient.fail_next = True
+    try:
+        with pytest.raises(ConnectionError):
+            plugin_methods.outline_action_manager("server_information")
+        assert _PooledClient.exited == 1
+
+        # The failed fetch is not cached; the next view reconnects.
+        assert plugin_methods.outline_action_manager("server_information") == {
+            "name": "server"
+        }
+        assert _PooledClient.calls == ["get_server_info", "get_server_info"]
+        assert _PooledClient.entered == 2
+    finally:
+        plugin_methods.close()
+
+
+def test_outline_methods_runs_from_inside_running_loop(
+    monkeypatch: pytest.MonkeyPatch, plugin_runtime: PluginRuntime
+) -> None:
+    plugin_methods = _pooled_methods(monkeypatch, plugin_runtime)
+
+    async def _caller() -> OutlinePayload:
+        return plugin_methods.outline_action_manager("server_information")
+
+    try:
+        assert asyncio.run(_caller()) == {"name": "server"}
+    finally:
+        plugin_methods.close()
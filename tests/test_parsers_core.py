@@ -2,21 +2,20 @@ from __future__ import annotations
 
 from pathlib import Path
 from types import SimpleNamespace
+from typing import cast
 
 import pytest
 
 import pytmbot.parsers._parser as parser_module
 from pytmbot.exceptions import TemplateError
+from pytmbot.parsers._types import ParserResultCacheStats, TemplateContext
+from pytmbot.parsers.compiler import Compiler
 
 
 def _reset_parser_caches() -> None:
     parser_module._template_cache.clear()
-    parser_module._result_cache.clear()
-    for name in (
-        "_render_template_cached",
-        "_hash_context",
-        "_resolve_template_subdirectory",
-    ):
+    parser_module._invalidate_results()
+    for name in ("_resolve_template_subdirectory",):
         cache_clear = getattr(getattr(parser_module, name, None), "cache_clear", None)
         if callable(cache_clear):
             cache_clear()
@@ -51,9 +50,96 @@ def test_resolve_template_subdirectory_for_standard_and_plugin_templates() -> No
         parser_module._resolve_template_subdirectory("")
 
 
-def test_hash_context_handles_non_sortable_keys() -> None:
-    assert isinstance(parser_module._hash_context({"a": 1}), str)
-    assert parser_module._hash_context({1: "x", "a": "b"}) is None  # type: ignore[dict-item]
+def test_render_template_reuses_result_for_same_cache_key(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    renders: list[str] = []
+    original = parser_module._render_template_hot
+
+    def _counting_render(template_name: str, context: TemplateContext) -> str:
+        renders.append(template_name)
+        return original(template_name, context)
+
+    monkeypatch.setattr(parser_module, "_render_template_hot", _counting_render)
+
+    first = parser_module._render_template(
+        "b_none.jinja2", trusted=True, cache_key=("v1", 1), context={"context": "first"}
+    )
+    again = parser_module._render_template(
+        "b_none.jinja2",
+        trusted=True,
+        cache_key=("v1", 1),
+        context={"context": "ignored"},
+    )
+    bumped = parser_module._render_template(
+        "b_none.jinja2",
+        trusted=True,
+        cache_key=("v2", 1),
+        context={"context": "second"},
+    )
+    parser_module._render_template(
+        "b_none.jinja2", trusted=True, context={"context": "x"}
+    )
+    parser_module._render_template(
+        "b_none.jinja2", trusted=True, context={"context": "x"}
+    )
+
+    assert again == first
+    assert "first" in first and "second" in bumped
+    assert len(renders) == 4
+
+    stats = parser_module._get_cache_stats()
+    assert stats["result_cache_size"] == 2
+    assert stats["result_cache_hits"] == 1
+    assert stats["result_cache_misses"] == 2
+    assert stats["result_cache_hit_ratio"] == pytest.approx(1 / 3, abs=1e-4)
+    per_template = cast(ParserResultCacheStats, stats["result_caches"])
+    assert per_template["b_none.jinja2"]["maxsize"] == 15
+
+
+def test_result_cache_policy_bounds_entries(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(
+        parser_module._TEMPLATE_CACHE_POLICIES,
+        "b_none.jinja2",
+        parser_module.TemplateCachePolicy(ttl=60, maxsize=2),
+    )
+    for page in range(5):
+        parser_module._render_template(
+            "b_none.jinja2",
+            trusted=True,
+            cache_key=page,
+            context={"context": str(page)},
+        )
+
+    stats = parser_module._get_cache_stats()
+    assert stats["result_cache_size"] == 2
+    assert stats["result_cache_misses"] == 5
+
+
+def test_invalidate_results_drops_one_template_or_all() -> None:
+    for template_name in ("b_none.jinja2", "b_echo.jinja2"):
+        parser_module._render_template(
+            template_name, trusted=True, cache_key=1, context={"context": "x"}
+        )
+
+    Compiler.invalidate_results("b_echo.jinja2")
+    per_template = cast(
+        ParserResultCacheStats, parser_module._get_cache_stats()["result_caches"]
+    )
+    assert per_template["b_echo.jinja2"]["size"] == 0
+    assert per_template["b_echo.jinja2"]["misses"] == 1
+    assert per_template["b_none.jinja2"]["size"] == 1
+
+    Compiler.invalidate_results(None)
+    assert parser_module._get_cache_stats()["result_caches"] == {}
+
+
+def test_strict_render_validates_before_cache_lookup() -> None:
+    parser_module._render_template(
+        "b_none.jinja2", trusted=True, cache_key="k", context={"context": "ok"}
+    )
+    with pytest.raises(TemplateError):
+        parser_module._render_template("../evil.jinja2", trusted=False, cache_key="k")
 
 
 def test_load_template_and_render_template_paths() -> None:
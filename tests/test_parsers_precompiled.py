@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+from jinja2 import ChoiceLoader, Environment, FileSystemLoader
+
+from pytmbot.parsers.precompiled import (
+    COMPILED_DIRNAME,
+    MANIFEST_NAME,
+    TEMPLATE_ROOT,
+    VerifiedModuleLoader,
+    build_environment,
+    build_loader,
+    compile_template_modules,
+)
+
+
+@pytest.fixture
+def template_root(tmp_path: Path) -> Path:
+    root = tmp_path / "templates"
+    shutil.copytree(
+        TEMPLATE_ROOT, root, ignore=shutil.ignore_patterns(COMPILED_DIRNAME)
+    )
+    return root
+
+
+def _render_or_error(environment: Environment, name: str) -> str:
+    try:
+        return environment.get_template(name).render()
+    except Exception as error:  # noqa: BLE001
+        return f"{type(error).__name__}: {error}"
+
+
+def test_compiled_modules_match_template_sources(template_root: Path) -> None:
+    manifest = compile_template_modules(template_root)
+    sources = sorted(
+        path.relative_to(template_root).as_posix()
+        for path in template_root.rglob("*.jinja2")
+    )
+
+    loader = build_loader(template_root)
+    assert isinstance(loader, ChoiceLoader)
+    module_loader = loader.loaders[0]
+    assert isinstance(module_loader, VerifiedModuleLoader)
+    assert sorted(manifest) == sources
+    assert module_loader.verified == frozenset(sources)
+
+    compiled_env = build_environment(loader)
+    source_env = build_environment(FileSystemLoader(template_root))
+    compiled_filename = compiled_env.get_template(sources[0]).filename
+    assert compiled_filename is not None
+    assert Path(compiled_filename).parent.name == COMPILED_DIRNAME
+    for name in sources:
+        assert _render_or_error(compiled_env, name) == _render_or_error(
+            source_env, name
+        ), name
+
+
+def test_stale_compiled_template_falls_back_to_source(template_root: Path) -> None:
+    compile_template_modules(template_root)
+    edited = "base_templates/b_none.jinja2"
+    (template_root / edited).write_text("edited {{ 1 + 1 }}\n", encoding="utf-8")
+
+    loader = build_loader(template_root)
+    assert isinstance(loader, ChoiceLoader)
+    module_loader = loader.loaders[0]
+    assert isinstance(module_loader, VerifiedModuleLoader)
+    assert edited not in module_loader.verified
+    assert "base_templates/b_back.jinja2" in module_loader.verified
+
+    environment = build_environment(loader)
+    assert environment.get_template(edited).render() == "edited 2\n"
+
+
+def test_manifest_from_other_jinja_version_is_ignored(template_root: Path) -> None:
+    compile_template_modules(template_root)
+    manifest_path = template_root / COMPILED_DIRNAME / MANIFEST_NAME
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    manifest["jinja2"] = "0.0"
+    manifest_path.write_text(json.dumps(manifest), encoding="utf-8")
+
+    assert isinstance(build_loader(template_root), FileSystemLoader)
+    shutil.rmtree(template_root / COMPILED_DIRNAME)
+    assert isinstance(build_loader(template_root), FileSystemLoader)
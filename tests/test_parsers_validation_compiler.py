@@ -98,10 +98,15 @@ def test_compiler_compile_success_and_quick_render(
     calls: _ContextDict = {}
 
     def _fake_render(
-        template_name: str, *, trusted: bool, **context: _ContextValue
+        template_name: str,
+        *,
+        trusted: bool,
+        cache_key: str | None = None,
+        **context: _ContextValue,
     ) -> str:
         calls["template_name"] = template_name
         calls["trusted"] = trusted
+        calls["cache_key"] = cache_key
         calls["context"] = context
         return "rendered"
 
@@ -113,8 +118,11 @@ def test_compiler_compile_success_and_quick_render(
     assert calls["trusted"] is False
     assert calls["context"] in ({"value": 42}, {"context": {"value": 42}})
 
-    assert Compiler.quick_render("b_demo.jinja2", v=1) == "rendered"
+    assert calls["cache_key"] is None
+
+    assert Compiler.quick_render("b_demo.jinja2", cache_key="v1", v=1) == "rendered"
     assert calls["trusted"] is True
+    assert calls["cache_key"] == "v1"
 
 
 def test_compiler_compile_error_wrapping(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -12,14 +12,17 @@ import pytmbot.plugins.plugin_manager as plugin_manager_module
 from pytmbot.plugins.models import PluginsPermissionsModel
 from pytmbot.plugins.plugin_interface import PluginInterface
 from pytmbot.plugins.plugin_manager import PluginManager, _PluginInfo
+from pytmbot.plugins.runtime import PluginRuntime
 
 
 class _TestPlugin(PluginInterface):
     registered_calls = 0
     cleanup_calls = 0
+    registered_runtime: PluginRuntime | None = None
 
     def register(self) -> None:
         type(self).registered_calls += 1
+        type(self).registered_runtime = self.runtime
 
     def cleanup(self) -> None:
         type(self).cleanup_calls += 1
@@ -32,6 +35,7 @@ def _reset_plugin_manager_singleton() -> None:
     PluginManager._module_exists.cache_clear()
     _TestPlugin.registered_calls = 0
     _TestPlugin.cleanup_calls = 0
+    _TestPlugin.registered_runtime = None
 
 
 def _build_config_module(
@@ -165,6 +169,21 @@ def _prepare_register_plugin_monkeypatch(
     )
 
 
+def test_register_plugin_binds_manager_runtime(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _prepare_register_plugin_monkeypatch(monkeypatch, base_permission=True)
+    manager = PluginManager()
+    bot = TeleBot("12345678:ABCDEFGHIJKLMNOPQRSTUVWXYZABCDE")
+
+    manager._register_plugin("test_plugin", bot)
+
+    assert _TestPlugin.registered_calls == 1
+    assert _TestPlugin.registered_runtime is manager.runtime
+    with pytest.raises(RuntimeError):
+        _ = _TestPlugin(bot).runtime
+
+
 def test_cleanup_plugin_and_cleanup_all_plugins() -> None:
     manager = PluginManager()
     bot = TeleBot("12345678:ABCDEFGHIJKLMNOPQRSTUVWXYZABCDE")
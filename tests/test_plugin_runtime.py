@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from pytmbot.plugins.plugin_manager import PluginManager
+from pytmbot.plugins.runtime import PluginRuntime
+
+
+def _runtime_threads() -> set[str]:
+    return {
+        thread.name
+        for thread in threading.enumerate()
+        if thread.name.startswith(("plugin-", "plugin_"))
+    }
+
+
+def test_runtime_runs_coroutines() -> None:
+    runtime = PluginRuntime(max_workers=2)
+    try:
+
+        async def _double(value: int) -> int:
+            await asyncio.sleep(0)
+            return value * 2
+
+        assert runtime.run_coroutine(lambda: _double(21), timeout=2.0) == 42
+        stats = runtime.get_stats()
+        assert stats["loop_running"] is True
+        assert stats["executor_workers"] <= 2
+    finally:
+        runtime.shutdown(timeout=2.0)
+
+    assert runtime.get_stats()["loop_running"] is False
+    with pytest.raises(RuntimeError):
+        runtime.schedule("noop", lambda: None, interval=60.0)
+
+
+def test_scheduled_task_never_overlaps_and_survives_failures() -> None:
+    runtime = PluginRuntime(max_workers=4, rng=lambda: 0.5)
+    active = 0
+    max_active = 0
+    calls = 0
+    lock = threading.Lock()
+    done = threading.Event()
+
+    def _tick() -> None:
+        nonlocal active, max_active, calls
+        with lock:
+            active += 1
+            calls += 1
+            max_active = max(max_active, active)
+            current = calls
+        time.sleep(0.02)
+        with lock:
+            active -= 1
+        if current >= 4:
+            done.set()
+        if current % 2:
+            raise ValueError("flaky")
+
+    try:
+        task = runtime.schedule("tick", _tick, interval=0.0, initial_delay=0.0)
+        assert done.wait(timeout=2.0)
+        assert task.cancel(wait=2.0) is True
+    finally:
+        runtime.shutdown(timeout=2.0)
+
+    assert max_active == 1
+    assert task.runs >= 4
+    assert task.failures >= 2
+
+
+def test_scheduled_task_interval_is_reevaluated_with_jitter() -> None:
+    runtime = PluginRuntime(rng=lambda: 1.0)
+    intervals = iter([10.0, 20.0])
+    task = runtime.schedule("noop", lambda: None, interval=lambda: next(intervals))
+    try:
+        # rng() == 1.0 stretches each interval by the full +10 % jitter.
+        assert task.next_delay(lambda: 1.0) == pytest.approx(22.0)
+        assert runtime.get_stats()["scheduled_tasks"] == 1
+        task.cancel()
+        assert runtime.get_stats()["scheduled_tasks"] == 0
+    finally:
+        runtime.shutdown(timeout=2.0)
+
+
+def test_plugin_manager_cleanup_shuts_down_shared_runtime() -> None:
+    manager = PluginManager()
+    runtime = manager.runtime
+    ran = threading.Event()
+    runtime.schedule("noop", ran.set, interval=60.0, initial_delay=0.0)
+    assert ran.wait(timeout=2.0)
+    assert runtime.run_coroutine(lambda: asyncio.sleep(0, "ok"), timeout=2.0) == "ok"
+    assert _runtime_threads()
+
+    manager.cleanup_all_plugins()
+
+    deadline = time.monotonic() + 2.0
+    while _runtime_threads() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not _runtime_threads()
+    assert manager.runtime is not runtime
@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Iterator
+from typing import cast
+
+import pytest
+from aiohttp import web
+from telebot import TeleBot
+from telebot.apihelper import ApiTelegramException
+from telebot.types import Update
+
+from pytmbot.polling import AsyncPoller, PollingBackoff, update_chat_key
+
+type _Json = dict[str, object]
+
+
+def _message_update(update_id: int, chat_id: int) -> _Json:
+    return {
+        "update_id": update_id,
+        "message": {
+            "message_id": update_id,
+            "date": 0,
+            "chat": {"id": chat_id, "type": "private"},
+            "from": {"id": chat_id, "is_bot": False, "first_name": "u"},
+            "text": f"m{update_id}",
+        },
+    }
+
+
+class _FakeTelegram:
+    """Local ``getUpdates`` endpoint that replays scripted responses."""
+
+    def __init__(self, script: list[tuple[int, _Json]]) -> None:
+        self.script = list(script)
+        self.requests: list[tuple[float, _Json]] = []
+        self._loop = asyncio.new_event_loop()
+        self._runner: web.AppRunner | None = None
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self.port = 0
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        payload = cast(_Json, await request.json())
+        self.requests.append((time.monotonic(), payload))
+        if self.script:
+            status, body = self.script.pop(0)
+            return web.json_response(body, status=status)
+        await asyncio.sleep(cast(int, payload["timeout"]))
+        return web.json_response({"ok": True, "result": []})
+
+    async def _start(self) -> None:
+        app = web.Application()
+        app.router.add_post("/bot{token}/getUpdates", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        server = cast(asyncio.base_events.Server, site._server)
+        self.port = server.sockets[0].getsockname()[1]
+
+    def start(self) -> None:
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._start(), self._loop).result(timeout=5)
+
+    def stop(self) -> None:
+        if self._runner is not None:
+            asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result(
+                timeout=5
+            )
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+
+    @property
+    def api_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}/bot{{0}}/{{1}}"
+
+
+class _RecordingBot:
+    def __init__(self, delay: float = 0.0) -> None:
+        self.token = "123:abc"
+        self.threaded = True
+        self.delay = delay
+        self.handled: list[tuple[int, int]] = []
+        self.threaded_during_dispatch: set[bool] = set()
+        self._lock = threading.Lock()
+
+    def process_new_updates(self, updates: list[Update]) -> None:
+        for update in updates:
+            assert update.message is not None
+            self.threaded_during_dispatch.add(self.threaded)
+            time.sleep(self.delay)
+            with self._lock:
+                self.handled.append((update.message.chat.id, update.update_id))
+
+
+@pytest.fixture
+def telegram_factory() -> Iterator[list[_FakeTelegram]]:
+    servers: list[_FakeTelegram] = []
+    yield servers
+    for server in servers:
+        server.stop()
+
+
+def _serve(
+    servers: list[_FakeTelegram], script: list[tuple[int, _Json]]
+) -> _FakeTelegram:
+    server = _FakeTelegram(script)
+    server.start()
+    servers.append(server)
+    return server
+
+
+def _start_poller(poller: AsyncPoller) -> tuple[threading.Thread, list[BaseException]]:
+    errors: list[BaseException] = []
+
+    def _run() -> None:
+        try:
+            poller.run()
+        except BaseException as error:  # noqa: BLE001
+            errors.append(error)
+
+    thread = threading.Thread(target=_run, daemon=True)
+    thread.start()
+    return thread, errors
+
+
+def _wait_until(predicate: object, timeout: float = 5.0) -> bool:
+    assert callable(predicate)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_update_chat_key_covers_messages_callbacks_and_users() -> None:
+    assert update_chat_key(_message_update(1, -100)) == -100
+    callback = {
+        "update_id": 2,
+        "callback_query": {
+            "id": "cb",
+            "from": {"id": 7},
+            "message": {"chat": {"id": 42}},
+        },
+    }
+    assert update_chat_key(callback) == 42
+    assert update_chat_key({"update_id": 3, "inline_query": {"from": {"id": 9}}}) == 9
+    assert update_chat_key({"update_id": 4, "poll": {"id": "p"}}) is None
+
+
+def test_polling_backoff_grows_to_maximum_and_resets() -> None:
+    backoff = PollingBackoff(base=1.0, maximum=4.0, jitter=0.0)
+    assert [backoff.next_delay() for _ in range(4)] == [1.0, 2.0, 4.0, 4.0]
+    backoff.reset()
+    assert backoff.next_delay() == 1.0
+
+
+def test_poller_pipelines_polls_and_keeps_per_chat_order(
+    telegram_factory: list[_FakeTelegram],
+) -> None:
+    batch = [_message_update(i, chat_id=1) for i in range(1, 6)]
+    batch += [_message_update(i, chat_id=2) for i in range(6, 11)]
+    server = _serve(
+        telegram_factory,
+        [
+            (200, {"ok": True, "result": [_message_update(100, chat_id=1)]}),
+            (200, {"ok": True, "result": batch}),
+        ],
+    )
+    bot = _RecordingBot(delay=0.05)
+    poller = AsyncPoller(
+        cast(TeleBot, bot),
+        long_polling_timeout=1,
+        request_timeout=5.0,
+        workers=4,
+        api_url=server.api_url,
+    )
+    thread, errors = _start_poller(poller)
+
+    assert _wait_until(lambda: len(bot.handled) == len(batch))
+    poller.stop()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert errors == []
+
+    # The skip-pending request drops the backlog before polling starts.
+    assert server.requests[0][1]["offset"] == -1
+    assert server.requests[1][1]["offset"] == 101
+    assert server.requests[2][1]["offset"] == 11
+    # The next poll went out long before the batch finished dispatching.
+    assert server.requests[2][0] - server.requests[1][0] < 0.2
+    for chat_id in (1, 2):
+        ids = [update_id for chat, update_id in bot.handled if chat == chat_id]
+        assert ids == sorted(ids)
+    assert bot.threaded_during_dispatch == {False}
+    assert bot.threaded is True
+
+    stats = poller.get_stats()
+    assert stats["running"] is False
+    assert stats["updates_dispatched"] == len(batch)
+    assert stats["pending"] == 0
+    assert stats["latency_ms_max"] >= stats["latency_ms_p95"] > 0.0
+
+
+def test_poller_honours_retry_after_and_backs_off_on_server_errors(
+    telegram_factory: list[_FakeTelegram],
+) -> None:
+    server = _serve(
+        telegram_factory,
+        [
+            (
+                429,
+                {
+                    "ok": False,
+                    "error_code": 429,
+                    "description": "Too Many Requests",
+                    "parameters": {"retry_after": 0},
+                },
+            ),
+            (502, {"ok": False, "error_code": 502, "description": "Bad Gateway"}),
+            (200, {"ok": True, "result": [_message_update(5, chat_id=3)]}),
+        ],
+    )
+    bot = _RecordingBot()
+    poller = AsyncPoller(
+        cast(TeleBot, bot),
+        long_polling_timeout=1,
+        request_timeout=5.0,
+        skip_pending=False,
+        api_url=server.api_url,
+        backoff=PollingBackoff(base=0.01, maximum=0.05, jitter=0.0),
+    )
+    thread, errors = _start_poller(poller)
+
+    assert _wait_until(lambda: bot.handled == [(3, 5)])
+    poller.stop()
+    thread.join(timeout=5)
+    assert errors == []
+    stats = poller.get_stats()
+    assert stats["retry_after_waits"] == 1
+    assert stats["backoff_waits"] == 1
+    assert [payload["offset"] for _, payload in server.requests[:4]] == [0, 0, 0, 6]
+
+
+def test_poller_raises_conflict_for_the_caller(
+    telegram_factory: list[_FakeTelegram],
+) -> None:
+    server = _serve(
+        telegram_factory,
+        [(409, {"ok": False, "error_code": 409, "description": "Conflict"})],
+    )
+    poller = AsyncPoller(
+        cast(TeleBot, _RecordingBot()),
+        long_polling_timeout=1,
+        request_timeout=5.0,
+        skip_pending=False,
+        api_url=server.api_url,
+    )
+
+    with pytest.raises(ApiTelegramException) as excinfo:
+        poller.run()
+    assert excinfo.value.error_code == 409
+    assert poller.get_stats()["running"] is False
+
+
+def test_stopped_poller_does_not_start_again() -> None:
+    poller = AsyncPoller(
+        cast(TeleBot, _RecordingBot()),
+        long_polling_timeout=1,
+        request_timeout=1.0,
+        api_url="http://127.0.0.1:9/bot{0}/{1}",
+    )
+    poller.stop()
+    poller.run()
+    assert poller.stop_requested is True
+    assert poller.get_stats()["polls"] == 0
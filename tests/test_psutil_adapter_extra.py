@@ -1,11 +1,9 @@
 from __future__ import annotations
 
 import socket
-import threading
 import time
 from dataclasses import dataclass
 from types import SimpleNamespace
-from typing import cast
 
 import psutil
 import pytest
@@ -155,89 +153,84 @@ def test_top_processes_validation() -> None:
     adapter.close()
 
 
-def test_start_cpu_warmup_returns_when_thread_alive(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
+def test_start_cpu_warmup_registers_single_job() -> None:
     adapter = psutil_adapter_module.PsutilAdapter()
+    job = adapter._cpu_warmup_job
+    assert job is not None
 
-    class _AliveThread:
-        @staticmethod
-        def is_alive() -> bool:
-            return True
-
-        @staticmethod
-        def join(timeout: float | None = None) -> None:
-            del timeout
-            return None
-
-    adapter._cpu_warmup_thread = cast(threading.Thread, _AliveThread())
     adapter._start_cpu_warmup()
+    assert adapter._cpu_warmup_job is job
+
     adapter.close()
+    assert job.cancelled
+    assert adapter._cpu_warmup_job is None
 
 
-def test_cpu_warmup_worker_fallback_to_overall(monkeypatch: pytest.MonkeyPatch) -> None:
-    adapter = _new_adapter_without_warmup(monkeypatch)
-
-    class _FakeStopEvent:
-        def __init__(self) -> None:
-            self._iterated = False
+@dataclass
+class _FakeCoreTimes:
+    user: float
+    idle: float
 
-        def is_set(self) -> bool:
-            return self._iterated
+    def _asdict(self) -> dict[str, float]:
+        return {"user": self.user, "idle": self.idle, "guest": 0.0}
 
-        def set(self) -> None:
-            self._iterated = True
 
-        def wait(self, timeout: float) -> bool:
-            del timeout
-            self._iterated = True
-            return True
+class _CpuTimesPsutil:
+    """Per-core ``cpu_times`` counters advanced by the test."""
 
-    class _WarmupPsutil:
-        def cpu_percent(
-            self, *, interval: float, percpu: bool = False
-        ) -> float | list[float]:
-            del interval
-            if percpu:
-                return []
-            return 33.3
-
-    adapter._cpu_warmup_stop_event = cast(threading.Event, _FakeStopEvent())
-    monkeypatch.setattr(adapter, "_psutil", _WarmupPsutil())
-    adapter._cpu_warmup_worker()
-    assert adapter._cpu_usage_snapshot is not None
-    assert adapter._cpu_usage_snapshot["cpu_percent"] == 33.3
-    adapter.close()
+    def __init__(self, *cores: tuple[float, float]) -> None:
+        self.cores = [list(core) for core in cores]
 
+    def advance(self, *deltas: tuple[float, float]) -> None:
+        for core, (busy, idle) in zip(self.cores, deltas, strict=True):
+            core[0] += busy
+            core[1] += idle
 
-def test_cpu_warmup_worker_logs_failures(monkeypatch: pytest.MonkeyPatch) -> None:
-    adapter = _new_adapter_without_warmup(monkeypatch)
+    def cpu_times(self, *, percpu: bool = False) -> list[_FakeCoreTimes]:
+        assert percpu
+        return [_FakeCoreTimes(busy, idle) for busy, idle in self.cores]
 
-    class _FakeStopEvent:
-        def __init__(self) -> None:
-            self._iterated = False
 
-        def is_set(self) -> bool:
-            return self._iterated
+def test_sample_cpu_usage_measures_deltas_per_adapter(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    fake = _CpuTimesPsutil((100.0, 900.0), (50.0, 950.0))
+    first = _new_adapter_without_warmup(monkeypatch)
+    second = _new_adapter_without_warmup(monkeypatch)
+    for adapter in (first, second):
+        monkeypatch.setattr(adapter, "_psutil", fake)
+        adapter._sample_cpu_usage()
+        assert adapter._cpu_usage_snapshot is None
+
+    fake.advance((3.0, 1.0), (1.0, 3.0))
+    first._sample_cpu_usage()
+    fake.advance((0.0, 4.0), (0.0, 4.0))
+    second._sample_cpu_usage()
+
+    assert first._cpu_usage_snapshot == {
+        "cpu_percent": 50.0,
+        "cpu_percent_per_core": [75.0, 25.0],
+    }
+    # The second adapter's window spans both advances, whatever the first sampled.
+    assert second._cpu_usage_snapshot == {
+        "cpu_percent": 25.0,
+        "cpu_percent_per_core": [37.5, 12.5],
+    }
+    first.close()
+    second.close()
 
-        def set(self) -> None:
-            self._iterated = True
 
-        def wait(self, timeout: float) -> bool:
-            del timeout
-            self._iterated = True
-            return True
+def test_sample_cpu_usage_logs_failures(monkeypatch: pytest.MonkeyPatch) -> None:
+    adapter = _new_adapter_without_warmup(monkeypatch)
 
     class _FailingWarmupPsutil:
-        def cpu_percent(
-            self, *, interval: float, percpu: bool = False
-        ) -> float | list[float]:
-            del interval, percpu
+        def cpu_times(self, *, percpu: bool = False) -> list[_FakeCoreTimes]:
+            del percpu
             raise RuntimeError("cpu boom")
 
-    adapter._cpu_warmup_stop_event = cast(threading.Event, _FakeStopEvent())
     monkeypatch.setattr(adapter, "_psutil", _FailingWarmupPsutil())
-    adapter._cpu_warmup_worker()
+    adapter._sample_cpu_usage()
+    assert adapter._cpu_usage_snapshot is None
     adapter.close()
 
 
@@ -427,13 +420,9 @@ def test_net_io_users_interfaces_and_cpu_fallbacks(
         def cpu_freq(self) -> SimpleNamespace | None:
             return None
 
-        def cpu_percent(
-            self, *, interval: float, percpu: bool = False
-        ) -> float | list[float]:
-            del interval
-            if percpu:
-                return []
-            return 7.0
+        def cpu_times(self, *, percpu: bool = False) -> list[_FakeCoreTimes]:
+            assert percpu
+            return [_FakeCoreTimes(30.0, 70.0)]
 
         def cpu_times_percent(self, *, interval: float) -> SimpleNamespace:
             del interval
@@ -453,9 +442,15 @@ def test_net_io_users_interfaces_and_cpu_fallbacks(
         "min_freq": 0.0,
         "max_freq": 0.0,
     }
-    # force uncached branch of get_cpu_usage with empty per-core values
+    # force uncached branch of get_cpu_usage, first without and then with a baseline
     adapter._cpu_usage_snapshot = None
-    assert adapter.get_cpu_usage()["cpu_percent"] == 7.0
+    assert adapter.get_cpu_usage() == {"cpu_percent": 0.0, "cpu_percent_per_core": []}
+    assert adapter._cpu_usage_snapshot is None
+    adapter._cpu_times_baseline = [(20.0, 80.0)]
+    assert adapter.get_cpu_usage() == {
+        "cpu_percent": 50.0,
+        "cpu_percent_per_core": [50.0],
+    }
     assert adapter.get_cpu_times_percent() == {
         "user": 0.0,
         "system": 0.0,
@@ -18,6 +18,7 @@ from telebot.types import BotCommand
 import pytmbot.pytmbot_instance as instance_module
 from pytmbot.exceptions import InitializationError
 from pytmbot.plugins.plugin_manager import PluginManager
+from pytmbot.utils.cli import PollingEngine
 
 type _PayloadValue = (
     str | int | float | bool | None | dict[str, _PayloadValue] | list[_PayloadValue]
@@ -449,11 +450,20 @@ def test_get_bot_session_statistics_includes_runtime_state(
         lambda self: {"active_users": 1},
     )
 
+    housekeeping_stats = {
+        "running": True,
+        "jobs": {"session_expiry": {"runs": 3, "overruns": 1, "failures": 0}},
+    }
+    monkeypatch.setattr(
+        instance_module, "get_housekeeping_stats", lambda: housekeeping_stats
+    )
+
     stats = bot.get_bot_session_statistics()
 
     assert stats["bot_healthy"] is True
     assert stats["polling_active"] is True
     assert stats["rate_limit_stats"] == {"active_users": 1}
+    assert stats["housekeeping_stats"] == housekeeping_stats
 
 
 def test_handle_bot_conflict_strategy_dispatch(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -830,3 +840,41 @@ def test_get_session_stats_without_session() -> None:
     bot = instance_module.PyTMBot()
     bot._session = None
     assert bot.get_bot_session_statistics() == {}
+
+
+def test_start_polling_loop_uses_async_engine_until_stopped(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    runs: list[TeleBot] = []
+
+    class _FakePoller:
+        def __init__(self, bot: TeleBot, **_kwargs: _PayloadValue) -> None:
+            self.bot = bot
+            self.stop_requested = False
+
+        def run(self) -> None:
+            runs.append(self.bot)
+            self.stop_requested = True
+
+        def stop(self) -> None:
+            self.stop_requested = True
+
+        def get_stats(self) -> dict[str, int]:
+            return {"polls": len(runs)}
+
+    monkeypatch.setattr(instance_module, "AsyncPoller", _FakePoller)
+    bot = _build_bot_with_dummy_telebot(monkeypatch)
+    bot.args = argparse.Namespace(
+        mode="dev",
+        webhook="False",
+        plugins=[],
+        socket_host="127.0.0.1",
+        polling_engine=PollingEngine.ASYNC,
+    )
+    dummy = cast(Any, bot.bot)
+
+    bot._start_polling_loop(cast(TeleBot, dummy))
+
+    assert runs == [dummy]
+    assert bot.get_bot_session_statistics()["async_polling_stats"] == {"polls": 1}
+    bot.stop_async_polling()
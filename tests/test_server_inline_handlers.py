@@ -7,7 +7,7 @@ from typing import cast
 
 import pytest
 from telebot import TeleBot
-from telebot.types import CallbackQuery
+from telebot.types import CallbackQuery, InlineKeyboardButton, InlineKeyboardMarkup
 
 import pytmbot.handlers.server_handlers.health_summary as health_module
 import pytmbot.handlers.server_handlers.inline.common as inline_common_module
@@ -491,6 +491,44 @@ def test_system_views_edit_message_handles_rate_limited_error(
     )
 
 
+def test_edit_callback_message_text_skips_identical_edit() -> None:
+    bot = _Bot()
+    call = cast(CallbackQuery, _Call())
+    markup = InlineKeyboardMarkup()
+    markup.add(InlineKeyboardButton("Refresh", callback_data="__health_refresh__"))
+
+    def _edit(text: str) -> bool:
+        return inline_common_module.edit_callback_message_text(
+            call,
+            cast(TeleBot, bot),
+            text=text,
+            parse_mode="HTML",
+            reply_markup=markup,
+            not_modified_text="Still current.",
+        )
+
+    assert _edit("snapshot") is True
+    assert _edit("snapshot") is False
+    assert len(bot.edited_messages) == 1
+    assert bot.callback_answers[-1]["text"] == "Still current."
+
+    assert _edit("changed") is True
+    assert len(bot.edited_messages) == 2
+
+
+def test_edit_fingerprint_cache_is_bounded() -> None:
+    cache = inline_common_module.EditFingerprintCache(max_entries=2)
+    cache.remember((1, 1), b"a")
+    cache.remember((1, 2), b"b")
+    assert cache.matches((1, 1), b"a")
+    cache.remember((1, 3), b"c")
+
+    assert cache.matches((1, 1), b"a")
+    assert not cache.matches((1, 2), b"b")
+    cache.forget((1, 1))
+    assert not cache.matches((1, 1), b"a")
+
+
 def test_system_views_edit_message_reraises_other_telegram_errors(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+from datetime import datetime, timedelta
+from pathlib import Path
 from time import time_ns
 
 import pytest
 
 import pytmbot.middleware.session_manager as session_manager_module
+from pytmbot.middleware.session_backend import (
+    PersistedSession,
+    StateStoreSessionBackend,
+)
+from pytmbot.utils.state_store import StateStore
 
 
 def _create_manager(
@@ -17,7 +24,7 @@ def _create_manager(
 ) -> session_manager_module.SessionManager:
     monkeypatch.setattr(
         session_manager_module.SessionManager,
-        "_start_cleanup_thread",
+        "_register_cleanup_job",
         lambda self: None,
     )
     manager = session_manager_module.SessionManager(instance_name=f"test-{time_ns()}")
@@ -26,7 +33,8 @@ def _create_manager(
     manager.max_totp_attempts = max_totp_attempts
     manager.block_duration = block_duration
     manager._shutdown_event.clear()
-    manager._user_sessions.clear()
+    for shard in manager._shards:
+        shard.clear()
     return manager
 
 
@@ -52,3 +60,73 @@ def test_auth_state_and_totp_blocking(monkeypatch: pytest.MonkeyPatch) -> None:
 
     manager.reset_totp_attempts(user_id)
     assert manager.get_totp_attempts(user_id) == 0
+
+
+def test_expiry_heap_removes_only_expired_sessions(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    manager = _create_manager(monkeypatch, session_timeout=10)
+
+    manager.set_login_time(1)
+    manager.set_login_time(2)
+    manager.get_auth_state(3)  # no login: eligible on the next sweep
+    shard = manager._shard_for(2)
+    with shard.lock:
+        shard.sessions[2].login_time = datetime.now() - timedelta(minutes=30)
+        shard.index(2, shard.sessions[2])
+    manager.set_login_time(1)  # re-login leaves a stale heap entry behind
+
+    manager.clear_expired_sessions()
+
+    remaining = {uid for s in manager._shards for uid in s.sessions}
+    assert remaining == {1}
+    assert manager.get_session_stats()["total_sessions"] == 1
+
+
+def test_state_store_backend_restores_authenticated_sessions(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    database = tmp_path / "state" / "state.sqlite3"
+    store = StateStore(database)
+    manager = _create_manager(monkeypatch)
+    manager._attach_backend(StateStoreSessionBackend(store.namespace("sessions")))
+
+    manager.set_auth_state(7, manager.state_fabric.AUTHENTICATED)
+    manager.set_login_time(7)
+    manager.set_auth_state(8, manager.state_fabric.AUTHENTICATED)
+    manager.set_login_time(8)
+    manager.set_auth_state(8, manager.state_fabric.UNAUTHENTICATED)
+    manager.set_referer_data(7, "docker", "/containers")
+    manager.shutdown()
+    store.close()
+
+    reopened = StateStore(database)
+    assert reopened._connection.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+    backend = StateStoreSessionBackend(reopened.namespace("sessions"))
+    assert [record.user_id for record in backend.load()] == [7]
+
+    restored = _create_manager(monkeypatch)
+    restored._attach_backend(backend)
+    assert restored.is_authenticated(7) is True
+    assert restored.get_referer_uri(7) is None
+    assert restored.is_authenticated(8) is False
+
+
+def test_state_store_backend_discards_sessions_past_timeout(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    backend = StateStoreSessionBackend(StateStore(None).namespace("sessions"))
+    backend.save(
+        PersistedSession(
+            user_id=5,
+            auth_state="authenticated",
+            login_time=datetime.now() - timedelta(hours=1),
+            blocked_time=None,
+        )
+    )
+
+    manager = _create_manager(monkeypatch, session_timeout=10)
+    manager._attach_backend(backend)
+
+    assert manager.is_authenticated(5) is False
+    assert backend.load() == []
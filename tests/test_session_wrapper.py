@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
 from types import SimpleNamespace, TracebackType
 from typing import Literal, cast
@@ -65,6 +65,17 @@ class _AuthComponentStub:
         del kwargs
         return _LogContext(self.events)
 
+    def emit(
+        self,
+        level: str,
+        message: str,
+        context_factory: Callable[[], Mapping[str, object]] | None = None,
+    ) -> None:
+        del level
+        if context_factory is not None:
+            context_factory()
+        self.events.append(message)
+
 
 def _make_session_manager_stub(
     *, authenticated: bool = True, expired: bool = False
@@ -9,8 +9,12 @@ from pydantic import ValidationError
 
 import pytmbot.models.settings_model as settings_model_module
 from pytmbot.models.settings_model import (
+    AgentServerModel,
     ConfigMigrator,
     ConfigVersionError,
+    DockerHostModel,
+    MonitorAlertRuleModel,
+    MonitorAnomalyModel,
     SettingsModel,
     check_config_deprecation,
     get_app_version,
@@ -61,6 +65,83 @@ def test_webhook_config_trusted_proxy_ips_normalization_and_validation() -> None
         build_webhook_config(trusted_proxy_ips=[""])
 
 
+def test_docker_endpoints_require_unique_names() -> None:
+    config = DockerHostModel.model_validate(
+        {
+            "host": ["unix:///var/run/docker.sock"],
+            "endpoints": [
+                {"name": "local", "host": "unix:///var/run/docker.sock"},
+                {"name": "edge-1", "host": "tcp://10.0.0.5:2376", "tls_ca_cert": "ca"},
+            ],
+        }
+    )
+    assert config.endpoints is not None
+    assert config.endpoints[1].query_timeout_seconds == 5.0
+
+    with pytest.raises(ValidationError):
+        DockerHostModel.model_validate(
+            {
+                "host": ["unix:///var/run/docker.sock"],
+                "endpoints": [
+                    {"name": "a", "host": "unix:///a.sock"},
+                    {"name": "a", "host": "unix:///b.sock"},
+                ],
+            }
+        )
+
+
+def test_agent_server_model_normalizes_listen_and_rejects_short_secrets() -> None:
+    config = AgentServerModel.model_validate(
+        {"listen": [" tcp://0.0.0.0:9130 "], "secret": ["s" * 16]}
+    )
+    assert config.listen == ["tcp://0.0.0.0:9130"]
+    assert config.stale_after_seconds == 90
+
+    with pytest.raises(ValidationError):
+        AgentServerModel.model_validate(
+            {"listen": ["localhost:9130"], "secret": ["s" * 16]}
+        )
+    with pytest.raises(ValidationError):
+        AgentServerModel.model_validate(
+            {"listen": ["unix:///run/agent.sock"], "secret": ["short"]}
+        )
+
+
+def test_agent_server_model_validates_host_bound_secrets() -> None:
+    config = AgentServerModel.model_validate(
+        {"listen": ["tcp://0.0.0.0:9130"], "host_secrets": {"web-1": "h" * 16}}
+    )
+    assert config.secret == []
+    assert config.host_secrets["web-1"].get_secret_value() == "h" * 16
+
+    for invalid in (
+        {"listen": ["tcp://0.0.0.0:9130"]},
+        {"listen": ["tcp://0.0.0.0:9130"], "host_secrets": {"web 1": "h" * 16}},
+        {"listen": ["tcp://0.0.0.0:9130"], "host_secrets": {"web-1": "short"}},
+    ):
+        with pytest.raises(ValidationError):
+            AgentServerModel.model_validate(invalid)
+
+
+def test_monitor_alert_rule_model_validates_expression_and_clear() -> None:
+    rule = MonitorAlertRuleModel.model_validate(
+        {"expr": "avg(cpu, 5m) > 85", "clear": 75}
+    )
+    assert rule.cooldown_seconds == 300
+
+    with pytest.raises(ValidationError, match="Invalid alert rule"):
+        MonitorAlertRuleModel.model_validate({"expr": "avg(cpu) > 85"})
+    with pytest.raises(ValidationError, match="alerting side"):
+        MonitorAlertRuleModel.model_validate({"expr": "avg(cpu, 5m) > 85", "clear": 90})
+
+
+def test_monitor_anomaly_model_requires_hysteresis_gap() -> None:
+    assert MonitorAnomalyModel().direction == "above"
+
+    with pytest.raises(ValidationError, match="z_clear must be lower"):
+        MonitorAnomalyModel(z_threshold=3.0, z_clear=3.0)
+
+
 @pytest.mark.parametrize(
     ("config_version", "app_version", "should_raise"),
     [
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from pytmbot.utils.state_store import (
+    StateStore,
+    get_state_store,
+    shutdown_state_store,
+)
+
+
+def test_namespaces_are_isolated_and_expire(tmp_path: Path) -> None:
+    store = StateStore(tmp_path / "state.sqlite3")
+    bans = store.namespace("bans")
+    sessions = store.namespace("sessions")
+
+    bans.put("10.0.0.1", 100, expires_at=50.0)
+    bans.put("10.0.0.2", 200)
+    sessions.put("10.0.0.1", {"auth_state": "authenticated"})
+
+    assert bans.items(now=10.0) == [("10.0.0.1", 100), ("10.0.0.2", 200)]
+    assert bans.items(now=60.0) == [("10.0.0.2", 200)]
+    assert sessions.get("10.0.0.1") == {"auth_state": "authenticated"}
+
+    bans.purge_expired(now=60.0)
+    bans.delete(["10.0.0.2"])
+    assert bans.items(now=0.0) == []
+    assert oct((tmp_path / "state.sqlite3").stat().st_mode & 0o777) == "0o600"
+
+
+def test_batch_commits_once_and_rolls_back_on_error(tmp_path: Path) -> None:
+    store = StateStore(tmp_path / "state.sqlite3")
+    replay = store.namespace("replay")
+
+    with store.batch():
+        for user_id in range(10):
+            replay.put(str(user_id), [["123456", user_id]])
+    with pytest.raises(RuntimeError), store.batch():
+        replay.put("lost", 1)
+        raise RuntimeError("boom")
+
+    stats = store.get_stats()
+    assert stats["writes"] == 11
+    assert stats["transactions"] == 1
+    assert replay.get("lost") is None
+    store.close()
+
+    assert len(StateStore(tmp_path / "state.sqlite3").namespace("replay").items()) == 10
+
+
+def test_batch_survives_failed_begin(tmp_path: Path) -> None:
+    store = StateStore(tmp_path / "state.sqlite3")
+    replay = store.namespace("replay")
+    # An open transaction makes the batch's own BEGIN fail.
+    store._connection.execute("BEGIN")
+
+    with store.batch():
+        replay.put("kept", 1)
+
+    assert store.get_stats()["errors"] == 1
+    assert replay.get("kept") == 1
+    store.close()
+
+
+def test_unwritable_state_dir_falls_back_to_memory(tmp_path: Path) -> None:
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+
+    store = StateStore(blocker / "state.sqlite3")
+    store.namespace("bans").put("k", 1)
+
+    assert store.get_stats()["persistent"] is False
+    assert store.namespace("bans").get("k") == 1
+
+
+def test_shared_store_lives_under_state_dir() -> None:
+    store = get_state_store()
+
+    assert store is get_state_store()
+    assert store.get_stats()["path"] == os.path.join(
+        os.environ["PYTMBOT_STATE_DIR"], "state.sqlite3"
+    )
+
+    shutdown_state_store()
+    assert get_state_store.cache_info().currsize == 0
+    assert get_state_store() is not store
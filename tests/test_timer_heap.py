@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+
+from pytmbot.utils.timer_heap import PeriodicTask, TimerHeap
+
+
+def test_timer_heap_dispatches_runs_and_reports_failures() -> None:
+    dispatched: list[str] = []
+    failures: list[tuple[str, str]] = []
+    done = threading.Event()
+
+    def _dispatch(run: Callable[[], None]) -> None:
+        dispatched.append(threading.current_thread().name)
+        threading.Thread(target=run).start()
+
+    def _tick() -> None:
+        if task.runs >= 2:
+            done.set()
+        raise ValueError("boom")
+
+    timers = TimerHeap(
+        "test-timers",
+        clock=time.monotonic,
+        rng=lambda: 0.5,
+        on_error=lambda task, error: failures.append((task.name, str(error))),
+        dispatch=_dispatch,
+    )
+    task = PeriodicTask("tick", _tick, 0.0, 0.1)
+    try:
+        timers.add(task, initial_delay=0.0)
+        assert done.wait(timeout=2.0)
+        assert task.cancel(wait=2.0) is True
+    finally:
+        timers.shutdown(timeout=2.0)
+
+    assert set(dispatched) == {"test-timers"}
+    assert task.failures == task.runs >= 3
+    assert failures[0] == ("tick", "boom")
+    assert timers.tasks() == [] and not timers.running
@@ -9,6 +9,7 @@ from pytmbot.utils.cli import (
     CLIError,
     LogFormat,
     LogLevel,
+    PollingEngine,
     _str_to_bool,
     _validate_plugins,
     _validate_socket_host,
@@ -62,6 +63,7 @@ def test_parse_cli_args_defaults(monkeypatch: pytest.MonkeyPatch) -> None:
     assert args.log_format == LogFormat.JSON
     assert args.plugins == []
     assert args.health_check is False
+    assert args.polling_engine == PollingEngine.THREADED
 
 
 def test_parse_cli_args_debug_flag_overrides_mode_and_level(
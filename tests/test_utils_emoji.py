@@ -1,28 +1,115 @@
 from __future__ import annotations
 
+import importlib.util
+import re
 import types
+from collections.abc import Generator
+from pathlib import Path
 
 import pytest
 
+import pytmbot.utils.emoji as emoji_module
+from pytmbot.plugins.monitor import config as monitor_config
+from pytmbot.plugins.outline import config as outline_config
+from pytmbot.settings import KeyboardSettings
 from pytmbot.utils.emoji import EmojiConverter
+from pytmbot.utils.emoji_table import EMOJI_TABLE
 
+_BUILD_SCRIPT = Path(__file__).resolve().parents[1] / "tools" / "build_emoji_table.py"
 
-def test_emoji_converter_uses_emojize_callable(
+
+@pytest.fixture(autouse=True)
+def _clear_fallback_caches() -> Generator[None, None, None]:
+    emoji_module._load_emoji_library.cache_clear()
+    emoji_module._emojize_fallback.cache_clear()
+    yield
+    emoji_module._load_emoji_library.cache_clear()
+    emoji_module._emojize_fallback.cache_clear()
+
+
+def _fail_import(name: str) -> types.ModuleType:
+    raise AssertionError(f"{name} must not be imported")
+
+
+def test_emoji_converter_serves_known_names_without_emoji_package(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    converter = EmojiConverter()
-    fake_module = types.SimpleNamespace(emojize=lambda text: f"ok:{text}")
+    monkeypatch.setattr("pytmbot.utils.emoji.import_module", _fail_import)
+
+    assert EmojiConverter().get_emoji("house") == EMOJI_TABLE["house"] == "🏠"
+
+
+def test_emoji_converter_falls_back_to_cached_emojize(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[str] = []
+
+    def _emojize(text: str) -> str:
+        calls.append(text)
+        return f"ok:{text}"
+
+    fake_module = types.SimpleNamespace(emojize=_emojize)
     monkeypatch.setattr("pytmbot.utils.emoji.import_module", lambda _name: fake_module)
+    converter = EmojiConverter()
+
+    assert converter.get_emoji("not_in_table") == "ok::not_in_table:"
+    assert converter.get_emoji("not_in_table") == "ok::not_in_table:"
+    assert calls == [":not_in_table:"]
 
-    assert converter.get_emoji("house") == "ok::house:"
+
+def test_emoji_converter_without_emoji_package_keeps_alias(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def _missing(name: str) -> types.ModuleType:
+        raise ImportError(name)
+
+    monkeypatch.setattr("pytmbot.utils.emoji.import_module", _missing)
+
+    assert EmojiConverter().get_emoji("not_in_table") == ":not_in_table:"
 
 
 def test_emoji_converter_rejects_missing_emojize(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    converter = EmojiConverter()
     fake_module = types.SimpleNamespace()
     monkeypatch.setattr("pytmbot.utils.emoji.import_module", lambda _name: fake_module)
 
     with pytest.raises(TypeError, match="emojize"):
-        _ = converter.emoji_library
+        EmojiConverter().get_emoji("not_in_table")
+
+
+def test_emoji_table_matches_build_script_output() -> None:
+    spec = importlib.util.spec_from_file_location("build_emoji_table", _BUILD_SCRIPT)
+    assert spec is not None and spec.loader is not None
+    build_script = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(build_script)
+
+    expected = build_script.build_table_source()
+    assert build_script.TABLE_PATH.read_text(encoding="utf-8") == expected, (
+        "Emoji table is stale: run `python tools/build_emoji_table.py`"
+    )
+
+
+def test_literal_emoji_names_resolve_from_table() -> None:
+    package_root = Path(__file__).resolve().parents[1] / "pytmbot"
+    pattern = re.compile(r"get_emoji\(\s*[\"']([^\"']+)[\"']")
+    names = {
+        name
+        for path in package_root.rglob("*.py")
+        for name in pattern.findall(path.read_text(encoding="utf-8"))
+    }
+
+    assert names
+    assert sorted(names - EMOJI_TABLE.keys()) == []
+
+
+def test_emoji_table_covers_keyboards_and_skips_plain_strings() -> None:
+    keyboards = KeyboardSettings().model_dump()
+    names = {name for keyboard in keyboards.values() for name in keyboard}
+    for config in (monitor_config, outline_config):
+        names |= config.KEYBOARD.keys() | config.PLUGIN_INDEX_KEY.keys()
+    names |= monitor_config.PERIOD_KEYBOARD.keys()
+
+    assert sorted(names - EMOJI_TABLE.keys()) == []
+    # Ordinary identifiers that happen to be emoji aliases stay out of the table.
+    assert {"family", "window", "keyboard", "zombie"}.isdisjoint(EMOJI_TABLE)
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
 from collections.abc import Generator
-from pathlib import Path
 from typing import cast
 
 import pyotp
 import pytest
 
 from pytmbot.exceptions import QRCodeError, TOTPError
+from pytmbot.utils.state_store import get_state_store
 from pytmbot.utils.totp import TwoFactorAuthenticator
 
 
@@ -17,17 +17,11 @@ def _reset_totp_replay_registry() -> Generator[None, None, None]:
         TwoFactorAuthenticator._used_totp_codes.clear()
         TwoFactorAuthenticator._backup_code_hashes.clear()
         TwoFactorAuthenticator._replay_state_loaded = False
-        replay_state_file = Path(TwoFactorAuthenticator._REPLAY_STATE_FILE)
-        if replay_state_file.exists():
-            replay_state_file.unlink()
     yield
     with TwoFactorAuthenticator._used_totp_codes_lock:
         TwoFactorAuthenticator._used_totp_codes.clear()
         TwoFactorAuthenticator._backup_code_hashes.clear()
         TwoFactorAuthenticator._replay_state_loaded = False
-        replay_state_file = Path(TwoFactorAuthenticator._REPLAY_STATE_FILE)
-        if replay_state_file.exists():
-            replay_state_file.unlink()
 
 
 def test_totp_authenticator_rejects_invalid_inputs() -> None:
@@ -66,13 +60,7 @@ def test_generate_qr_code_returns_png_bytes() -> None:
     assert len(qr_data) > 100
 
 
-def test_totp_replay_state_persists_between_instances(
-    monkeypatch: pytest.MonkeyPatch,
-    tmp_path: Path,
-) -> None:
-    state_file = tmp_path / "totp_replay_state.json"
-    monkeypatch.setattr(TwoFactorAuthenticator, "_REPLAY_STATE_FILE", state_file)
-
+def test_totp_replay_state_persists_between_instances() -> None:
     auth_one = TwoFactorAuthenticator(user_id=123456789, username="test_user")
     totp = pyotp.TOTP(
         auth_one._generate_secret(),
@@ -82,10 +70,14 @@ def test_totp_replay_state_persists_between_instances(
     valid_code = totp.now()
     assert auth_one.verify_totp_code(valid_code) is True
 
-    # Simulate process restart: in-memory state cleared, file remains.
+    # Simulate process restart: in-memory state cleared, store reopened.
     with TwoFactorAuthenticator._used_totp_codes_lock:
         TwoFactorAuthenticator._used_totp_codes.clear()
         TwoFactorAuthenticator._replay_state_loaded = False
+    get_state_store().close()
+    get_state_store.cache_clear()
+    replay_rows = get_state_store().namespace("totp_replay").items()
+    assert [user_id for user_id, _markers in replay_rows] == ["123456789"]
 
     auth_two = TwoFactorAuthenticator(user_id=123456789, username="test_user")
     assert auth_two.verify_totp_code(valid_code) is False
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections import deque
+from collections import OrderedDict, deque
 from datetime import datetime, timedelta
 from types import SimpleNamespace
 
@@ -65,11 +65,13 @@ def test_rate_limit_cleanup_and_evict_oldest() -> None:
         "2.2.2.2": deque([1.0]),
         "3.3.3.3": deque([2.0]),
     }
-    limiter._last_seen = {
-        "1.1.1.1": 1.0,
-        "2.2.2.2": 2.0,
-        "3.3.3.3": 3.0,
-    }
+    limiter._last_seen = OrderedDict(
+        {
+            "1.1.1.1": 1.0,
+            "2.2.2.2": 2.0,
+            "3.3.3.3": 3.0,
+        }
+    )
     limiter._cleanup_state(1000.0)
     assert "1.1.1.1" not in limiter._last_seen
     assert len(limiter._last_seen) <= 2
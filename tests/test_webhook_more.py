@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from collections import deque
 from collections.abc import Awaitable, Callable
 from datetime import datetime, timedelta
+from pathlib import Path
 from types import FunctionType, SimpleNamespace
 from typing import cast
 
@@ -17,6 +19,7 @@ from telebot import TeleBot
 
 import pytmbot.webhook as webhook_module
 from pytmbot.exceptions import BotException, InitializationError
+from pytmbot.utils.state_store import StateStore
 from pytmbot.webhook import RateLimit, WebhookServer
 
 
@@ -49,6 +52,95 @@ def _build_server() -> WebhookServer:
     )
 
 
+def test_rate_limit_escalates_to_network_ban() -> None:
+    limiter = RateLimit(limit=5, period=10, ban_threshold=1, range_ban_threshold=3)
+
+    for host in (1, 2, 3):
+        assert limiter.is_rate_limited(f"203.0.113.{host}") is False
+        assert limiter.is_rate_limited(f"203.0.113.{host}") is True
+
+    assert "203.0.113.0/24" in limiter.banned_networks
+    assert limiter.is_banned("203.0.113.200") is True
+    assert limiter.is_banned("203.0.114.1") is False
+
+    for _ in range(2):
+        limiter.is_rate_limited("2001:db8:1:1::a")
+    limiter.is_rate_limited("2001:db8:1:1::b")
+    limiter.is_rate_limited("2001:db8:1:1::b")
+    limiter.is_rate_limited("2001:db8:1:1::c")
+    limiter.is_rate_limited("2001:db8:1:1::c")
+    assert limiter.is_banned("2001:db8:1:1::ffff") is True
+
+
+def test_rate_limit_ban_survives_idle_sweep_and_eviction(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    clock = [1_000.0]
+    monkeypatch.setattr(webhook_module, "time", lambda: clock[0])
+    limiter = RateLimit(limit=10, period=10, ban_threshold=5, max_tracked_ips=128)
+
+    results = [limiter.is_rate_limited("198.51.100.7") for _ in range(20)]
+    assert results[:5] == [False] * 5 and all(results[5:])
+    assert limiter.is_banned("198.51.100.7") is True
+
+    # Banned, idle for longer than ``period``: the stale sweep must keep the ban.
+    clock[0] += 70.0
+    assert limiter.is_rate_limited("198.51.100.8") is False
+    assert limiter.is_banned("198.51.100.7") is True
+
+    # Cycling other source addresses through the LRU does not evict it either.
+    for index in range(300):
+        limiter.is_rate_limited(f"192.0.2.{index % 250}")
+    assert limiter.is_banned("198.51.100.7") is True
+
+
+def test_webhook_server_limiter_bans_a_flooding_client() -> None:
+    server = _build_server()
+    results = [server.rate_limiter.is_rate_limited("203.0.113.9") for _ in range(60)]
+
+    assert results.count(False) == server.rate_limiter.limit
+    assert server.rate_limiter.is_banned("203.0.113.9") is True
+
+
+def test_rate_limit_bans_persist_in_state_store(tmp_path: Path) -> None:
+    store = StateStore(tmp_path / "state.sqlite3")
+    limiter = RateLimit(
+        limit=5, period=10, ban_threshold=1, state=store.namespace("bans")
+    )
+
+    limiter.is_rate_limited("10.1.0.1")
+    limiter.is_rate_limited("10.1.0.1")
+    assert [key for key, _ in store.namespace("bans").items()] == ["10.1.0.1"]
+    assert store.namespace("other").items() == []
+
+    store.namespace("bans").put("10.9.9.9", 0, expires_at=1.0)
+    store.namespace("bans").put("bogus", "not-a-timestamp")
+    restored = RateLimit(limit=5, period=10, state=store.namespace("bans"))
+    assert restored.is_banned("10.1.0.1") is True
+    assert restored.is_banned("10.9.9.9") is False
+    assert store.get_stats()["writes"] == 3
+
+
+def test_rate_limit_constant_cost_at_100k_source_ips() -> None:
+    limiter = RateLimit(limit=10, period=60, max_tracked_ips=4096)
+
+    def _batch(start: int, count: int) -> float:
+        started = time.perf_counter()
+        for index in range(start, start + count):
+            limiter.is_rate_limited(
+                f"10.{index >> 16 & 255}.{index >> 8 & 255}.{index & 255}"
+            )
+        return time.perf_counter() - started
+
+    warm = _batch(0, 10_000)
+    _batch(10_000, 80_000)
+    late = _batch(90_000, 10_000)
+
+    assert len(limiter._last_seen) == limiter.max_tracked_ips
+    assert len(limiter.requests) == limiter.max_tracked_ips
+    assert late < warm * 3
+
+
 def test_rate_limit_cleanup_and_evict_paths() -> None:
     limiter = RateLimit(limit=1, period=1, max_tracked_ips=2)
     limiter._evict_oldest_ip()  # no state path
@@ -0,0 +1,192 @@
+#!/usr/local/bin/python3
+"""
+(c) Copyright 2025, Denis Rozhnovskiy <pytelemonbot@mail.ru>
+pyTMBot - A simple Telegram bot to handle Docker containers and images,
+also providing basic information about the status of local servers.
+
+Generate ``pytmbot/utils/emoji_table.py``: the static alias -> glyph table used by
+``EmojiConverter``. Only strings the bot actually resolves as emoji are collected
+from the ``pytmbot`` package (bundled plugins included):
+
+- literal ``get_emoji(...)`` arguments, including names iterated into such a call
+  from a list or tuple literal;
+- keys of plugin ``*KEYBOARD`` / ``PLUGIN_INDEX_KEY`` dicts;
+- keys of the default keyboards returned by ``get_default_*keyboard`` settings helpers.
+
+Usage:
+    python tools/build_emoji_table.py          # rewrite the table
+    python tools/build_emoji_table.py --check  # exit 1 if the table is stale
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import json
+import re
+import sys
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+import emoji
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+PACKAGE_ROOT = REPO_ROOT / "pytmbot"
+TABLE_PATH = PACKAGE_ROOT / "utils" / "emoji_table.py"
+
+_ALIAS_PATTERN = re.compile(r"^[A-Za-z0-9_\-]+$")
+
+_HEADER = '''#!/usr/local/bin/python3
+"""
+(c) Copyright 2025, Denis Rozhnovskiy <pytelemonbot@mail.ru>
+pyTMBot - A simple Telegram bot to handle Docker containers and images,
+also providing basic information about the status of local servers.
+
+Generated by tools/build_emoji_table.py - do not edit by hand.
+"""
+
+from typing import Final
+
+EMOJI_TABLE: Final[dict[str, str]] = {
+'''
+
+
+def _string_items(node: ast.expr | None) -> Iterator[str]:
+    if isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+        for element in node.elts:
+            if isinstance(element, ast.Constant) and isinstance(element.value, str):
+                yield element.value
+
+
+def _dict_keys(node: ast.expr | None) -> Iterator[str]:
+    if isinstance(node, ast.Dict):
+        for key in node.keys:
+            if isinstance(key, ast.Constant) and isinstance(key.value, str):
+                yield key.value
+
+
+def _is_keyboard_name(name: str) -> bool:
+    return name.endswith("KEYBOARD") or name == "PLUGIN_INDEX_KEY"
+
+
+def _get_emoji_argument(node: ast.AST) -> ast.expr | None:
+    if not isinstance(node, ast.Call) or not node.args:
+        return None
+    func = node.func
+    name = func.attr if isinstance(func, ast.Attribute) else getattr(func, "id", None)
+    return node.args[0] if name == "get_emoji" else None
+
+
+def iter_emoji_candidates(tree: ast.Module) -> Iterator[str]:
+    """Yield the strings one module hands to the emoji converter."""
+    literals: dict[str, ast.expr] = {}
+    for node in ast.walk(tree):
+        if (
+            isinstance(node, (ast.Assign, ast.AnnAssign))
+            and (
+                targets := node.targets
+                if isinstance(node, ast.Assign)
+                else [node.target]
+            )
+            and len(targets) == 1
+            and isinstance(targets[0], ast.Name)
+            and node.value is not None
+        ):
+            literals[targets[0].id] = node.value
+            if _is_keyboard_name(targets[0].id):
+                yield from _dict_keys(node.value)
+        elif isinstance(node, ast.FunctionDef) and node.name.startswith("get_default_"):
+            if node.name.endswith("keyboard"):
+                for statement in ast.walk(node):
+                    if isinstance(statement, ast.Return):
+                        yield from _dict_keys(statement.value)
+
+    for node in ast.walk(tree):
+        argument = _get_emoji_argument(node)
+        if isinstance(argument, ast.Constant) and isinstance(argument.value, str):
+            yield argument.value
+        if not isinstance(
+            node, (ast.ListComp, ast.SetComp, ast.DictComp, ast.GeneratorExp)
+        ):
+            continue
+        # ``{name: get_emoji(name) for name in names}`` with ``names`` a literal.
+        called = {
+            argument.id
+            for child in ast.walk(node)
+            if isinstance(argument := _get_emoji_argument(child), ast.Name)
+        }
+        for generator in node.generators:
+            if isinstance(generator.target, ast.Name) and generator.target.id in called:
+                source = generator.iter
+                if isinstance(source, ast.Name):
+                    source = literals.get(source.id, source)
+                yield from _string_items(source)
+
+
+def iter_emoji_aliases(paths: Iterable[Path]) -> Iterator[str]:
+    """Yield emoji alias candidates found in the given Python sources."""
+    for path in paths:
+        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+        yield from iter_emoji_candidates(tree)
+
+
+def source_files(package_root: Path = PACKAGE_ROOT) -> list[Path]:
+    """Python sources scanned for aliases, excluding the generated table itself."""
+    return sorted(
+        path for path in package_root.rglob("*.py") if path.resolve() != TABLE_PATH
+    )
+
+
+def resolve_aliases(candidates: Iterable[str]) -> dict[str, str]:
+    """Map each candidate that is a known emoji alias to its glyph."""
+    table: dict[str, str] = {}
+    for candidate in candidates:
+        if candidate in table or not _ALIAS_PATTERN.match(candidate):
+            continue
+        alias = f":{candidate}:"
+        glyph = emoji.emojize(alias)
+        if glyph != alias:
+            table[candidate] = glyph
+    return dict(sorted(table.items()))
+
+
+def render_table(table: dict[str, str]) -> str:
+    # Double-quoted, one entry per line: stable under ``ruff format``.
+    lines = [
+        f"    {json.dumps(name)}: {json.dumps(glyph, ensure_ascii=False)},\n"
+        for name, glyph in table.items()
+    ]
+    return _HEADER + "".join(lines) + "}\n"
+
+
+def build_table_source(package_root: Path = PACKAGE_ROOT) -> str:
+    return render_table(resolve_aliases(iter_emoji_aliases(source_files(package_root))))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Generate the static emoji alias table for EmojiConverter."
+    )
+    parser.add_argument(
+        "--check", action="store_true", help="fail if the table is stale"
+    )
+    args = parser.parse_args(argv)
+
+    source = build_table_source()
+    current = TABLE_PATH.read_text(encoding="utf-8") if TABLE_PATH.exists() else ""
+    if args.check:
+        if source != current:
+            print(
+                f"{TABLE_PATH.relative_to(REPO_ROOT)} is stale; run {Path(__file__).name}"
+            )
+            return 1
+        return 0
+
+    if source != current:
+        TABLE_PATH.write_text(source, encoding="utf-8")
+        print(f"Wrote {TABLE_PATH.relative_to(REPO_ROOT)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())